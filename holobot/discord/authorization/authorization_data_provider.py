@@ -1,32 +1,54 @@
+import asyncio
 from collections.abc import Iterable
+from datetime import datetime, timedelta
 
+from holobot.discord import DiscordOptions
+from holobot.discord.authorization.models import (
+    AuthorizationSnapshot, InteractableAuthorization, InteractableAuthorizationId
+)
 from holobot.discord.authorization.repositories import IInteractableAuthorizationRepository
 from holobot.discord.sdk.authorization import IAuthorizationDataProvider
+from holobot.discord.sdk.events import AuthorizationChangedEvent
 from holobot.discord.sdk.workflows.interactables import Interactable
 from holobot.discord.sdk.workflows.interactables.restrictions import (
     FeatureRestriction, ServerListRestriction
 )
+from holobot.sdk.configs import IOptions
+from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.logging import ILoggerFactory
+from holobot.sdk.reactive import IListener
+from holobot.sdk.utils import utcnow
 
 @injectable(IAuthorizationDataProvider)
 class AuthorizationDataProvider(IAuthorizationDataProvider):
     def __init__(
         self,
-        interactable_authorization_repository: IInteractableAuthorizationRepository
+        interactable_authorization_repository: IInteractableAuthorizationRepository,
+        listeners: tuple[IListener[AuthorizationChangedEvent], ...],
+        logger_factory: ILoggerFactory,
+        options: IOptions[DiscordOptions],
+        unit_of_work_provider: IUnitOfWorkProvider
     ) -> None:
         super().__init__()
         self.__authorization_repository = interactable_authorization_repository
+        self.__listeners = sorted(listeners, key=lambda i: i.priority)
+        self.__generation = 0
+        self.__logger = logger_factory.create(AuthorizationDataProvider)
+        self.__snapshot_duration = timedelta(seconds=options.value.AuthorizationCacheDuration)
+        self.__snapshot: AuthorizationSnapshot | None = None
+        self.__snapshot_expires_at: datetime | None = None
+        self.__snapshot_lock = asyncio.Lock()
+        self.__unit_of_work_provider = unit_of_work_provider
 
     async def is_server_authorized(self, interactable: Interactable, server_id: int) -> bool:
         if not interactable.restrictions:
             return True
 
+        snapshot = await self.__get_snapshot()
         for restriction in interactable.restrictions:
             if isinstance(restriction, FeatureRestriction):
-                has_authorization = await self.__authorization_repository.has_authorization(
-                    server_id,
-                    restriction.feature_name
-                )
+                has_authorization = snapshot.get_status(restriction.feature_name, server_id)
                 if has_authorization is not None:
                     return has_authorization
             elif isinstance(restriction, ServerListRestriction):
@@ -41,18 +63,66 @@ class AuthorizationDataProvider(IAuthorizationDataProvider):
         if not interactable.restrictions:
             return (0,)
 
+        snapshot = await self.__get_snapshot()
         server_ids = set[int]()
         for restriction in interactable.restrictions:
             if isinstance(restriction, FeatureRestriction):
-                auth_server_ids = await self.__authorization_repository.get_authorized_server_ids(
-                    restriction.feature_name
-                )
-                for server_id in auth_server_ids:
-                    server_ids.add(server_id)
+                server_ids.update(snapshot.get_server_ids(restriction.feature_name))
             elif isinstance(restriction, ServerListRestriction):
-                for server_id in restriction.server_ids:
-                    server_ids.add(server_id)
+                server_ids.update(restriction.server_ids)
             else:
                 raise TypeError(f"Unknown restriction type '{type(restriction)}'.")
 
         return server_ids
+
+    async def set_authorization(self, feature_name: str, server_id: int, status: bool | None) -> None:
+        identifier = InteractableAuthorizationId.create(feature_name, server_id)
+        async with (unit_of_work := await self.__unit_of_work_provider.create_new()):
+            if status is None:
+                await self.__authorization_repository.delete(identifier)
+            elif not await self.__authorization_repository.update(
+                InteractableAuthorization(identifier=identifier, status=status)
+            ):
+                await self.__authorization_repository.add(
+                    InteractableAuthorization(identifier=identifier, status=status)
+                )
+            unit_of_work.complete()
+
+        self.__generation += 1
+        # Only patch a loaded snapshot; an unloaded one will contain the change anyway.
+        if self.__snapshot:
+            self.__snapshot.set_status(feature_name, server_id, status)
+
+        event = AuthorizationChangedEvent(
+            feature_name=feature_name,
+            server_id=server_id,
+            status=status
+        )
+        for listener in self.__listeners:
+            try:
+                await listener.on_event(event)
+            except Exception as error:
+                self.__logger.error(
+                    "Failed to notify a listener about an authorization change",
+                    error,
+                    listener=type(listener).__name__
+                )
+
+    async def __get_snapshot(self) -> AuthorizationSnapshot:
+        if self.__snapshot and not self.__is_snapshot_expired():
+            return self.__snapshot
+
+        async with self.__snapshot_lock:
+            # Another caller may have loaded the snapshot while waiting for the lock.
+            if self.__snapshot and not self.__is_snapshot_expired():
+                return self.__snapshot
+
+            generation = self.__generation
+            self.__snapshot = AuthorizationSnapshot(await self.__authorization_repository.get_all())
+            # A change during the load means the loaded snapshot may be stale already.
+            if generation == self.__generation:
+                self.__snapshot_expires_at = utcnow() + self.__snapshot_duration
+            return self.__snapshot
+
+    def __is_snapshot_expired(self) -> bool:
+        return self.__snapshot_expires_at is None or utcnow() >= self.__snapshot_expires_at
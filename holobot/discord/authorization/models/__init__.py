@@ -1,2 +1,3 @@
+from .authorization_snapshot import AuthorizationSnapshot
 from .interactable_authorization import InteractableAuthorization
 from .interactable_authorization_id import InteractableAuthorizationId
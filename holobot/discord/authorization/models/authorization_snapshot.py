@@ -0,0 +1,68 @@
+from collections.abc import Iterable, Set
+
+from .interactable_authorization import InteractableAuthorization
+
+class AuthorizationSnapshot:
+    """An in-memory copy of every interactable authorization, grouped by feature."""
+
+    def __init__(self, authorizations: Iterable[InteractableAuthorization]) -> None:
+        super().__init__()
+        self.__statuses: dict[str, dict[int, bool]] = {}
+        for authorization in authorizations:
+            self.set_status(
+                authorization.identifier.interactable_id,
+                authorization.identifier.server_id,
+                authorization.status
+            )
+
+    def get_status(self, feature_name: str, server_id: int) -> bool | None:
+        """Gets the authorization status of the specified server for the specified feature.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :return: If exists, the status of the authorization; otherwise, None.
+        :rtype: bool | None
+        """
+
+        if not (statuses := self.__statuses.get(feature_name)):
+            return None
+
+        return statuses.get(server_id)
+
+    def get_server_ids(self, feature_name: str) -> Set[int]:
+        """Gets the identifiers of the servers that have an authorization for the specified feature.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :return: The identifiers of the servers.
+        :rtype: Set[int]
+        """
+
+        if not (statuses := self.__statuses.get(feature_name)):
+            return frozenset()
+
+        return statuses.keys()
+
+    def set_status(self, feature_name: str, server_id: int, status: bool | None) -> None:
+        """Sets or, if the status is None, removes an authorization.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param status: The new status of the authorization.
+        :type status: bool | None
+        """
+
+        if status is not None:
+            self.__statuses.setdefault(feature_name, {})[server_id] = status
+            return
+
+        if (statuses := self.__statuses.get(feature_name)) is None:
+            return
+
+        statuses.pop(server_id, None)
+        if not statuses:
+            self.__statuses.pop(feature_name)
@@ -11,3 +11,9 @@ class DiscordOptions(OptionsDefinition):
     PaginatorPreviousEmoji: int | None = None
     PaginatorNextEmoji: int | None = None
     IsNetworkTraceEnabled: bool = False
+
+    AuthorizationCacheDuration: int = 300
+    """The time, in seconds, after which the interactable authorizations are reloaded."""
+
+    PermissionCacheMaxSize: int = 10000
+    """The maximum number of effective member permissions kept in memory."""
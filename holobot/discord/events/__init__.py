@@ -2,6 +2,10 @@ from .discord_event_listener_base import DiscordEventListenerBase
 from .exception_event_listener import ExceptionEventListener
 from .idiscord_event_listener import IDiscordEventListener
 from .igeneric_discord_event_listener import IGenericDiscordEventListener
+from .invalidate_permissions_on_channel_event import InvalidatePermissionsOnChannelEvent
+from .invalidate_permissions_on_guild_update import InvalidatePermissionsOnGuildUpdate
+from .invalidate_permissions_on_member_event import InvalidatePermissionsOnMemberEvent
+from .invalidate_permissions_on_role_event import InvalidatePermissionsOnRoleEvent
 from .member_deleted_event_listener import MemberDeletedEventListener
 from .message_create_event_listener import MessageCreateEventListener
 from .process_interaction_on_interaction_create import ProcessInteractionOnInteractionCreate
@@ -0,0 +1,22 @@
+import hikari
+
+from holobot.discord.bot import Bot
+from holobot.discord.servers.ipermission_cache import IPermissionCache
+from holobot.sdk.ioc.decorators import injectable
+from .discord_event_listener_base import DiscordEventListenerBase
+from .igeneric_discord_event_listener import IGenericDiscordEventListener
+
+_EVENT_TYPE = hikari.GuildChannelEvent
+
+@injectable(IGenericDiscordEventListener)
+class InvalidatePermissionsOnChannelEvent(DiscordEventListenerBase[_EVENT_TYPE]):
+    def __init__(self, permission_cache: IPermissionCache) -> None:
+        super().__init__()
+        self.__permission_cache = permission_cache
+
+    @property
+    def event_type(self) -> type:
+        return _EVENT_TYPE
+
+    async def on_event(self, bot: Bot, event: _EVENT_TYPE) -> None:
+        self.__permission_cache.invalidate_channel(event.guild_id, event.channel_id)
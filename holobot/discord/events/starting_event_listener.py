@@ -1,12 +1,9 @@
 import hikari
-from hikari.api.special_endpoints import CommandBuilder
 
 from holobot.discord.bot import Bot
-from holobot.discord.workflows import IWorkflowRegistry
-from holobot.sdk.diagnostics import IDebugger
+from holobot.discord.workflows import ICommandRegistrar
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.logging import ILoggerFactory
-from holobot.sdk.utils import get_or_add
 from .discord_event_listener_base import DiscordEventListenerBase
 from .igeneric_discord_event_listener import IGenericDiscordEventListener
 
@@ -16,57 +13,17 @@ _EVENT_TYPE = hikari.StartingEvent
 class StartingEventListener(DiscordEventListenerBase[_EVENT_TYPE]):
     def __init__(
         self,
-        debugger: IDebugger,
-        logger_factory: ILoggerFactory,
-        workflow_registry: IWorkflowRegistry
+        command_registrar: ICommandRegistrar,
+        logger_factory: ILoggerFactory
     ) -> None:
         super().__init__()
-        self.__debugger = debugger
+        self.__command_registrar = command_registrar
         self.__logger = logger_factory.create(StartingEventListener)
-        self.__workflow_registry = workflow_registry
 
     @property
     def event_type(self) -> type:
         return _EVENT_TYPE
 
     async def on_event(self, bot: Bot, event: _EVENT_TYPE) -> None:
-        command_builders = await self.__get_command_builders(bot)
-        await self.__register_commands(bot, command_builders)
+        await self.__command_registrar.register_commands(bot)
         self.__logger.info("Registered all application commands")
-
-    async def __get_command_builders(
-        self,
-        bot: Bot
-    ) -> dict[int, list[CommandBuilder]]:
-        builder_tree: dict[int, list[CommandBuilder]] = {}
-        command_builders = await self.__workflow_registry.get_command_builders(bot)
-        for server_id, builders in command_builders.items():
-            cb = get_or_add(builder_tree, server_id, lambda _: list[CommandBuilder](), None)
-            cb.extend(builders)
-
-        menu_item_builders = await self.__workflow_registry.get_menu_item_builders(bot)
-        for server_id, builders in menu_item_builders.items():
-            cb = get_or_add(builder_tree, server_id, lambda _: list[CommandBuilder](), None)
-            cb.extend(builders)
-
-        return builder_tree
-
-    async def __register_commands(
-        self,
-        bot: Bot,
-        command_builders: dict[int, list[CommandBuilder]]
-    ) -> None:
-        application = await bot.rest.fetch_application()
-        for server_id, builders in command_builders.items():
-            try:
-                await bot.rest.set_application_commands(
-                    application=application.id,
-                    commands=builders,
-                    guild=server_id if server_id != 0 else hikari.UNDEFINED
-                )
-            except Exception as error:
-                self.__logger.error(
-                    "Failed to register some server-specific application commands",
-                    error,
-                    server_id=server_id
-                )
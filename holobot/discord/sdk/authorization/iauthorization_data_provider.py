@@ -9,3 +9,17 @@ class IAuthorizationDataProvider(Protocol):
 
     def get_authorized_server_ids(self, interactable: Interactable) -> Awaitable[Iterable[int]]:
         ...
+
+    def set_authorization(self, feature_name: str, server_id: int, status: bool | None) -> Awaitable[None]:
+        """Sets or removes the authorization of a server for a specific feature.
+
+        Listeners are notified about the change once it has been persisted.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param status: The new status of the authorization or None, to remove it.
+        :type status: bool | None
+        """
+        ...
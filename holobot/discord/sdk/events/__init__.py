@@ -1,3 +1,4 @@
+from .authorization_changed_event import AuthorizationChangedEvent
 from .command_processed_event import CommandProcessedEvent
 from .component_processed_event import ComponentProcessedEvent
 from .menu_item_processed_event import MenuItemProcessedEvent
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from holobot.sdk.reactive.models import EventBase
+
+@dataclass(kw_only=True, frozen=True)
+class AuthorizationChangedEvent(EventBase):
+    feature_name: str
+    """The name of the feature whose authorization has changed."""
+
+    server_id: int
+    """The identifier of the affected server."""
+
+    status: bool | None
+    """The new status of the authorization or None, if it has been removed."""
@@ -12,12 +12,22 @@ class Paginator(InteractableLayoutBase):
     has_previous_page: bool | None = None
     has_next_page: bool | None = None
     custom_data: dict[str, Any] = field(default_factory=dict)
+    previous_page_custom_data: dict[str, Any] = field(default_factory=dict)
+    """Additional data passed only when navigating to the previous page, such as a cursor."""
+    next_page_custom_data: dict[str, Any] = field(default_factory=dict)
+    """Additional data passed only when navigating to the next page, such as a cursor."""
     auto_hide_buttons: bool = True
 
     def is_first_page(self) -> bool:
+        if self.has_previous_page is not None:
+            return not self.has_previous_page
+
         return not self.current_page
 
     def is_last_page(self) -> bool:
+        if self.has_next_page is not None:
+            return not self.has_next_page
+
         if self.total_count is None or self.page_size is None:
             return False
 
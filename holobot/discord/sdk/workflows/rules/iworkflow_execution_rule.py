@@ -10,6 +10,47 @@ class IWorkflowExecutionRule(Protocol):
     A rule is responsible for determining if a workflow's execution should be interrupted.
     """
 
+    @property
+    def priority(self) -> int:
+        """Used to determine which rule's halt message is used.
+
+        When multiple rules halt the same interaction, the one
+        with the lower priority takes precedence.
+
+        :return: The priority of the rule.
+        :rtype: int
+        """
+
+        return 0
+
+    @property
+    def is_io_bound(self) -> bool:
+        """Determines whether the rule performs I/O, such as database or HTTP calls.
+
+        Cheap (in-memory) rules are evaluated sequentially before any I/O-bound rule,
+        while I/O-bound rules are evaluated concurrently. A rule reading from an
+        in-process snapshot, such as an EntitySnapshot, counts as cheap, even though
+        the snapshot is reloaded every now and then.
+
+        :return: True, if the rule is I/O-bound.
+        :rtype: bool
+        """
+
+        return True
+
+    @property
+    def has_side_effects(self) -> bool:
+        """Determines whether the rule changes state, such as recording the invocation.
+
+        Rules with side effects are evaluated sequentially, only after every other rule
+        has let the interaction through, so that their effects apply to executions only.
+
+        :return: True, if the rule has side effects.
+        :rtype: bool
+        """
+
+        return False
+
     async def should_halt(
         self,
         workflow: IWorkflow,
@@ -1,2 +1,4 @@
+from .ipermission_cache import IPermissionCache
 from .member_data_provider import MemberDataProvider
+from .permission_cache import PermissionCache
 from .server_data_provider import ServerDataProvider
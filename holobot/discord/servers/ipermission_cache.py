@@ -0,0 +1,80 @@
+from typing import Protocol
+
+from holobot.discord.sdk.enums import Permission
+
+class IPermissionCache(Protocol):
+    """Interface for a cache of the effective permissions of server members."""
+
+    @property
+    def version(self) -> int:
+        """Gets a number that changes every time some permissions are invalidated.
+
+        Callers that resolve permissions asynchronously may use it to avoid
+        caching results that have been invalidated in the meantime.
+
+        :return: The current version of the cache.
+        :rtype: int
+        """
+        ...
+
+    def get(self, server_id: int, channel_id: int, user_id: int) -> Permission | None:
+        """Gets the cached permissions of a member in the specified channel.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param channel_id: The identifier of the channel.
+        :type channel_id: int
+        :param user_id: The identifier of the member.
+        :type user_id: int
+        :return: If cached, the effective permissions; otherwise, None.
+        :rtype: Permission | None
+        """
+        ...
+
+    def set(
+        self,
+        server_id: int,
+        channel_id: int,
+        user_id: int,
+        permissions: Permission
+    ) -> None:
+        """Caches the permissions of a member in the specified channel.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param channel_id: The identifier of the channel.
+        :type channel_id: int
+        :param user_id: The identifier of the member.
+        :type user_id: int
+        :param permissions: The effective permissions of the member.
+        :type permissions: Permission
+        """
+        ...
+
+    def invalidate_server(self, server_id: int) -> None:
+        """Removes every cached permission of the specified server.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        """
+        ...
+
+    def invalidate_channel(self, server_id: int, channel_id: int) -> None:
+        """Removes the cached permissions of every member in the specified channel.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param channel_id: The identifier of the channel.
+        :type channel_id: int
+        """
+        ...
+
+    def invalidate_member(self, server_id: int, user_id: int) -> None:
+        """Removes the cached permissions of the specified member in every channel.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param user_id: The identifier of the member.
+        :type user_id: int
+        """
+        ...
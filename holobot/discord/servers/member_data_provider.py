@@ -7,13 +7,18 @@ from holobot.discord.sdk.enums import Permission
 from holobot.discord.sdk.exceptions import ServerNotFoundError, UserNotFoundError
 from holobot.discord.sdk.servers import IMemberDataProvider
 from holobot.discord.sdk.servers.models import MemberData
-from holobot.discord.utils.permission_utils import PERMISSION_TO_MODELS
+from holobot.discord.utils.permission_utils import map_permissions_to_model
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils import assert_not_none
 from holobot.sdk.utils.iterable_utils import first_or_default
+from .ipermission_cache import IPermissionCache
 
 @injectable(IMemberDataProvider)
 class MemberDataProvider(IMemberDataProvider):
+    def __init__(self, permission_cache: IPermissionCache) -> None:
+        super().__init__()
+        self.__permission_cache = permission_cache
+
     async def get_basic_data_by_id(
         self,
         server_id: int,
@@ -79,6 +84,23 @@ class MemberDataProvider(IMemberDataProvider):
         assert_not_none(channel_id, "channel_id")
         assert_not_none(user_id, "user_id")
 
+        if (permissions := self.__permission_cache.get(server_id, channel_id, user_id)) is not None:
+            return permissions
+
+        cache_version = self.__permission_cache.version
+        permissions = await MemberDataProvider.__resolve_member_permissions(server_id, channel_id, user_id)
+        # Skip caching if an event invalidated some permissions while resolving these.
+        if self.__permission_cache.version == cache_version:
+            self.__permission_cache.set(server_id, channel_id, user_id, permissions)
+
+        return permissions
+
+    @staticmethod
+    async def __resolve_member_permissions(
+        server_id: int,
+        channel_id: int,
+        user_id: int
+    ) -> Permission:
         guild = await get_bot().get_guild_by_id(server_id)
         member = await get_bot().get_guild_member(guild, user_id)
 
@@ -94,33 +116,10 @@ class MemberDataProvider(IMemberDataProvider):
 
         channel = await get_bot().get_guild_channel(guild, channel_id)
         if not channel:
-            return MemberDataProvider.__transform_permissions(base_permissions)
+            return map_permissions_to_model(base_permissions)
 
         channel_permissions = MemberDataProvider._get_channel_permissions(member, channel, base_permissions)
-        return MemberDataProvider.__transform_permissions(channel_permissions)
-
-    @staticmethod
-    def __transform_permissions(dto: hikari.Permissions) -> Permission:
-        if dto is hikari.Permissions.NONE:
-            return Permission.NONE
-
-        permissions = Permission.NONE
-        flags = dto.value
-        current_flag = 1
-        while flags > 0:
-            if (flags & current_flag) != current_flag:
-                current_flag <<= 1
-                continue
-
-            flags ^= current_flag
-            if (current_permission := PERMISSION_TO_MODELS.get(hikari.Permissions(current_flag))) is None:
-                current_flag <<= 1
-                continue
-
-            permissions |= int(current_permission)
-            current_flag <<= 1
-
-        return permissions
+        return map_permissions_to_model(channel_permissions)
 
     @staticmethod
     def __member_to_basic_data(user: hikari.Member) -> MemberData:
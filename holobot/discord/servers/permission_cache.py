@@ -0,0 +1,98 @@
+from collections import OrderedDict
+from collections.abc import Callable
+
+from holobot.discord import DiscordOptions
+from holobot.discord.sdk.enums import Permission
+from holobot.sdk.configs import IOptions
+from holobot.sdk.exceptions import ArgumentError
+from holobot.sdk.ioc.decorators import injectable
+from .ipermission_cache import IPermissionCache
+
+_CacheKey = tuple[int, int, int]
+
+@injectable(IPermissionCache)
+class PermissionCache(IPermissionCache):
+    """A size-bounded, least recently used cache of effective member permissions.
+
+    Entries are indexed by server as well so that the invalidations
+    triggered by Discord events needn't scan the whole cache.
+    """
+
+    def __init__(self, options: IOptions[DiscordOptions]) -> None:
+        super().__init__()
+        max_size = options.value.PermissionCacheMaxSize
+        if max_size < 1:
+            raise ArgumentError("PermissionCacheMaxSize", "Value must be positive.")
+
+        self.__max_size = max_size
+        self.__entries = OrderedDict[_CacheKey, Permission]()
+        self.__keys_by_server = dict[int, set[_CacheKey]]()
+        self.__version = 0
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    @property
+    def size(self) -> int:
+        return len(self.__entries)
+
+    def get(self, server_id: int, channel_id: int, user_id: int) -> Permission | None:
+        key = (server_id, channel_id, user_id)
+        if (permissions := self.__entries.get(key)) is not None:
+            self.__entries.move_to_end(key)
+
+        return permissions
+
+    def set(
+        self,
+        server_id: int,
+        channel_id: int,
+        user_id: int,
+        permissions: Permission
+    ) -> None:
+        key = (server_id, channel_id, user_id)
+        self.__entries[key] = permissions
+        self.__entries.move_to_end(key)
+        self.__keys_by_server.setdefault(server_id, set()).add(key)
+        while len(self.__entries) > self.__max_size:
+            evicted_key, _ = self.__entries.popitem(last=False)
+            self.__discard_server_key(evicted_key)
+
+    def invalidate_server(self, server_id: int) -> None:
+        self.__version += 1
+        if not (keys := self.__keys_by_server.pop(server_id, None)):
+            return
+
+        for key in keys:
+            self.__entries.pop(key, None)
+
+    def invalidate_channel(self, server_id: int, channel_id: int) -> None:
+        self.__invalidate_where(server_id, lambda key: key[1] == channel_id)
+
+    def invalidate_member(self, server_id: int, user_id: int) -> None:
+        self.__invalidate_where(server_id, lambda key: key[2] == user_id)
+
+    def __invalidate_where(
+        self,
+        server_id: int,
+        predicate: Callable[[_CacheKey], bool]
+    ) -> None:
+        self.__version += 1
+        if not (keys := self.__keys_by_server.get(server_id)):
+            return
+
+        for key in [key for key in keys if predicate(key)]:
+            keys.discard(key)
+            self.__entries.pop(key, None)
+
+        if not keys:
+            del self.__keys_by_server[server_id]
+
+    def __discard_server_key(self, key: _CacheKey) -> None:
+        if not (keys := self.__keys_by_server.get(key[0])):
+            return
+
+        keys.discard(key)
+        if not keys:
+            del self.__keys_by_server[key[0]]
@@ -49,3 +49,39 @@ def map_permissions_to_dtos(permissions: Permission) -> Permissions:
         flag |= PERMISSION_TO_DTOS[permission]
 
     return flag
+
+def _build_model_tables() -> tuple[tuple[int, ...], ...]:
+    # Each table maps one byte of a hikari.Permissions value
+    # to the union of the corresponding Permission flags.
+    bit_models = {
+        int(dto).bit_length() - 1: int(model)
+        for dto, model in PERMISSION_TO_MODELS.items()
+        if dto
+    }
+    table_count = (max(bit_models) >> 3) + 1
+    tables = []
+    for table_index in range(table_count):
+        table = []
+        for byte in range(256):
+            value = 0
+            for bit in range(8):
+                if byte & (1 << bit):
+                    value |= bit_models.get(table_index * 8 + bit, 0)
+            table.append(value)
+        tables.append(tuple(table))
+
+    return tuple(tables)
+
+_MODEL_TABLES = _build_model_tables()
+
+def map_permissions_to_model(permissions: Permissions) -> Permission:
+    value = int(permissions)
+    result = 0
+    for table in _MODEL_TABLES:
+        if not value:
+            break
+
+        result |= table[value & 0xFF]
+        value >>= 8
+
+    return Permission(result)
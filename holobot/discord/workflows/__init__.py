@@ -1,3 +1,8 @@
+from .command_registrar import CommandRegistrar
+from .command_registration_queue import CommandRegistrationQueue
+from .execution_rule_pipeline import ExecutionRulePipeline
+from .icommand_registrar import ICommandRegistrar
+from .icommand_registration_queue import ICommandRegistrationQueue
 from .iinteraction_processor import IInteractionProcessor
 from .iinvocation_tracker import IInvocationTracker
 from .interaction_processor_base import InteractionProcessorBase
@@ -0,0 +1,111 @@
+import asyncio
+from collections.abc import Iterable
+
+import hikari
+from hikari.api.special_endpoints import CommandBuilder
+
+from holobot.discord.bot import Bot, get_bot
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.lifecycle import IStartable
+from holobot.sdk.logging import ILoggerFactory
+from holobot.sdk.utils import get_or_add
+from .icommand_registrar import ICommandRegistrar
+from .icommand_registration_queue import ICommandRegistrationQueue
+from .iworkflow_registry import IWorkflowRegistry
+
+@injectable(IStartable)
+@injectable(ICommandRegistrar)
+class CommandRegistrar(ICommandRegistrar, IStartable):
+    """A service that registers the application commands with Discord.
+
+    The commands of the servers in the registration queue
+    are registered again in the background.
+    """
+
+    @property
+    def priority(self) -> int:
+        return 1000
+
+    def __init__(
+        self,
+        logger_factory: ILoggerFactory,
+        registration_queue: ICommandRegistrationQueue,
+        workflow_registry: IWorkflowRegistry
+    ) -> None:
+        super().__init__()
+        self.__logger = logger_factory.create(CommandRegistrar)
+        self.__registration_queue = registration_queue
+        self.__workflow_registry = workflow_registry
+        self.__background_task: asyncio.Task[None] | None = None
+
+    async def register_commands(
+        self,
+        bot: Bot,
+        server_ids: Iterable[int] | None = None
+    ) -> None:
+        command_builders = await self.__get_command_builders(bot)
+        if server_ids is not None:
+            command_builders = {
+                server_id: command_builders.get(server_id, [])
+                for server_id in server_ids
+            }
+
+        await self.__register_commands(bot, command_builders)
+
+    async def start(self) -> None:
+        self.__background_task = asyncio.create_task(self.__process_registration_queue())
+
+    async def stop(self) -> None:
+        if self.__background_task:
+            self.__background_task.cancel()
+            try:
+                await self.__background_task
+            except asyncio.exceptions.CancelledError:
+                pass
+        self.__logger.debug("Stopped background task")
+
+    async def __process_registration_queue(self) -> None:
+        while True:
+            server_ids = await self.__registration_queue.dequeue_all()
+            try:
+                await self.register_commands(get_bot(), server_ids)
+                self.__logger.info("Registered the application commands of servers", count=len(server_ids))
+            except Exception as error:
+                self.__logger.error("Failed to register the application commands of servers", error)
+
+    async def __get_command_builders(
+        self,
+        bot: Bot
+    ) -> dict[int, list[CommandBuilder]]:
+        builder_tree: dict[int, list[CommandBuilder]] = {}
+        command_builders = await self.__workflow_registry.get_command_builders(bot)
+        for server_id, builders in command_builders.items():
+            cb = get_or_add(builder_tree, server_id, lambda _: list[CommandBuilder](), None)
+            cb.extend(builders)
+
+        menu_item_builders = await self.__workflow_registry.get_menu_item_builders(bot)
+        for server_id, builders in menu_item_builders.items():
+            cb = get_or_add(builder_tree, server_id, lambda _: list[CommandBuilder](), None)
+            cb.extend(builders)
+
+        return builder_tree
+
+    async def __register_commands(
+        self,
+        bot: Bot,
+        command_builders: dict[int, list[CommandBuilder]]
+    ) -> None:
+        application = await bot.rest.fetch_application()
+        for server_id, builders in command_builders.items():
+            try:
+                await bot.rest.set_application_commands(
+                    application=application.id,
+                    commands=builders,
+                    guild=server_id if server_id != 0 else hikari.UNDEFINED
+                )
+            except Exception as error:
+                self.__logger.error(
+                    "Failed to register some server-specific application commands",
+                    error,
+                    server_id=server_id
+                )
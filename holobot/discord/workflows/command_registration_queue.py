@@ -0,0 +1,34 @@
+import asyncio
+
+from holobot.discord.sdk.events import AuthorizationChangedEvent
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.reactive import IListener
+from .icommand_registration_queue import ICommandRegistrationQueue
+
+@injectable(IListener[AuthorizationChangedEvent])
+@injectable(ICommandRegistrationQueue)
+class CommandRegistrationQueue(ICommandRegistrationQueue, IListener[AuthorizationChangedEvent]):
+    """Keeps track of the servers whose authorizations have changed.
+
+    The commands aren't registered here, because the command builders
+    depend on the authorization data provider that notifies this listener.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__server_ids = set[int]()
+        self.__change_event = asyncio.Event()
+
+    def enqueue(self, server_id: int) -> None:
+        self.__server_ids.add(server_id)
+        self.__change_event.set()
+
+    async def dequeue_all(self) -> tuple[int, ...]:
+        await self.__change_event.wait()
+        self.__change_event.clear()
+        server_ids = tuple(self.__server_ids)
+        self.__server_ids.clear()
+        return server_ids
+
+    async def on_event(self, event: AuthorizationChangedEvent) -> None:
+        self.enqueue(event.server_id)
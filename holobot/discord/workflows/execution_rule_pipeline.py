@@ -0,0 +1,146 @@
+import asyncio
+from collections.abc import Iterable
+
+from holobot.discord.sdk.models import InteractionContext
+from holobot.discord.sdk.workflows import IWorkflow
+from holobot.discord.sdk.workflows.interactables import Interactable
+from holobot.discord.sdk.workflows.rules import IWorkflowExecutionRule
+from holobot.sdk.diagnostics import IExecutionContext
+from .models import RuleHaltResult
+
+class ExecutionRulePipeline:
+    """Evaluates workflow execution rules to determine if an interaction should be halted.
+
+    Cheap rules are evaluated sequentially first, then I/O-bound rules are evaluated
+    concurrently. Once a rule halts, pending rules with a lower priority are cancelled,
+    while those with a higher priority are still awaited, so that the result is always
+    the halting rule with the highest priority. Rules with side effects are evaluated
+    sequentially, in the order of their priorities, only if no other rule has halted.
+    """
+
+    def __init__(self, rules: Iterable[IWorkflowExecutionRule]) -> None:
+        super().__init__()
+        ordered_rules = tuple(enumerate(sorted(rules, key=lambda i: i.priority)))
+        self.__cheap_rules = tuple(
+            i for i in ordered_rules
+            if not i[1].is_io_bound and not i[1].has_side_effects
+        )
+        self.__io_bound_rules = tuple(
+            i for i in ordered_rules
+            if i[1].is_io_bound and not i[1].has_side_effects
+        )
+        self.__side_effecting_rules = tuple(i[1] for i in ordered_rules if i[1].has_side_effects)
+
+    async def evaluate(
+        self,
+        workflow: IWorkflow,
+        interactable: Interactable,
+        context: InteractionContext,
+        execution_context: IExecutionContext
+    ) -> RuleHaltResult | None:
+        """Evaluates the rules against the specified interaction.
+
+        The elapsed time of each evaluated rule is reported through the execution context.
+
+        :param workflow: The workflow the interactable belongs to.
+        :type workflow: IWorkflow
+        :param interactable: The currently executing interactable.
+        :type interactable: Interactable
+        :param context: The current interaction context.
+        :type context: InteractionContext
+        :param execution_context: The execution context used for measurements.
+        :type execution_context: IExecutionContext
+        :return: If the interaction should be halted, the result of the halting rule.
+        :rtype: RuleHaltResult | None
+        """
+
+        if result := await self.__evaluate_checks(workflow, interactable, context, execution_context):
+            return result
+
+        for rule in self.__side_effecting_rules:
+            should_halt, message = await ExecutionRulePipeline.__evaluate_rule(
+                rule, workflow, interactable, context, execution_context
+            )
+            if should_halt:
+                return RuleHaltResult(rule=rule, message=message)
+
+        return None
+
+    async def __evaluate_checks(
+        self,
+        workflow: IWorkflow,
+        interactable: Interactable,
+        context: InteractionContext,
+        execution_context: IExecutionContext
+    ) -> RuleHaltResult | None:
+        halt_index = -1
+        result = None
+        for index, rule in self.__cheap_rules:
+            should_halt, message = await ExecutionRulePipeline.__evaluate_rule(
+                rule, workflow, interactable, context, execution_context
+            )
+            if should_halt:
+                halt_index = index
+                result = RuleHaltResult(rule=rule, message=message)
+                break
+
+        # Only the I/O-bound rules with a higher priority may override a cheap rule's result.
+        io_bound_rules = tuple(
+            (index, rule)
+            for index, rule in self.__io_bound_rules
+            if result is None or index < halt_index
+        )
+        if not io_bound_rules:
+            return result
+
+        if len(io_bound_rules) == 1:
+            _, rule = io_bound_rules[0]
+            should_halt, message = await ExecutionRulePipeline.__evaluate_rule(
+                rule, workflow, interactable, context, execution_context
+            )
+            return RuleHaltResult(rule=rule, message=message) if should_halt else result
+
+        tasks = {
+            asyncio.create_task(ExecutionRulePipeline.__evaluate_rule(
+                rule, workflow, interactable, context, execution_context
+            )): (index, rule)
+            for index, rule in io_bound_rules
+        }
+        pending = set(tasks.keys())
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    should_halt, message = task.result()
+                    index, rule = tasks[task]
+                    if should_halt and (result is None or index < halt_index):
+                        halt_index = index
+                        result = RuleHaltResult(rule=rule, message=message)
+
+                if result is None:
+                    continue
+
+                # Lower priority rules cannot change the outcome anymore.
+                for task in tuple(pending):
+                    if tasks[task][0] > halt_index:
+                        task.cancel()
+                        pending.remove(task)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            # Wait for the cancellations so that no measurement is left running.
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        return result
+
+    @staticmethod
+    async def __evaluate_rule(
+        rule: IWorkflowExecutionRule,
+        workflow: IWorkflow,
+        interactable: Interactable,
+        context: InteractionContext,
+        execution_context: IExecutionContext
+    ) -> tuple[bool, str | None]:
+        with execution_context.start(f"Rule checked ({type(rule).__name__})"):
+            return await rule.should_halt(workflow, interactable, context)
@@ -0,0 +1,23 @@
+from collections.abc import Awaitable, Iterable
+from typing import Protocol
+
+from holobot.discord.bot import Bot
+
+class ICommandRegistrar(Protocol):
+    """Interface for a service that registers the application commands with Discord."""
+
+    def register_commands(
+        self,
+        bot: Bot,
+        server_ids: Iterable[int] | None = None
+    ) -> Awaitable[None]:
+        """Registers the commands and menu items of the specified servers.
+
+        Commands of a server that has none left are unregistered.
+
+        :param bot: The current bot instance.
+        :type bot: Bot
+        :param server_ids: The identifiers of the servers or None, to register every command.
+        :type server_ids: Iterable[int] | None, optional
+        """
+        ...
@@ -0,0 +1,23 @@
+from collections.abc import Awaitable
+from typing import Protocol
+
+class ICommandRegistrationQueue(Protocol):
+    """Interface for a service that keeps track of the servers
+    whose application commands need to be registered again."""
+
+    def enqueue(self, server_id: int) -> None:
+        """Marks the commands of the specified server for registration.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        """
+        ...
+
+    def dequeue_all(self) -> Awaitable[tuple[int, ...]]:
+        """Waits until there is at least one marked server,
+        then removes and returns the identifiers of every marked server.
+
+        :return: The identifiers of the servers.
+        :rtype: tuple[int, ...]
+        """
+        ...
@@ -6,6 +6,24 @@ from holobot.discord.sdk.workflows.interactables.enums import EntityType
 class IInvocationTracker(Protocol):
     """Interface for a service used for tracking interactable invocations."""
 
+    @property
+    def size(self) -> int:
+        """Gets the number of tracked invocations.
+
+        :return: The number of tracked invocations.
+        :rtype: int
+        """
+        ...
+
+    @property
+    def eviction_count(self) -> int:
+        """Gets the number of invocations forgotten since their cooldowns elapsed.
+
+        :return: The number of evicted invocations.
+        :rtype: int
+        """
+        ...
+
     async def update_invocation(
         self,
         entity_type: EntityType,
@@ -23,7 +41,7 @@ class IInvocationTracker(Protocol):
         :type invoked_at: datetime
         :param expires_after: The duration after which the tracking expires.
         :type expires_after: timedelta
-        :return: If available, the date and time of the last invocation.
+        :return: If the tracking hasn't expired yet, the date and time of the last invocation.
         :rtype: datetime | None
         """
         ...
@@ -14,11 +14,13 @@ from holobot.discord.sdk.workflows import IWorkflow
 from holobot.discord.sdk.workflows.interactables import Interactable
 from holobot.discord.sdk.workflows.interactables.models import InteractionResponse
 from holobot.discord.sdk.workflows.rules import IWorkflowExecutionRule
+from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.database.exceptions import SerializationError
 from holobot.sdk.diagnostics import IExecutionContext, IExecutionContextFactory
 from holobot.sdk.exceptions import ArgumentError
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.logging import ILoggerFactory
+from .execution_rule_pipeline import ExecutionRulePipeline
 from .iinteraction_processor import IInteractionProcessor, TInteraction
 from .models import InteractionDescriptor
 
@@ -37,18 +39,24 @@ class InteractionProcessorBase(
         i18n_provider: II18nProvider,
         logger_factory: ILoggerFactory,
         execution_context_factory: IExecutionContextFactory,
-        workflow_execution_rules: tuple[IWorkflowExecutionRule, ...]
+        workflow_execution_rules: tuple[IWorkflowExecutionRule, ...],
+        unit_of_work_provider: IUnitOfWorkProvider
     ) -> None:
         super().__init__()
         self.__action_processor = action_processor
         self.__i18n_provider = i18n_provider
         self.__log = logger_factory.create(type(self))
         self.__execution_context_factory = execution_context_factory
-        self.__workflow_execution_rules = workflow_execution_rules
+        self.__rule_pipeline = ExecutionRulePipeline(workflow_execution_rules)
+        self.__unit_of_work_provider = unit_of_work_provider
 
     async def process(self, interaction: TInteraction) -> None:
         execution_data = {}
-        with self.__execution_context_factory.create("Processed interactable", "Parent", execution_data) as context:
+        # Entities loaded during the interaction are reused instead of being loaded repeatedly.
+        with (
+            self.__unit_of_work_provider.create_identity_map_scope(),
+            self.__execution_context_factory.create("Processed interactable", "Parent", execution_data) as context
+        ):
             try:
                 await self.__process_interaction(interaction, context, execution_data)
             except hikari.ClientHTTPResponseError as error:
@@ -184,7 +192,7 @@ class InteractionProcessorBase(
                 return
 
         with execution_context.start("Rules checked"):
-            if await self.__try_halt_by_rule(interaction, workflow, interactable, context):
+            if await self.__try_halt_by_rule(interaction, workflow, interactable, context, execution_context):
                 execution_data["halt_reason"] = "rule"
                 return
 
@@ -287,30 +295,30 @@ class InteractionProcessorBase(
         interaction: TInteraction,
         workflow: IWorkflow,
         interactable: TInteractable,
-        context: InteractionContext
+        context: InteractionContext,
+        execution_context: IExecutionContext
     ) -> bool:
-        for rule in self.__workflow_execution_rules:
-            should_halt, message = await rule.should_halt(workflow, interactable, context)
-            if should_halt:
-                self.__log.debug(
-                    "Interactable has been halted",
-                    interactable=str(interactable),
-                    user_id=context.author_id,
-                    rule=type(rule).__name__
-                )
-                await self.__action_processor.process(
-                    interaction,
-                    ReplyAction(
-                        content=message or self.__i18n_provider.get(
-                            "interactions.halted_interaction_error"
-                        )
-                    ),
-                    DeferType.NONE,
-                    True
-                )
-                return True
+        result = await self.__rule_pipeline.evaluate(workflow, interactable, context, execution_context)
+        if not result:
+            return False
 
-        return False
+        self.__log.debug(
+            "Interactable has been halted",
+            interactable=str(interactable),
+            user_id=context.author_id,
+            rule=type(result.rule).__name__
+        )
+        await self.__action_processor.process(
+            interaction,
+            ReplyAction(
+                content=result.message or self.__i18n_provider.get(
+                    "interactions.halted_interaction_error"
+                )
+            ),
+            DeferType.NONE,
+            True
+        )
+        return True
 
     async def __try_send_error_response(
         self,
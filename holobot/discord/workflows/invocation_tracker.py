@@ -1,17 +1,44 @@
 from datetime import datetime, timedelta
 
 from holobot.discord.sdk.workflows.interactables.enums import EntityType
-from holobot.sdk.caching import ConcurrentDict
+from holobot.sdk.caching import ExpiringDict
 from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.lifecycle import IJob
+from holobot.sdk.lifecycle.models import JobSchedule
+from holobot.sdk.threading import CancellationToken
+from holobot.sdk.utils import utcnow
 from .iinvocation_tracker import IInvocationTracker
 
+_EVICTION_INTERVAL = timedelta(minutes=5)
+
+@injectable(IJob)
 @injectable(IInvocationTracker)
-class InvocationTracker(IInvocationTracker):
-    """A service used for tracking interactable invocations."""
+class InvocationTracker(IInvocationTracker, IJob):
+    """A service used for tracking interactable invocations.
+
+    The invocations are forgotten once their cooldowns elapse.
+    The ones that are never looked up again are evicted periodically.
+    """
+
+    @property
+    def name(self) -> str:
+        return "invocation_eviction"
+
+    @property
+    def schedule(self) -> JobSchedule:
+        return JobSchedule(interval=_EVICTION_INTERVAL, initial_delay=_EVICTION_INTERVAL)
+
+    @property
+    def size(self) -> int:
+        return self.__invocations.size
+
+    @property
+    def eviction_count(self) -> int:
+        return self.__invocations.eviction_count
 
     def __init__(self) -> None:
         super().__init__()
-        self.__cache = ConcurrentDict[EntityType, ConcurrentDict[str, datetime]]()
+        self.__invocations = ExpiringDict[tuple[EntityType, str], datetime]()
 
     async def update_invocation(
         self,
@@ -20,28 +47,13 @@ class InvocationTracker(IInvocationTracker):
         invoked_at: datetime,
         expires_after: timedelta
     ) -> datetime | None:
-        entities = await self.__cache.get_or_add3(entity_type, lambda _: ConcurrentDict())
-        old_value, _ = await entities.add_or_update3(
-            entity_id,
-            lambda key, new_value: new_value[0],
-            lambda key, old_value, new_value: InvocationTracker.__get_new_value(
-                old_value,
-                new_value[0],
-                new_value[1]
-            ),
-            (invoked_at, expires_after)
+        # The check and the update happen without yielding to the event loop.
+        return self.__invocations.get_or_add(
+            (entity_type, entity_id),
+            invoked_at,
+            invoked_at + expires_after,
+            invoked_at
         )
 
-        return old_value if isinstance(old_value, datetime) else None
-
-    @staticmethod
-    def __get_new_value(
-        last_invoked_at: datetime,
-        invoked_at: datetime,
-        expires_after: timedelta
-    ) -> datetime:
-        return (
-            last_invoked_at
-            if (last_invoked_at + expires_after - invoked_at).total_seconds() > 0
-            else invoked_at
-        )
+    async def run(self, token: CancellationToken) -> None:
+        self.__invocations.evict_expired(utcnow())
@@ -1 +1,2 @@
 from .interaction_descriptor import InteractionDescriptor
+from .rule_halt_result import RuleHaltResult
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from holobot.discord.sdk.workflows.rules import IWorkflowExecutionRule
+
+@dataclass(kw_only=True, frozen=True)
+class RuleHaltResult:
+    rule: IWorkflowExecutionRule
+    """The rule that halted the interaction."""
+
+    message: str | None
+    """The optional response message provided by the rule."""
@@ -17,6 +17,7 @@ from holobot.discord.workflows import (
     IInteractionProcessor, InteractionProcessorBase, IWorkflowRegistry
 )
 from holobot.discord.workflows.models import InteractionDescriptor
+from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.diagnostics import IExecutionContextFactory
 from holobot.sdk.exceptions import ArgumentError
 from holobot.sdk.i18n import II18nProvider
@@ -32,9 +33,10 @@ class AutocompleteProcessor(InteractionProcessorBase[hikari.AutocompleteInteract
         i18n_provider: II18nProvider,
         log: ILoggerFactory,
         measurement_context_factory: IExecutionContextFactory,
+        unit_of_work_provider: IUnitOfWorkProvider,
         workflow_registry: IWorkflowRegistry
     ) -> None:
-        super().__init__(action_processor, i18n_provider, log, measurement_context_factory, ())
+        super().__init__(action_processor, i18n_provider, log, measurement_context_factory, (), unit_of_work_provider)
         self.__workflow_registry = workflow_registry
 
     def _get_interactable_descriptor(
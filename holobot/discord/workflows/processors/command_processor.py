@@ -16,6 +16,7 @@ from holobot.discord.workflows import (
     IInteractionProcessor, InteractionProcessorBase, IWorkflowRegistry
 )
 from holobot.discord.workflows.models import InteractionDescriptor
+from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.diagnostics import IExecutionContextFactory
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
@@ -31,10 +32,18 @@ class CommandProcessor(InteractionProcessorBase[hikari.CommandInteraction, Comma
         i18n_provider: II18nProvider,
         log: ILoggerFactory,
         measurement_context_factory: IExecutionContextFactory,
+        unit_of_work_provider: IUnitOfWorkProvider,
         workflow_execution_rules: tuple[IWorkflowExecutionRule, ...],
         workflow_registry: IWorkflowRegistry
     ) -> None:
-        super().__init__(action_processor, i18n_provider, log, measurement_context_factory, workflow_execution_rules)
+        super().__init__(
+            action_processor,
+            i18n_provider,
+            log,
+            measurement_context_factory,
+            workflow_execution_rules,
+            unit_of_work_provider
+        )
         self.__event_listeners = sorted(event_listeners, key=lambda i: i.priority)
         self.__workflow_registry = workflow_registry
 
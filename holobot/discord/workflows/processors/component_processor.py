@@ -19,6 +19,7 @@ from holobot.discord.workflows import (
 )
 from holobot.discord.workflows.models import InteractionDescriptor
 from holobot.discord.workflows.transformers import IComponentTransformer
+from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.diagnostics import IExecutionContextFactory
 from holobot.sdk.exceptions import InvalidOperationError
 from holobot.sdk.i18n import II18nProvider
@@ -36,10 +37,18 @@ class ComponentProcessor(InteractionProcessorBase[hikari.ComponentInteraction, C
         i18n_provider: II18nProvider,
         log: ILoggerFactory,
         measurement_context_factory: IExecutionContextFactory,
+        unit_of_work_provider: IUnitOfWorkProvider,
         workflow_execution_rules: tuple[IWorkflowExecutionRule, ...],
         workflow_registry: IWorkflowRegistry
     ) -> None:
-        super().__init__(action_processor, i18n_provider, log, measurement_context_factory, workflow_execution_rules)
+        super().__init__(
+            action_processor,
+            i18n_provider,
+            log,
+            measurement_context_factory,
+            workflow_execution_rules,
+            unit_of_work_provider
+        )
         self.__component_transformer = component_transformer
         self.__event_listeners = sorted(event_listeners, key=lambda i: i.priority)
         self.__workflow_registry = workflow_registry
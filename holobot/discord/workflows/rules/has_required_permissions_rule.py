@@ -21,6 +21,10 @@ class HasRequiredPermissionsRule(IWorkflowExecutionRule):
         super().__init__()
         self.__member_data_provider: IMemberDataProvider = member_data_provider
 
+    @property
+    def priority(self) -> int:
+        return 20
+
     async def should_halt(
         self,
         workflow: IWorkflow,
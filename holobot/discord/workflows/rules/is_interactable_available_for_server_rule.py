@@ -26,6 +26,14 @@ class IsInteractableAvailableForServerRule(IWorkflowExecutionRule):
         self.__i18n_provider = i18n_provider
         self.__authorization_data_provider = authorization_data_provider
 
+    @property
+    def priority(self) -> int:
+        return 10
+
+    @property
+    def is_io_bound(self) -> bool:
+        return False
+
     async def should_halt(
         self,
         workflow: IWorkflow,
@@ -30,6 +30,15 @@ class IsInteractableOnCooldownRule(IWorkflowExecutionRule):
         self.__i18n_provider = i18n_provider
         self.__invocation_tracker = invocation_tracker
 
+    @property
+    def priority(self) -> int:
+        return 100
+
+    @property
+    def has_side_effects(self) -> bool:
+        # An invocation is recorded only if the interaction is executed.
+        return True
+
     async def should_halt(
         self,
         workflow: IWorkflow,
@@ -506,12 +506,14 @@ class ComponentTransformer(IComponentTransformer):
 
         previous_button_custom_data = {
             "page": str(control.current_page - 1),
-            **control.custom_data
+            **control.custom_data,
+            **control.previous_page_custom_data
         }
 
         next_button_custom_data = {
             "page": str(control.current_page + 1),
-            **control.custom_data
+            **control.custom_data,
+            **control.next_page_custom_data
         }
 
         # TODO Use the counter value?
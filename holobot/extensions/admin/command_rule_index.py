@@ -0,0 +1,173 @@
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from holobot.sdk.exceptions import ArgumentError
+from .models import CommandRule
+
+_RuleKey = tuple[int | None, str | None, str | None, str | None]
+
+class _ServerRuleIndex:
+    def __init__(self, rules: Iterable[CommandRule]) -> None:
+        super().__init__()
+        self.rules: dict[_RuleKey, CommandRule] = {
+            (rule.channel_id, rule.group, rule.subgroup, rule.command): rule
+            for rule in rules
+        }
+
+    def resolve(
+        self,
+        channel_id: int,
+        group: str | None,
+        subgroup: str | None,
+        command: str
+    ) -> CommandRule | None:
+        # The same combinations the database query would match.
+        patterns: list[tuple[str | None, str | None, str | None]] = [(None, None, None)]
+        if group is not None:
+            patterns.append((group, None, None))
+        if subgroup is not None:
+            patterns.append((group, subgroup, None))
+        patterns.append((group, subgroup, command))
+
+        best_rule: CommandRule | None = None
+        for channel_key in (None, channel_id):
+            for group_key, subgroup_key, command_key in patterns:
+                rule = self.rules.get((channel_key, group_key, subgroup_key, command_key))
+                if rule and (best_rule is None or best_rule < rule):
+                    best_rule = rule
+
+        return best_rule
+
+    def get_memory_footprint(self) -> int:
+        return (
+            sys.getsizeof(self.rules)
+            + sum(sys.getsizeof(key) + sys.getsizeof(rule) for key, rule in self.rules.items())
+        )
+
+class CommandRuleIndex:
+    """A bounded, least recently used collection of compiled per-server command rule lookups.
+
+    The index of a server is a dictionary keyed by (channel, group, subgroup, command),
+    which makes resolving the effective rule of a command a dictionary walk.
+    """
+
+    @property
+    def server_count(self) -> int:
+        """Gets the number of servers currently indexed.
+
+        :return: The number of indexed servers.
+        :rtype: int
+        """
+
+        return len(self.__servers)
+
+    @property
+    def rule_count(self) -> int:
+        """Gets the number of rules currently indexed across all servers.
+
+        :return: The number of indexed rules.
+        :rtype: int
+        """
+
+        return sum(len(index.rules) for index in self.__servers.values())
+
+    @property
+    def generation(self) -> int:
+        """Gets a value that changes whenever any of the indexes is invalidated.
+
+        This can be used for detecting invalidations that occurred while the rules were loaded.
+
+        :return: The current generation of the index.
+        :rtype: int
+        """
+
+        return self.__generation
+
+    def __init__(self, max_server_count: int) -> None:
+        super().__init__()
+        if max_server_count < 1:
+            raise ArgumentError("max_server_count", "Value must be positive.")
+
+        self.__max_server_count = max_server_count
+        self.__servers = OrderedDict[int, _ServerRuleIndex]()
+        self.__generation = 0
+
+    def contains(self, server_id: int) -> bool:
+        """Determines whether the specified server is indexed.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :return: True, if the server is indexed.
+        :rtype: bool
+        """
+
+        return server_id in self.__servers
+
+    def add(self, server_id: int, rules: Iterable[CommandRule]) -> None:
+        """Compiles and adds the index of the specified server.
+
+        If the maximum number of servers is reached, the least recently used index is evicted.
+
+        :param server_id: The identifier of the server.
+        :type server_id: int
+        :param rules: Every rule of the server.
+        :type rules: Iterable[CommandRule]
+        """
+
+        self.__servers[server_id] = _ServerRuleIndex(rules)
+        self.__servers.move_to_end(server_id)
+        while len(self.__servers) > self.__max_server_count:
+            self.__servers.popitem(last=False)
+
+    def resolve(
+        self,
+        server_id: int,
+        channel_id: int,
+        group: str | None,
+        subgroup: str | None,
+        command: str
+    ) -> CommandRule | None:
+        """Resolves the effective rule of the specified command.
+
+        :param server_id: The identifier of the server. Must be indexed.
+        :type server_id: int
+        :param channel_id: The identifier of the channel.
+        :type channel_id: int
+        :param group: The name of the command group, if any.
+        :type group: str | None
+        :param subgroup: The name of the command subgroup, if any.
+        :type subgroup: str | None
+        :param command: The name of the command.
+        :type command: str
+        :return: If any, the rule with the highest precedence.
+        :rtype: CommandRule | None
+        """
+
+        index = self.__servers[server_id]
+        self.__servers.move_to_end(server_id)
+        return index.resolve(channel_id, group, subgroup, command)
+
+    def invalidate(self, server_id: int | None = None) -> None:
+        """Invalidates the index of the specified server or, if not specified, of every server.
+
+        :param server_id: The identifier of the server, defaults to None
+        :type server_id: int | None, optional
+        """
+
+        self.__generation += 1
+        if server_id is None:
+            self.__servers.clear()
+        else:
+            self.__servers.pop(server_id, None)
+
+    def get_memory_footprint(self) -> int:
+        """Gets the approximate memory footprint of the indexed rules.
+
+        :return: The approximate size in bytes.
+        :rtype: int
+        """
+
+        return sys.getsizeof(self.__servers) + sum(
+            index.get_memory_footprint() for index in self.__servers.values()
+        )
@@ -1,19 +1,31 @@
+from holobot.sdk.configs import IOptions
 from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.logging import ILoggerFactory
+from holobot.sdk.logging.enums import LogLevel
 from holobot.sdk.queries import PaginationResult
 from holobot.sdk.utils.exception_utils import assert_not_none
 from .command_registry_interface import CommandRegistryInterface
+from .command_rule_index import CommandRuleIndex
 from .command_rule_manager_interface import CommandRuleManagerInterface
 from .enums import RuleState
 from .exceptions import InvalidCommandError
-from .models import CommandRule
+from .models import CommandOptions, CommandRule
 from .repositories import ICommandRuleRepository
 
 @injectable(CommandRuleManagerInterface)
 class CommandRuleManager(CommandRuleManagerInterface):
-    def __init__(self, command_registry: CommandRegistryInterface, rule_repository: ICommandRuleRepository) -> None:
+    def __init__(
+        self,
+        command_registry: CommandRegistryInterface,
+        logger_factory: ILoggerFactory,
+        options: IOptions[CommandOptions],
+        rule_repository: ICommandRuleRepository
+    ) -> None:
         super().__init__()
+        self.__log = logger_factory.create(CommandRuleManager)
         self.__repository: ICommandRuleRepository = rule_repository
         self.__registry: CommandRegistryInterface = command_registry
+        self.__index = CommandRuleIndex(options.value.RuleIndexMaxServerCount)
 
     async def get_rules_by_server(self, server_id: int, page_index: int, page_size: int, group: str | None = None, subgroup: str | None = None) -> PaginationResult[CommandRule]:
         assert_not_none(server_id, "server_id")
@@ -38,16 +50,26 @@ class CommandRuleManager(CommandRuleManagerInterface):
             if not (group := self.__registry.get_group(rule.group)) or not group.CanDisable:
                 raise InvalidCommandError(rule.command, rule.group, rule.subgroup)
 
-        rule.identifier = await self.__repository.add_or_update(rule)
+        try:
+            rule.identifier = await self.__repository.add_or_update(rule)
+        finally:
+            self.__index.invalidate(rule.server_id)
         return rule.identifier
 
     async def remove_rule(self, rule_id: int) -> None:
-        await self.__repository.delete(rule_id)
+        rule = await self.__repository.get(rule_id)
+        try:
+            await self.__repository.delete(rule_id)
+        finally:
+            self.__index.invalidate(rule.server_id if rule else None)
 
     async def remove_rules_by_server(self, server_id: int) -> None:
         assert_not_none(server_id, "server_id")
 
-        await self.__repository.delete_by_server(server_id)
+        try:
+            await self.__repository.delete_by_server(server_id)
+        finally:
+            self.__index.invalidate(server_id)
 
     async def can_execute(self, server_id: int, channel_id: int, group: str | None, subgroup: str | None, command: str) -> bool:
         assert_not_none(server_id, "server_id")
@@ -58,6 +80,32 @@ class CommandRuleManager(CommandRuleManagerInterface):
         if not command_config or not command_config.CanDisable:
             return True
 
-        rules = await self.__repository.get_relevant(server_id, channel_id, group, subgroup, command)
-        sorted_rules = sorted(rules, reverse=True)
-        return not sorted_rules or sorted_rules[0].state is RuleState.ALLOW
+        if not self.__index.contains(server_id):
+            await self.__build_index(server_id)
+            # The index may have been invalidated while the rules were being loaded.
+            if not self.__index.contains(server_id):
+                rules = await self.__repository.get_relevant(server_id, channel_id, group, subgroup, command)
+                sorted_rules = sorted(rules, reverse=True)
+                return not sorted_rules or sorted_rules[0].state is RuleState.ALLOW
+
+        rule = self.__index.resolve(server_id, channel_id, group, subgroup, command)
+        return not rule or rule.state is RuleState.ALLOW
+
+    async def __build_index(self, server_id: int) -> None:
+        generation = self.__index.generation
+        rules = await self.__repository.get_by_server(server_id)
+        if generation != self.__index.generation:
+            return
+
+        self.__index.add(server_id, rules)
+        if not self.__log.is_log_level_enabled(LogLevel.DEBUG):
+            return
+
+        self.__log.debug(
+            "Indexed command rules",
+            server_id=server_id,
+            rule_count=len(rules),
+            indexed_server_count=self.__index.server_count,
+            indexed_rule_count=self.__index.rule_count,
+            memory_footprint=self.__index.get_memory_footprint()
+        )
@@ -9,3 +9,6 @@ class CommandOptions(OptionsDefinition):
     section_name: ClassVar[str] = "Admin"
 
     CommandGroups: list[GroupConfiguration] = field(default_factory=list)
+
+    RuleIndexMaxServerCount: int = 1000
+    """The maximum number of servers whose command rules are indexed in memory."""
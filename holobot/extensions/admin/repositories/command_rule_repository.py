@@ -58,6 +58,7 @@ class CommandRuleRepository(
                 ("channel_id", Equality.EQUAL, rule.channel_id)
             ).returning().column("id").compile().fetchval(session.connection)
             if id is not None:
+                await self._invalidate_model(id)
                 return id
 
             id = await Query.insert().in_table(self.table_name).fields(
@@ -97,6 +98,11 @@ class CommandRuleRepository(
             get_filter
         )
 
+    def get_by_server(self, server_id: int) -> Awaitable[tuple[CommandRule, ...]]:
+        return self._get_many_by_filter(
+            lambda where: where.field("server_id", Equality.EQUAL, server_id)
+        )
+
     async def get_relevant(
         self,
         server_id: int,
@@ -151,10 +157,7 @@ class CommandRuleRepository(
                 )
             ).compile().fetch(session.connection)
 
-            return tuple(
-                self._map_record_to_model(self._map_query_result_to_record(record))
-                for record in records
-            )
+            return self._map_query_results_to_models(records)
 
     def delete_by_server(self, server_id: int) -> Awaitable[int]:
         return self._delete_by_filter(
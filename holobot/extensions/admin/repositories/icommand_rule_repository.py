@@ -22,6 +22,9 @@ class ICommandRuleRepository(
     ) -> Awaitable[PaginationResult[CommandRule]]:
         ...
 
+    def get_by_server(self, server_id: int) -> Awaitable[tuple[CommandRule, ...]]:
+        ...
+
     def get_relevant(
         self,
         server_id: int,
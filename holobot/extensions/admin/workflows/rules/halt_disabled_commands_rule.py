@@ -12,6 +12,10 @@ class HaltDisabledCommandsRule(IWorkflowExecutionRule):
         super().__init__()
         self.__rule_manager: CommandRuleManagerInterface = command_rule_manager
 
+    @property
+    def priority(self) -> int:
+        return 40
+
     async def should_halt(
         self,
         workflow: IWorkflow,
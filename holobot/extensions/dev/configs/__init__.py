@@ -0,0 +1 @@
+from .dev_options import DevOptions
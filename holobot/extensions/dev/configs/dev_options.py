@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from holobot.sdk.configs import OptionsDefinition
+
+@dataclass
+class DevOptions(OptionsDefinition):
+    section_name: ClassVar[str] = "Dev"
+
+    FeatureStateCacheDuration: int = 60
+    """The time, in seconds, for which the feature states are served from memory."""
@@ -1,5 +1,10 @@
+from datetime import timedelta
+
+from holobot.extensions.dev.configs import DevOptions
 from holobot.extensions.dev.models import FeatureState
 from holobot.extensions.dev.repositories import IFeatureStateRepository
+from holobot.sdk.configs import IOptions
+from holobot.sdk.database.repositories import EntitySnapshot
 from holobot.sdk.ioc.decorators import injectable
 from .imaintenance_manager import IMaintenanceManager
 
@@ -9,23 +14,31 @@ class MaintenanceManager(IMaintenanceManager):
 
     def __init__(
         self,
-        feature_state_repository: IFeatureStateRepository
+        feature_state_repository: IFeatureStateRepository,
+        options: IOptions[DevOptions]
     ) -> None:
         super().__init__()
         self.__feature_state_repository = feature_state_repository
+        self.__feature_states = EntitySnapshot[str, FeatureState](
+            feature_state_repository.get_all,
+            timedelta(seconds=options.value.FeatureStateCacheDuration)
+        )
 
     async def is_maintenance_mode_enabled(self) -> bool:
-        feature_state = await self.__feature_state_repository.get(MaintenanceManager._FEATURE_NAME)
+        feature_state = await self.__feature_states.get(MaintenanceManager._FEATURE_NAME)
         return feature_state.is_enabled if feature_state else False
 
     async def set_maintenance_mode(self, is_enabled: bool) -> None:
-        feature_state = await self.__feature_state_repository.get(MaintenanceManager._FEATURE_NAME)
-        if feature_state:
-            feature_state.is_enabled = is_enabled
-            await self.__feature_state_repository.update(feature_state)
-            return
+        try:
+            feature_state = await self.__feature_state_repository.get(MaintenanceManager._FEATURE_NAME)
+            if feature_state:
+                feature_state.is_enabled = is_enabled
+                await self.__feature_state_repository.update(feature_state)
+                return
 
-        await self.__feature_state_repository.add(FeatureState(
-            identifier=MaintenanceManager._FEATURE_NAME,
-            is_enabled=is_enabled
-        ))
+            await self.__feature_state_repository.add(FeatureState(
+                identifier=MaintenanceManager._FEATURE_NAME,
+                is_enabled=is_enabled
+            ))
+        finally:
+            self.__feature_states.invalidate()
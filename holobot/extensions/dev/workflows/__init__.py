@@ -1,5 +1,8 @@
 from .components_v2_demo import ComponentsV2Demo
+from .manage_jobs_workflow import ManageJobsWorkflow
 from .reload_i18n_workflow import ReloadI18nWorkflow
+from .set_authorization_workflow import SetAuthorizationWorkflow
 from .set_log_level_workflow import SetLogLevelWorkflow
 from .set_operating_mode_workflow import SetOperatingModeWorkflow
 from .show_available_servers_workflow import ShowAvailableServersWorkflow
+from .show_database_statistics_workflow import ShowDatabaseStatisticsWorkflow
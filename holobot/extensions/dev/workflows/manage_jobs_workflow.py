@@ -0,0 +1,97 @@
+from holobot.discord.sdk.enums import Permission
+from holobot.discord.sdk.models import Embed, EmbedField, InteractionContext
+from holobot.discord.sdk.workflows import IWorkflow, WorkflowBase
+from holobot.discord.sdk.workflows.interactables.decorators import command
+from holobot.discord.sdk.workflows.interactables.models import InteractionResponse, Option
+from holobot.discord.sdk.workflows.interactables.restrictions import FeatureRestriction
+from holobot.extensions.dev.constants import DEV_FEATURE_NAME
+from holobot.sdk.exceptions import ArgumentError
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.lifecycle import IJobScheduler
+from holobot.sdk.lifecycle.models import JobStatistics
+
+@injectable(IWorkflow)
+class ManageJobsWorkflow(WorkflowBase):
+    def __init__(
+        self,
+        job_scheduler: IJobScheduler
+    ) -> None:
+        super().__init__(
+            required_permissions=Permission.ADMINISTRATOR
+        )
+        self.__job_scheduler = job_scheduler
+
+    @command(
+        description="Displays information about the background jobs.",
+        name="jobs",
+        group_name="dev",
+        restrictions=(FeatureRestriction(feature_name=DEV_FEATURE_NAME),)
+    )
+    async def show_jobs(
+        self,
+        context: InteractionContext
+    ) -> InteractionResponse:
+        job_statistics = self.__job_scheduler.get_statistics()
+        return self._reply(
+            embed=Embed(
+                title="Background jobs",
+                description=None if job_statistics else "There are no registered jobs.",
+                fields=[
+                    ManageJobsWorkflow.__create_job_field(statistics)
+                    for statistics in job_statistics
+                ]
+            )
+        )
+
+    @command(
+        description="Runs a background job immediately.",
+        name="runjob",
+        group_name="dev",
+        options=(
+            Option("name", "The name of the job."),
+        ),
+        restrictions=(FeatureRestriction(feature_name=DEV_FEATURE_NAME),)
+    )
+    async def run_job(
+        self,
+        context: InteractionContext,
+        name: str
+    ) -> InteractionResponse:
+        try:
+            is_triggered = self.__job_scheduler.trigger(name)
+        except ArgumentError:
+            return self._reply(content=f"There is no job named '{name}'.")
+
+        return self._reply(
+            content=f"Triggered job '{name}'."
+            if is_triggered
+            else f"Job '{name}' is disabled or still running."
+        )
+
+    @staticmethod
+    def __create_job_field(statistics: JobStatistics) -> EmbedField:
+        if not statistics.is_enabled:
+            status = "disabled"
+        elif statistics.is_running:
+            status = "running"
+        else:
+            status = "idle"
+
+        durations = statistics.durations
+        lines = [
+            f"Status: {status}",
+            f"Runs: {statistics.run_count}, failures: {statistics.failure_count}"
+            f", timeouts: {statistics.timeout_count}, skipped: {statistics.skipped_count}"
+        ]
+        if durations.count:
+            lines.append(
+                f"Duration: mean {durations.mean:.2f} ms"
+                f", p95 {durations.get_percentile(95):.2f} ms"
+                f", max {durations.maximum:.2f} ms"
+            )
+        if statistics.last_started_at:
+            lines.append(f"Last run: <t:{int(statistics.last_started_at.timestamp())}:R>")
+        if statistics.next_run_at and statistics.is_enabled:
+            lines.append(f"Next run: <t:{int(statistics.next_run_at.timestamp())}:R>")
+
+        return EmbedField(statistics.name, "\n".join(lines), is_inline=False)
@@ -17,6 +17,14 @@ class IsMaintenanceModeEnabledRule(IWorkflowExecutionRule):
         self.__i18n_provider = i18n_provider
         self.__maintenance_manager = maintenance_manager
 
+    @property
+    def priority(self) -> int:
+        return 0
+
+    @property
+    def is_io_bound(self) -> bool:
+        return False
+
     async def should_halt(
         self,
         workflow: IWorkflow,
@@ -0,0 +1,76 @@
+from holobot.discord.sdk.authorization import IAuthorizationDataProvider
+from holobot.discord.sdk.enums import Permission
+from holobot.discord.sdk.models import InteractionContext
+from holobot.discord.sdk.workflows import IWorkflow, WorkflowBase
+from holobot.discord.sdk.workflows.interactables.decorators import command
+from holobot.discord.sdk.workflows.interactables.enums import OptionType
+from holobot.discord.sdk.workflows.interactables.models import Choice, InteractionResponse, Option
+from holobot.discord.sdk.workflows.interactables.restrictions import FeatureRestriction
+from holobot.extensions.dev.constants import DEV_FEATURE_NAME
+from holobot.sdk.i18n import II18nProvider
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.logging import ILoggerFactory
+
+_STATUS_REMOVED = -1
+
+@injectable(IWorkflow)
+class SetAuthorizationWorkflow(WorkflowBase):
+    def __init__(
+        self,
+        authorization_data_provider: IAuthorizationDataProvider,
+        i18n_provider: II18nProvider,
+        logger_factory: ILoggerFactory
+    ) -> None:
+        super().__init__(
+            required_permissions=Permission.ADMINISTRATOR
+        )
+        self.__authorization_data_provider = authorization_data_provider
+        self.__i18n_provider = i18n_provider
+        self.__logger = logger_factory.create(SetAuthorizationWorkflow)
+
+    @command(
+        description="Sets the authorization of a server for a feature.",
+        name="setauth",
+        group_name="dev",
+        options=(
+            Option("feature", "The name of the feature."),
+            Option("server_id", "The identifier of the server."),
+            Option("status", "The new status of the authorization.", OptionType.INTEGER, choices=(
+                Choice("Allowed", 1),
+                Choice("Denied", 0),
+                Choice("Removed", _STATUS_REMOVED)
+            ))
+        ),
+        restrictions=(FeatureRestriction(feature_name=DEV_FEATURE_NAME),)
+    )
+    async def set_authorization(
+        self,
+        context: InteractionContext,
+        feature: str,
+        server_id: str,
+        status: int
+    ) -> InteractionResponse:
+        # Server identifiers exceed the range of integer options.
+        if not server_id.isdigit():
+            return self._reply(
+                content=self.__i18n_provider.get(
+                    "extensions.dev.set_authorization_workflow.invalid_server_id_error"
+                )
+            )
+
+        await self.__authorization_data_provider.set_authorization(
+            feature,
+            int(server_id),
+            None if status == _STATUS_REMOVED else bool(status)
+        )
+        self.__logger.info(
+            "Changed authorization",
+            feature_name=feature,
+            server_id=server_id,
+            status=status
+        )
+        return self._reply(
+            content=self.__i18n_provider.get(
+                "extensions.dev.set_authorization_workflow.authorization_changed"
+            )
+        )
@@ -0,0 +1,109 @@
+from holobot.discord.sdk.enums import Permission
+from holobot.discord.sdk.models import Embed, EmbedField, InteractionContext
+from holobot.discord.sdk.workflows import IWorkflow, WorkflowBase
+from holobot.discord.sdk.workflows.interactables.decorators import command
+from holobot.discord.sdk.workflows.interactables.models import InteractionResponse
+from holobot.discord.sdk.workflows.interactables.restrictions import FeatureRestriction
+from holobot.extensions.dev.constants import DEV_FEATURE_NAME
+from holobot.sdk.database import IDatabaseManager
+from holobot.sdk.database.queries import IQueryTracer
+from holobot.sdk.database.queries.models import QueryShapeStatistics
+from holobot.sdk.diagnostics import Histogram
+from holobot.sdk.ioc.decorators import injectable
+
+_TOP_QUERY_SHAPE_COUNT = 10
+_MAX_QUERY_LENGTH = 300
+
+@injectable(IWorkflow)
+class ShowDatabaseStatisticsWorkflow(WorkflowBase):
+    def __init__(
+        self,
+        database_manager: IDatabaseManager,
+        query_tracer: IQueryTracer
+    ) -> None:
+        super().__init__(
+            required_permissions=Permission.ADMINISTRATOR
+        )
+        self.__database_manager = database_manager
+        self.__query_tracer = query_tracer
+
+    @command(
+        description="Displays information about the database connection pool.",
+        name="dbstats",
+        group_name="dev",
+        restrictions=(FeatureRestriction(feature_name=DEV_FEATURE_NAME),)
+    )
+    async def show_database_statistics(
+        self,
+        context: InteractionContext
+    ) -> InteractionResponse:
+        statistics = self.__database_manager.get_pool_statistics()
+        return self._reply(
+            embed=Embed(
+                title="Database connection pool",
+                fields=[
+                    EmbedField("Size", f"{statistics.size} ({statistics.min_size}-{statistics.max_size})"),
+                    EmbedField("In use", str(statistics.in_use_count)),
+                    EmbedField("Idle", str(statistics.idle_count)),
+                    EmbedField("Acquisitions", str(statistics.acquisition_count)),
+                    EmbedField("Timeouts", str(statistics.acquisition_timeout_count)),
+                    EmbedField(
+                        "Acquire wait time",
+                        ShowDatabaseStatisticsWorkflow.__format_histogram(statistics.acquire_wait_times),
+                        is_inline=False
+                    )
+                ]
+            )
+        )
+
+    @command(
+        description="Displays the queries with the highest total execution time.",
+        name="dbqueries",
+        group_name="dev",
+        restrictions=(FeatureRestriction(feature_name=DEV_FEATURE_NAME),)
+    )
+    async def show_top_queries(
+        self,
+        context: InteractionContext
+    ) -> InteractionResponse:
+        query_shapes = self.__query_tracer.get_top_query_shapes(_TOP_QUERY_SHAPE_COUNT)
+        return self._reply(
+            embed=Embed(
+                title="Top queries by total time",
+                description=None if query_shapes else "No queries have been recorded yet.",
+                fields=[
+                    ShowDatabaseStatisticsWorkflow.__create_query_shape_field(index, query_shape)
+                    for index, query_shape in enumerate(query_shapes, 1)
+                ]
+            )
+        )
+
+    @staticmethod
+    def __create_query_shape_field(index: int, query_shape: QueryShapeStatistics) -> EmbedField:
+        query = " ".join(query_shape.query.split())
+        if len(query) > _MAX_QUERY_LENGTH:
+            query = f"{query[:_MAX_QUERY_LENGTH - 3]}..."
+
+        return EmbedField(
+            f"#{index} - {query_shape.total_elapsed_time:.2f} ms in {query_shape.elapsed_times.count} calls",
+            (
+                f"```sql\n{query}\n```"
+                f"{ShowDatabaseStatisticsWorkflow.__format_histogram(query_shape.elapsed_times)}\n"
+                f"{query_shape.mean_row_count:.1f} rows/call, {query_shape.argument_count} arguments"
+                f", {query_shape.slow_execution_count} slow"
+            ),
+            is_inline=False
+        )
+
+    @staticmethod
+    def __format_histogram(histogram: Histogram) -> str:
+        if not histogram.count:
+            return "N/A"
+
+        return (
+            f"mean {histogram.mean:.2f} ms"
+            f", p50 {histogram.get_percentile(50):.2f} ms"
+            f", p95 {histogram.get_percentile(95):.2f} ms"
+            f", p99 {histogram.get_percentile(99):.2f} ms"
+            f", max {histogram.maximum:.2f} ms"
+        )
@@ -1,24 +1,31 @@
 import asyncio
-from collections.abc import Awaitable
 from datetime import timedelta
 
 from holobot.discord.sdk.exceptions import ChannelNotFoundError, ForbiddenError, ServerNotFoundError
 from holobot.discord.sdk.servers.managers import IChannelManager
 from holobot.extensions.general.models import ChannelTimer
 from holobot.extensions.general.repositories import IChannelTimerRepository
+from holobot.sdk.concurrency import AsyncRateLimiter
 from holobot.sdk.ioc import injectable
-from holobot.sdk.lifecycle import IStartable
+from holobot.sdk.lifecycle import IJob
+from holobot.sdk.lifecycle.models import JobSchedule
 from holobot.sdk.logging import ILoggerFactory
 from holobot.sdk.logging.enums.log_level import LogLevel
-from holobot.sdk.threading import CancellationToken, CancellationTokenSource
-from holobot.sdk.threading.utils import COMPLETED_TASK, wait
+from holobot.sdk.threading import CancellationToken
 from holobot.sdk.utils.datetime_utils import utcnow
 from holobot.sdk.utils.timedelta_utils import format_timedelta
 
 _REFRESH_INTERVAL: timedelta = timedelta(minutes=5)
+# The renames are spread over most of the interval, leaving time for the last ones to finish.
+_RENAME_PERIOD: timedelta = _REFRESH_INTERVAL * 0.8
+_PAGE_SIZE: int = 100
+_MAX_CONCURRENT_RENAMES: int = 5
+# Discord allows renaming a channel twice per ten minutes.
+_CHANNEL_RENAMES_PER_INTERVAL: int = 2
+_CHANNEL_RENAME_INTERVAL: timedelta = timedelta(minutes=10)
 
-@injectable(IStartable)
-class ChannelTimerProcessor(IStartable):
+@injectable(IJob)
+class ChannelTimerProcessor(IJob):
     def __init__(
         self,
         channel_manager: IChannelManager,
@@ -29,55 +36,87 @@ class ChannelTimerProcessor(IStartable):
         self.__logger = logger_factory.create(ChannelTimerProcessor)
         self.__channel_manager = channel_manager
         self.__channel_timer_repository = channel_timer_repository
-        self.__token_source: CancellationTokenSource | None = None
-        self.__background_task: Awaitable[None] | None = None
+        self.__channel_names = dict[int, str]()
+        self.__channel_rate_limiters = dict[int, AsyncRateLimiter]()
 
     @property
-    def priority(self) -> int:
-        return 1000
-
-    def start(self) -> Awaitable[None]:
-        self.__logger.info("Channel timers are enabled")
-        self.__token_source = CancellationTokenSource()
-        self.__background_task = asyncio.create_task(
-            self.__process_items(self.__token_source.token)
+    def name(self) -> str:
+        return "channel_timers"
+
+    @property
+    def schedule(self) -> JobSchedule:
+        return JobSchedule(
+            interval=_REFRESH_INTERVAL,
+            initial_delay=timedelta(seconds=30),
+            max_runtime=_REFRESH_INTERVAL
         )
-        return COMPLETED_TASK
-
-    async def stop(self):
-        if self.__token_source: self.__token_source.cancel()
-        if self.__background_task:
-            try:
-                await self.__background_task
-            except asyncio.exceptions.CancelledError:
-                pass
-        self.__logger.debug("Stopped channel timer processor")
-
-    async def __process_items(self, token: CancellationToken):
-        await wait(30, token)
-        while not token.is_cancellation_requested:
-            self.__logger.trace("Processing channel timers...")
-            processed_items: int = 0
-            try:
-                page_index = 0
-                has_items = True
-                while has_items:
-                    pagination = await self.__channel_timer_repository.paginate(page_index, 5)
-                    for item in pagination.items:
-                        await self.__try_process_item(item)
-                        processed_items += 1
-
-                    has_items = pagination.total_count > (page_index + 1) * pagination.page_size
-                    page_index += 1
-            except Exception as error:
-                self.__logger.error("Unexpected failure while processing channel timers", error)
-            finally:
-                self.__logger.trace("Processed channel timers", count=processed_items)
-            await wait(int(_REFRESH_INTERVAL.total_seconds()) + 5, token)
-
-    async def __try_process_item(self, item: ChannelTimer) -> None:
+
+    async def run(self, token: CancellationToken) -> None:
+        self.__logger.trace("Processing channel timers...")
+        await self.__process_all_items()
+
+    async def __process_all_items(self) -> None:
+        # The renames are spread over the refresh interval instead of being sent in a burst.
+        total_count = await self.__channel_timer_repository.count() or 0
+        rename_delay = (_RENAME_PERIOD / max(total_count, 1)).total_seconds()
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_RENAMES)
+        rename_tasks = set[asyncio.Task[None]]()
+        channel_ids = set[int]()
+        processed_items = 0
+        renamed_items = 0
+        cursor: str | None = None
+        try:
+            while True:
+                # Each page is a separate keyset query, thus no connection is held while waiting.
+                page = await self.__channel_timer_repository.paginate_keyset(_PAGE_SIZE, cursor)
+                for item in page.items:
+                    processed_items += 1
+                    channel_ids.add(item.channel_id)
+                    channel_name = self.__render_channel_name(item)
+                    if self.__channel_names.get(item.channel_id) == channel_name:
+                        continue
+
+                    if renamed_items:
+                        await asyncio.sleep(rename_delay)
+                    await semaphore.acquire()
+                    rename_task = asyncio.create_task(self.__try_process_item(item, channel_name))
+                    rename_task.add_done_callback(lambda _: semaphore.release())
+                    rename_tasks.add(rename_task)
+                    rename_task.add_done_callback(rename_tasks.discard)
+                    renamed_items += 1
+
+                if not (cursor := page.next_cursor):
+                    break
+        finally:
+            if rename_tasks:
+                await asyncio.gather(*rename_tasks, return_exceptions=True)
+
+        self.__channel_names = {
+            channel_id: channel_name
+            for channel_id, channel_name in self.__channel_names.items()
+            if channel_id in channel_ids
+        }
+        self.__channel_rate_limiters = {
+            channel_id: rate_limiter
+            for channel_id, rate_limiter in self.__channel_rate_limiters.items()
+            if not rate_limiter.is_idle
+        }
+        self.__logger.trace("Processed channel timers", count=processed_items, renamed_count=renamed_items)
+
+    async def __try_process_item(self, item: ChannelTimer, channel_name: str) -> None:
+        if not (rate_limiter := self.__channel_rate_limiters.get(item.channel_id)):
+            rate_limiter = self.__channel_rate_limiters[item.channel_id] = AsyncRateLimiter(
+                _CHANNEL_RENAMES_PER_INTERVAL,
+                _CHANNEL_RENAME_INTERVAL
+            )
+        if not rate_limiter.try_acquire():
+            # The channel will be renamed in a later cycle, instead of blocking a rename slot.
+            self.__logger.trace("Skipped renaming a rate limited channel", channel_id=item.channel_id)
+            return
+
         try:
-            await self.__process_item(item)
+            await self.__channel_manager.change_channel_name(item.server_id, item.channel_id, channel_name)
+            self.__channel_names[item.channel_id] = channel_name
         except (ChannelNotFoundError, ServerNotFoundError, ForbiddenError) as error:
             self.__logger.warning(
                 "Failed to process a channel timer due to an unrecoverable error, will not retry",
@@ -88,8 +127,14 @@ class ChannelTimerProcessor(IStartable):
                 channel_id=item.channel_id
             )
             await self.__channel_timer_repository.delete(item.identifier)
+        except Exception as error:
+            self.__logger.error(
+                "Unexpected failure while processing a channel timer",
+                error,
+                timer_id=item.identifier
+            )
 
-    async def __process_item(self, item: ChannelTimer) -> None:
+    def __render_channel_name(self, item: ChannelTimer) -> str:
         now = utcnow()
         total_elapsed_time = now - item.base_time
         cycle_count = int(total_elapsed_time.total_seconds() / item.countdown_interval.total_seconds())
@@ -111,19 +156,15 @@ class ChannelTimerProcessor(IStartable):
 
         if (self.__logger.is_log_level_enabled(LogLevel.TRACE)):
             self.__logger.trace(
-                "Updating channel timer",
+                "Rendered channel timer",
                 server_id=item.server_id,
                 channel_id=item.channel_id,
                 name_template=time_template,
                 remaining_seconds=remaining_time.total_seconds()
             )
 
-        await self.__channel_manager.change_channel_name(
-            item.server_id,
-            item.channel_id,
-            name_template.replace(
-                "%t",
-                format_timedelta(remaining_time, "-", time_template),
-                1
-            )
+        return name_template.replace(
+            "%t",
+            format_timedelta(remaining_time, "-", time_template),
+            1
         )
@@ -2,6 +2,7 @@ from pathlib import Path
 
 from asyncpg.connection import Connection
 
+from holobot.extensions.general.enums import ItemType
 from holobot.sdk.database.migration import IMigration, MigrationBase
 from holobot.sdk.database.migration.models import MigrationPlan
 from holobot.sdk.ioc.decorators import injectable
@@ -13,6 +14,7 @@ class UserItemsMigration(MigrationBase):
             "user_items",
             (
                 MigrationPlan(202411131202, self.__initialize_table),
+                MigrationPlan(202610181200, self.__add_unique_wallet_index),
             )
         )
 
@@ -40,3 +42,32 @@ class UserItemsMigration(MigrationBase):
             connection,
             str(Path(__file__).parent.joinpath("scripts", "202411131202_migrate_data.sql").absolute())
         )
+
+    async def __add_unique_wallet_index(self, connection: Connection) -> None:
+        # Concurrent first deposits could create duplicate wallets before,
+        # which are merged into the oldest one to keep the balances intact.
+        await connection.execute(
+            "WITH ranked AS (\n"
+            " SELECT user_id, server_id, serial_id,\n"
+            "  SUM(count) OVER (PARTITION BY user_id, server_id, item_id1) AS total_count,\n"
+            "  ROW_NUMBER() OVER (PARTITION BY user_id, server_id, item_id1 ORDER BY serial_id) AS row_number\n"
+            f" FROM {self.table_name}\n"
+            f" WHERE item_type = {ItemType.CURRENCY.value}\n"
+            "), merged AS (\n"
+            f" UPDATE {self.table_name} AS ui SET\n"
+            "  count = r.total_count,\n"
+            "  item_data_json = jsonb_set(ui.item_data_json::jsonb, '{count}', to_jsonb(r.total_count))::text\n"
+            " FROM ranked AS r\n"
+            " WHERE r.row_number = 1 AND r.total_count <> ui.count\n"
+            "  AND ui.user_id = r.user_id AND ui.server_id = r.server_id AND ui.serial_id = r.serial_id\n"
+            ")\n"
+            f"DELETE FROM {self.table_name} AS ui\n"
+            "USING ranked AS r\n"
+            "WHERE r.row_number > 1\n"
+            " AND ui.user_id = r.user_id AND ui.server_id = r.server_id AND ui.serial_id = r.serial_id"
+        )
+
+        await connection.execute(
+            f"CREATE UNIQUE INDEX ux_user_id_server_id_currency_id ON {self.table_name}"
+            f" (user_id, server_id, item_id1) WHERE item_type = {ItemType.CURRENCY.value}"
+        )
@@ -1,5 +1,6 @@
 from .already_married_error import AlreadyMarriedError
 from .not_married_error import NotMarriedError
+from .renderer_busy_error import RendererBusyError
 from .shop_item_not_found_error import ShopItemNotFoundError
 from .shop_not_available_error import ShopNotAvailableError
 from .shop_not_found_error import ShopNotFoundError
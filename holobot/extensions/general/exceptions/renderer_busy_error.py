@@ -0,0 +1,18 @@
+class RendererBusyError(Exception):
+    @property
+    def pending_count(self) -> int:
+        return self.__pending_count
+
+    @property
+    def pending_count_max(self) -> int:
+        return self.__pending_count_max
+
+    def __init__(
+        self,
+        pending_count: int,
+        pending_count_max: int,
+        message: str | None = None
+    ) -> None:
+        super().__init__(message)
+        self.__pending_count = pending_count
+        self.__pending_count_max = pending_count_max
@@ -3,7 +3,8 @@ from typing import Protocol
 
 from holobot.extensions.general.enums import RankingType, ReactionType
 from holobot.extensions.general.models import Marriage, RankingInfo
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.database.queries.enums import SeekDirection
+from holobot.sdk.queries import KeysetPaginationResult
 
 class IMarriageManager(Protocol):
     def get_spouse_id(
@@ -53,7 +54,8 @@ class IMarriageManager(Protocol):
         self,
         server_id: int,
         ranking_type: RankingType,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[RankingInfo]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[RankingInfo]]:
         ...
@@ -7,8 +7,9 @@ from holobot.extensions.general.models import Marriage, RankingInfo
 from holobot.extensions.general.options import GeneralOptions
 from holobot.extensions.general.repositories import IMarriageRepository
 from holobot.sdk.configs import IOptions
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 from holobot.sdk.utils import utcnow
 from holobot.sdk.utils.string_utils import try_parse_int
 from .imarriage_manager import IMarriageManager
@@ -144,14 +145,16 @@ class MarriageManager(IMarriageManager):
         self,
         server_id: int,
         ranking_type: RankingType,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[RankingInfo]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[RankingInfo]]:
         return self.__marriage_repository.paginate_rankings(
             server_id,
             ranking_type,
-            page_index,
-            page_size
+            page_size,
+            cursor,
+            direction
         )
 
     @staticmethod
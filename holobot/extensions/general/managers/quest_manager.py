@@ -23,6 +23,7 @@ from holobot.extensions.general.sdk.quests.models import (
     BadgeQuestReward, CurrencyQuestReward, IQuest, QuestId, QuestProtoId, QuestRewardBase
 )
 from holobot.sdk.chrono import IClock
+from holobot.sdk.database import IQueryFanOut
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils.datetime_utils import get_last_day_of_week, today_midnight_utc
 from holobot.sdk.utils.iterable_utils import group_by_types, multi_to_dict
@@ -39,6 +40,7 @@ class QuestManager(IQuestManager):
         quest_proto_repository: IQuestProtoRepository,
         quest_repository: IQuestRepository,
         quest_reward_factories: tuple[IQuestRewardFactory, ...],
+        query_fan_out: IQueryFanOut,
         user_item_manager: IUserItemManager
     ) -> None:
         super().__init__()
@@ -51,6 +53,7 @@ class QuestManager(IQuestManager):
         )
         self.__quest_proto_repository = quest_proto_repository
         self.__quest_repository = quest_repository
+        self.__query_fan_out = query_fan_out
         self.__user_item_manager = user_item_manager
         # TODO IQuestRewardFactory per server, not just code!
         self.__quest_reward_factories = multi_to_dict(
@@ -64,13 +67,12 @@ class QuestManager(IQuestManager):
         user_id: int,
         quest_proto_id: QuestProtoId
     ) -> IQuest:
-        quest_proto = await self.__quest_proto_repository.get(quest_proto_id)
+        quest_proto, quest = await self.__get_quest_and_proto(server_id, user_id, quest_proto_id)
         if not quest_proto:
             raise InvalidQuestException(quest_proto_id, "This quest prototype doesn't exist.")
 
-        if (quest := await self.__get_quest(server_id, user_id, quest_proto_id)):
-            if not quest.completed_at:
-                return quest
+        if quest and not quest.completed_at:
+            return quest
 
         availability, cooldown = self.__get_quest_status(quest_proto, quest)
         if availability == QuestStatus.ON_COOLDOWN:
@@ -107,7 +109,7 @@ class QuestManager(IQuestManager):
         user_id: int,
         quest_proto_id: QuestProtoId
     ) -> QuestRewardDescriptor:
-        quest_proto = await self.__quest_proto_repository.get(quest_proto_id)
+        quest_proto, quest = await self.__get_quest_and_proto(server_id, user_id, quest_proto_id)
         if not quest_proto:
             raise InvalidQuestException(quest_proto_id, "This quest prototype doesn't exist.")
 
@@ -118,7 +120,7 @@ class QuestManager(IQuestManager):
         ):
             raise QuestUnavailableException(quest_proto_id, "This quest has expired already or is not available yet.")
 
-        if not (quest := await self.__get_quest(server_id, user_id, quest_proto_id)):
+        if not quest:
             raise QuestNotStartedException(quest_proto_id)
 
         if not QuestManager.__are_objectives_complete(quest_proto, quest):
@@ -157,11 +159,10 @@ class QuestManager(IQuestManager):
         user_id: int,
         quest_proto_id: QuestProtoId
     ) -> QuestStatus:
-        quest_proto = await self.__quest_proto_repository.get(quest_proto_id)
+        quest_proto, quest = await self.__get_quest_and_proto(server_id, user_id, quest_proto_id)
         if not quest_proto:
             return QuestStatus.MISSING
 
-        quest = await self.__get_quest(server_id, user_id, quest_proto_id)
         status, _ = self.__get_quest_status(quest_proto, quest)
 
         return status
@@ -276,17 +277,20 @@ class QuestManager(IQuestManager):
                     f" has an invalid reset type '{quest_proto.reset_type}'."
                 )
 
-    def __get_quest(
+    def __get_quest_and_proto(
         self,
         server_id: int,
         user_id: int,
         quest_proto_id: QuestProtoId
-    ) -> Awaitable[Quest | None]:
-        return self.__quest_repository.get(
-            QuestId(
-                user_id=user_id,
-                server_id=server_id,
-                quest_proto_code=quest_proto_id.code
+    ) -> Awaitable[tuple[QuestProto | None, Quest | None]]:
+        return self.__query_fan_out.fetch(
+            self.__quest_proto_repository.get(quest_proto_id),
+            self.__quest_repository.get(
+                QuestId(
+                    user_id=user_id,
+                    server_id=server_id,
+                    quest_proto_code=quest_proto_id.code
+                )
             )
         )
 
@@ -327,15 +331,19 @@ class QuestManager(IQuestManager):
         self,
         quest_proto: QuestProto
     ) -> AsyncGenerator[CurrencyQuestReward]:
-        rewards = (
-            (quest_proto.reward_currency_id_1, quest_proto.reward_currency_count_1),
-            (quest_proto.reward_currency_id_2, quest_proto.reward_currency_count_2)
+        rewards = tuple(
+            (currency_id, currency_count)
+            for currency_id, currency_count in (
+                (quest_proto.reward_currency_id_1, quest_proto.reward_currency_count_1),
+                (quest_proto.reward_currency_id_2, quest_proto.reward_currency_count_2)
+            )
+            if currency_id is not None
         )
-        for currency_id, currency_count in rewards:
-            if currency_id is None:
-                continue
-
-            currency = await self.__currency_repository.get(currency_id)
+        currencies = await self.__query_fan_out.fetch_all(
+            self.__currency_repository.get(currency_id)
+            for currency_id, _ in rewards
+        )
+        for (currency_id, currency_count), currency in zip(rewards, currencies):
             if not currency:
                 continue
 
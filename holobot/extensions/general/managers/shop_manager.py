@@ -1,5 +1,4 @@
-from collections.abc import AsyncGenerator, Awaitable, Iterable, Sequence
-from typing import Any
+from collections.abc import Awaitable, Iterable, Sequence
 
 from holobot.extensions.general.enums import GrantItemOutcome, ItemType
 from holobot.extensions.general.exceptions import (
@@ -7,7 +6,8 @@ from holobot.extensions.general.exceptions import (
     TooManyShopsError, UnknownShopItemTypeError
 )
 from holobot.extensions.general.models.items import (
-    BackgroundItem, BadgeDisplayInfo, BadgeItem, CurrencyDisplayInfo, CurrencyItem, UserItem
+    BackgroundItem, BadgeDisplayInfo, BadgeItem, CurrencyDisplayInfo, CurrencyItem,
+    ItemDisplayInfoBase, UserItem
 )
 from holobot.extensions.general.models.shops import (
     DetailedShopDisplayInfo, Shop, ShopDisplayInfo, ShopItem, ShopItemDisplayInfo, TransactionInfo
@@ -21,11 +21,12 @@ from holobot.extensions.general.sdk.shops.models import ShopId, ShopItemId
 from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.sdk.chrono import IClock
 from holobot.sdk.configs import IOptions
+from holobot.sdk.database import IQueryFanOut
 from holobot.sdk.identification import IHoloflakeProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.logging import ILoggerFactory
 from holobot.sdk.queries import PaginationResult
-from holobot.sdk.utils.iterable_utils import extend_async, group_by, select, unique
+from holobot.sdk.utils.iterable_utils import group_by, select, unique
 from .ishop_manager import IShopManager
 from .iuser_item_manager import IUserItemManager
 
@@ -40,6 +41,7 @@ class ShopManager(IShopManager):
         holoflake_provider: IHoloflakeProvider,
         logger_factory: ILoggerFactory,
         options: IOptions[ShopOptions],
+        query_fan_out: IQueryFanOut,
         shop_repository: IShopRepository,
         shop_item_repository: IShopItemRepository,
         user_item_manager: IUserItemManager,
@@ -53,6 +55,7 @@ class ShopManager(IShopManager):
         self.__holoflake_provider = holoflake_provider
         self.__logger = logger_factory.create(ShopManager)
         self.__options = options
+        self.__query_fan_out = query_fan_out
         self.__shop_repository = shop_repository
         self.__shop_item_repository = shop_item_repository
         self.__user_item_manager = user_item_manager
@@ -63,9 +66,9 @@ class ShopManager(IShopManager):
             ItemType.BACKGROUND: self.__grant_background
         }
         self.__item_display_resolvers = {
-            ItemType.CURRENCY: self.__resolve_currency_display_items,
-            ItemType.BADGE: self.__resolve_badge_display_items,
-            ItemType.BACKGROUND: self.__resolve_background_display_items
+            ItemType.CURRENCY: self.__resolve_currency_display_infos,
+            ItemType.BADGE: self.__resolve_badge_display_infos,
+            ItemType.BACKGROUND: self.__resolve_background_display_infos
         }
 
     def paginate_shops(
@@ -88,15 +91,17 @@ class ShopManager(IShopManager):
         page_index: int,
         page_size: int = 5
     ) -> DetailedShopDisplayInfo:
-        shop = await self.__shop_repository.get(shop_id)
+        shop, shop_items = await self.__query_fan_out.fetch(
+            self.__shop_repository.get(shop_id),
+            self.__shop_item_repository.paginate(
+                shop_id,
+                page_index,
+                page_size
+            )
+        )
         if not shop:
             raise ShopNotFoundError(shop_id)
 
-        shop_items = await self.__shop_item_repository.paginate(
-            shop_id,
-            page_index,
-            page_size
-        )
         if len(shop_items.items) == 0:
             return DetailedShopDisplayInfo(
                 name=shop.shop_name,
@@ -127,10 +132,13 @@ class ShopManager(IShopManager):
             server_id=shop_item_id.server_id,
             shop_id=shop_item_id.shop_id
         )
-        if not await self.__shop_repository.is_valid(shop_id, self.__clock.now_utc()):
+        is_shop_valid, shop_item = await self.__query_fan_out.fetch(
+            self.__shop_repository.is_valid(shop_id, self.__clock.now_utc()),
+            self.__shop_item_repository.get(shop_item_id)
+        )
+        if not is_shop_valid:
             raise ShopNotAvailableError(shop_id)
 
-        shop_item = await self.__shop_item_repository.get(shop_item_id)
         if not shop_item:
             raise ShopItemNotFoundError(shop_item_id)
 
@@ -219,10 +227,12 @@ class ShopManager(IShopManager):
         currency_id: int,
         currency_amount: int
     ) -> tuple[BadgeDisplayInfo, CurrencyDisplayInfo]:
+        # The validation errors take precedence over those of the display infos.
         await self.__validate_shop_for_new_item(shop_id)
-
-        badge_info = await self.__badge_repository.get_display_info(badge_id)
-        currency_info = await self.__currency_repository.get_display_info(currency_id)
+        badge_info, currency_info = await self.__query_fan_out.fetch(
+            self.__badge_repository.get_display_info(badge_id),
+            self.__currency_repository.get_display_info(currency_id)
+        )
 
         await self.__shop_item_repository.add(
             ShopItem(
@@ -252,9 +262,10 @@ class ShopManager(IShopManager):
         price_currency_amount: int
     ) -> tuple[CurrencyDisplayInfo, CurrencyDisplayInfo]:
         await self.__validate_shop_for_new_item(shop_id)
-
-        currency_info = await self.__currency_repository.get_display_info(currency_id)
-        price_currency_info = await self.__currency_repository.get_display_info(price_currency_id)
+        currency_info, price_currency_info = await self.__query_fan_out.fetch(
+            self.__currency_repository.get_display_info(currency_id),
+            self.__currency_repository.get_display_info(price_currency_id)
+        )
 
         await self.__shop_item_repository.add(
             ShopItem(
@@ -340,10 +351,8 @@ class ShopManager(IShopManager):
         shop_id: ShopId,
         shop_items: Sequence[ShopItem]
     ) -> list[ShopItemDisplayInfo]:
-        currency_info_by_ids = await self.__resolve_currency_infos(shop_items)
-        grouped_items = group_by(shop_items, lambda i: i.item_type)
-        item_display_infos = list[ShopItemDisplayInfo]()
-        for item_type, items in grouped_items.items():
+        grouped_items = list[tuple[ItemType, Sequence[ShopItem]]]()
+        for item_type, items in group_by(shop_items, lambda i: i.item_type).items():
             if item_type not in self.__item_display_resolvers:
                 self.__logger.warning(
                     "Unknown shop item type",
@@ -352,13 +361,39 @@ class ShopManager(IShopManager):
                 )
                 continue
 
-            resolved_infos = self.__item_display_resolvers[item_type](
-                shop_id.server_id,
-                items,
-                currency_info_by_ids
+            grouped_items.append((item_type, items))
+
+        currency_info_by_ids, item_info_by_ids_by_groups = await self.__query_fan_out.fetch(
+            self.__resolve_currency_infos(shop_items),
+            self.__query_fan_out.fetch_all(
+                self.__item_display_resolvers[item_type](
+                    shop_id.server_id,
+                    tuple(map(lambda i: i.item_id1, items))
+                )
+                for item_type, items in grouped_items
             )
+        )
 
-            await extend_async(item_display_infos, resolved_infos)
+        item_display_infos = list[ShopItemDisplayInfo]()
+        for (item_type, items), item_info_by_ids in zip(grouped_items, item_info_by_ids_by_groups):
+            for item in items:
+                if item.item_id1 not in item_info_by_ids:
+                    self.__logger.warning(
+                        "Unresolvable shop item",
+                        item_type=item_type,
+                        item_id1=item.item_id1
+                    )
+                    continue
+
+                currency_info = currency_info_by_ids[item.price_currency_id]
+                item_display_infos.append(ShopItemDisplayInfo(
+                    item_id=item.identifier,
+                    count=item.count,
+                    currency_emoji_name=currency_info.emoji_name,
+                    currency_emoji_id=currency_info.emoji_id,
+                    price=item.price_amount,
+                    item_info=item_info_by_ids[item.item_id1]
+                ))
 
         return item_display_infos
 
@@ -374,102 +409,38 @@ class ShopManager(IShopManager):
             for currency_info in currency_infos
         }
 
-    async def __resolve_currency_display_items(
+    async def __resolve_currency_display_infos(
         self,
         server_id: int,
-        items: Sequence[ShopItem],
-        currency_infos: dict[int, CurrencyDisplayInfo]
-    ) -> AsyncGenerator[ShopItemDisplayInfo, Any]:
-        item_infos = await self.__currency_repository.get_display_infos(
-            tuple(map(lambda i: i.item_id1, items))
-        )
-        item_info_by_ids = {
+        item_ids: tuple[int, ...]
+    ) -> dict[int, ItemDisplayInfoBase]:
+        item_infos = await self.__currency_repository.get_display_infos(item_ids)
+
+        return {
             item_info.currency_id: item_info
             for item_info in item_infos
         }
-        for item in items:
-            if item.item_id1 not in item_info_by_ids:
-                self.__logger.warning(
-                    "Unresolvable currency shop item",
-                    item_type=item.item_type,
-                    item_id1=item.item_id1
-                )
-                continue
 
-            currency_info = currency_infos[item.price_currency_id]
-
-            yield ShopItemDisplayInfo(
-                item_id=item.identifier,
-                count=item.count,
-                currency_emoji_name=currency_info.emoji_name,
-                currency_emoji_id=currency_info.emoji_id,
-                price=item.price_amount,
-                item_info=item_info_by_ids[item.item_id1]
-            )
-
-    async def __resolve_badge_display_items(
+    async def __resolve_badge_display_infos(
         self,
         server_id: int,
-        items: Sequence[ShopItem],
-        currency_infos: dict[int, CurrencyDisplayInfo]
-    ) -> AsyncGenerator[ShopItemDisplayInfo, Any]:
-        item_infos = await self.__badge_repository.get_display_infos(
-            server_id,
-            tuple(map(lambda i: i.item_id1, items))
-        )
-        item_info_by_ids = {
+        item_ids: tuple[int, ...]
+    ) -> dict[int, ItemDisplayInfoBase]:
+        item_infos = await self.__badge_repository.get_display_infos(server_id, item_ids)
+
+        return {
             item_info.badge_id.badge_id: item_info
             for item_info in item_infos
         }
-        for item in items:
-            if item.item_id1 not in item_info_by_ids:
-                self.__logger.warning(
-                    "Unresolvable badge shop item",
-                    item_type=item.item_type,
-                    item_id1=item.item_id1
-                )
-                continue
-
-            currency_info = currency_infos[item.price_currency_id]
 
-            yield ShopItemDisplayInfo(
-                item_id=item.identifier,
-                count=item.count,
-                currency_emoji_name=currency_info.emoji_name,
-                currency_emoji_id=currency_info.emoji_id,
-                price=item.price_amount,
-                item_info=item_info_by_ids[item.item_id1]
-            )
-
-    async def __resolve_background_display_items(
+    async def __resolve_background_display_infos(
         self,
         server_id: int,
-        items: Sequence[ShopItem],
-        currency_infos: dict[int, CurrencyDisplayInfo]
-    ) -> AsyncGenerator[ShopItemDisplayInfo, Any]:
-        item_infos = await self.__background_repository.get_display_infos(
-            tuple(map(lambda i: i.item_id1, items))
-        )
-        item_info_by_ids = {
+        item_ids: tuple[int, ...]
+    ) -> dict[int, ItemDisplayInfoBase]:
+        item_infos = await self.__background_repository.get_display_infos(item_ids)
+
+        return {
             item_info.background_id: item_info
             for item_info in item_infos
         }
-        for item in items:
-            if item.item_id1 not in item_info_by_ids:
-                self.__logger.warning(
-                    "Unresolvable background shop item",
-                    item_type=item.item_type,
-                    item_id1=item.item_id1
-                )
-                continue
-
-            currency_info = currency_infos[item.price_currency_id]
-
-            yield ShopItemDisplayInfo(
-                item_id=item.identifier,
-                count=item.count,
-                currency_emoji_name=currency_info.emoji_name,
-                currency_emoji_id=currency_info.emoji_id,
-                price=item.price_amount,
-                item_info=item_info_by_ids[item.item_id1]
-            )
@@ -16,6 +16,8 @@ from holobot.extensions.general.sdk.items.models import UserItemId
 from holobot.extensions.general.sdk.quests.models import (
     BackgroundQuestReward, BadgeQuestReward, CurrencyQuestReward, QuestRewardBase
 )
+from holobot.extensions.general.sdk.wallets.exceptions import WalletNotFoundException
+from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.sdk.chrono import IClock
 from holobot.sdk.identification import IHoloflakeProvider
 from holobot.sdk.ioc.decorators import injectable
@@ -36,7 +38,8 @@ class UserItemManager(IUserItemManager):
         clock: IClock,
         currency_repository: ICurrencyRepository,
         holoflake_provider: IHoloflakeProvider,
-        user_item_repository: IUserItemRepository
+        user_item_repository: IUserItemRepository,
+        wallet_manager: IWalletManager
     ) -> None:
         super().__init__()
         self.__background_repository = background_repository
@@ -45,6 +48,7 @@ class UserItemManager(IUserItemManager):
         self.__currency_repository = currency_repository
         self.__holoflake_provider = holoflake_provider
         self.__user_item_repository = user_item_repository
+        self.__wallet_manager = wallet_manager
         self.__quest_reward_handlers: dict[type, THandler] = {
             CurrencyQuestReward: self.__grant_currency_reward,
             BadgeQuestReward: self.__grant_badge_reward,
@@ -124,29 +128,18 @@ class UserItemManager(IUserItemManager):
         currency_id: int,
         count: int
     ) -> tuple[GrantItemOutcome, UserItem]:
+        # The deposit is atomic, so that concurrent grants and payments aren't lost.
+        await self.__wallet_manager.give_money(user_id, currency_id, server_id, count)
         user_item = await self.__user_item_repository.get_wallet(
             user_id,
             server_id,
             currency_id
         )
-        if user_item:
-            if not isinstance(user_item.item, CurrencyItem):
-                raise InvalidItemTypeException(user_id, server_id, currency_id)
-
-            user_item.item.count += count
-            await self.__user_item_repository.update(user_item)
-            return (GrantItemOutcome.GRANTED, user_item)
+        if not user_item:
+            raise WalletNotFoundException(user_id, server_id, currency_id)
 
-        user_item = self.__create_user_item(
-            server_id,
-            user_id,
-            CurrencyItem(
-                count=count,
-                currency_id=currency_id
-            )
-        )
-
-        await self.__user_item_repository.add(user_item)
+        if not isinstance(user_item.item, CurrencyItem):
+            raise InvalidItemTypeException(user_id, server_id, currency_id)
 
         return (GrantItemOutcome.GRANTED, user_item)
 
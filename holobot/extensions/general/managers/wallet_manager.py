@@ -1,12 +1,12 @@
-from holobot.extensions.general.models.items import CurrencyItem, UserItem
+from holobot.extensions.general.models.items import CurrencyItem
 from holobot.extensions.general.repositories import ICurrencyRepository, IUserItemRepository
 from holobot.extensions.general.sdk.items.exceptions import InvalidItemTypeException
-from holobot.extensions.general.sdk.items.models import UserItemId
 from holobot.extensions.general.sdk.wallets.exceptions import (
     CurrencyNotFoundException, NotEnoughMoneyException, WalletNotFoundException
 )
 from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.extensions.general.sdk.wallets.models import ExchangeInfo
+from holobot.sdk.database import IQueryFanOut
 from holobot.sdk.identification import IHoloflakeProvider
 from holobot.sdk.ioc.decorators import injectable
 
@@ -16,11 +16,13 @@ class WalletManager(IWalletManager):
         self,
         currency_repository: ICurrencyRepository,
         holoflake_provider: IHoloflakeProvider,
+        query_fan_out: IQueryFanOut,
         user_item_repository: IUserItemRepository
     ) -> None:
         super().__init__()
         self.__currency_repository = currency_repository
         self.__holoflake_provider = holoflake_provider
+        self.__query_fan_out = query_fan_out
         self.__user_item_repository = user_item_repository
 
     async def give_money(
@@ -30,41 +32,20 @@ class WalletManager(IWalletManager):
         server_id: int,
         amount: int
     ) -> ExchangeInfo:
-        currency_item = await self.__currency_repository.try_get_by_server(currency_id, server_id, True)
-        if not currency_item:
+        amounts = await self.__user_item_repository.deposit_to_wallet(
+            user_id,
+            server_id,
+            currency_id,
+            amount,
+            self.__holoflake_provider.get_next_id()
+        )
+        if not amounts:
             raise CurrencyNotFoundException(currency_id, server_id)
 
-        wallet = await self.__user_item_repository.get_wallet(user_id, server_id, currency_id)
-        if wallet:
-            if not isinstance(wallet.item, CurrencyItem):
-                raise InvalidItemTypeException(user_id, server_id, currency_id)
-
-            previous_amount = wallet.item.count
-            wallet.item.count += amount
-            await self.__user_item_repository.update(wallet)
-
-            return ExchangeInfo(
-                currency_id=currency_id,
-                previous_amount=previous_amount,
-                new_amount=wallet.item.count
-            )
-
-        await self.__user_item_repository.add(UserItem(
-            identifier=UserItemId(
-                server_id=server_id,
-                user_id=user_id,
-                serial_id=self.__holoflake_provider.get_next_id()
-            ),
-            item=CurrencyItem(
-                count=amount,
-                currency_id=currency_id
-            )
-        ))
-
         return ExchangeInfo(
             currency_id=currency_id,
-            previous_amount=0,
-            new_amount=amount
+            previous_amount=amounts[0],
+            new_amount=amounts[1]
         )
 
     async def take_money(
@@ -75,26 +56,32 @@ class WalletManager(IWalletManager):
         amount: int,
         allow_take_less: bool
     ) -> ExchangeInfo:
-        currency_item = await self.__currency_repository.try_get_by_server(currency_id, server_id, True)
+        amounts = await self.__user_item_repository.withdraw_from_wallet(
+            user_id,
+            server_id,
+            currency_id,
+            amount,
+            allow_take_less
+        )
+        if amounts:
+            return ExchangeInfo(
+                currency_id=currency_id,
+                previous_amount=amounts[0],
+                new_amount=amounts[1]
+            )
+
+        # Only the failures need further queries to tell their reason.
+        currency_item, wallet = await self.__query_fan_out.fetch(
+            self.__currency_repository.try_get_by_server(currency_id, server_id, True),
+            self.__user_item_repository.get_wallet(user_id, server_id, currency_id)
+        )
         if not currency_item:
             raise CurrencyNotFoundException(currency_id, server_id)
 
-        wallet = await self.__user_item_repository.get_wallet(user_id, server_id, currency_id)
         if not wallet:
             raise WalletNotFoundException(user_id, server_id, currency_id)
 
         if not isinstance(wallet.item, CurrencyItem):
             raise InvalidItemTypeException(user_id, server_id, currency_id)
 
-        if not allow_take_less and wallet.item.count < amount:
-            raise NotEnoughMoneyException(user_id, server_id, currency_id)
-
-        previous_amount = wallet.item.count
-        wallet.item.count = max(wallet.item.count - amount, 0)
-        await self.__user_item_repository.update(wallet)
-
-        return ExchangeInfo(
-            currency_id=currency_id,
-            previous_amount=previous_amount,
-            new_amount=wallet.item.count
-        )
+        raise NotEnoughMoneyException(user_id, server_id, currency_id)
@@ -4,5 +4,7 @@ from .reputation_change_info import ReputationChangeInfo
 from .reputation_cooldown import ReputationCooldown
 from .reputation_rank_info import ReputationRankInfo
 from .user_profile import UserProfile
+from .user_profile_asset_paths import UserProfileAssetPaths
 from .user_profile_background import UserProfileBackground
 from .user_profile_background_info import UserProfileBackgroundInfo
+from .user_profile_render_request import UserProfileRenderRequest
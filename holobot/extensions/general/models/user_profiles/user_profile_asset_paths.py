@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass(kw_only=True, frozen=True)
+class UserProfileAssetPaths:
+    """Holds the paths of the static assets used for drawing user profiles."""
+
+    card_background: str
+    text_background: str
+    badges_background: str
+    progress_bar_background: str
+    default_background: str
+    avatar_border: str
+    card_border: str
+    reputation_icon: str
+    default_avatar: str
+    font: str
+    badges: str
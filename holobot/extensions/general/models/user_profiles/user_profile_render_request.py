@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+
+@dataclass(kw_only=True, frozen=True)
+class UserProfileRenderRequest:
+    """Holds everything required for drawing a user profile.
+
+    Instances are sent to the rendering processes, hence every field must be picklable.
+    """
+
+    user_name: str
+    """The name of the user."""
+
+    title: str
+    """The title matching the user's reputation rank."""
+
+    rank_color: tuple[int, ...]
+    """The color of the user's reputation rank."""
+
+    reputation_points: int
+    """The number of reputation points the user has."""
+
+    last_required_reputation: int
+    """The number of reputation points required for the current rank."""
+
+    next_required_reputation: int
+    """The number of reputation points required for the next rank."""
+
+    show_badges: bool
+    """Whether the badges should be displayed."""
+
+    badge_ids: tuple[int | None, ...]
+    """The identifiers of the badges to display, in order, with None for the empty slots."""
+
+    avatar: bytes | None
+    """The encoded avatar image of the user, if any."""
+
+    background_path: str
+    """The path of the background image."""
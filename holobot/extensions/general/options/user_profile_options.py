@@ -20,3 +20,21 @@ class UserProfileOptions(OptionsDefinition):
     ReputationTable: list[_ReputationTableItem] = field(default_factory=list)
     CustomBackgroundsPath: str = "resources/images/user_profiles/custom_backgrounds"
     CustomBackgrounds: list[_CustomBackgroundItem] = field(default_factory=list)
+
+    RendererWorkerCount: int = 2
+    """The number of processes drawing user profiles.
+
+    If zero, user profiles are drawn on the event loop.
+    """
+
+    RendererMaxPendingCount: int = 16
+    """The maximum number of user profiles being drawn or waiting to be drawn.
+
+    Further requests are rejected until a slot becomes available.
+    """
+
+    RenderCacheMaxSize: int = 16 * 1024 * 1024
+    """The maximum total size, in bytes, of the user profile images kept in memory.
+
+    If zero, the images aren't cached.
+    """
@@ -0,0 +1,2 @@
+from .iuser_profile_renderer import IUserProfileRenderer
+from .user_profile_renderer import UserProfileRenderer
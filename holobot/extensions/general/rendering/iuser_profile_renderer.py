@@ -0,0 +1,19 @@
+from collections.abc import Awaitable
+from typing import Protocol
+
+from holobot.extensions.general.models.user_profiles import UserProfileRenderRequest
+
+class IUserProfileRenderer(Protocol):
+    """Interface for a service that draws user profile images."""
+
+    def render(self, request: UserProfileRenderRequest) -> Awaitable[bytes]:
+        """Draws the specified user profile.
+
+        If the rendering queue is full, waits until a slot becomes available.
+
+        :param request: The description of the user profile.
+        :type request: UserProfileRenderRequest
+        :return: The PNG encoded image.
+        :rtype: Awaitable[bytes]
+        """
+        ...
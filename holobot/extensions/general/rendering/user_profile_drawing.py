@@ -0,0 +1,314 @@
+"""Draws user profile images.
+
+The functions of this module are executed in the rendering processes, therefore
+they rely only on the state of the current process and the picklable arguments.
+"""
+
+import io
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from PIL import Image, ImageDraw, ImageFont
+
+from holobot.extensions.general.models.user_profiles import (
+    UserProfile, UserProfileAssetPaths, UserProfileRenderRequest
+)
+
+_BADGES_PER_ROW: int = 25
+"""Defines the number of badge icons present in a single row of the badge_icons.png file."""
+
+_BADGE_SIZE: int = 40
+"""Defines the width and height of a badge icon."""
+
+_BADGE_PADDING: int = 4
+"""Defines the empty space between badges in the profile picture."""
+
+_CARD_SIZE: tuple[int, int] = (548, 174)
+"""Defines the width and height of the profile picture."""
+
+_AVATAR_POSITION: tuple[int, int] = (23, 23)
+"""Defines the position of the top-left corner of the avatar."""
+
+_AVATAR_SIZE: int = 128
+"""Defines the width and height of the avatar."""
+
+_BADGES_POSITION: tuple[int, int] = (183, 120)
+"""Defines the position of the top-left corner of the first badge."""
+
+_MAX_TEMPLATE_COUNT: int = 16
+"""Defines the number of card templates kept in memory by each process."""
+
+_Box = tuple[int, int, int, int]
+
+@dataclass(kw_only=True, frozen=True)
+class _Layer:
+    image: Image.Image
+    position: tuple[int, int] = (0, 0)
+
+@dataclass(kw_only=True, frozen=True)
+class _CardTemplate:
+    card: Image.Image
+    """The background with every static layer flattened onto it."""
+
+    avatar_underlay: Image.Image
+    """The avatar region of the card before any layer above the avatar."""
+
+    badges_underlay: Image.Image | None
+    """The badges region of the card before the layers above the badges, if badges are shown."""
+
+@dataclass(kw_only=True, frozen=True)
+class _AssetCollection:
+    card_background: Image.Image
+    text_background: Image.Image
+    badges_background: Image.Image
+    progress_bar_background: Image.Image
+    default_background: Image.Image
+    avatar_border: Image.Image
+    card_border: Image.Image
+    reputation_icon: Image.Image
+    default_avatar: Image.Image
+    font_small: ImageFont.FreeTypeFont
+    font_medium: ImageFont.FreeTypeFont
+    font_large: ImageFont.FreeTypeFont
+    badge_icons: tuple[Image.Image, ...]
+    avatar_mask: Image.Image
+    avatar_region: _Box
+    badges_region: _Box
+
+_assets: _AssetCollection | None = None
+_templates = OrderedDict[tuple[str, bool], _CardTemplate]()
+
+def initialize(asset_paths: UserProfileAssetPaths) -> None:
+    """Loads the static assets into the memory of the current process.
+
+    :param asset_paths: The paths of the assets to load.
+    :type asset_paths: UserProfileAssetPaths
+    """
+
+    global _assets
+
+    avatar_mask = Image.new("L", (_AVATAR_SIZE, _AVATAR_SIZE), 0)
+    ImageDraw.Draw(avatar_mask).ellipse((0, 0, _AVATAR_SIZE, _AVATAR_SIZE), fill=255)
+    avatar_border = _load_image(asset_paths.avatar_border)
+    _assets = _AssetCollection(
+        card_background=_load_image(asset_paths.card_background),
+        text_background=_load_image(asset_paths.text_background),
+        badges_background=_load_image(asset_paths.badges_background),
+        progress_bar_background=_load_image(asset_paths.progress_bar_background),
+        default_background=_load_image(asset_paths.default_background),
+        avatar_border=avatar_border,
+        card_border=_load_image(asset_paths.card_border),
+        reputation_icon=_load_image(asset_paths.reputation_icon),
+        default_avatar=_load_image(asset_paths.default_avatar),
+        font_small=ImageFont.truetype(asset_paths.font, size=15),
+        font_medium=ImageFont.truetype(asset_paths.font, size=20),
+        font_large=ImageFont.truetype(asset_paths.font, size=30),
+        badge_icons=_slice_badge_icons(_load_image(asset_paths.badges)),
+        avatar_mask=avatar_mask,
+        avatar_region=_get_union(
+            (*_AVATAR_POSITION, _AVATAR_POSITION[0] + _AVATAR_SIZE, _AVATAR_POSITION[1] + _AVATAR_SIZE),
+            (22, 22, 22 + avatar_border.width, 22 + avatar_border.height)
+        ),
+        badges_region=(
+            *_BADGES_POSITION,
+            _BADGES_POSITION[0] + UserProfile.MAX_BADGE_COUNT * (_BADGE_SIZE + _BADGE_PADDING) - _BADGE_PADDING,
+            _BADGES_POSITION[1] + _BADGE_SIZE
+        )
+    )
+    _templates.clear()
+
+def is_initialized() -> bool:
+    """Determines whether the static assets are loaded in the current process.
+
+    :return: True, if the assets are loaded.
+    :rtype: bool
+    """
+
+    return _assets is not None
+
+def render(request: UserProfileRenderRequest) -> bytes:
+    """Draws the user profile described by the request and encodes it as PNG.
+
+    :param request: The description of the user profile.
+    :type request: UserProfileRenderRequest
+    :return: The encoded image.
+    :rtype: bytes
+    """
+
+    if _assets is None:
+        raise RuntimeError("The user profile assets haven't been loaded in this process.")
+
+    avatar = Image.open(io.BytesIO(request.avatar)) if request.avatar is not None else None
+    try:
+        profile_image = _draw_user_profile_image(
+            request,
+            _assets,
+            avatar,
+            _get_template(_assets, request.background_path, request.show_badges)
+        )
+    finally:
+        if avatar:
+            avatar.close()
+
+    output_bytes_io = io.BytesIO()
+    profile_image.save(output_bytes_io, format="PNG")
+
+    return output_bytes_io.getvalue()
+
+def _load_image(path: str) -> Image.Image:
+    image = Image.open(path)
+    # Decode eagerly so that the first render doesn't pay for it.
+    image.load()
+    return image
+
+def _slice_badge_icons(badges: Image.Image) -> tuple[Image.Image, ...]:
+    row_count = badges.height // _BADGE_SIZE
+    icons = []
+    for badge_id in range(row_count * _BADGES_PER_ROW):
+        badge_x = (badge_id % _BADGES_PER_ROW) * _BADGE_SIZE
+        badge_y = (badge_id // _BADGES_PER_ROW) * _BADGE_SIZE
+        icons.append(badges.crop((badge_x, badge_y, badge_x + _BADGE_SIZE, badge_y + _BADGE_SIZE)))
+
+    badges.close()
+    return tuple(icons)
+
+def _get_union(box1: _Box, box2: _Box) -> _Box:
+    return (
+        min(box1[0], box2[0]),
+        min(box1[1], box2[1]),
+        max(box1[2], box2[2]),
+        max(box1[3], box2[3])
+    )
+
+def _get_overlays(assets: _AssetCollection, show_badges: bool) -> tuple[_Layer, ...]:
+    # The static layers above the avatar, in the order they are drawn.
+    # The badge icons go right below the last layer.
+    return (
+        _Layer(image=assets.avatar_border, position=(22, 22)),
+        _Layer(image=assets.text_background),
+        _Layer(image=assets.reputation_icon, position=(192, 81)),
+        *((_Layer(image=assets.badges_background),) if show_badges else ()),
+        _Layer(image=assets.card_border)
+    )
+
+def _get_template(
+    assets: _AssetCollection,
+    background_path: str,
+    show_badges: bool
+) -> _CardTemplate:
+    key = (background_path, show_badges)
+    if (template := _templates.get(key)) is not None:
+        _templates.move_to_end(key)
+        return template
+
+    background_image = _load_image(background_path)
+    template = _create_template(assets, background_image, show_badges)
+    background_image.close()
+    _templates[key] = template
+    if len(_templates) > _MAX_TEMPLATE_COUNT:
+        _templates.popitem(last=False)
+
+    return template
+
+def _create_template(
+    assets: _AssetCollection,
+    background_image: Image.Image,
+    show_badges: bool
+) -> _CardTemplate:
+    card = Image.new("RGBA", _CARD_SIZE, None)
+    card.paste(assets.card_background)
+    card.paste(background_image, background_image)
+    avatar_underlay = card.crop(assets.avatar_region)
+
+    overlays = _get_overlays(assets, show_badges)
+    for overlay in overlays[:-1]:
+        card.paste(overlay.image, overlay.position, overlay.image)
+
+    badges_underlay = card.crop(assets.badges_region) if show_badges else None
+    card.paste(overlays[-1].image, overlays[-1].position, overlays[-1].image)
+
+    return _CardTemplate(
+        card=card,
+        avatar_underlay=avatar_underlay,
+        badges_underlay=badges_underlay
+    )
+
+def _paste_into_region(
+    region_image: Image.Image,
+    region: _Box,
+    image: Image.Image,
+    position: tuple[int, int]
+) -> None:
+    # Pasting is clipped to the region, so only the overlapping part is composited.
+    region_image.paste(image, (position[0] - region[0], position[1] - region[1]), image)
+
+def _draw_user_profile_image(
+    request: UserProfileRenderRequest,
+    assets: _AssetCollection,
+    avatar: Image.Image | None,
+    template: _CardTemplate
+) -> Image.Image:
+    reputation_points = request.reputation_points
+    if avatar is None:
+        avatar = assets.default_avatar
+    else:
+        avatar = avatar.resize((_AVATAR_SIZE, _AVATAR_SIZE), Image.Resampling.LANCZOS)
+
+    avatar_cropped = Image.new("RGBA", avatar.size, (255, 255, 255, 0))
+    avatar_cropped.paste(avatar, mask=assets.avatar_mask)
+
+    # Only the regions of the dynamic images are composited again,
+    # together with the static layers above them.
+    profile_image = template.card.copy()
+    avatar_region_image = template.avatar_underlay.copy()
+    _paste_into_region(avatar_region_image, assets.avatar_region, avatar_cropped, _AVATAR_POSITION)
+    for overlay in _get_overlays(assets, request.show_badges):
+        _paste_into_region(avatar_region_image, assets.avatar_region, overlay.image, overlay.position)
+    profile_image.paste(avatar_region_image, assets.avatar_region[:2])
+    _draw_badges(profile_image, request, assets, template)
+
+    drawing_context = ImageDraw.Draw(profile_image)
+    drawing_context.text(xy=(195, 20), text=request.user_name[:20], font=assets.font_large, fill=(102, 102, 102), stroke_width=1, stroke_fill="black")
+    drawing_context.text(xy=(194, 56), text=request.title, font=assets.font_medium, fill="black")
+    drawing_context.text(xy=(193, 55), text=request.title, font=assets.font_medium, fill=request.rank_color)
+
+    if reputation_points < 100_000:
+        reputation_bar_scale = min(1, (reputation_points - request.last_required_reputation) / (request.next_required_reputation - request.last_required_reputation))
+        reputation_bar_width = int(307 * reputation_bar_scale)
+        profile_image.paste(assets.progress_bar_background, (220, 85))
+        if reputation_bar_width > 0:
+            drawing_context.rectangle(((220, 85), (220 + reputation_bar_width, 99)), fill=request.rank_color)
+        drawing_context.text(xy=(366, 92), text=f"{reputation_points}/{request.next_required_reputation}", anchor="mm", align="center", font=assets.font_small, fill="white", stroke_width=1, stroke_fill="black")
+    else:
+        drawing_context.text(xy=(220, 80), text=f"{reputation_points}", font=assets.font_medium, fill=(91, 7, 7), stroke_width=1, stroke_fill="black")
+
+    return profile_image
+
+def _draw_badges(
+    profile_image: Image.Image,
+    request: UserProfileRenderRequest,
+    assets: _AssetCollection,
+    template: _CardTemplate
+) -> None:
+    if not template.badges_underlay or not any(i is not None for i in request.badge_ids):
+        return
+
+    region = assets.badges_region
+    region_image = template.badges_underlay.copy()
+    for badge_index, badge_id in enumerate(request.badge_ids):
+        if badge_id is None:
+            continue
+
+        badge_icon = _get_badge_icon(assets, badge_id)
+        target_position = (badge_index * (_BADGE_SIZE + _BADGE_PADDING) + _BADGES_POSITION[0], _BADGES_POSITION[1])
+        _paste_into_region(region_image, region, badge_icon, target_position)
+
+    _paste_into_region(region_image, region, assets.card_border, (0, 0))
+    profile_image.paste(region_image, region[:2])
+
+def _get_badge_icon(assets: _AssetCollection, badge_id: int) -> Image.Image:
+    if 0 <= badge_id < len(assets.badge_icons):
+        return assets.badge_icons[badge_id]
+
+    # Icons outside the atlas are fully transparent.
+    return Image.new("RGBA", (_BADGE_SIZE, _BADGE_SIZE), (0, 0, 0, 0))
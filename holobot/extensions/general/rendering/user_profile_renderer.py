@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from holobot.extensions.general.exceptions import RendererBusyError
+from holobot.extensions.general.models.user_profiles import (
+    UserProfileAssetPaths, UserProfileRenderRequest
+)
+from holobot.extensions.general.options import UserProfileOptions
+from holobot.sdk.configs import IOptions
+from holobot.sdk.exceptions import ArgumentOutOfRangeError, InvalidOperationError
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.lifecycle import IStartable
+from holobot.sdk.logging import ILoggerFactory
+from holobot.sdk.resources import IAssetManager
+from . import user_profile_drawing
+from .iuser_profile_renderer import IUserProfileRenderer
+
+@injectable(IStartable)
+@injectable(IUserProfileRenderer)
+class UserProfileRenderer(IUserProfileRenderer, IStartable):
+    """Draws user profile images in a pool of processes.
+
+    Each process loads the static assets once, when it's started,
+    so that only the request specific data is sent to the processes.
+    Requests beyond the maximum pending count are rejected instead of queued.
+    """
+
+    @property
+    def priority(self) -> int:
+        return 1000
+
+    @property
+    def pending_count(self) -> int:
+        return self.__pending_count
+
+    def __init__(
+        self,
+        asset_manager: IAssetManager,
+        logger_factory: ILoggerFactory,
+        options: IOptions[UserProfileOptions]
+    ) -> None:
+        super().__init__()
+        self.__asset_manager = asset_manager
+        self.__logger = logger_factory.create(UserProfileRenderer)
+        self.__options = options
+        self.__executor: ProcessPoolExecutor | None = None
+        self.__asset_paths: UserProfileAssetPaths | None = None
+        self.__pending_count = 0
+
+    async def start(self) -> None:
+        options = self.__options.value
+        if options.RendererWorkerCount < 0:
+            raise ArgumentOutOfRangeError("RendererWorkerCount", "0", "infinite")
+        if options.RendererMaxPendingCount < 1:
+            raise ArgumentOutOfRangeError("RendererMaxPendingCount", "1", "infinite")
+
+        self.__asset_paths = self.__get_asset_paths()
+        if options.RendererWorkerCount == 0:
+            self.__logger.info("User profiles are drawn on the event loop")
+            return
+
+        self.__executor = self.__create_executor(self.__asset_paths)
+        self.__logger.info(
+            "Started user profile renderer",
+            worker_count=options.RendererWorkerCount,
+            max_pending_count=options.RendererMaxPendingCount
+        )
+
+    async def stop(self) -> None:
+        if self.__executor:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    async def render(self, request: UserProfileRenderRequest) -> bytes:
+        if not self.__asset_paths:
+            raise InvalidOperationError("The renderer hasn't been started yet.")
+
+        max_pending_count = self.__options.value.RendererMaxPendingCount
+        if self.__pending_count >= max_pending_count:
+            raise RendererBusyError(self.__pending_count, max_pending_count)
+
+        self.__pending_count += 1
+        try:
+            return await self.__render(request, self.__asset_paths)
+        finally:
+            self.__pending_count -= 1
+
+    async def __render(
+        self,
+        request: UserProfileRenderRequest,
+        asset_paths: UserProfileAssetPaths
+    ) -> bytes:
+        if not (executor := self.__executor):
+            if not user_profile_drawing.is_initialized():
+                user_profile_drawing.initialize(asset_paths)
+            return user_profile_drawing.render(request)
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                user_profile_drawing.render,
+                request
+            )
+        except BrokenProcessPool:
+            # A crashed process renders the whole pool unusable, hence it's replaced.
+            if self.__executor is executor:
+                self.__logger.warning("The user profile rendering pool is broken, restarting")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self.__executor = self.__create_executor(asset_paths)
+            raise
+
+    def __create_executor(self, asset_paths: UserProfileAssetPaths) -> ProcessPoolExecutor:
+        # Forking would copy the state of the bot, including its event loop and sockets,
+        # into the workers, while the initializer already loads everything they need.
+        return ProcessPoolExecutor(
+            max_workers=self.__options.value.RendererWorkerCount,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=user_profile_drawing.initialize,
+            initargs=(asset_paths,)
+        )
+
+    def __get_asset_paths(self) -> UserProfileAssetPaths:
+        get_path = self.__asset_manager.get_asset_path
+        return UserProfileAssetPaths(
+            card_background=get_path("images/user_profiles/card_background.png"),
+            text_background=get_path("images/user_profiles/text_background.png"),
+            badges_background=get_path("images/user_profiles/badges.png"),
+            progress_bar_background=get_path("images/user_profiles/progress_bar_background.png"),
+            default_background=get_path("images/user_profiles/default_background.png"),
+            avatar_border=get_path("images/user_profiles/avatar_border_default.png"),
+            card_border=get_path("images/user_profiles/card_border.png"),
+            reputation_icon=get_path("images/user_profiles/reputation_icon.png"),
+            default_avatar=get_path("images/user_profiles/default_avatar.png"),
+            font=get_path("fonts/AGPmod.ttf"),
+            badges=get_path("images/user_profiles/badge_icons.png")
+        )
@@ -5,6 +5,7 @@ from holobot.extensions.general.models import Badge
 from holobot.extensions.general.models.items import BadgeDisplayInfo
 from holobot.extensions.general.sdk.badges.exceptions import BadgeNotFoundException
 from holobot.extensions.general.sdk.badges.models import BadgeId
+from holobot.sdk.caching import BatchLoader
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
 from holobot.sdk.database.queries import Query
@@ -12,6 +13,7 @@ from holobot.sdk.database.queries.enums import Connector, Equality, Order
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.queries import PaginationResult
+from holobot.sdk.utils.iterable_utils import group_by
 from .ibadge_repository import IBadgeRepository
 from .records import BadgeRecord
 
@@ -42,6 +44,10 @@ class BadgeRepository(
         unit_of_work_provider: IUnitOfWorkProvider
     ) -> None:
         super().__init__(database_manager, unit_of_work_provider)
+        # Badge identifiers aren't hashable, hence the loader is keyed by (server_id, badge_id).
+        self.__display_info_loader = BatchLoader[tuple[int, int], BadgeDisplayInfo](
+            self.__load_display_infos
+        )
 
     async def get_badge_name(self, badge_id: BadgeId) -> str | None:
         async with (session := await self._get_session()):
@@ -66,27 +72,15 @@ class BadgeRepository(
         self,
         badge_id: BadgeId
     ) -> BadgeDisplayInfo:
-        async with (session := await self._get_session()):
-            query = (Query
-                .select()
-                .columns("name", "emoji_id", "emoji_name")
-                .from_table(self.table_name, schema_name=self.schema_name)
-                .where()
-                .fields(
-                    Connector.AND,
-                    ("server_id", Equality.EQUAL, badge_id.server_id),
-                    ("badge_id", Equality.EQUAL, badge_id.badge_id)
-                )
-            )
-            if (result := await query.compile().fetchrow(session.connection)) is None:
-                raise BadgeNotFoundException(badge_id)
-
-            return BadgeDisplayInfo(
-                badge_id=badge_id,
-                name=cast(str, result.get("name")),
-                emoji_id=cast(int, result.get("emoji_id")),
-                emoji_name=cast(str, result.get("emoji_name"))
-            )
+        display_info = await self._load_batched(
+            self.__display_info_loader,
+            BadgeDisplayInfo,
+            (badge_id.server_id, badge_id.badge_id)
+        )
+        if not display_info:
+            raise BadgeNotFoundException(badge_id)
+
+        return display_info
 
     async def get_display_infos(
         self,
@@ -185,3 +179,17 @@ class BadgeRepository(
             emoji_name=model.emoji_name,
             emoji_id=model.emoji_id
         )
+
+    async def __load_display_infos(
+        self,
+        badge_ids: tuple[tuple[int, int], ...]
+    ) -> dict[tuple[int, int], BadgeDisplayInfo]:
+        display_infos = dict[tuple[int, int], BadgeDisplayInfo]()
+        for server_id, server_badge_ids in group_by(badge_ids, lambda i: i[0]).items():
+            for display_info in await self.get_display_infos(
+                server_id,
+                tuple(badge_id for _, badge_id in server_badge_ids)
+            ):
+                display_infos[(server_id, display_info.badge_id.badge_id)] = display_info
+
+        return display_infos
@@ -3,10 +3,10 @@ from collections.abc import Awaitable
 from holobot.extensions.general.models import ChannelTimer
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
-from holobot.sdk.database.queries.enums import Equality, Order
+from holobot.sdk.database.queries.enums import Equality, Order, SeekDirection
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 from .ichannel_timer_repository import IChannelTimerRepository
 from .records import ChannelTimerRecord
 
@@ -41,11 +41,16 @@ class ChannelTimerRepository(
     def count_by_server(self, server_id: int) -> Awaitable[int]:
         return self._count_by_filter(lambda where: where.field("server_id", Equality.EQUAL, server_id))
 
-    def paginate(self, page_index: int, page_size: int) -> Awaitable[PaginationResult[ChannelTimer]]:
-        return self._paginate(
+    def paginate_keyset(
+        self,
+        page_size: int,
+        cursor: str | None
+    ) -> Awaitable[KeysetPaginationResult[ChannelTimer]]:
+        return self._paginate_keyset(
             (("id", Order.ASCENDING),),
-            page_index,
             page_size,
+            cursor,
+            SeekDirection.FORWARD,
             None
         )
 
@@ -6,6 +6,7 @@ from holobot.extensions.general.models.items import CurrencyDisplayInfo
 from holobot.extensions.general.sdk.currencies.data_providers import ICurrencyDataProvider
 from holobot.extensions.general.sdk.currencies.exceptions import CurrencyNotFoundException
 from holobot.extensions.general.sdk.currencies.models import ICurrency
+from holobot.sdk.caching import BatchLoader
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
 from holobot.sdk.database.queries.constraints import (
@@ -48,6 +49,7 @@ class CurrencyRepository(
         unit_of_work_provider: IUnitOfWorkProvider
     ) -> None:
         super().__init__(database_manager, unit_of_work_provider)
+        self.__display_info_loader = BatchLoader[int, CurrencyDisplayInfo](self.__load_display_infos)
 
     def paginate_by_server(
         self,
@@ -150,23 +152,15 @@ class CurrencyRepository(
         self,
         currency_id: int
     ) -> CurrencyDisplayInfo:
-        async with (session := await self._get_session()):
-            query = (Query
-                .select()
-                .columns("id", "name", "emoji_id", "emoji_name")
-                .from_table(self.table_name, schema_name=self.schema_name)
-                .where()
-                .field("id", Equality.EQUAL, currency_id)
-            )
-            if (result := await query.compile().fetchrow(session.connection)) is None:
-                raise CurrencyNotFoundException(currency_id)
+        display_info = await self._load_batched(
+            self.__display_info_loader,
+            CurrencyDisplayInfo,
+            currency_id
+        )
+        if not display_info:
+            raise CurrencyNotFoundException(currency_id)
 
-            return CurrencyDisplayInfo(
-                currency_id=cast(int, result.get("id")),
-                name=cast(str, result.get("name")),
-                emoji_id=cast(int, result.get("emoji_id")),
-                emoji_name=cast(str, result.get("emoji_name"))
-            )
+        return display_info
 
     async def get_display_infos(
         self,
@@ -264,3 +258,12 @@ class CurrencyRepository(
             emoji_name=model.emoji_name,
             is_tradable=model.is_tradable
         )
+
+    async def __load_display_infos(
+        self,
+        currency_ids: tuple[int, ...]
+    ) -> dict[int, CurrencyDisplayInfo]:
+        return {
+            display_info.currency_id: display_info
+            for display_info in await self.get_display_infos(currency_ids)
+        }
@@ -3,13 +3,26 @@ from typing import Protocol
 
 from holobot.extensions.general.models import ChannelTimer
 from holobot.sdk.database.repositories import IRepository
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 
 class IChannelTimerRepository(IRepository[int, ChannelTimer], Protocol):
     def count_by_server(self, server_id: int) -> Awaitable[int]:
         ...
 
-    def paginate(self, page_index: int, page_size: int) -> Awaitable[PaginationResult[ChannelTimer]]:
+    def paginate_keyset(
+        self,
+        page_size: int,
+        cursor: str | None
+    ) -> Awaitable[KeysetPaginationResult[ChannelTimer]]:
+        """Gets the next page of every channel timer, in the order of their identifiers.
+
+        :param page_size: The maximum number of channel timers to get.
+        :type page_size: int
+        :param cursor: The cursor of the previous page, or None to get the first page.
+        :type cursor: str | None
+        :return: The page of channel timers.
+        :rtype: Awaitable[KeysetPaginationResult[ChannelTimer]]
+        """
         ...
 
     def remove_all_by_server(self, server_id: int) -> Awaitable[int]:
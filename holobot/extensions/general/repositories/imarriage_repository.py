@@ -3,8 +3,9 @@ from typing import Protocol
 
 from holobot.extensions.general.enums import RankingType
 from holobot.extensions.general.models import Marriage, RankingInfo
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.database.repositories import IRepository
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 
 class IMarriageRepository(IRepository[int, Marriage], Protocol):
     def get_by_user(
@@ -34,7 +35,8 @@ class IMarriageRepository(IRepository[int, Marriage], Protocol):
         self,
         server_id: int,
         ranking_type: RankingType,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[RankingInfo]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[RankingInfo]]:
         ...
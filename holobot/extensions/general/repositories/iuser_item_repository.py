@@ -4,8 +4,9 @@ from typing import Protocol
 from holobot.extensions.general.models.items import UserItem, WalletWithDetailsDto
 from holobot.extensions.general.models.user_profiles import UserProfileBackgroundInfo
 from holobot.extensions.general.sdk.items.models import UserItemId
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.database.repositories import IRepository
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult, PaginationResult
 
 class IUserItemRepository(IRepository[UserItemId, UserItem], Protocol):
     #region Backgrounds
@@ -55,9 +56,10 @@ class IUserItemRepository(IRepository[UserItemId, UserItem], Protocol):
     def paginate_badges(
         self,
         user_id: int,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[UserItem]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[UserItem]]:
         ...
 
     def badge_exists(
@@ -93,9 +95,61 @@ class IUserItemRepository(IRepository[UserItemId, UserItem], Protocol):
         user_id: int,
         server_id: int,
         include_global: bool = False,
-        page_index: int = 0,
-        page_size: int = 5
-    ) -> Awaitable[PaginationResult[WalletWithDetailsDto]]:
+        page_size: int = 5,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[WalletWithDetailsDto]]:
+        ...
+
+    def deposit_to_wallet(
+        self,
+        user_id: int,
+        server_id: int,
+        currency_id: int,
+        amount: int,
+        new_serial_id: int
+    ) -> Awaitable[tuple[int, int] | None]:
+        """Atomically adds the specified amount to a wallet, creating the wallet if necessary.
+
+        :param user_id: The identifier of the user who owns the wallet.
+        :type user_id: int
+        :param server_id: The identifier of the server the wallet belongs to.
+        :type server_id: int
+        :param currency_id: The identifier of the currency.
+        :type currency_id: int
+        :param amount: The amount to add.
+        :type amount: int
+        :param new_serial_id: The serial identifier used if a new wallet is created.
+        :type new_serial_id: int
+        :return: If the currency is available on the server, the previous and the new amount; otherwise, None.
+        :rtype: Awaitable[tuple[int, int] | None]
+        """
+        ...
+
+    def withdraw_from_wallet(
+        self,
+        user_id: int,
+        server_id: int,
+        currency_id: int,
+        amount: int,
+        allow_take_less: bool
+    ) -> Awaitable[tuple[int, int] | None]:
+        """Atomically takes the specified amount from a wallet.
+
+        :param user_id: The identifier of the user who owns the wallet.
+        :type user_id: int
+        :param server_id: The identifier of the server the wallet belongs to.
+        :type server_id: int
+        :param currency_id: The identifier of the currency.
+        :type currency_id: int
+        :param amount: The amount to take.
+        :type amount: int
+        :param allow_take_less: If the balance is insufficient, whether to take all of it instead of nothing.
+        :type allow_take_less: bool
+        :return: If the wallet exists and the balance is sufficient
+            or allow_take_less is set, the previous and the new amount; otherwise, None.
+        :rtype: Awaitable[tuple[int, int] | None]
+        """
         ...
 
     #endregion
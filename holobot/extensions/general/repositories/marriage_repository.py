@@ -10,10 +10,10 @@ from holobot.sdk.database.queries import Query
 from holobot.sdk.database.queries.constraints import (
     and_expression, column_expression, or_expression
 )
-from holobot.sdk.database.queries.enums import Equality, Order
+from holobot.sdk.database.queries.enums import Equality, Order, SeekDirection
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult, decode_cursor, encode_cursor
 from holobot.sdk.utils import assert_not_none
 from holobot.sdk.utils.datetime_utils import set_time_zone
 from .imarriage_repository import IMarriageRepository
@@ -125,29 +125,44 @@ class MarriageRepository(
         self,
         server_id: int,
         ranking_type: RankingType,
-        page_index: int,
-        page_size: int
-    ) -> PaginationResult[RankingInfo]:
-        columns = set[str](("user_id1", "user_id2", "level", "married_at"))
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginationResult[RankingInfo]:
         ordering_columns = MarriageRepository.__get_ranking_ordering_columns(ranking_type)
-        for ordering_column, _ in ordering_columns:
-            columns.add(ordering_column)
+        if (cursor_values := decode_cursor(cursor)) is not None:
+            if len(cursor_values) != len(ordering_columns):
+                cursor_values = None
+            else:
+                # The timestamps are stored without a time zone.
+                cursor_values = tuple(
+                    set_time_zone(value, None) if isinstance(value, datetime) else value
+                    for value in cursor_values
+                )
 
         async with (session := await self._get_session()):
             result = await (Query
                 .select()
-                .columns(*columns)
+                .columns(
+                    "id", "user_id1", "user_id2", "level", "married_at",
+                    # Keyset pagination needs non-null ordering columns; marriages
+                    # that have never leveled up are ranked by their age instead.
+                    "COALESCE(last_level_up_at, married_at) AS leveled_up_at"
+                )
                 .from_table(self.table_name)
                 .where()
                 .field("server_id", Equality.EQUAL, server_id)
-                .paginate(ordering_columns, page_index, page_size)
+                .paginate_keyset(
+                    ordering_columns,
+                    page_size,
+                    cursor_values,
+                    direction if cursor_values is not None else SeekDirection.FORWARD
+                )
                 .compile().fetch(session.connection)
             )
 
-            return PaginationResult[RankingInfo](
-                result.page_index,
+            return KeysetPaginationResult[RankingInfo](
                 result.page_size,
-                result.total_count,
                 [
                     RankingInfo(
                         user_id1=record["user_id1"],
@@ -156,7 +171,9 @@ class MarriageRepository(
                         married_at=set_time_zone(cast(datetime, record["married_at"]), timezone.utc)
                     )
                     for record in result.records
-                ]
+                ],
+                encode_cursor(result.first_key) if result.has_previous_page and result.first_key else None,
+                encode_cursor(result.last_key) if result.has_next_page and result.last_key else None
             )
 
     def _map_record_to_model(self, record: MarriageRecord) -> Marriage:
@@ -213,6 +230,10 @@ class MarriageRepository(
     ) -> tuple[tuple[str, Order], ...]:
         match ranking_type:
             case RankingType.LEVEL:
-                return (("level", Order.DESCENDING), ("last_level_up_at", Order.ASCENDING))
+                return (
+                    ("level", Order.DESCENDING),
+                    ("leveled_up_at", Order.ASCENDING),
+                    ("id", Order.ASCENDING)
+                )
             case _:
-                return (("married_at", Order.ASCENDING),)
+                return (("married_at", Order.ASCENDING), ("id", Order.ASCENDING))
@@ -15,12 +15,14 @@ from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
 from holobot.sdk.database.queries import WhereBuilder, WhereConstraintBuilder
 from holobot.sdk.database.queries.constraints import column_expression, or_expression
-from holobot.sdk.database.queries.enums import Connector, Equality, Order
+from holobot.sdk.database.queries.enums import Connector, Equality, Order, SeekDirection
 from holobot.sdk.database.queries.query import Query
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.identification import Holoflake
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import (
+    KeysetPaginationResult, PaginationResult, decode_cursor, encode_cursor
+)
 from holobot.sdk.serialization import JsonSerializer
 from .iuser_item_repository import IUserItemRepository
 
@@ -77,6 +79,42 @@ def storage_model_to_item(item: ItemStorageModelBase) -> ItemBase:
         )
     raise TypeError(f"Unknown item type '{type(item).__name__}'.")
 
+_CURRENCY_EXISTS_CONDITION = (
+    "EXISTS (SELECT 1 FROM currencies WHERE id = $3 AND (server_id = $2 OR server_id IS NULL))"
+)
+
+# NOTE: The balance is stored both in the count column and in the JSON data,
+# hence the wallet statements below update both of them.
+# The insert or the increment happens in a single statement, relying on the unique
+# index of wallets; an existing wallet's previous amount is derived from the new one.
+_DEPOSIT_TO_WALLET_QUERY = (
+    "INSERT INTO user_items AS ui (user_id, server_id, item_id1, serial_id, item_type, count, item_data_json)\n"
+    f"SELECT $1::bigint, $2::bigint, $3::bigint, $4::bigint, {ItemType.CURRENCY.value}, $5::integer, $6::text\n"
+    f"WHERE {_CURRENCY_EXISTS_CONDITION}\n"
+    f"ON CONFLICT (user_id, server_id, item_id1) WHERE item_type = {ItemType.CURRENCY.value}\n"
+    "DO UPDATE SET\n"
+    " count = ui.count + EXCLUDED.count,\n"
+    " item_data_json = jsonb_set(ui.item_data_json::jsonb, '{count}', to_jsonb(ui.count + EXCLUDED.count))::text\n"
+    "RETURNING ui.serial_id, ui.count - $5 AS previous_amount, ui.count AS new_amount"
+)
+
+# The locking sub-query provides the previous amount and makes concurrent withdrawals wait.
+_WITHDRAW_FROM_WALLET_QUERY = (
+    "UPDATE user_items AS ui SET\n"
+    " count = w.new_amount,\n"
+    " item_data_json = jsonb_set(ui.item_data_json::jsonb, '{count}', to_jsonb(w.new_amount))::text\n"
+    "FROM (\n"
+    " SELECT serial_id, count AS previous_amount, GREATEST(count - $4, 0) AS new_amount\n"
+    " FROM user_items\n"
+    f" WHERE item_type = {ItemType.CURRENCY.value} AND user_id = $1 AND server_id = $2 AND item_id1 = $3\n"
+    " FOR UPDATE\n"
+    ") AS w\n"
+    "WHERE ui.user_id = $1 AND ui.server_id = $2 AND ui.serial_id = w.serial_id\n"
+    " AND (w.previous_amount >= $4 OR $5)\n"
+    f" AND {_CURRENCY_EXISTS_CONDITION}\n"
+    "RETURNING ui.serial_id, w.previous_amount, w.new_amount"
+)
+
 @injectable(IUserItemRepository)
 class UserItemRepository(
     RepositoryBase[UserItemId, UserItemRecord, UserItem],
@@ -211,22 +249,44 @@ class UserItemRepository(
             )
         ))
 
-    def paginate_badges(
+    async def paginate_badges(
         self,
         user_id: int,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[UserItem]]:
-        return self._paginate(
-            (("serial_id", Order.ASCENDING),),
-            page_index,
-            page_size,
-            lambda where: where.fields(
-                Connector.AND,
-                ("item_type", Equality.EQUAL, ItemType.BADGE),
-                ("user_id", Equality.EQUAL, user_id)
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginationResult[UserItem]:
+        # Serial identifiers are unique holoflakes, hence they alone identify the items
+        # and the cursor stays short enough to fit in the custom ID of the buttons.
+        if (cursor_values := decode_cursor(cursor)) is not None and len(cursor_values) != 1:
+            cursor_values = None
+
+        async with (session := await self._get_session()):
+            result = await (Query
+                .select()
+                .columns(*self.column_names)
+                .from_table(self.table_name)
+                .where()
+                .fields(
+                    Connector.AND,
+                    ("item_type", Equality.EQUAL, ItemType.BADGE),
+                    ("user_id", Equality.EQUAL, user_id)
+                )
+                .paginate_keyset(
+                    (("serial_id", Order.ASCENDING),),
+                    page_size,
+                    cursor_values,
+                    direction if cursor_values is not None else SeekDirection.FORWARD
+                )
+                .compile().fetch(session.connection)
+            )
+
+            return KeysetPaginationResult[UserItem](
+                result.page_size,
+                list(self._map_query_results_to_models(result.records)),
+                encode_cursor(result.first_key) if result.has_previous_page and result.first_key else None,
+                encode_cursor(result.last_key) if result.has_next_page and result.last_key else None
             )
-        )
 
     def badge_exists(
         self,
@@ -282,9 +342,15 @@ class UserItemRepository(
         user_id: int,
         server_id: int,
         include_global: bool = False,
-        page_index: int = 0,
-        page_size: int = 5
-    ) -> PaginationResult[WalletWithDetailsDto]:
+        page_size: int = 5,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginationResult[WalletWithDetailsDto]:
+        # A user has at most one wallet per currency in each server.
+        ordering_columns = (("server_id", Order.ASCENDING), ("item_id1", Order.ASCENDING))
+        if (cursor_values := decode_cursor(cursor)) is not None and len(cursor_values) != len(ordering_columns):
+            cursor_values = None
+
         async with (session := await self._get_session()):
             query = (Query
                 .select()
@@ -306,16 +372,15 @@ class UserItemRepository(
                 server_id,
                 include_global
             )
-            result = await query.paginate(
-                (("server_id", Order.ASCENDING),),
-                page_index,
-                page_size
+            result = await query.paginate_keyset(
+                ordering_columns,
+                page_size,
+                cursor_values,
+                direction if cursor_values is not None else SeekDirection.FORWARD
             ).compile().fetch(session.connection)
 
-            return PaginationResult(
-                result.page_index,
+            return KeysetPaginationResult(
                 result.page_size,
-                result.total_count,
                 [
                     WalletWithDetailsDto(
                         user_id=int(record.get("user_id", 0)),
@@ -327,9 +392,72 @@ class UserItemRepository(
                         currency_emoji_name=record.get("emoji_name", "")
                     )
                     for record in result.records
-                ]
+                ],
+                encode_cursor(result.first_key) if result.has_previous_page and result.first_key else None,
+                encode_cursor(result.last_key) if result.has_next_page and result.last_key else None
             )
 
+    async def deposit_to_wallet(
+        self,
+        user_id: int,
+        server_id: int,
+        currency_id: int,
+        amount: int,
+        new_serial_id: int
+    ) -> tuple[int, int] | None:
+        initial_data_json = _SERIALIZER.serialize(CurrencyItemStorageModel(
+            count=amount,
+            currency_id=currency_id
+        ))
+        async with (session := await self._get_session()):
+            record = await session.connection.fetchrow(
+                _DEPOSIT_TO_WALLET_QUERY,
+                user_id,
+                server_id,
+                currency_id,
+                int(new_serial_id),
+                amount,
+                initial_data_json
+            )
+            if not record:
+                return None
+
+            await self._invalidate_model(UserItemId(
+                user_id=user_id,
+                server_id=server_id,
+                serial_id=record["serial_id"]
+            ))
+
+            return (record["previous_amount"], record["new_amount"])
+
+    async def withdraw_from_wallet(
+        self,
+        user_id: int,
+        server_id: int,
+        currency_id: int,
+        amount: int,
+        allow_take_less: bool
+    ) -> tuple[int, int] | None:
+        async with (session := await self._get_session()):
+            record = await session.connection.fetchrow(
+                _WITHDRAW_FROM_WALLET_QUERY,
+                user_id,
+                server_id,
+                currency_id,
+                amount,
+                allow_take_less
+            )
+            if not record:
+                return None
+
+            await self._invalidate_model(UserItemId(
+                user_id=user_id,
+                server_id=server_id,
+                serial_id=record["serial_id"]
+            ))
+
+            return (record["previous_amount"], record["new_amount"])
+
     #endregion
 
     def _map_record_to_model(self, record: UserItemRecord) -> UserItem:
@@ -3,15 +3,31 @@ from typing import Protocol
 
 from holobot.extensions.general.models.user_profiles import RankingInfo, UserProfile
 from holobot.extensions.general.sdk.badges.models.badge_id import BadgeId
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.database.repositories import IRepository
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 
 class IUserProfileRepository(IRepository[int, UserProfile], Protocol):
     def paginate_rankings(
         self,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[RankingInfo]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD,
+        total_count: int | None = None
+    ) -> Awaitable[KeysetPaginationResult[RankingInfo]]:
+        """Gets a page of the reputation ranking by seeking from the specified cursor.
+
+        :param page_size: The size of the page.
+        :type page_size: int
+        :param cursor: The cursor of a previous page to seek from, defaults to None
+        :type cursor: str | None, optional
+        :param direction: The direction to seek in from the cursor, defaults to SeekDirection.FORWARD
+        :type direction: SeekDirection, optional
+        :param total_count: The total count known from a previous page; if None, it's counted, defaults to None
+        :type total_count: int | None, optional
+        :return: A pagination result containing the ranking entries.
+        :rtype: Awaitable[KeysetPaginationResult[RankingInfo]]
+        """
         ...
 
     def is_badge_equipped(
@@ -3,6 +3,7 @@ from typing import cast
 
 from holobot.extensions.general.models.items import BackgroundDisplayInfo
 from holobot.extensions.general.models.user_profiles import UserProfileBackground
+from holobot.sdk.caching import BatchLoader
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
 from holobot.sdk.database.queries import Query
@@ -39,6 +40,7 @@ class UserProfileBackgroundRepository(
         unit_of_work_provider: IUnitOfWorkProvider
     ) -> None:
         super().__init__(database_manager, unit_of_work_provider)
+        self.__display_info_loader = BatchLoader[int, BackgroundDisplayInfo](self.__load_display_infos)
 
     def get_by_code(self, background_code: str) -> Awaitable[UserProfileBackground | None]:
         return self._get_by_filter(lambda where: where.field(
@@ -94,21 +96,15 @@ class UserProfileBackgroundRepository(
         self,
         background_id: int
     ) -> BackgroundDisplayInfo:
-        async with (session := await self._get_session()):
-            query = (Query
-                .select()
-                .columns("name")
-                .from_table(self.table_name)
-                .where()
-                .field("id", Equality.EQUAL, background_id)
-            )
-            if (result := await query.compile().fetchrow(session.connection)) is None:
-                raise ValueError(f"Background with identifier '{background_id}' cannot be found.")
+        display_info = await self._load_batched(
+            self.__display_info_loader,
+            BackgroundDisplayInfo,
+            background_id
+        )
+        if not display_info:
+            raise ValueError(f"Background with identifier '{background_id}' cannot be found.")
 
-            return BackgroundDisplayInfo(
-                background_id=background_id,
-                name=cast(str, result.get("name"))
-            )
+        return display_info
 
     async def get_display_infos(
         self,
@@ -147,3 +143,12 @@ class UserProfileBackgroundRepository(
             code=model.code,
             name=model.name
         )
+
+    async def __load_display_infos(
+        self,
+        background_ids: tuple[int, ...]
+    ) -> dict[int, BackgroundDisplayInfo]:
+        return {
+            display_info.background_id: display_info
+            for display_info in await self.get_display_infos(background_ids)
+        }
@@ -4,14 +4,15 @@ from holobot.extensions.general.models.user_profiles import RankingInfo, UserPro
 from holobot.extensions.general.sdk.badges.models import BadgeId
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
+from holobot.sdk.database.enums import CountMode
 from holobot.sdk.database.queries import Query
 from holobot.sdk.database.queries.constraints import (
     and_expression, column_expression, or_expression
 )
-from holobot.sdk.database.queries.enums import Equality, Order
+from holobot.sdk.database.queries.enums import Equality, Order, SeekDirection
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult, decode_cursor, encode_cursor
 from .iuser_profile_repository import IUserProfileRepository
 from .records import UserProfileRecord
 
@@ -45,30 +46,46 @@ class UserProfileRepository(
 
     async def paginate_rankings(
         self,
-        page_index: int,
-        page_size: int
-    ) -> PaginationResult[RankingInfo]:
-        columns = set[str](("id", "reputation_points"))
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD,
+        total_count: int | None = None
+    ) -> KeysetPaginationResult[RankingInfo]:
+        ordering_columns = (
+            ("reputation_points", Order.DESCENDING),
+            ("id", Order.ASCENDING)
+        )
+        if (cursor_values := decode_cursor(cursor)) is not None and len(cursor_values) != len(ordering_columns):
+            cursor_values = None
+
         async with (session := await self._get_session()):
             result = await (Query
                 .select()
-                .columns(*columns)
+                .columns("id", "reputation_points")
                 .from_table(self.table_name)
-                .paginate((("reputation_points", Order.DESCENDING),), page_index, page_size)
+                .paginate_keyset(
+                    ordering_columns,
+                    page_size,
+                    cursor_values,
+                    direction if cursor_values is not None else SeekDirection.FORWARD
+                )
                 .compile().fetch(session.connection)
             )
+            if total_count is None:
+                total_count = await self._count_for_pagination(session.connection, CountMode.EXACT)
 
-            return PaginationResult[RankingInfo](
-                result.page_index,
+            return KeysetPaginationResult[RankingInfo](
                 result.page_size,
-                result.total_count,
                 [
                     RankingInfo(
                         user_id=record["id"],
                         reputation_points=record["reputation_points"]
                     )
                     for record in result.records
-                ]
+                ],
+                encode_cursor(result.first_key) if result.has_previous_page and result.first_key else None,
+                encode_cursor(result.last_key) if result.has_next_page and result.last_key else None,
+                total_count
             )
 
     def is_badge_equipped(
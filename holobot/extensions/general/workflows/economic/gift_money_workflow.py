@@ -7,14 +7,14 @@ from holobot.discord.sdk.workflows.interactables.models import (
     AutocompleteOption, InteractionResponse, Option
 )
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
-from holobot.extensions.general.models.items import CurrencyItem, UserItem
 from holobot.extensions.general.repositories import ICurrencyRepository, IUserItemRepository
-from holobot.extensions.general.sdk.items.models import UserItemId
+from holobot.extensions.general.sdk.wallets.exceptions import (
+    NotEnoughMoneyException, WalletNotFoundException
+)
 from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.extensions.general.workflows.economic.utils import get_currency_autocomplete_choices
 from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.i18n import II18nProvider
-from holobot.sdk.identification import IHoloflakeProvider
 from holobot.sdk.ioc.decorators import injectable
 
 _MONEY_AMOUNT_MAX: int = 1_000_000_000
@@ -25,7 +25,6 @@ class GiftMoneyWorkflow(WorkflowBase):
     def __init__(
         self,
         currency_repository: ICurrencyRepository,
-        holoflake_provider: IHoloflakeProvider,
         i18n_provider: II18nProvider,
         unit_of_work_provider: IUnitOfWorkProvider,
         user_item_repository: IUserItemRepository,
@@ -33,10 +32,10 @@ class GiftMoneyWorkflow(WorkflowBase):
     ) -> None:
         super().__init__()
         self.__currency_repository = currency_repository
-        self.__holoflake_provider = holoflake_provider
         self.__i18n = i18n_provider
         self.__unit_of_work_provider = unit_of_work_provider
         self.__user_item_repository = user_item_repository
+        self.__wallet_manager = wallet_manager
 
     @command(
         group_name="economic",
@@ -92,12 +91,21 @@ class GiftMoneyWorkflow(WorkflowBase):
                     content=self.__i18n.get("extensions.general.gift_money_workflow.currency_untradable_error")
                 )
 
-            own_wallet = await self.__user_item_repository.get_wallet(
-                context.author_id,
-                currency_item.server_id or 0,
-                currency_id
-            )
-            if not own_wallet or own_wallet.item.count < amount:
+            wallet_server_id = currency_item.server_id or 0
+            try:
+                await self.__wallet_manager.take_money(
+                    context.author_id,
+                    currency_id,
+                    wallet_server_id,
+                    amount,
+                    False
+                )
+            except (WalletNotFoundException, NotEnoughMoneyException):
+                own_wallet = await self.__user_item_repository.get_wallet(
+                    context.author_id,
+                    wallet_server_id,
+                    currency_id
+                )
                 return self._reply(
                     content=self.__i18n.get(
                         "extensions.general.gift_money_workflow.not_enough_money_error",
@@ -109,30 +117,12 @@ class GiftMoneyWorkflow(WorkflowBase):
                     )
                 )
 
-            target_wallet = await self.__user_item_repository.get_wallet(
+            await self.__wallet_manager.give_money(
                 user,
-                currency_item.server_id or 0,
-                currency_id
+                currency_id,
+                wallet_server_id,
+                amount
             )
-            if target_wallet:
-                target_wallet.item.count += amount
-                await self.__user_item_repository.update(target_wallet)
-            else:
-                target_wallet = UserItem(
-                    identifier=UserItemId(
-                        server_id=currency_item.server_id or 0,
-                        user_id=user,
-                        serial_id=self.__holoflake_provider.get_next_id()
-                    ),
-                    item=CurrencyItem(
-                        count=amount,
-                        currency_id=currency_id
-                    )
-                )
-                await self.__user_item_repository.add(target_wallet)
-
-            own_wallet.item.count -= amount
-            await self.__user_item_repository.update(own_wallet)
 
             unit_of_work.complete()
 
@@ -140,8 +130,8 @@ class GiftMoneyWorkflow(WorkflowBase):
             content=self.__i18n.get(
                 "extensions.general.gift_money_workflow.successfully_gifted_money",
                 {
-                    "target_user_id": target_wallet.identifier.user_id,
-                    "user_id": own_wallet.identifier.user_id,
+                    "target_user_id": user,
+                    "user_id": context.author_id,
                     "amount": amount,
                     "emoji_id": currency_item.emoji_id,
                     "emoji_name": currency_item.emoji_name
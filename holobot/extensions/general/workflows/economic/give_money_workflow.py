@@ -8,13 +8,11 @@ from holobot.discord.sdk.workflows.interactables.models import (
     AutocompleteOption, InteractionResponse, Option
 )
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
-from holobot.extensions.general.models.items import CurrencyItem, UserItem
-from holobot.extensions.general.repositories import ICurrencyRepository, IUserItemRepository
-from holobot.extensions.general.sdk.items.models import UserItemId
+from holobot.extensions.general.repositories import ICurrencyRepository
+from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.extensions.general.workflows.economic.utils import get_currency_autocomplete_choices
 from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.i18n import II18nProvider
-from holobot.sdk.identification import IHoloflakeProvider
 from holobot.sdk.ioc.decorators import injectable
 
 _MONEY_AMOUNT_MAX: int = 1_000_000_000
@@ -25,17 +23,15 @@ class GiveMoneyWorkflow(WorkflowBase):
     def __init__(
         self,
         currency_repository: ICurrencyRepository,
-        holoflake_provider: IHoloflakeProvider,
         i18n_provider: II18nProvider,
         unit_of_work_provider: IUnitOfWorkProvider,
-        user_item_repository: IUserItemRepository
+        wallet_manager: IWalletManager
     ) -> None:
         super().__init__()
         self.__currency_repository = currency_repository
-        self.__holoflake_provider = holoflake_provider
         self.__i18n = i18n_provider
         self.__unit_of_work_provider = unit_of_work_provider
-        self.__user_item_repository = user_item_repository
+        self.__wallet_manager = wallet_manager
 
     @command(
         group_name="economic",
@@ -78,36 +74,20 @@ class GiveMoneyWorkflow(WorkflowBase):
                     content=self.__i18n.get("extensions.general.give_money_workflow.invalid_currency_error")
                 )
 
-            wallet = await self.__user_item_repository.get_wallet(
+            exchange_info = await self.__wallet_manager.give_money(
                 user,
+                currency_id,
                 context.server_id,
-                currency_id
+                amount
             )
-            if wallet:
-                wallet.item.count += amount
-                await self.__user_item_repository.update(wallet)
-            else:
-                wallet = UserItem(
-                    identifier=UserItemId(
-                        server_id=context.server_id,
-                        user_id=user,
-                        serial_id=self.__holoflake_provider.get_next_id()
-                    ),
-                    item=CurrencyItem(
-                        count=amount,
-                        currency_id=currency_id
-                    )
-                )
-                await self.__user_item_repository.add(wallet)
-
             unit_of_work.complete()
 
         return self._reply(
             content=self.__i18n.get(
                 "extensions.general.give_money_workflow.successfully_gave_money",
                 {
-                    "user_id": wallet.identifier.user_id,
-                    "amount": wallet.item.count,
+                    "user_id": user,
+                    "amount": exchange_info.new_amount,
                     "emoji_id": currency_item.emoji_id,
                     "emoji_name": currency_item.emoji_name
                 }
@@ -8,7 +8,9 @@ from holobot.discord.sdk.workflows.interactables.models import (
     AutocompleteOption, InteractionResponse, Option
 )
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
-from holobot.extensions.general.repositories import ICurrencyRepository, IUserItemRepository
+from holobot.extensions.general.repositories import ICurrencyRepository
+from holobot.extensions.general.sdk.wallets.exceptions import WalletNotFoundException
+from holobot.extensions.general.sdk.wallets.managers import IWalletManager
 from holobot.extensions.general.workflows.economic.utils import get_currency_autocomplete_choices
 from holobot.sdk.database import IUnitOfWorkProvider
 from holobot.sdk.i18n import II18nProvider
@@ -23,13 +25,13 @@ class TakeMoneyWorkflow(WorkflowBase):
         currency_repository: ICurrencyRepository,
         i18n_provider: II18nProvider,
         unit_of_work_provider: IUnitOfWorkProvider,
-        user_item_repository: IUserItemRepository
+        wallet_manager: IWalletManager
     ) -> None:
         super().__init__()
         self.__currency_repository = currency_repository
         self.__i18n = i18n_provider
         self.__unit_of_work_provider = unit_of_work_provider
-        self.__user_item_repository = user_item_repository
+        self.__wallet_manager = wallet_manager
 
     @command(
         group_name="economic",
@@ -67,8 +69,15 @@ class TakeMoneyWorkflow(WorkflowBase):
                     content=self.__i18n.get("extensions.general.take_money_workflow.invalid_currency_error")
                 )
 
-            wallet = await self.__user_item_repository.get_wallet(user, context.server_id, currency_id)
-            if not wallet:
+            try:
+                exchange_info = await self.__wallet_manager.take_money(
+                    user,
+                    currency_id,
+                    context.server_id,
+                    amount,
+                    True
+                )
+            except WalletNotFoundException:
                 return self._reply(
                     content=self.__i18n.get(
                         "extensions.general.take_money_workflow.user_has_no_money_error",
@@ -78,16 +87,14 @@ class TakeMoneyWorkflow(WorkflowBase):
                     )
                 )
 
-            wallet.item.count = max(wallet.item.count - amount, 0)
-            await self.__user_item_repository.update(wallet)
             unit_of_work.complete()
 
         return self._reply(
             content=self.__i18n.get(
                 "extensions.general.take_money_workflow.successfully_removed_money",
                 {
-                    "user_id": wallet.identifier.user_id,
-                    "amount": wallet.item.count,
+                    "user_id": user,
+                    "amount": exchange_info.new_amount,
                     "emoji_id": currency_item.emoji_id,
                     "emoji_name": currency_item.emoji_name
                 }
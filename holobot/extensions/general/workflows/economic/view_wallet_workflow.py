@@ -4,13 +4,13 @@ from holobot.discord.sdk.workflows import IWorkflow, WorkflowBase
 from holobot.discord.sdk.workflows.interactables.components import (
     ComponentBase, LayoutBase, Paginator, PaginatorState
 )
-from holobot.discord.sdk.workflows.interactables.components.component_utils import get_custom_int
 from holobot.discord.sdk.workflows.interactables.decorators import command, component
 from holobot.discord.sdk.workflows.interactables.models import Cooldown, InteractionResponse
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
 from holobot.extensions.general.options import EconomicOptions
 from holobot.extensions.general.repositories import IUserItemRepository
 from holobot.sdk.configs import IOptions
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils.type_utils import UndefinedOrNoneOr
@@ -47,7 +47,9 @@ class ViewWalletWorkflow(WorkflowBase):
             server_id,
             True,
             0,
-            _PAGE_SIZE
+            _PAGE_SIZE,
+            None,
+            SeekDirection.FORWARD
         )
 
         return self._reply(
@@ -66,18 +68,17 @@ class ViewWalletWorkflow(WorkflowBase):
         context: InteractionContext,
         state: PaginatorState
     ) -> InteractionResponse:
-        if (
-            not isinstance(context, ServerChatInteractionContext)
-            or (user_id := get_custom_int(state.custom_data, "u", 0)) is None
-        ):
-            return self._edit_message(content=self.__i18n.get("interactions.invalid_interaction_data_error"))
-
+        # The wallet always belongs to the owner of the paginator and the current server,
+        # which keeps the custom data short enough for the cursor.
+        server_id = context.server_id if isinstance(context, ServerChatInteractionContext) else 0
         content, embed, components = await self.__create_page_content(
-            user_id,
-            get_custom_int(state.custom_data, "s", 0) or 0,
+            state.owner_id,
+            server_id,
             state.custom_data.get("g", "0") == "1",
             max(state.current_page, 0),
-            _PAGE_SIZE
+            _PAGE_SIZE,
+            state.custom_data.get("c"),
+            SeekDirection.BACKWARD if state.custom_data.get("d") == "b" else SeekDirection.FORWARD
         )
 
         return self._edit_message(
@@ -92,7 +93,9 @@ class ViewWalletWorkflow(WorkflowBase):
         server_id: int,
         include_global: bool,
         page_index: int,
-        page_size: int
+        page_size: int,
+        cursor: str | None,
+        direction: SeekDirection
     ) -> tuple[
         UndefinedOrNoneOr[str],
         UndefinedOrNoneOr[Embed],
@@ -102,15 +105,17 @@ class ViewWalletWorkflow(WorkflowBase):
             user_id,
             server_id,
             include_global,
-            page_index,
-            page_size
+            page_size,
+            cursor,
+            direction
         )
-        if not result.items and result.total_count > 0:
+        if not result.items and cursor is not None:
+            # The wallets past the cursor may have been emptied since.
+            page_index = 0
             result = await self.__user_item_repository.paginate_wallets_with_details(
                 user_id,
                 server_id,
                 include_global,
-                0,
                 page_size
             )
 
@@ -145,14 +150,13 @@ class ViewWalletWorkflow(WorkflowBase):
         layouts = Paginator(
             id="gn_wallet_pagi",
             owner_id=user_id,
-            current_page=result.page_index,
+            current_page=page_index,
             page_size=result.page_size,
-            total_count=result.total_count,
-            custom_data={
-                "u": user_id,
-                "s": server_id,
-                "g": "1" if include_global else "0"
-            }
+            has_previous_page=result.previous_cursor is not None,
+            has_next_page=result.next_cursor is not None,
+            custom_data={ "g": "1" if include_global else "0" },
+            previous_page_custom_data={ "c": result.previous_cursor, "d": "b" } if result.previous_cursor else {},
+            next_page_custom_data={ "c": result.next_cursor, "d": "f" } if result.next_cursor else {}
         )
 
         return (None, embed, layouts)
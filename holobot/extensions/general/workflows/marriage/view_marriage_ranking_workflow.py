@@ -15,6 +15,7 @@ from holobot.discord.sdk.workflows.interactables.models import (
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
 from holobot.extensions.general.enums import RankingType
 from holobot.extensions.general.managers import IMarriageManager
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils.iterable_utils import select_many
@@ -63,7 +64,9 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
             context.author_id,
             RankingType(type) if type is not None else RankingType.LEVEL,
             0,
-            ViewMarriageRankingWorkflow._DEFAULT_PAGE_SIZE
+            ViewMarriageRankingWorkflow._DEFAULT_PAGE_SIZE,
+            None,
+            SeekDirection.FORWARD
         )
 
         return self._reply(
@@ -96,7 +99,9 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
             state.owner_id,
             ranking_type,
             max(state.current_page, 0),
-            ViewMarriageRankingWorkflow._DEFAULT_PAGE_SIZE
+            ViewMarriageRankingWorkflow._DEFAULT_PAGE_SIZE,
+            state.custom_data.get("c"),
+            SeekDirection.BACKWARD if state.custom_data.get("d") == "b" else SeekDirection.FORWARD
         )
 
         return self._edit_message(
@@ -111,7 +116,9 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
         user_id: int,
         ranking_type: RankingType,
         page_index: int,
-        page_size: int
+        page_size: int,
+        cursor: str | None,
+        direction: SeekDirection
     ) -> tuple[
             UndefinedOrNoneOr[str],
             UndefinedOrNoneOr[Embed],
@@ -120,8 +127,9 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
         result = await self.__marriage_manager.get_ranking_infos(
             server_id,
             ranking_type,
-            page_index,
-            page_size
+            page_size,
+            cursor,
+            direction
         )
         if not result.items:
             return (
@@ -151,7 +159,7 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
             else "extensions.general.view_marriage_ranking_workflow.level_"
         )
         for index, item in enumerate(result.items):
-            rank = index + result.page_index * result.page_size + 1
+            rank = index + page_index * result.page_size + 1
             match rank:
                 case 1:
                     i18n_key = f"{i18n_key_prefix}top1_descriptor"
@@ -195,8 +203,11 @@ class ViewMarriageRankingWorkflow(WorkflowBase):
             owner_id=user_id,
             current_page=page_index,
             page_size=page_size,
-            total_count=result.total_count,
-            custom_data={ ViewMarriageRankingWorkflow._RANKING_TYPE_KEY: ranking_type }
+            has_previous_page=result.previous_cursor is not None,
+            has_next_page=result.next_cursor is not None,
+            custom_data={ ViewMarriageRankingWorkflow._RANKING_TYPE_KEY: ranking_type },
+            previous_page_custom_data={ "c": result.previous_cursor, "d": "b" } if result.previous_cursor else {},
+            next_page_custom_data={ "c": result.next_cursor, "d": "f" } if result.next_cursor else {}
         )
 
         return (None, embed, component)
@@ -20,7 +20,7 @@ from holobot.extensions.general.sdk.wallets.exceptions import (
     CurrencyNotFoundException, NotEnoughMoneyException, WalletNotFoundException
 )
 from holobot.sdk.configs import IOptions
-from holobot.sdk.database import IUnitOfWorkProvider
+from holobot.sdk.database import IQueryFanOut, IUnitOfWorkProvider
 from holobot.sdk.i18n import localize
 from holobot.sdk.ioc.decorators import injectable
 from .utils import autocomplete_global_shop, autocomplete_shop
@@ -33,6 +33,7 @@ class BrowseShopsWorkflow(WorkflowBase):
         self,
         currency_repository: ICurrencyRepository,
         options: IOptions[GeneralOptions],
+        query_fan_out: IQueryFanOut,
         shop_manager: IShopManager,
         unit_of_work_provider: IUnitOfWorkProvider,
         user_item_manager: IUserItemManager
@@ -40,6 +41,7 @@ class BrowseShopsWorkflow(WorkflowBase):
         super().__init__()
         self.__currency_repository = currency_repository
         self.__options = options
+        self.__query_fan_out = query_fan_out
         self.__shop_manager = shop_manager
         self.__unit_of_work_provider = unit_of_work_provider
         self.__user_item_manager = user_item_manager
@@ -201,9 +203,6 @@ class BrowseShopsWorkflow(WorkflowBase):
 
                 unit_of_work.complete()
 
-            item_display_info = await self.__user_item_manager.get_item_display_info(
-                transaction_info.item.item
-            )
             if transaction_info.outcome == GrantItemOutcome.GRANTED_ALREADY:
                 return self._edit_message(
                     content=localize("extensions.general.browse_shops_workflow.item_owned_already_error"),
@@ -228,8 +227,9 @@ class BrowseShopsWorkflow(WorkflowBase):
 
             exchange_info = transaction_info.exchange_info
             transaction_cost = exchange_info.previous_amount - exchange_info.new_amount
-            currency_display_info = await self.__currency_repository.get_display_info(
-                exchange_info.currency_id
+            item_display_info, currency_display_info = await self.__query_fan_out.fetch(
+                self.__user_item_manager.get_item_display_info(transaction_info.item.item),
+                self.__currency_repository.get_display_info(exchange_info.currency_id)
             )
 
             return self._edit_message(
@@ -11,6 +11,7 @@ from holobot.discord.sdk.workflows.interactables.components import (
 )
 from holobot.discord.sdk.workflows.interactables.decorators import command, component
 from holobot.discord.sdk.workflows.interactables.models import Cooldown, InteractionResponse
+from holobot.extensions.general.exceptions import RendererBusyError
 from holobot.extensions.general.factories import IUserProfileFactory
 from holobot.extensions.general.models.items import BackgroundItem
 from holobot.extensions.general.models.user_profiles import UserProfileBackground
@@ -231,6 +232,19 @@ class ViewProfileBackgroundsWorkflow(UserProfileWorkflowBase):
             _PAGE_SIZE
         )
 
+        try:
+            user_profile_image = await self._generate_user_profile(
+                user_id,
+                user_profile,
+                background.code
+            )
+        except RendererBusyError:
+            return (
+                self.__i18n.get("extensions.general.view_profile_backgrounds_workflow.renderer_busy_error"),
+                None,
+                None
+            )
+
         embed = Embed(
             title=self.__i18n.get("extensions.general.view_profile_backgrounds_workflow.embed_title"),
             description=self.__i18n.get(
@@ -239,11 +253,7 @@ class ViewProfileBackgroundsWorkflow(UserProfileWorkflowBase):
                     "name": background.name
                 }
             ),
-            image_attachment=await self._generate_user_profile(
-                user_id,
-                user_profile,
-                background.code
-            )
+            image_attachment=user_profile_image
         )
 
         comboBox = StackLayout(
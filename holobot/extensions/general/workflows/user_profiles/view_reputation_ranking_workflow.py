@@ -8,6 +8,7 @@ from holobot.discord.sdk.workflows.interactables.components.models import Pagina
 from holobot.discord.sdk.workflows.interactables.decorators import command, component
 from holobot.discord.sdk.workflows.interactables.models import Cooldown, InteractionResponse
 from holobot.extensions.general.repositories.user_profiles import IUserProfileRepository
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils.type_utils import UndefinedOrNoneOr
@@ -40,7 +41,10 @@ class ViewReputationRankingWorkflow(WorkflowBase):
         content, embed, components = await self.__create_page_content(
             context.author_id,
             0,
-            ViewReputationRankingWorkflow._DEFAULT_PAGE_SIZE
+            ViewReputationRankingWorkflow._DEFAULT_PAGE_SIZE,
+            None,
+            SeekDirection.FORWARD,
+            None
         )
 
         return self._reply(
@@ -58,10 +62,16 @@ class ViewReputationRankingWorkflow(WorkflowBase):
         context: InteractionContext,
         state: PaginatorState
     ) -> InteractionResponse:
+        # The cursor and the total count of the previous page are carried by the buttons
+        # so that deep pages are fetched by seeking instead of counting and skipping rows.
+        total_count = state.custom_data.get("t")
         content, embed, components = await self.__create_page_content(
             state.owner_id,
             max(state.current_page, 0),
-            ViewReputationRankingWorkflow._DEFAULT_PAGE_SIZE
+            ViewReputationRankingWorkflow._DEFAULT_PAGE_SIZE,
+            state.custom_data.get("c"),
+            SeekDirection.BACKWARD if state.custom_data.get("d") == "b" else SeekDirection.FORWARD,
+            int(total_count) if total_count and total_count.isdigit() else None
         )
 
         return self._edit_message(
@@ -74,15 +84,20 @@ class ViewReputationRankingWorkflow(WorkflowBase):
         self,
         user_id: int,
         page_index: int,
-        page_size: int
+        page_size: int,
+        cursor: str | None,
+        direction: SeekDirection,
+        total_count: int | None
     ) -> tuple[
             UndefinedOrNoneOr[str],
             UndefinedOrNoneOr[Embed],
             ComponentBase | list[LayoutBase] | None
         ]:
         result = await self.__user_profile_repository.paginate_rankings(
-            page_index,
-            page_size
+            page_size,
+            cursor,
+            direction,
+            total_count
         )
         if not result.items:
             return (
@@ -103,7 +118,7 @@ class ViewReputationRankingWorkflow(WorkflowBase):
 
         entries = list[str]()
         for index, item in enumerate(result.items):
-            rank_index = result.page_index * result.page_size + index + 1
+            rank_index = page_index * result.page_size + index + 1
             user_name = user_names[item.user_id]
             entries.append(
                 self.__i18n.get(
@@ -134,7 +149,12 @@ class ViewReputationRankingWorkflow(WorkflowBase):
             owner_id=user_id,
             current_page=page_index,
             page_size=page_size,
-            total_count=result.total_count
+            total_count=result.total_count,
+            has_previous_page=result.previous_cursor is not None,
+            has_next_page=result.next_cursor is not None,
+            custom_data={ "t": str(result.total_count) } if result.total_count is not None else {},
+            previous_page_custom_data={ "c": result.previous_cursor, "d": "b" } if result.previous_cursor else {},
+            next_page_custom_data={ "c": result.next_cursor, "d": "f" } if result.next_cursor else {}
         )
 
         return ("\n".join(content), None, component)
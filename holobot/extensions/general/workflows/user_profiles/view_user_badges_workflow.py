@@ -18,6 +18,7 @@ from holobot.extensions.general.repositories import IBadgeRepository, IUserItemR
 from holobot.extensions.general.repositories.user_profiles import IUserProfileRepository
 from holobot.extensions.general.sdk.badges.models import BadgeId
 from holobot.sdk.database import IUnitOfWorkProvider
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.utils.iterable_utils import batch
@@ -68,7 +69,9 @@ class ViewUserBadgesWorkflow(WorkflowBase):
             context.author_id,
             0,
             ViewUserBadgesWorkflow._DEFAULT_PAGE_SIZE,
-            user if user else context.author_id
+            user if user else context.author_id,
+            None,
+            SeekDirection.FORWARD
         )
 
         return self._reply(
@@ -97,7 +100,9 @@ class ViewUserBadgesWorkflow(WorkflowBase):
             state.owner_id,
             max(state.current_page, 0),
             ViewUserBadgesWorkflow._DEFAULT_PAGE_SIZE,
-            user_id
+            user_id,
+            state.custom_data.get("c"),
+            SeekDirection.BACKWARD if state.custom_data.get("d") == "b" else SeekDirection.FORWARD
         )
 
         return self._edit_message(
@@ -127,7 +132,9 @@ class ViewUserBadgesWorkflow(WorkflowBase):
             state.owner_id,
             0,
             ViewUserBadgesWorkflow._DEFAULT_PAGE_SIZE,
-            user_id
+            user_id,
+            None,
+            SeekDirection.FORWARD
         )
 
         return self._edit_message(
@@ -301,14 +308,16 @@ class ViewUserBadgesWorkflow(WorkflowBase):
         owner_id: int,
         page_index: int,
         page_size: int,
-        user_id: int
+        user_id: int,
+        cursor: str | None,
+        direction: SeekDirection
     ) -> tuple[
         UndefinedOrNoneOr[str],
         UndefinedOrNoneOr[Embed],
         ComponentBase | list[LayoutBase] | None
     ]:
         is_self = owner_id == user_id
-        result = await self.__user_item_repository.paginate_badges(user_id, page_index, page_size)
+        result = await self.__user_item_repository.paginate_badges(user_id, page_size, cursor, direction)
         if not result.items:
             return (
                 self.__i18n.get(
@@ -391,8 +400,11 @@ class ViewUserBadgesWorkflow(WorkflowBase):
             owner_id=owner_id,
             current_page=page_index,
             page_size=page_size,
-            total_count=result.total_count,
-            custom_data={ "u": user_id }
+            has_previous_page=result.previous_cursor is not None,
+            has_next_page=result.next_cursor is not None,
+            custom_data={ "u": user_id },
+            previous_page_custom_data={ "c": result.previous_cursor, "d": "b" } if result.previous_cursor else {},
+            next_page_custom_data={ "c": result.next_cursor, "d": "f" } if result.next_cursor else {}
         ))
 
         return (None, embed, layouts)
@@ -9,6 +9,7 @@ from holobot.discord.sdk.workflows.interactables.decorators import command, comp
 from holobot.discord.sdk.workflows.interactables.enums import OptionType
 from holobot.discord.sdk.workflows.interactables.models import Cooldown, InteractionResponse, Option
 from holobot.discord.sdk.workflows.models import ServerChatInteractionContext
+from holobot.extensions.general.exceptions import RendererBusyError
 from holobot.extensions.general.factories import IUserProfileFactory
 from holobot.extensions.general.repositories.user_profiles import IUserProfileRepository
 from holobot.sdk.caching import IObjectCache
@@ -97,9 +98,10 @@ class ShowUserProfileWorkflow(UserProfileWorkflowBase):
         if not (user_profile := await self.__user_profile_repository.get(target_user_id)):
             return self.__i18n.get("extensions.general.show_user_profile_workflow.profile_not_found_error")
 
-        user_profile_image = await self._generate_user_profile(
-            target_user_id,
-            user_profile
-        )
-
-        return user_profile_image
+        try:
+            return await self._generate_user_profile(
+                target_user_id,
+                user_profile
+            )
+        except RendererBusyError:
+            return self.__i18n.get("extensions.general.show_user_profile_workflow.renderer_busy_error")
@@ -11,10 +11,16 @@ class ExternalGiveawayItemMigration(MigrationBase):
             "external_giveaway_items",
             [
                 MigrationPlan(1, self.__initialize_table),
-                MigrationPlan(2, self.__upgrade_to_v2)
+                MigrationPlan(2, self.__upgrade_to_v2),
+                MigrationPlan(202610181400, self.__add_url_index)
             ]
         )
 
+    async def __add_url_index(self, connection: Connection) -> None:
+        await connection.execute(
+            f"CREATE INDEX ix_external_giveaway_items_url ON {self.table_name} (url)"
+        )
+
     async def __upgrade_to_v2(self, connection: Connection) -> None:
         await connection.execute((
             f"ALTER TABLE {self.table_name}"
@@ -10,6 +10,7 @@ class GiveawayOptions(OptionsDefinition):
     EnableScrapers: bool = True
     RunnerResolution: int = 60
     RunnerDelay: int = 40
+    ScraperTimeout: int = 120
     AnnouncementServerId: int = 0
     AnnouncementChannelId: int = 0
     GiveawayEmbedThumbnailUrl: str = ""
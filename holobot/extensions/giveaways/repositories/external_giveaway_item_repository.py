@@ -1,9 +1,9 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 
 from holobot.extensions.giveaways.models import ExternalGiveawayItem, ExternalGiveawayItemMetadata
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
-from holobot.sdk.database.queries import Query, WhereBuilder, WhereConstraintBuilder
+from holobot.sdk.database.queries import CompiledQuery, Query, WhereBuilder, WhereConstraintBuilder
 from holobot.sdk.database.queries.enums import Equality, Order
 from holobot.sdk.database.repositories import RepositoryBase
 from holobot.sdk.ioc.decorators import injectable
@@ -100,20 +100,22 @@ class ExternalGiveawayItemRepository(
                 ]
             )
 
-    async def exists(self, url: str, active_only: bool = True) -> bool:
+    async def get_existing_urls(
+        self,
+        urls: Iterable[str],
+        active_only: bool = True
+    ) -> set[str]:
+        unique_urls = list(set(urls))
+        if not unique_urls:
+            return set()
+
         async with (session := await self._get_session()):
-            query = (Query
-                .select()
-                .columns("id")
-                .from_table(self.table_name)
-                .where()
-                .field("url", Equality.EQUAL, url)
-            )
+            query = f"SELECT DISTINCT url FROM {self.table_name} WHERE url = ANY($1::VARCHAR[])"
             if active_only:
-                query = query.and_field(
-                    "end_time", Equality.GREATER, "(NOW() AT TIME ZONE 'utc')", True
-                )
-            return bool(await query.exists().compile().fetchval(session.connection))
+                query += " AND end_time > (NOW() AT TIME ZONE 'utc')"
+            records = await CompiledQuery(query, (unique_urls,)).fetch(session.connection)
+
+            return {record["url"] for record in records}
 
     def delete_expired(self) -> Awaitable[int]:
         return self._delete_by_filter(
@@ -1,4 +1,4 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Iterable
 from typing import Protocol
 
 from holobot.extensions.giveaways.models import ExternalGiveawayItem, ExternalGiveawayItemMetadata
@@ -27,7 +27,20 @@ class IExternalGiveawayItemRepository(
     ) -> Awaitable[PaginationResult[ExternalGiveawayItemMetadata]]:
         ...
 
-    def exists(self, url: str, active_only: bool = True) -> Awaitable[bool]:
+    def get_existing_urls(
+        self,
+        urls: Iterable[str],
+        active_only: bool = True
+    ) -> Awaitable[set[str]]:
+        """Gets which of the specified URLs belong to an existing item.
+
+        :param urls: The URLs to look for.
+        :type urls: Iterable[str]
+        :param active_only: Whether only items that haven't ended yet should be considered.
+        :type active_only: bool, optional
+        :return: The subset of the URLs that belong to an existing item.
+        :rtype: Awaitable[set[str]]
+        """
         ...
 
     def delete_expired(self) -> Awaitable[int]:
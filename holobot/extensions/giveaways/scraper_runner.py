@@ -1,17 +1,15 @@
 import asyncio
-import contextlib
-from collections.abc import Awaitable
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 from holobot.extensions.giveaways.models import GiveawayOptions
 from holobot.sdk.configs import IOptions
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.lifecycle import IStartable
+from holobot.sdk.lifecycle import IJob
+from holobot.sdk.lifecycle.models import JobSchedule
 from holobot.sdk.logging import ILoggerFactory
 from holobot.sdk.network.resilience.exceptions import CircuitBrokenError
 from holobot.sdk.reactive import IListener
-from holobot.sdk.threading import CancellationToken, CancellationTokenSource
-from holobot.sdk.threading.utils import wait
+from holobot.sdk.threading import CancellationToken
 from holobot.sdk.utils import utcnow
 from .events.models import NewGiveawaysEvent
 from .iscraper_manager import IScraperManager
@@ -19,12 +17,21 @@ from .models import ExternalGiveawayItem, ScraperInfo
 from .repositories import IExternalGiveawayItemRepository, IScraperInfoRepository
 from .scrapers import IScraper
 
-@injectable(IStartable)
+@injectable(IJob)
 @injectable(IScraperManager)
-class ScraperRunner(IScraperManager, IStartable):
+class ScraperRunner(IScraperManager, IJob):
     @property
-    def priority(self) -> int:
-        return 1000
+    def name(self) -> str:
+        return "giveaway_scrapers"
+
+    @property
+    def schedule(self) -> JobSchedule:
+        options = self.__options.value
+        return JobSchedule(
+            interval=timedelta(seconds=options.RunnerResolution),
+            initial_delay=timedelta(seconds=options.RunnerDelay),
+            is_enabled=options.EnableScrapers and bool(self.__scrapers)
+        )
 
     def __init__(
         self,
@@ -42,32 +49,6 @@ class ScraperRunner(IScraperManager, IStartable):
         self.__options = options
         self.__scraper_info_repository = scraper_info_repository
         self.__scrapers = scrapers
-        self.__token_source: CancellationTokenSource | None = None
-        self.__background_task: Awaitable[None] | None = None
-
-    async def start(self) -> None:
-        options = self.__options.value
-        if not options.EnableScrapers:
-            self.__logger.info("Giveaway scraping is disabled by configuration")
-            return
-
-        if not self.__scrapers:
-            self.__logger.info("Giveaway scraping is disabled, because there are no loaded scrapers")
-            return
-
-        self.__logger.info("Giveaway scraping is enabled", delay=options.RunnerDelay, resolution=options.RunnerResolution)
-        self.__token_source = CancellationTokenSource()
-        self.__background_task = asyncio.create_task(
-            self.__run_scrapers(self.__token_source.token)
-        )
-
-    async def stop(self) -> None:
-        if self.__token_source:
-            self.__token_source.cancel()
-        if self.__background_task:
-            with contextlib.suppress(asyncio.exceptions.CancelledError):
-                await self.__background_task
-        self.__logger.debug("Stopped background task")
 
     async def invalidate_scrape_time(self, scraper_name: str) -> None:
         scraper_info = await self.__scraper_info_repository.get_by_name(scraper_name)
@@ -77,61 +58,96 @@ class ScraperRunner(IScraperManager, IStartable):
         scraper_info.last_scrape_time = utcnow() - timedelta(days=30)
         await self.__scraper_info_repository.update(scraper_info)
 
-    async def __run_scrapers(self, token: CancellationToken):
-        options = self.__options.value
-        await wait(options.RunnerDelay, token)
-        while not token.is_cancellation_requested:
-            self.__logger.trace("Running giveaway scrapers...")
-            run_count = 0
-            giveaway_items: list[ExternalGiveawayItem] = []
-            for scraper in self.__scrapers:
-                giveaway_items.extend(await self.__run_scraper(scraper))
-                run_count += 1
-            self.__logger.trace("Ran giveaway scrapers", count=run_count)
-
-            await self.__notify_listeners(tuple(giveaway_items))
-
-            deleted_count = await self.__external_giveaway_item_repository.delete_expired()
-            if deleted_count > 0:
-                self.__logger.debug("Deleted expired giveaway items", count=deleted_count)
-
-            await wait(options.RunnerResolution, token)
-
-    async def __run_scraper(self, scraper: IScraper) -> tuple[ExternalGiveawayItem, ...]:
+    async def run(self, token: CancellationToken) -> None:
+        self.__logger.trace("Running giveaway scrapers...")
+        timeout = self.__options.value.ScraperTimeout
+        results = await asyncio.gather(*(
+            self.__run_scraper(scraper, timeout)
+            for scraper in self.__scrapers
+        ))
+        scraped_results = [result for result in results if result is not None]
+        self.__logger.trace("Ran giveaway scrapers", count=len(scraped_results))
+
+        new_giveaway_items = await self.__add_new_giveaway_items([
+            item
+            for _, _, scraped_giveaway_items in scraped_results
+            for item in scraped_giveaway_items
+        ])
+        # Scrape times are updated only after the items have been stored,
+        # so that a failed insertion is retried on the next run.
+        for scraper_name, scraper_info, _ in scraped_results:
+            await self.__update_scrape_time(scraper_name, scraper_info)
+
+        await self.__notify_listeners(new_giveaway_items)
+
+        deleted_count = await self.__external_giveaway_item_repository.delete_expired()
+        if deleted_count > 0:
+            self.__logger.debug("Deleted expired giveaway items", count=deleted_count)
+
+    async def __run_scraper(
+        self,
+        scraper: IScraper,
+        timeout: int
+    ) -> tuple[str, ScraperInfo | None, tuple[ExternalGiveawayItem, ...]] | None:
+        scraper_name = type(scraper).__name__
         try:
-            scraper_name = type(scraper).__name__
             scraper_info = await self.__scraper_info_repository.get_by_name(scraper_name)
             last_scrape_time = scraper_info.last_scrape_time if scraper_info else None
 
             next_scrape_time = scraper.get_next_scrape_time(last_scrape_time)
             if utcnow() < next_scrape_time:
                 self.__logger.trace("Postponed scraping", name=scraper_name, scrape_at=next_scrape_time)
-                return ()
+                return None
 
             self.__logger.trace("Running giveaway scraper...", name=scraper_name)
-            scraped_giveaway_items = await scraper.scrape()
-            new_giveaway_items: list[ExternalGiveawayItem] = []
-            self.__logger.trace("Ran giveaway scraper", name=scraper_name)
-            for item in scraped_giveaway_items:
-                if not await self.__external_giveaway_item_repository.exists(item.url):
-                    new_giveaway_items.append(item)
-                    await self.__external_giveaway_item_repository.add(item)
-
-            if scraper_info:
-                scraper_info.last_scrape_time = utcnow()
-                await self.__scraper_info_repository.update(scraper_info)
-            else:
-                await self.__scraper_info_repository.add(
-                    ScraperInfo(scraper_name=scraper_name, last_scrape_time=utcnow())
-                )
-
-            return tuple(new_giveaway_items)
+            scraped_giveaway_items = await asyncio.wait_for(scraper.scrape(), timeout)
+            self.__logger.trace("Ran giveaway scraper", name=scraper_name, count=len(scraped_giveaway_items))
+
+            return (scraper_name, scraper_info, tuple(scraped_giveaway_items))
         except CircuitBrokenError:
-            return ()
+            return None
+        except asyncio.TimeoutError:
+            self.__logger.warning(
+                "Cancelled a giveaway scraper exceeding its timeout",
+                name=scraper_name,
+                timeout=timeout
+            )
+            return None
         except Exception as error: # pylint: disable=broad-except
-            self.__logger.error("An error has occurred while running a giveaway scraper", error)
+            self.__logger.error("An error has occurred while running a giveaway scraper", error, name=scraper_name)
+            return None
+
+    async def __add_new_giveaway_items(
+        self,
+        giveaway_items: list[ExternalGiveawayItem]
+    ) -> tuple[ExternalGiveawayItem, ...]:
+        if not giveaway_items:
             return ()
 
+        existing_urls = await self.__external_giveaway_item_repository.get_existing_urls(
+            item.url for item in giveaway_items
+        )
+        new_giveaway_items: list[ExternalGiveawayItem] = []
+        for item in giveaway_items:
+            # Different scrapers may find the same giveaway, too.
+            if item.url not in existing_urls:
+                existing_urls.add(item.url)
+                new_giveaway_items.append(item)
+
+        await self.__external_giveaway_item_repository.add_many(new_giveaway_items)
+        self.__logger.trace("Added new giveaway items", count=len(new_giveaway_items))
+
+        return tuple(new_giveaway_items)
+
+    async def __update_scrape_time(self, scraper_name: str, scraper_info: ScraperInfo | None) -> None:
+        if scraper_info:
+            scraper_info.last_scrape_time = utcnow()
+            await self.__scraper_info_repository.update(scraper_info)
+        else:
+            await self.__scraper_info_repository.add(
+                ScraperInfo(scraper_name=scraper_name, last_scrape_time=utcnow())
+            )
+
     async def __notify_listeners(
         self,
         giveaway_items: tuple[ExternalGiveawayItem, ...]
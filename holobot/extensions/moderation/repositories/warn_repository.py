@@ -102,10 +102,7 @@ class WarnRepository(
                 result.page_index,
                 result.page_size,
                 result.total_count,
-                [
-                    self._map_record_to_model(self._map_query_result_to_record(record))
-                    for record in result.records
-                ]
+                list(self._map_query_results_to_models(result.records))
             )
 
     async def add_warn(
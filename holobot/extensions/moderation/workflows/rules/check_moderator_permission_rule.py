@@ -24,6 +24,10 @@ class CheckModeratorPermissionRule(IWorkflowExecutionRule):
         self.__member_data_provider = member_data_provider
         self.__permission_manager = permission_manager
 
+    @property
+    def priority(self) -> int:
+        return 30
+
     async def should_halt(
         self,
         workflow: IWorkflow,
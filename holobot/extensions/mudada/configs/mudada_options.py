@@ -33,6 +33,9 @@ class MudadaOptions(OptionsDefinition):
     The chart data will be passed as `chart_data`.
     """
 
+    FeatureStateCacheDuration: int = 60
+    """The time, in seconds, for which the feature states are served from memory."""
+
     Valentine2025MaxReward: int = 0
     Valentine2025RewardPerRating: int = 0
     Valentine2025RewardCurrencyCode: str = "MUDERATEST"
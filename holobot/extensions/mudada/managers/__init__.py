@@ -0,0 +1,2 @@
+from .feature_state_manager import FeatureStateManager
+from .ifeature_state_manager import IFeatureStateManager
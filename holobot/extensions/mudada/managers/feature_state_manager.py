@@ -0,0 +1,44 @@
+from datetime import timedelta
+
+from holobot.extensions.mudada.configs import MudadaOptions
+from holobot.extensions.mudada.models import FeatureState
+from holobot.extensions.mudada.repositories import IFeatureStateRepository
+from holobot.sdk.configs import IOptions
+from holobot.sdk.database import IUnitOfWorkProvider
+from holobot.sdk.database.repositories import EntitySnapshot
+from holobot.sdk.ioc.decorators import injectable
+from .ifeature_state_manager import IFeatureStateManager
+
+@injectable(IFeatureStateManager)
+class FeatureStateManager(IFeatureStateManager):
+    def __init__(
+        self,
+        feature_state_repository: IFeatureStateRepository,
+        options: IOptions[MudadaOptions],
+        unit_of_work_provider: IUnitOfWorkProvider
+    ) -> None:
+        super().__init__()
+        self.__feature_state_repository = feature_state_repository
+        self.__unit_of_work_provider = unit_of_work_provider
+        self.__feature_states = EntitySnapshot[str, FeatureState](
+            feature_state_repository.get_all,
+            timedelta(seconds=options.value.FeatureStateCacheDuration)
+        )
+
+    async def is_feature_enabled(self, feature_name: str) -> bool:
+        feature_state = await self.__feature_states.get(feature_name)
+        return feature_state.is_enabled if feature_state else False
+
+    async def set_feature_state(self, feature_name: str, is_enabled: bool) -> None:
+        try:
+            async with (unit_of_work := await self.__unit_of_work_provider.create_new()):
+                feature_state = await self.__feature_state_repository.get(feature_name)
+                if feature_state:
+                    feature_state.is_enabled = is_enabled
+                    await self.__feature_state_repository.update(feature_state)
+                else:
+                    await self.__feature_state_repository.add(FeatureState(feature_name, is_enabled))
+
+                unit_of_work.complete()
+        finally:
+            self.__feature_states.invalidate()
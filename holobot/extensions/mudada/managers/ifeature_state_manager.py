@@ -0,0 +1,24 @@
+from typing import Protocol
+
+class IFeatureStateManager(Protocol):
+    """Interface for a service used to manage the states of Mudada features."""
+
+    async def is_feature_enabled(self, feature_name: str) -> bool:
+        """Determines whether the specified feature is enabled.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :return: True, if the feature exists and is enabled.
+        :rtype: bool
+        """
+        ...
+
+    async def set_feature_state(self, feature_name: str, is_enabled: bool) -> None:
+        """Turns the specified feature on or off.
+
+        :param feature_name: The name of the feature.
+        :type feature_name: str
+        :param is_enabled: Whether the feature is to be enabled.
+        :type is_enabled: bool
+        """
+        ...
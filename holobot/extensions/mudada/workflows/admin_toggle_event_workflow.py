@@ -13,10 +13,7 @@ from holobot.extensions.mudada.constants import (
     MUDADA_FEATURE_NAME, VALENTINES_2024_EVENT_TOGGLE_FEATURE_NAME,
     VALENTINES_2025_EVENT_TOGGLE_FEATURE_NAME
 )
-from holobot.extensions.mudada.models.feature_state import FeatureState
-from holobot.extensions.mudada.repositories import IFeatureStateRepository
-from holobot.sdk.database import IUnitOfWorkProvider
-from holobot.sdk.database.repositories import IEntityCache
+from holobot.extensions.mudada.managers import IFeatureStateManager
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 
@@ -34,16 +31,12 @@ EVENT_TYPE_TO_FEATURE_STATE_NAME_MAP: dict[EventType, str] = {
 class AdminToggleEventWorkflow(WorkflowBase):
     def __init__(
         self,
-        entity_cache: IEntityCache,
-        feature_state_repository: IFeatureStateRepository,
-        i18n_provider: II18nProvider,
-        unit_of_work_provider: IUnitOfWorkProvider
+        feature_state_manager: IFeatureStateManager,
+        i18n_provider: II18nProvider
     ) -> None:
         super().__init__()
-        self.__entity_cache = entity_cache
-        self.__feature_state_repository = feature_state_repository
+        self.__feature_state_manager = feature_state_manager
         self.__i18n = i18n_provider
-        self.__unit_of_work_provider = unit_of_work_provider
 
     @command(
         group_name="mudada",
@@ -77,18 +70,7 @@ class AdminToggleEventWorkflow(WorkflowBase):
 
         event_type = EventType(event)
         feature_state_name = EVENT_TYPE_TO_FEATURE_STATE_NAME_MAP[event_type]
-        async with (unit_of_work := await self.__unit_of_work_provider.create_new()):
-            feature_state = await self.__feature_state_repository.get(feature_state_name)
-            if feature_state:
-                feature_state.is_enabled = enabled
-                await self.__feature_state_repository.update(feature_state)
-            else:
-                feature_state = FeatureState(feature_state_name, enabled)
-                await self.__feature_state_repository.add(feature_state)
-
-            unit_of_work.complete()
-
-        await self.__entity_cache.invalidate(FeatureState, feature_state_name)
+        await self.__feature_state_manager.set_feature_state(feature_state_name, enabled)
 
         return self._reply(
             content=self.__i18n.get(
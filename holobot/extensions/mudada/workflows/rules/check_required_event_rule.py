@@ -2,10 +2,8 @@ from holobot.discord.sdk.models import InteractionContext
 from holobot.discord.sdk.workflows import IWorkflow
 from holobot.discord.sdk.workflows.interactables import Interactable
 from holobot.discord.sdk.workflows.rules import IWorkflowExecutionRule
-from holobot.extensions.mudada.models import FeatureState
-from holobot.extensions.mudada.repositories import IFeatureStateRepository
+from holobot.extensions.mudada.managers import IFeatureStateManager
 from holobot.extensions.mudada.workflows.decorators.requires_event import REQUIRED_EVENT_NAME_KEY
-from holobot.sdk.database.repositories import IEntityCache
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 
@@ -13,15 +11,21 @@ from holobot.sdk.ioc.decorators import injectable
 class CheckRequiredEventRule(IWorkflowExecutionRule):
     def __init__(
         self,
-        entity_cache: IEntityCache,
-        feature_state_repository: IFeatureStateRepository,
+        feature_state_manager: IFeatureStateManager,
         i18n_provider: II18nProvider
     ) -> None:
         super().__init__()
-        self.__entity_cache = entity_cache
-        self.__feature_state_repository = feature_state_repository
+        self.__feature_state_manager = feature_state_manager
         self.__i18n = i18n_provider
 
+    @property
+    def priority(self) -> int:
+        return 50
+
+    @property
+    def is_io_bound(self) -> bool:
+        return False
+
     async def should_halt(
         self,
         workflow: IWorkflow,
@@ -32,12 +36,7 @@ class CheckRequiredEventRule(IWorkflowExecutionRule):
         if not required_event_name:
             return (False, None)
 
-        if not (feature_state := await self.__entity_cache.get(FeatureState, required_event_name)):
-            feature_state = await self.__feature_state_repository.get(required_event_name)
-            if feature_state:
-                await self.__entity_cache.set(feature_state)
-
-        if not feature_state or not feature_state.is_enabled:
+        if not await self.__feature_state_manager.is_feature_enabled(required_event_name):
             return (
                 True,
                 self.__i18n.get("extensions.mudada.inactive_event_error")
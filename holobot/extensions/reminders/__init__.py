@@ -1,3 +1,5 @@
 from .ireminder_manager import IReminderManager
+from .ireminder_scheduler import IReminderScheduler
 from .reminder_manager import ReminderManager
 from .reminder_processor import ReminderProcessor
+from .reminder_scheduler import ReminderScheduler
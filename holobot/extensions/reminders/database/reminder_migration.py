@@ -14,10 +14,16 @@ class ReminderMigration(MigrationBase):
                 MigrationPlan(2, self.__upgrade_to_v2),
                 MigrationPlan(3, self.__upgrade_to_v3),
                 MigrationPlan(4, self.__upgrade_to_v4),
-                MigrationPlan(202411071725, self.__upgrade_to_v5)
+                MigrationPlan(202411071725, self.__upgrade_to_v5),
+                MigrationPlan(202610181300, self.__add_next_trigger_index)
             ]
         )
 
+    async def __add_next_trigger_index(self, connection: Connection) -> None:
+        await connection.execute(
+            f"CREATE INDEX ix_reminders_next_trigger ON {self.table_name} (next_trigger)"
+        )
+
     async def __upgrade_to_v5(self, connection: Connection) -> None:
         await connection.execute(
             f"ALTER TABLE {self.table_name}"
@@ -1,6 +1,7 @@
 from typing import Protocol
 
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.database.queries.enums import SeekDirection
+from holobot.sdk.queries import KeysetPaginationResult
 from .models import Reminder, ReminderConfig
 
 class IReminderManager(Protocol):
@@ -10,5 +11,11 @@ class IReminderManager(Protocol):
     async def delete_reminder(self, user_id: int, reminder_id: int) -> None:
         ...
 
-    async def get_by_user(self, user_id: int, page_index: int, page_size: int) -> PaginationResult[Reminder]:
+    async def get_by_user(
+        self,
+        user_id: int,
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginationResult[Reminder]:
         ...
@@ -0,0 +1,80 @@
+from collections.abc import Awaitable, Iterable
+from datetime import datetime
+from typing import Protocol
+
+from .models import Reminder
+
+class IReminderScheduler(Protocol):
+    """Interface for the in-memory schedule of the upcoming reminders.
+
+    The schedule holds the reminders that trigger within the current window,
+    which is loaded from the database in advance, and it's kept up to date by
+    notifications about the reminders created, rescheduled or removed since.
+    """
+
+    @property
+    def window_end(self) -> datetime | None:
+        """Gets the time until which the schedule holds every reminder, if loaded."""
+        ...
+
+    def schedule(self, reminder: Reminder) -> None:
+        """Adds a new reminder or reschedules an existing one.
+
+        Reminders triggering after the end of the current window are ignored,
+        as they're loaded together with a later window.
+
+        :param reminder: The reminder to schedule.
+        :type reminder: Reminder
+        """
+        ...
+
+    def unschedule(self, reminder_id: int) -> None:
+        """Removes a reminder from the schedule.
+
+        :param reminder_id: The identifier of the reminder to remove.
+        :type reminder_id: int
+        """
+        ...
+
+    def begin_load(self) -> None:
+        """Indicates that a new window is being loaded.
+
+        Notifications received until the window is loaded are replayed over the loaded reminders.
+        """
+        ...
+
+    def load(self, reminders: Iterable[Reminder], window_end: datetime) -> None:
+        """Replaces the schedule with the specified window.
+
+        :param reminders: Every reminder triggering until the end of the window.
+        :type reminders: Iterable[Reminder]
+        :param window_end: The end of the window, inclusive.
+        :type window_end: datetime
+        """
+        ...
+
+    def get_next_trigger(self) -> datetime | None:
+        """Gets the time of the next reminder in the schedule, if any.
+
+        :return: If there is one, the time of the next reminder; otherwise, None.
+        :rtype: datetime | None
+        """
+        ...
+
+    def pop_due(self, until: datetime) -> tuple[Reminder, ...]:
+        """Removes and returns the reminders triggering until the specified time.
+
+        :param until: The time until which to get the reminders, inclusive.
+        :type until: datetime
+        :return: The due reminders, in the order of triggering.
+        :rtype: tuple[Reminder, ...]
+        """
+        ...
+
+    def wait_for_change(self, timeout: float) -> Awaitable[None]:
+        """Waits until a reminder is scheduled earlier than the current next one or the timeout elapses.
+
+        :param timeout: The maximum time to wait for, in seconds.
+        :type timeout: float
+        """
+        ...
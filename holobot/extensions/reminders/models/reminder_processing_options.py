@@ -8,8 +8,25 @@ class ReminderProcessingOptions(OptionsDefinition):
     section_name: ClassVar[str] = "Reminders"
 
     IsEnabled: bool = True
-    Resolution: int = 60
     Delay: int = 30
 
+    ScheduleWindow: int = 3600
+    """The time, in seconds, for which the upcoming reminders are loaded in advance."""
+
+    ScheduleWindowSize: int = 1000
+    """The maximum number of upcoming reminders loaded at once."""
+
     BelatedReminderAfter: int = 300
     """The time, in seconds, after which a reminder counts as a belated reminder."""
+
+    MaxConcurrentDeliveries: int = 10
+    """The maximum number of reminder notifications sent concurrently."""
+
+    GlobalDeliveryRate: int = 25
+    """The maximum number of reminder notifications sent per second."""
+
+    ChannelDeliveryRate: int = 5
+    """The maximum number of reminder notifications sent to the same channel per ChannelDeliveryInterval."""
+
+    ChannelDeliveryInterval: int = 5
+    """The time, in seconds, for which ChannelDeliveryRate applies."""
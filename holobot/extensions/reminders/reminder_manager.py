@@ -3,13 +3,15 @@ from typing import cast
 
 from holobot.extensions.reminders.exceptions import InvalidMessageLengthError
 from holobot.sdk.configs import IOptions
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.exceptions import ArgumentError
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.logging import ILoggerFactory
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 from holobot.sdk.utils import utcnow
 from .exceptions import InvalidReminderConfigError, InvalidReminderError, TooManyRemindersError
 from .ireminder_manager import IReminderManager
+from .ireminder_scheduler import IReminderScheduler
 from .models import Reminder, ReminderConfig, ReminderOptions
 from .repositories import IReminderRepository
 
@@ -19,11 +21,13 @@ class ReminderManager(IReminderManager):
         self,
         logger_factory: ILoggerFactory,
         options: IOptions[ReminderOptions],
-        reminder_repository: IReminderRepository
+        reminder_repository: IReminderRepository,
+        reminder_scheduler: IReminderScheduler
     ) -> None:
         super().__init__()
         self.__logger = logger_factory.create(ReminderManager)
         self.__reminder_repository = reminder_repository
+        self.__reminder_scheduler = reminder_scheduler
         self.__options = options
 
     async def set_reminder(self, user_id: int, config: ReminderConfig) -> Reminder:
@@ -54,6 +58,8 @@ class ReminderManager(IReminderManager):
         else:
             raise ArgumentError("occurrence", "Either the frequency or the specific time of the occurrence must be specified.")
 
+        self.__reminder_scheduler.schedule(reminder)
+
         self.__logger.debug("Set new reminder", user_id=user_id, next_trigger=reminder.next_trigger, base_trigger=reminder.base_trigger, repeats=reminder.is_repeating)
         return reminder
 
@@ -65,8 +71,16 @@ class ReminderManager(IReminderManager):
         if deleted_count == 0:
             raise InvalidReminderError("The specified reminder doesn't exist or belong to the specified user.")
 
-    async def get_by_user(self, user_id: int, page_index: int, page_size: int) -> PaginationResult[Reminder]:
-        return await self.__reminder_repository.get_many(user_id, page_index, page_size)
+        self.__reminder_scheduler.unschedule(reminder_id)
+
+    async def get_by_user(
+        self,
+        user_id: int,
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginationResult[Reminder]:
+        return await self.__reminder_repository.get_many(user_id, page_size, cursor, direction)
 
     @staticmethod
     def __assert_message(
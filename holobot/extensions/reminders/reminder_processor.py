@@ -1,5 +1,6 @@
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Iterator
+from datetime import datetime, timedelta
 
 from holobot.discord.sdk import IMessaging
 from holobot.discord.sdk.exceptions import (
@@ -8,23 +9,49 @@ from holobot.discord.sdk.exceptions import (
 from holobot.discord.sdk.servers import IMemberDataProvider
 from holobot.extensions.reminders.enums import ReminderLocation
 from holobot.extensions.reminders.models import Reminder
+from holobot.sdk.concurrency import AsyncRateLimiter
 from holobot.sdk.configs import IOptions
+from holobot.sdk.diagnostics import Histogram
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.lifecycle import IStartable
+from holobot.sdk.lifecycle import IJob, IStartable
+from holobot.sdk.lifecycle.models import JobSchedule
 from holobot.sdk.logging import ILoggerFactory
 from holobot.sdk.threading import CancellationToken, CancellationTokenSource
-from holobot.sdk.threading.utils import wait
 from holobot.sdk.utils import utcnow
+from .ireminder_scheduler import IReminderScheduler
 from .models import ReminderProcessingOptions
 from .repositories import IReminderRepository
 
+_RETRY_DELAY = timedelta(seconds=60)
+
 @injectable(IStartable)
-class ReminderProcessor(IStartable):
+@injectable(IJob)
+class ReminderProcessor(IStartable, IJob):
+    """Delivers the due reminders as soon as they trigger.
+
+    The upcoming window of reminders is loaded periodically as a job,
+    while the delivery runs in the background, waiting for the next reminder.
+    """
+
     @property
     def priority(self) -> int:
         return 1000
 
+    @property
+    def name(self) -> str:
+        return "reminder_window"
+
+    @property
+    def schedule(self) -> JobSchedule:
+        options = self.__options.value
+        # Loading the next window halfway through the current one keeps it ahead.
+        return JobSchedule(
+            interval=timedelta(seconds=options.ScheduleWindow) / 2,
+            initial_delay=timedelta(seconds=options.Delay),
+            is_enabled=options.IsEnabled
+        )
+
     def __init__(
         self,
         i18n_provider: II18nProvider,
@@ -32,7 +59,8 @@ class ReminderProcessor(IStartable):
         member_data_provider: IMemberDataProvider,
         messaging: IMessaging,
         options: IOptions[ReminderProcessingOptions],
-        reminder_repository: IReminderRepository
+        reminder_repository: IReminderRepository,
+        reminder_scheduler: IReminderScheduler
     ) -> None:
         super().__init__()
         self.__i18n_provider = i18n_provider
@@ -41,8 +69,19 @@ class ReminderProcessor(IStartable):
         self.__messaging: IMessaging = messaging
         self.__options = options
         self.__reminder_repository: IReminderRepository = reminder_repository
+        self.__reminder_scheduler = reminder_scheduler
         self.__token_source: CancellationTokenSource | None = None
-        self.__background_task: Awaitable[None] | None = None
+        self.__background_task: asyncio.Task[None] | None = None
+        # Held by loads and delivery cycles, because a load during a cycle would
+        # bring back the popped reminders that haven't been removed yet.
+        self.__schedule_lock = asyncio.Lock()
+        # Set when a window has to be loaded earlier than the next run of the job.
+        self.__next_load_at: datetime | None = None
+        self.__global_rate_limiter = AsyncRateLimiter(
+            options.value.GlobalDeliveryRate,
+            timedelta(seconds=1)
+        )
+        self.__channel_rate_limiters = dict[int, AsyncRateLimiter]()
 
     async def start(self):
         options = self.__options.value
@@ -53,7 +92,7 @@ class ReminderProcessor(IStartable):
         self.__logger.info(
             "Reminders are enabled",
             delay=options.Delay,
-            resolution=options.Resolution
+            schedule_window=options.ScheduleWindow
         )
         self.__token_source = CancellationTokenSource()
         self.__background_task = asyncio.create_task(
@@ -63,56 +102,169 @@ class ReminderProcessor(IStartable):
     async def stop(self):
         if self.__token_source: self.__token_source.cancel()
         if self.__background_task:
+            # The task may be waiting for the next reminder.
+            self.__background_task.cancel()
             try:
                 await self.__background_task
             except asyncio.exceptions.CancelledError:
                 pass
         self.__logger.debug("Stopped background task")
 
+    async def run(self, token: CancellationToken) -> None:
+        try:
+            await self.__load_schedule_window()
+        except Exception:
+            self.__schedule_retry()
+            raise
+
     async def __process_reminders(self, token: CancellationToken):
-        await wait(self.__options.value.Delay, token)
         while not token.is_cancellation_requested:
-            self.__logger.trace("Processing reminders...")
-            processed_reminders: int = 0
             try:
-                reminders = await self.__reminder_repository.get_triggerable()
-                for reminder in reminders:
-                    await self.__try_process_reminder(reminder)
-                    processed_reminders += 1
+                if self.__next_load_at and utcnow() >= self.__next_load_at:
+                    await self.__load_schedule_window()
+
+                async with self.__schedule_lock:
+                    if reminders := self.__reminder_scheduler.pop_due(utcnow()):
+                        await self.__process_due_reminders(reminders)
             except Exception as error:
                 self.__logger.error("Unexpected failure while processing reminders", error)
-            finally:
-                self.__logger.trace("Processed reminders", count=processed_reminders)
-            await wait(self.__options.value.Resolution, token)
+                self.__schedule_retry()
+            await self.__reminder_scheduler.wait_for_change(self.__get_time_until_next_event())
 
-    async def __try_process_reminder(self, reminder: Reminder) -> None:
-        try:
-            await self.__process_reminder(reminder)
-        except (ForbiddenError, UserNotFoundError, ServerNotFoundError, ChannelNotFoundError) as error:
-            self.__logger.debug(
-                "Failed to send reminder notification, will not retry.",
-                exception=error,
-                reminder_id=reminder.identifier,
-                user_id=reminder.user_id
+    async def __load_schedule_window(self) -> None:
+        options = self.__options.value
+        async with self.__schedule_lock:
+            # The job may have waited for a delivery cycle to finish.
+            current_time = utcnow()
+            window_end = current_time + timedelta(seconds=options.ScheduleWindow)
+            self.__reminder_scheduler.begin_load()
+            reminders = await self.__reminder_repository.get_triggerable(
+                window_end,
+                options.ScheduleWindowSize
             )
-            await self.__reminder_repository.delete(reminder.identifier)
 
-    async def __process_reminder(self, reminder: Reminder) -> None:
-        await self.__send_notification(reminder)
-        if not reminder.is_repeating:
-            await self.__reminder_repository.delete(reminder.identifier)
-            return
+            self.__next_load_at = None
+            if len(reminders) >= options.ScheduleWindowSize:
+                # Reminders triggering at the same time as the last one may be left out,
+                # but they're loaded with the next window, by which they're due.
+                window_end = reminders[-1].next_trigger
+                self.__next_load_at = current_time + max(window_end - current_time, timedelta()) / 2
+
+            self.__reminder_scheduler.load(reminders, window_end)
+            self.__logger.trace("Loaded reminders", count=len(reminders), window_end=window_end)
+
+    def __get_time_until_next_event(self) -> float:
+        current_time = utcnow()
+        # Waking up at least this often makes sure that a retry is never delayed.
+        next_event_at = current_time + _RETRY_DELAY
+        for event_at in (self.__next_load_at, self.__reminder_scheduler.get_next_trigger()):
+            if event_at and event_at < next_event_at:
+                next_event_at = event_at
 
-        reminder.last_trigger = utcnow()
-        reminder.recalculate_next_trigger()
-        await self.__reminder_repository.update(reminder)
-        self.__logger.trace(
-            "Processed reminder",
-            reminder_id=reminder.identifier,
-            next_trigger=int(reminder.next_trigger.timestamp())
+        return (next_event_at - current_time).total_seconds()
+
+    async def __process_due_reminders(self, reminders: tuple[Reminder, ...]) -> None:
+        removed_reminder_ids = list[int]()
+        rescheduled_reminders = list[Reminder]()
+        delivery_lags = Histogram()
+        pending_reminders = iter(reminders)
+        # The workers share the iterator, hence each reminder is delivered by exactly one of them.
+        await asyncio.gather(*(
+            self.__run_delivery_worker(
+                pending_reminders,
+                removed_reminder_ids,
+                rescheduled_reminders,
+                delivery_lags
+            )
+            for _ in range(min(self.__options.value.MaxConcurrentDeliveries, len(reminders)))
+        ))
+
+        # The follow-ups of the whole cycle are persisted in one statement each.
+        await self.__reminder_repository.delete_many(removed_reminder_ids)
+        for reminder_id in removed_reminder_ids:
+            self.__reminder_scheduler.unschedule(reminder_id)
+        await self.__reminder_repository.update_triggers(rescheduled_reminders)
+        for reminder in rescheduled_reminders:
+            self.__reminder_scheduler.schedule(reminder)
+
+        self.__channel_rate_limiters = {
+            channel_id: rate_limiter
+            for channel_id, rate_limiter in self.__channel_rate_limiters.items()
+            if not rate_limiter.is_idle
+        }
+        self.__logger.debug(
+            "Processed reminders",
+            count=len(reminders),
+            delivered_count=delivery_lags.count,
+            removed_count=len(removed_reminder_ids),
+            rescheduled_count=len(rescheduled_reminders),
+            mean_lag=delivery_lags.mean,
+            p95_lag=delivery_lags.get_percentile(95),
+            max_lag=delivery_lags.maximum
         )
 
-    async def __send_notification(self, reminder: Reminder) -> None:
+    async def __run_delivery_worker(
+        self,
+        reminders: Iterator[Reminder],
+        removed_reminder_ids: list[int],
+        rescheduled_reminders: list[Reminder],
+        delivery_lags: Histogram
+    ) -> None:
+        for reminder in reminders:
+            try:
+                is_delivered = await self.__send_notification(reminder)
+            except (ForbiddenError, UserNotFoundError, ServerNotFoundError, ChannelNotFoundError) as error:
+                self.__logger.debug(
+                    "Failed to send reminder notification, will not retry.",
+                    exception=error,
+                    reminder_id=reminder.identifier,
+                    user_id=reminder.user_id
+                )
+                removed_reminder_ids.append(reminder.identifier)
+                continue
+            except Exception as error:
+                self.__logger.error(
+                    "Unexpected failure while sending reminder notification",
+                    error,
+                    reminder_id=reminder.identifier
+                )
+                self.__schedule_retry()
+                continue
+
+            if is_delivered:
+                # The lag is measured in milliseconds, relative to the scheduled time.
+                delivery_lags.record((utcnow() - reminder.next_trigger).total_seconds() * 1000)
+            if not reminder.is_repeating:
+                removed_reminder_ids.append(reminder.identifier)
+                continue
+
+            reminder.last_trigger = utcnow()
+            reminder.recalculate_next_trigger()
+            rescheduled_reminders.append(reminder)
+            self.__logger.trace(
+                "Processed reminder",
+                reminder_id=reminder.identifier,
+                next_trigger=int(reminder.next_trigger.timestamp())
+            )
+
+    def __schedule_retry(self) -> None:
+        # Reminders popped but not processed are recovered by reloading the window.
+        retry_at = utcnow() + _RETRY_DELAY
+        if not self.__next_load_at or retry_at < self.__next_load_at:
+            self.__next_load_at = retry_at
+
+    async def __wait_for_rate_limit(self, channel_id: int) -> None:
+        if not (rate_limiter := self.__channel_rate_limiters.get(channel_id)):
+            options = self.__options.value
+            rate_limiter = self.__channel_rate_limiters[channel_id] = AsyncRateLimiter(
+                options.ChannelDeliveryRate,
+                timedelta(seconds=options.ChannelDeliveryInterval)
+            )
+
+        await rate_limiter.acquire()
+        await self.__global_rate_limiter.acquire()
+
+    async def __send_notification(self, reminder: Reminder) -> bool:
         is_belated = (utcnow() - reminder.next_trigger).total_seconds() > self.__options.value.BelatedReminderAfter
         localized_message = self.__i18n_provider.get(
             self.__get_dm_localization_key(is_belated, bool(reminder.message)),
@@ -124,8 +276,10 @@ class ReminderProcessor(IStartable):
         )
         if reminder.location == ReminderLocation.DIRECT_MESSAGE:
             try:
+                # Direct messages are rate limited per DM channel, which is tied to the user.
+                await self.__wait_for_rate_limit(reminder.user_id)
                 await self.__messaging.send_private_message(reminder.user_id, localized_message)
-                return
+                return True
             except UserNotFoundError:
                 raise
             except ForbiddenError:
@@ -134,19 +288,21 @@ class ReminderProcessor(IStartable):
                     raise
 
         if not reminder.server_id or not reminder.channel_id:
-            return
+            return False
 
         # Remove the reminder if the user is not a server member anymore.
         if not await self.__member_data_provider.is_member(reminder.server_id, reminder.user_id):
             reminder.is_repeating = False
-            return
+            return False
 
+        await self.__wait_for_rate_limit(reminder.channel_id)
         await self.__messaging.send_channel_message(
             reminder.server_id,
             reminder.channel_id,
             None,
             localized_message
         )
+        return True
 
     def __get_dm_localization_key(
         self,
@@ -0,0 +1,97 @@
+import asyncio
+import heapq
+from collections.abc import Iterable
+from datetime import datetime
+
+from holobot.sdk.ioc.decorators import injectable
+from .ireminder_scheduler import IReminderScheduler
+from .models import Reminder
+
+@injectable(IReminderScheduler)
+class ReminderScheduler(IReminderScheduler):
+    @property
+    def window_end(self) -> datetime | None:
+        return self.__window_end
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Entries are removed lazily: an entry is stale when its reminder
+        # has been removed or rescheduled since the entry was pushed.
+        self.__triggers: list[tuple[datetime, int]] = []
+        self.__reminders: dict[int, Reminder] = {}
+        self.__window_end: datetime | None = None
+        self.__pending_changes: list[tuple[int, Reminder | None]] | None = None
+        self.__change_event = asyncio.Event()
+
+    def schedule(self, reminder: Reminder) -> None:
+        if self.__pending_changes is not None:
+            self.__pending_changes.append((reminder.identifier, reminder))
+        self.__schedule(reminder)
+
+    def unschedule(self, reminder_id: int) -> None:
+        if self.__pending_changes is not None:
+            self.__pending_changes.append((reminder_id, None))
+        self.__reminders.pop(reminder_id, None)
+
+    def begin_load(self) -> None:
+        self.__pending_changes = []
+
+    def load(self, reminders: Iterable[Reminder], window_end: datetime) -> None:
+        pending_changes = self.__pending_changes or ()
+        self.__pending_changes = None
+        self.__window_end = window_end
+        self.__reminders = { reminder.identifier: reminder for reminder in reminders }
+        self.__triggers = [
+            (reminder.next_trigger, reminder.identifier)
+            for reminder in self.__reminders.values()
+        ]
+        heapq.heapify(self.__triggers)
+
+        # The loaded reminders may predate the changes made during the load.
+        for reminder_id, reminder in pending_changes:
+            if reminder:
+                self.__schedule(reminder)
+            else:
+                self.__reminders.pop(reminder_id, None)
+        self.__change_event.set()
+
+    def get_next_trigger(self) -> datetime | None:
+        while self.__triggers:
+            if self.__is_current(*self.__triggers[0]):
+                return self.__triggers[0][0]
+            heapq.heappop(self.__triggers)
+
+        return None
+
+    def pop_due(self, until: datetime) -> tuple[Reminder, ...]:
+        reminders = []
+        while self.__triggers and self.__triggers[0][0] <= until:
+            trigger, reminder_id = heapq.heappop(self.__triggers)
+            if self.__is_current(trigger, reminder_id):
+                reminders.append(self.__reminders.pop(reminder_id))
+
+        return tuple(reminders)
+
+    async def wait_for_change(self, timeout: float) -> None:
+        try:
+            await asyncio.wait_for(self.__change_event.wait(), max(timeout, 0))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.__change_event.clear()
+
+    def __schedule(self, reminder: Reminder) -> None:
+        if self.__window_end is None or reminder.next_trigger > self.__window_end:
+            # It'll be loaded with a later window.
+            self.__reminders.pop(reminder.identifier, None)
+            return
+
+        next_trigger = self.get_next_trigger()
+        self.__reminders[reminder.identifier] = reminder
+        heapq.heappush(self.__triggers, (reminder.next_trigger, reminder.identifier))
+        if next_trigger is None or reminder.next_trigger < next_trigger:
+            self.__change_event.set()
+
+    def __is_current(self, trigger: datetime, reminder_id: int) -> bool:
+        reminder = self.__reminders.get(reminder_id)
+        return reminder is not None and reminder.next_trigger == trigger
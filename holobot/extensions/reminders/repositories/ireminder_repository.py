@@ -1,9 +1,11 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
+from datetime import datetime
 from typing import Protocol
 
 from holobot.extensions.reminders.models import Reminder
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.database.repositories import IRepository
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
 
 class IReminderRepository(IRepository[int, Reminder], Protocol):
     def count_by_user(self, user_id: int) -> Awaitable[int]:
@@ -12,12 +14,40 @@ class IReminderRepository(IRepository[int, Reminder], Protocol):
     def get_many(
         self,
         user_id: int,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[Reminder]]:
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[Reminder]]:
         ...
 
-    def get_triggerable(self) -> Awaitable[tuple[Reminder, ...]]:
+    def get_triggerable(self, until: datetime, max_count: int) -> Awaitable[tuple[Reminder, ...]]:
+        """Gets the reminders that trigger until the specified time, in the order of triggering.
+
+        :param until: The time until which to get the reminders, inclusive.
+        :type until: datetime
+        :param max_count: The maximum number of reminders to get.
+        :type max_count: int
+        :return: The reminders that trigger until the specified time.
+        :rtype: Awaitable[tuple[Reminder, ...]]
+        """
+        ...
+
+    def update_triggers(self, reminders: Sequence[Reminder]) -> Awaitable[None]:
+        """Updates the last and next trigger times of the specified reminders in a single statement.
+
+        :param reminders: The reminders to update.
+        :type reminders: Sequence[Reminder]
+        """
+        ...
+
+    def delete_many(self, reminder_ids: Sequence[int]) -> Awaitable[int]:
+        """Deletes the specified reminders in a single statement.
+
+        :param reminder_ids: The identifiers of the reminders to delete.
+        :type reminder_ids: Sequence[int]
+        :return: The number of deleted reminders.
+        :rtype: Awaitable[int]
+        """
         ...
 
     def delete_by_user(self, user_id: int, reminder_id: int) -> Awaitable[int]:
@@ -1,13 +1,17 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
+from datetime import datetime
 
 from holobot.extensions.reminders.enums import ReminderLocation
 from holobot.extensions.reminders.models import Reminder
 from holobot.sdk.database import IDatabaseManager, IUnitOfWorkProvider
 from holobot.sdk.database.entities import PrimaryKey
-from holobot.sdk.database.queries.enums import Connector, Equality, Order
+from holobot.sdk.database.queries import CompiledQuery
+from holobot.sdk.database.queries.enums import Connector, Equality, Order, SeekDirection
 from holobot.sdk.database.repositories import RepositoryBase
+from holobot.sdk.database.statuses.command_tags import DeleteCommandTag
 from holobot.sdk.ioc.decorators import injectable
-from holobot.sdk.queries import PaginationResult
+from holobot.sdk.queries import KeysetPaginationResult
+from holobot.sdk.utils import set_time_zone
 from .ireminder_repository import IReminderRepository
 from .records import ReminderRecord
 
@@ -47,21 +51,67 @@ class ReminderRepository(
     def get_many(
         self,
         user_id: int,
-        page_index: int,
-        page_size: int
-    ) -> Awaitable[PaginationResult[Reminder]]:
-        return self._paginate(
+        page_size: int,
+        cursor: str | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> Awaitable[KeysetPaginationResult[Reminder]]:
+        return self._paginate_keyset(
             ((RepositoryBase._ID_FIELD_NAME, Order.ASCENDING),),
-            page_index,
             page_size,
+            cursor,
+            direction,
             lambda where: where.field("user_id", Equality.EQUAL, user_id)
         )
 
-    def get_triggerable(self) -> Awaitable[tuple[Reminder, ...]]:
+    def get_triggerable(self, until: datetime, max_count: int) -> Awaitable[tuple[Reminder, ...]]:
         return self._get_many_by_filter(lambda where: (
-            where.field("next_trigger", Equality.LESS_OR_EQUAL, "(NOW() AT TIME ZONE 'utc')", True)
+            where.field("next_trigger", Equality.LESS_OR_EQUAL, set_time_zone(until, None))
+            .order_by()
+            .column("next_trigger", Order.ASCENDING)
+            .column(RepositoryBase._ID_FIELD_NAME, Order.ASCENDING)
+            .limit()
+            .max_count(max_count)
         ))
 
+    async def update_triggers(self, reminders: Sequence[Reminder]) -> None:
+        if not reminders:
+            return
+
+        async with (session := await self._get_session()):
+            await CompiledQuery(
+                (
+                    f"UPDATE {self.table_name} AS r"
+                    " SET last_trigger = t.last_trigger, next_trigger = t.next_trigger"
+                    " FROM UNNEST($1::INTEGER[], $2::TIMESTAMP[], $3::TIMESTAMP[])"
+                    " AS t (id, last_trigger, next_trigger)"
+                    " WHERE r.id = t.id"
+                ),
+                (
+                    [reminder.identifier for reminder in reminders],
+                    [set_time_zone(reminder.last_trigger, None) for reminder in reminders],
+                    [set_time_zone(reminder.next_trigger, None) for reminder in reminders]
+                )
+            ).execute(session.connection)
+
+            for reminder in reminders:
+                await self._invalidate_model(reminder.identifier)
+
+    async def delete_many(self, reminder_ids: Sequence[int]) -> int:
+        if not reminder_ids:
+            return 0
+
+        async with (session := await self._get_session()):
+            status = await CompiledQuery(
+                f"DELETE FROM {self.table_name} WHERE id = ANY($1::INTEGER[])",
+                (list(reminder_ids),)
+            ).execute(session.connection)
+
+            for reminder_id in reminder_ids:
+                await self._invalidate_model(reminder_id)
+
+            command_tag = status.command_tag
+            return command_tag.rows if isinstance(command_tag, DeleteCommandTag) else 0
+
     def delete_by_user(self, user_id: int, reminder_id: int) -> Awaitable[int]:
         return self._delete_by_filter(
             lambda where: where.fields(
@@ -10,6 +10,7 @@ from holobot.discord.sdk.workflows.interactables.components.models import (
 from holobot.discord.sdk.workflows.interactables.decorators import command, component
 from holobot.discord.sdk.workflows.interactables.models import Cooldown, InteractionResponse
 from holobot.extensions.reminders import IReminderManager
+from holobot.sdk.database.queries.enums import SeekDirection
 from holobot.sdk.i18n import II18nProvider
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.logging import ILoggerFactory
@@ -43,7 +44,9 @@ class ViewRemindersWorkflow(WorkflowBase):
         content, embed, components = await self.__create_page_content(
             context.author_id,
             0,
-            DEFAULT_PAGE_SIZE
+            DEFAULT_PAGE_SIZE,
+            None,
+            SeekDirection.FORWARD
         )
         return self._reply(
             content=content if isinstance(content, str) else None,
@@ -63,7 +66,9 @@ class ViewRemindersWorkflow(WorkflowBase):
         content, embed, components = await self.__create_page_content(
             context.author_id,
             0,
-            DEFAULT_PAGE_SIZE
+            DEFAULT_PAGE_SIZE,
+            None,
+            SeekDirection.FORWARD
         )
         return self._edit_message(
             content=content if isinstance(content, str) else None,
@@ -84,7 +89,9 @@ class ViewRemindersWorkflow(WorkflowBase):
         content, embed, components = await self.__create_page_content(
             state.owner_id,
             max(state.current_page, 0),
-            DEFAULT_PAGE_SIZE
+            DEFAULT_PAGE_SIZE,
+            state.custom_data.get("c"),
+            SeekDirection.BACKWARD if state.custom_data.get("d") == "b" else SeekDirection.FORWARD
         )
 
         return (self._edit_message(
@@ -102,14 +109,21 @@ class ViewRemindersWorkflow(WorkflowBase):
         self,
         user_id: int,
         page_index: int,
-        page_size: int
+        page_size: int,
+        cursor: str | None,
+        direction: SeekDirection
     ) -> tuple[
             UndefinedOrNoneOr[str],
             UndefinedOrNoneOr[Embed],
             ComponentBase | list[LayoutBase] | None
         ]:
         self.__logger.trace("User requested to-do list page", user_id=user_id, page_index=page_index)
-        result = await self.__reminder_manager.get_by_user(user_id, page_index, page_size)
+        result = await self.__reminder_manager.get_by_user(user_id, page_size, cursor, direction)
+        if not result.items and cursor is not None:
+            # The reminders past the cursor may have been removed since.
+            page_index = 0
+            result = await self.__reminder_manager.get_by_user(user_id, page_size)
+
         if not result.items:
             return (
                 self.__i18n_provider.get(
@@ -159,7 +173,10 @@ class ViewRemindersWorkflow(WorkflowBase):
             owner_id=user_id,
             current_page=page_index,
             page_size=page_size,
-            total_count=result.total_count
+            has_previous_page=result.previous_cursor is not None,
+            has_next_page=result.next_cursor is not None,
+            previous_page_custom_data={ "c": result.previous_cursor, "d": "b" } if result.previous_cursor else {},
+            next_page_custom_data={ "c": result.next_cursor, "d": "f" } if result.next_cursor else {}
         )
 
         return (None, embed, component)
@@ -1,4 +1,8 @@
 from .database_manager import DatabaseManager
+from .database_options import DatabaseOptions
+from .identity_map import IdentityMap
+from .query_fan_out import QueryFanOut
+from .query_tracer import QueryTracer
 from .session import Session
 from .unit_of_work import UnitOfWork
 from .unit_of_work_provider import UnitOfWorkProvider
@@ -1,11 +1,15 @@
+import asyncio
 import ssl
+import time
 from collections.abc import Awaitable
 
 import asyncpg
 
 from holobot.sdk.configs import IOptions
-from holobot.sdk.database import IDatabaseManager, ISession
+from holobot.sdk.database import IConnectionInitializer, IDatabaseManager, ISession, PoolStatistics
+from holobot.sdk.database.exceptions import DatabaseError
 from holobot.sdk.database.migration import IMigration
+from holobot.sdk.diagnostics import Histogram
 from holobot.sdk.ioc.decorators import injectable
 from holobot.sdk.lifecycle import IStartable
 from holobot.sdk.logging import ILoggerFactory
@@ -23,14 +27,19 @@ class DatabaseManager(IDatabaseManager, IStartable):
 
     def __init__(
         self,
+        connection_initializers: tuple[IConnectionInitializer, ...],
         database_options: IOptions[DatabaseOptions],
         logger_factory: ILoggerFactory,
         migrations: tuple[IMigration, ...]
     ) -> None:
+        self.__connection_initializers = connection_initializers
         self.__database_options = database_options
         self.__logger = logger_factory.create(DatabaseManager)
         self.__migrations: tuple[IMigration, ...] = migrations
         self.__connection_pool: asyncpg.Pool | None = None
+        self.__acquire_wait_times = Histogram()
+        self.__acquisition_count = 0
+        self.__acquisition_timeout_count = 0
 
     def start(self) -> Awaitable[None]:
         return COMPLETED_TASK
@@ -71,9 +80,40 @@ class DatabaseManager(IDatabaseManager, IStartable):
 
     async def acquire_connection(self) -> ISession:
         assert self.__connection_pool
-        connection: asyncpg.Connection = await self.__connection_pool.acquire()
+        acquire_timeout = self.__database_options.value.AcquireTimeout
+        started_at = time.perf_counter()
+        try:
+            connection: asyncpg.Connection = await self.__connection_pool.acquire(
+                timeout=acquire_timeout if acquire_timeout > 0 else None
+            )
+        except asyncio.TimeoutError as error:
+            self.__acquisition_timeout_count += 1
+            self.__logger.warning(
+                "Timed out while waiting for a database connection",
+                timeout=acquire_timeout,
+                pool_size=self.__connection_pool.get_size()
+            )
+            raise DatabaseError("Timed out while waiting for a database connection.") from error
+
+        self.__acquire_wait_times.record((time.perf_counter() - started_at) * 1000)
+        self.__acquisition_count += 1
         return Session(connection, self.__connection_pool)
 
+    def get_pool_statistics(self) -> PoolStatistics:
+        options = self.__database_options.value
+        size = self.__connection_pool.get_size() if self.__connection_pool else 0
+        idle_count = self.__connection_pool.get_idle_size() if self.__connection_pool else 0
+        return PoolStatistics(
+            min_size=options.MinPoolSize,
+            max_size=options.MaxPoolSize,
+            size=size,
+            in_use_count=size - idle_count,
+            idle_count=idle_count,
+            acquisition_count=self.__acquisition_count,
+            acquisition_timeout_count=self.__acquisition_timeout_count,
+            acquire_wait_times=self.__acquire_wait_times.copy()
+        )
+
     async def __initialize_database(self) -> asyncpg.pool.Pool:
         options = self.__database_options.value
         connection_string_base = f"postgres://{options.User}:{options.Password}@{options.Host}:{options.Port}/"
@@ -89,9 +129,19 @@ class DatabaseManager(IDatabaseManager, IStartable):
                 await connection.close()
 
         self.__logger.debug("Initializing the connection pool...")
+        # Queries are executed as text, but asyncpg prepares them behind the scenes
+        # and caches the prepared statements per connection, keyed by the query text.
         pool = await asyncpg.create_pool(
             f"{connection_string_base}{options.Database}",
-            ssl=ssl_object)
+            ssl=ssl_object,
+            min_size=options.MinPoolSize,
+            max_size=options.MaxPoolSize,
+            max_queries=options.MaxQueriesPerConnection,
+            max_inactive_connection_lifetime=options.MaxInactiveConnectionLifetime,
+            statement_cache_size=options.StatementCacheSize,
+            max_cached_statement_lifetime=options.MaxCachedStatementLifetime,
+            server_settings=DatabaseManager.__get_server_settings(options),
+            init=self.__initialize_connection)
         if not pool:
             raise Exception("Failed to initialize the database connection pool.")
         self.__logger.debug("Successfully initialized the connection pool")
@@ -101,6 +151,18 @@ class DatabaseManager(IDatabaseManager, IStartable):
 
         return pool
 
+    async def __initialize_connection(self, connection: asyncpg.Connection) -> None:
+        for initializer in self.__connection_initializers:
+            await initializer.initialize(connection)
+
+    @staticmethod
+    def __get_server_settings(options: DatabaseOptions) -> dict[str, str]:
+        server_settings = {}
+        if options.StatementTimeout > 0:
+            server_settings["statement_timeout"] = str(options.StatementTimeout)
+
+        return server_settings
+
     def __create_ssl_context(self):
         ssl_context = None
         if self.__database_options.value.IsSslEnabled:
@@ -14,3 +14,44 @@ class DatabaseOptions(OptionsDefinition):
     Password: str = ""
     AutoCreateDatabase: bool = False
     IsSslEnabled: bool = True
+    StatementCacheSize: int = 512
+    """The maximum number of prepared statements cached per connection.
+
+    Statements are evicted in a least recently used manner. Zero disables the cache.
+    """
+
+    MaxCachedStatementLifetime: int = 0
+    """The number of seconds after which a cached prepared statement is discarded, or zero to keep them indefinitely."""
+
+    MinPoolSize: int = 10
+    """The number of connections the pool opens at start and keeps open."""
+
+    MaxPoolSize: int = 10
+    """The maximum number of connections the pool opens."""
+
+    MaxQueriesPerConnection: int = 50000
+    """The number of queries after which a connection is replaced with a new one."""
+
+    MaxInactiveConnectionLifetime: float = 300.0
+    """The number of seconds after which an idle connection is closed, or zero to keep them open indefinitely.
+
+    Connections are never closed below the minimum size of the pool.
+    """
+
+    AcquireTimeout: float = 0.0
+    """The number of seconds to wait for an available connection, or zero to wait indefinitely."""
+
+    StatementTimeout: int = 0
+    """The number of milliseconds after which the server cancels a statement, or zero to disable the timeout."""
+
+    SlowQueryThreshold: int = 500
+    """The number of milliseconds above which a query is logged as slow, or zero to disable logging."""
+
+    MaxTrackedQueryShapes: int = 1000
+    """The maximum number of distinct queries whose execution statistics are collected."""
+
+    IsQueryPlanCaptureEnabled: bool = False
+    """Determines whether the execution plans of slow read queries are captured in debug mode.
+
+    Capturing a plan executes the query once more, therefore it's done only once per query.
+    """
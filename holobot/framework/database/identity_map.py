@@ -0,0 +1,34 @@
+from collections.abc import Hashable
+from typing import Any
+
+from holobot.sdk.database import IIdentityMap
+
+class IdentityMap(IIdentityMap):
+    """Default implementation of an identity map.
+
+    The identity map is meant to be used by a single logical flow
+    (for example, an interaction), therefore it uses no locking.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__entities: dict[type, dict[Hashable, Any]] = {}
+
+    def get(self, entity_type: type, key: Hashable) -> Any | None:
+        if (entities := self.__entities.get(entity_type)) is None:
+            return None
+
+        return entities.get(key)
+
+    def set(self, entity_type: type, key: Hashable, value: Any) -> None:
+        if (entities := self.__entities.get(entity_type)) is None:
+            self.__entities[entity_type] = entities = {}
+
+        entities[key] = value
+
+    def remove(self, entity_type: type, key: Hashable) -> None:
+        if (entities := self.__entities.get(entity_type)) is not None:
+            entities.pop(key, None)
+
+    def clear(self) -> None:
+        self.__entities.clear()
@@ -0,0 +1,74 @@
+import asyncio
+import inspect
+from collections.abc import Awaitable, Iterable, Sequence
+from typing import Any, TypeVar
+
+from holobot.sdk.configs import IOptions
+from holobot.sdk.database import IQueryFanOut, IUnitOfWorkProvider
+from holobot.sdk.ioc.decorators import injectable
+from .database_options import DatabaseOptions
+
+T = TypeVar("T")
+
+@injectable(IQueryFanOut)
+class QueryFanOut(IQueryFanOut):
+    """Default implementation of a service used to execute independent queries concurrently.
+
+    Notice that asyncpg doesn't support pipelining multiple queries on a single connection,
+    therefore concurrent queries always use separate connections of the pool.
+    """
+
+    def __init__(
+        self,
+        database_options: IOptions[DatabaseOptions],
+        unit_of_work_provider: IUnitOfWorkProvider
+    ) -> None:
+        super().__init__()
+        self.__database_options = database_options
+        self.__unit_of_work_provider = unit_of_work_provider
+
+    def fetch(self, *queries: Awaitable[Any]) -> Awaitable[tuple[Any, ...]]:
+        return self.fetch_all(queries)
+
+    async def fetch_all(self, queries: Iterable[Awaitable[T]]) -> tuple[T, ...]:
+        queries = tuple(queries)
+        if len(queries) < 2 or self.__unit_of_work_provider.current:
+            # The connection of a unit of work doesn't support concurrent operations.
+            return await QueryFanOut.__fetch_sequentially(queries)
+
+        # Half of the pool at most, so that a single fan-out cannot starve everything else.
+        semaphore = asyncio.Semaphore(max(self.__database_options.value.MaxPoolSize // 2, 1))
+        tasks = [
+            asyncio.ensure_future(QueryFanOut.__fetch_limited(query, semaphore))
+            for query in queries
+        ]
+        try:
+            return tuple(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    @staticmethod
+    async def __fetch_sequentially(queries: Sequence[Awaitable[T]]) -> tuple[T, ...]:
+        results = list[T]()
+        for index, query in enumerate(queries):
+            try:
+                results.append(await query)
+            except BaseException:
+                QueryFanOut.__close_queries(queries[index + 1:])
+                raise
+
+        return tuple(results)
+
+    @staticmethod
+    async def __fetch_limited(query: Awaitable[T], semaphore: asyncio.Semaphore) -> T:
+        async with semaphore:
+            return await query
+
+    @staticmethod
+    def __close_queries(queries: Iterable[Awaitable[Any]]) -> None:
+        # Avoids the warnings about coroutines that were never awaited.
+        for query in queries:
+            if inspect.iscoroutine(query):
+                query.close()
@@ -0,0 +1,117 @@
+from typing import Any
+
+import asyncpg
+
+from holobot.sdk.configs import IOptions
+from holobot.sdk.database.queries import IQueryTracer
+from holobot.sdk.database.queries.models import QueryShapeStatistics
+from holobot.sdk.diagnostics import Histogram, IDebugger
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.logging import ILoggerFactory
+from .database_options import DatabaseOptions
+
+@injectable(IQueryTracer)
+class QueryTracer(IQueryTracer):
+    def __init__(
+        self,
+        database_options: IOptions[DatabaseOptions],
+        debugger: IDebugger,
+        logger_factory: ILoggerFactory
+    ) -> None:
+        super().__init__()
+        self.__database_options = database_options
+        self.__debugger = debugger
+        self.__logger = logger_factory.create(QueryTracer)
+        self.__query_shapes = dict[str, QueryShapeStatistics]()
+        self.__explained_queries = set[str]()
+
+    def record(
+        self,
+        query: str,
+        argument_count: int,
+        row_count: int,
+        elapsed_time: float
+    ) -> bool:
+        options = self.__database_options.value
+        statistics = self.__query_shapes.get(query)
+        if not statistics and len(self.__query_shapes) < options.MaxTrackedQueryShapes:
+            statistics = self.__query_shapes[query] = QueryShapeStatistics(
+                query=query,
+                argument_count=argument_count,
+                elapsed_times=Histogram()
+            )
+
+        if statistics:
+            statistics.elapsed_times.record(elapsed_time)
+            statistics.row_count += row_count
+
+        if not options.SlowQueryThreshold or elapsed_time < options.SlowQueryThreshold:
+            return False
+
+        if statistics:
+            statistics.slow_execution_count += 1
+
+        # Only the shape of the query is logged as the arguments may contain user data.
+        self.__logger.warning(
+            "Slow query",
+            query=query,
+            argument_count=argument_count,
+            row_count=row_count,
+            elapsed_time=elapsed_time
+        )
+
+        return (
+            options.IsQueryPlanCaptureEnabled
+            and query not in self.__explained_queries
+            and QueryTracer.__is_read_query(query)
+            and self.__debugger.is_debug_mode_enabled()
+        )
+
+    async def capture_query_plan(
+        self,
+        connection: asyncpg.Connection,
+        query: str,
+        arguments: tuple[Any, ...]
+    ) -> None:
+        # Marked in advance so that concurrent executions don't capture it, too.
+        self.__explained_queries.add(query)
+        try:
+            # Within a transaction, this is a savepoint that keeps a failure from aborting it.
+            async with connection.transaction():
+                records = await connection.fetch(f"EXPLAIN (ANALYZE, BUFFERS) {query}", *arguments)
+        except asyncpg.PostgresError as error:
+            self.__logger.warning("Failed to capture a query plan", query=query, exception=error)
+            return
+
+        query_plan = "\n".join(record[0] for record in records)
+        if statistics := self.__query_shapes.get(query):
+            statistics.query_plan = query_plan
+        self.__logger.debug("Captured a query plan", query=query, query_plan=query_plan)
+
+    def get_top_query_shapes(self, count: int) -> tuple[QueryShapeStatistics, ...]:
+        top_query_shapes = sorted(
+            self.__query_shapes.values(),
+            key=lambda i: i.total_elapsed_time,
+            reverse=True
+        )[:count]
+
+        return tuple(
+            QueryShapeStatistics(
+                query=statistics.query,
+                argument_count=statistics.argument_count,
+                elapsed_times=statistics.elapsed_times.copy(),
+                row_count=statistics.row_count,
+                slow_execution_count=statistics.slow_execution_count,
+                query_plan=statistics.query_plan
+            )
+            for statistics in top_query_shapes
+        )
+
+    def reset(self) -> None:
+        self.__query_shapes.clear()
+        self.__explained_queries.clear()
+
+    @staticmethod
+    def __is_read_query(query: str) -> bool:
+        # EXPLAIN ANALYZE executes the statement, hence only plain reads are safe to capture.
+        return query.lstrip()[:6].upper() == "SELECT"
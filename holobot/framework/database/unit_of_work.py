@@ -4,12 +4,10 @@ from typing import Any
 from asyncpg import Connection
 from asyncpg.transaction import Transaction
 
-from holobot.sdk.caching import ConcurrentDict
-from holobot.sdk.database.entities import AggregateRoot
+from holobot.sdk.database.entities import AggregateRoot, Identifier
 from holobot.sdk.database.iunit_of_work import IUnitOfWork, TIdentifier
 from holobot.sdk.exceptions import InvalidOperationError
-from holobot.sdk.threading.utils import as_task
-from holobot.sdk.utils import UndefinedType
+from holobot.sdk.threading.utils import COMPLETED_TASK, as_task
 
 class UnitOfWork(IUnitOfWork):
     """Default implementation of a unit of work."""
@@ -26,7 +24,8 @@ class UnitOfWork(IUnitOfWork):
         self.__on_disposed = on_disposed
         self.__is_completed = False
         self.__is_disposed = False
-        self.__entities = ConcurrentDict[type, ConcurrentDict[str, Any]]()
+        # A unit of work is used by a single logical flow, hence there is no need for locking.
+        self.__entities: dict[type, dict[int | str, Any]] = {}
 
     @property
     def connection(self) -> Connection:
@@ -36,45 +35,38 @@ class UnitOfWork(IUnitOfWork):
         self.__throw_if_disposed()
         self.__is_completed = True
 
-    async def get(
+    def get(
         self,
         entity_type: type[AggregateRoot[TIdentifier]],
         identifier: TIdentifier
-    ) -> Any | None:
+    ) -> Awaitable[Any | None]:
         self.__throw_if_disposed()
-        if (
-            isinstance(entities := await self.__entities.get(entity_type), UndefinedType)
-            or isinstance(entity := await entities.get(str(identifier)), UndefinedType)
-        ):
-            return None
+        if (entities := self.__entities.get(entity_type)) is None:
+            return as_task(None)
 
-        return entity
+        return as_task(entities.get(UnitOfWork.__get_key(identifier)))
 
-    async def set(
+    def set(
         self,
         value: AggregateRoot[Any]
-    ) -> None:
+    ) -> Awaitable[None]:
         self.__throw_if_disposed()
-        entities = await self.__entities.get_or_add(
-            type(value),
-            lambda _: as_task(ConcurrentDict())
-        )
-        await entities.add_or_update(
-            str(value.identifier),
-            lambda _k: as_task(value),
-            lambda _k, _v: as_task(value)
-        )
-
-    async def remove(
+        if (entities := self.__entities.get(entity_type := type(value))) is None:
+            self.__entities[entity_type] = entities = {}
+
+        entities[UnitOfWork.__get_key(value.identifier)] = value
+        return COMPLETED_TASK
+
+    def remove(
         self,
         entity_type: type[AggregateRoot[TIdentifier]],
         identifier: TIdentifier
-    ) -> None:
+    ) -> Awaitable[None]:
         self.__throw_if_disposed()
-        if isinstance(entities := await self.__entities.get(entity_type), UndefinedType):
-            return
+        if (entities := self.__entities.get(entity_type)) is not None:
+            entities.pop(UnitOfWork.__get_key(identifier), None)
 
-        await entities.remove(str(identifier))
+        return COMPLETED_TASK
 
     async def _on_dispose(self) -> None:
         if self.__is_disposed:
@@ -93,3 +85,8 @@ class UnitOfWork(IUnitOfWork):
     def __throw_if_disposed(self) -> None:
         if self.__is_disposed:
             raise InvalidOperationError("The unit of work has been completed already.")
+
+    @staticmethod
+    def __get_key(identifier: int | str | Identifier) -> int | str:
+        # Composite identifiers are mutable dataclasses, hence they aren't hashable.
+        return identifier if isinstance(identifier, int | str) else str(identifier)
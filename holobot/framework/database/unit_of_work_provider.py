@@ -1,10 +1,14 @@
 import contextvars
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Generator
+from contextlib import contextmanager
 
-from holobot.sdk.database import IDatabaseManager, ISession, IUnitOfWork, IUnitOfWorkProvider
+from holobot.sdk.database import (
+    IDatabaseManager, IIdentityMap, ISession, IUnitOfWork, IUnitOfWorkProvider
+)
 from holobot.sdk.database.enums import IsolationLevel
 from holobot.sdk.exceptions import ArgumentError, InvalidOperationError
 from holobot.sdk.ioc.decorators import injectable
+from .identity_map import IdentityMap
 from .unit_of_work import UnitOfWork
 
 @injectable(IUnitOfWorkProvider)
@@ -21,11 +25,31 @@ class UnitOfWorkProvider(IUnitOfWorkProvider):
             "unit_of_work",
             default=None
         )
+        self.__identity_map = contextvars.ContextVar[IIdentityMap | None](
+            "identity_map",
+            default=None
+        )
 
     @property
     def current(self) -> IUnitOfWork | None:
         return self.__unit_of_work.get()
 
+    @property
+    def identity_map(self) -> IIdentityMap | None:
+        return self.__identity_map.get()
+
+    @contextmanager
+    def create_identity_map_scope(self) -> Generator[IIdentityMap, None, None]:
+        if identity_map := self.__identity_map.get():
+            yield identity_map
+            return
+
+        token = self.__identity_map.set(identity_map := IdentityMap())
+        try:
+            yield identity_map
+        finally:
+            self.__identity_map.reset(token)
+
     async def create_new(
         self,
         isolation_level: IsolationLevel = IsolationLevel.READ_COMMITTED
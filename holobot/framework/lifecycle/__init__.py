@@ -1,2 +1,4 @@
+from .job_scheduler import JobScheduler
+from .job_state import JobState
 from .lifecycle_manager import LifecycleManager
 from .lifecycle_manager_interface import LifecycleManagerInterface
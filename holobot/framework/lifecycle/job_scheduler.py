@@ -0,0 +1,159 @@
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+
+from holobot.sdk.exceptions import ArgumentError
+from holobot.sdk.ioc.decorators import injectable
+from holobot.sdk.lifecycle import IJob, IJobScheduler, IStartable
+from holobot.sdk.lifecycle.models import JobSchedule, JobStatistics
+from holobot.sdk.logging import ILoggerFactory
+from holobot.sdk.threading import CancellationToken, CancellationTokenSource
+from holobot.sdk.utils import utcnow
+from .job_state import JobState
+
+@injectable(IStartable)
+@injectable(IJobScheduler)
+class JobScheduler(IJobScheduler, IStartable):
+    @property
+    def priority(self) -> int:
+        return 1000
+
+    def __init__(
+        self,
+        jobs: tuple[IJob, ...],
+        logger_factory: ILoggerFactory
+    ) -> None:
+        super().__init__()
+        self.__jobs = jobs
+        self.__logger = logger_factory.create(JobScheduler)
+        self.__job_states = dict[str, JobState]()
+        self.__token_source: CancellationTokenSource | None = None
+
+    async def start(self) -> None:
+        self.__token_source = CancellationTokenSource()
+        for job in self.__jobs:
+            if job.name in self.__job_states:
+                self.__logger.warning("Ignored a job with a duplicate name", job_name=job.name)
+                continue
+
+            state = self.__job_states[job.name] = JobState(job=job, schedule=job.schedule)
+            if not state.schedule.is_enabled:
+                self.__logger.info("Job is disabled", job_name=job.name)
+                continue
+
+            state.task = asyncio.create_task(self.__run_job_loop(state, self.__token_source.token))
+            self.__logger.debug(
+                "Scheduled job",
+                job_name=job.name,
+                interval=state.schedule.interval,
+                initial_delay=state.schedule.initial_delay
+            )
+
+    async def stop(self) -> None:
+        if self.__token_source:
+            self.__token_source.cancel()
+
+        tasks = [state.task for state in self.__job_states.values() if state.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.__logger.debug("Stopped jobs", count=len(tasks))
+
+    def get_statistics(self) -> tuple[JobStatistics, ...]:
+        return tuple(
+            self.__job_states[job_name].to_statistics()
+            for job_name in sorted(self.__job_states)
+        )
+
+    def trigger(self, job_name: str) -> bool:
+        if not (state := self.__job_states.get(job_name)):
+            raise ArgumentError("job_name", "There is no job with the specified name.")
+
+        if not state.task:
+            return False
+
+        if state.is_running:
+            state.skipped_count += 1
+            return False
+
+        state.trigger_event.set()
+        return True
+
+    async def __run_job_loop(self, state: JobState, token: CancellationToken) -> None:
+        schedule = state.schedule
+        scheduled_at = utcnow() + schedule.initial_delay
+        if schedule.cron_expression:
+            scheduled_at = schedule.cron_expression.get_next(scheduled_at)
+
+        while not token.is_cancellation_requested:
+            state.next_run_at = scheduled_at + JobScheduler.__get_jitter(schedule)
+            is_triggered = await JobScheduler.__wait_for_run(state, state.next_run_at)
+            await self.__run_job(state, token)
+            if is_triggered:
+                # A manual run doesn't affect the regular schedule.
+                continue
+
+            scheduled_at = JobScheduler.__get_next_scheduled_time(schedule, scheduled_at)
+            current_time = utcnow()
+            while scheduled_at <= current_time:
+                # The previous run was still going at the time.
+                state.skipped_count += 1
+                scheduled_at = JobScheduler.__get_next_scheduled_time(schedule, scheduled_at)
+
+    async def __run_job(self, state: JobState, token: CancellationToken) -> None:
+        max_runtime = state.schedule.max_runtime
+        state.is_running = True
+        state.last_started_at = utcnow()
+        started_at = time.perf_counter()
+        self.__logger.trace("Running job...", job_name=state.job.name)
+        try:
+            await asyncio.wait_for(
+                state.job.run(token),
+                max_runtime.total_seconds() if max_runtime else None
+            )
+        except asyncio.TimeoutError:
+            state.timeout_count += 1
+            self.__logger.warning(
+                "Cancelled a job exceeding its maximum runtime",
+                job_name=state.job.name,
+                max_runtime=max_runtime
+            )
+        except Exception as error:
+            state.failure_count += 1
+            self.__logger.error("Unexpected failure while running a job", error, job_name=state.job.name)
+        finally:
+            elapsed_time = (time.perf_counter() - started_at) * 1000
+            state.durations.record(elapsed_time)
+            state.run_count += 1
+            state.is_running = False
+            self.__logger.trace("Ran job", job_name=state.job.name, elapsed_time=elapsed_time)
+
+    @staticmethod
+    async def __wait_for_run(state: JobState, run_at: datetime) -> bool:
+        if not state.trigger_event.is_set():
+            try:
+                await asyncio.wait_for(
+                    state.trigger_event.wait(),
+                    max((run_at - utcnow()).total_seconds(), 0)
+                )
+            except asyncio.TimeoutError:
+                return False
+
+        state.trigger_event.clear()
+        return True
+
+    @staticmethod
+    def __get_next_scheduled_time(schedule: JobSchedule, scheduled_at: datetime) -> datetime:
+        if schedule.cron_expression:
+            return schedule.cron_expression.get_next(scheduled_at)
+
+        assert schedule.interval is not None
+        return scheduled_at + schedule.interval
+
+    @staticmethod
+    def __get_jitter(schedule: JobSchedule) -> timedelta:
+        if not schedule.jitter:
+            return timedelta()
+
+        return random.random() * schedule.jitter
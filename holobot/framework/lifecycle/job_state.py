@@ -0,0 +1,38 @@
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from holobot.sdk.diagnostics import Histogram
+from holobot.sdk.lifecycle import IJob
+from holobot.sdk.lifecycle.models import JobSchedule, JobStatistics
+
+@dataclass(kw_only=True)
+class JobState:
+    """The mutable state of a job registered with the job scheduler."""
+
+    job: IJob
+    schedule: JobSchedule
+    trigger_event: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task[None] | None = None
+    is_running: bool = False
+    run_count: int = 0
+    failure_count: int = 0
+    timeout_count: int = 0
+    skipped_count: int = 0
+    durations: Histogram = field(default_factory=Histogram)
+    last_started_at: datetime | None = None
+    next_run_at: datetime | None = None
+
+    def to_statistics(self) -> JobStatistics:
+        return JobStatistics(
+            name=self.job.name,
+            is_enabled=self.task is not None,
+            is_running=self.is_running,
+            run_count=self.run_count,
+            failure_count=self.failure_count,
+            timeout_count=self.timeout_count,
+            skipped_count=self.skipped_count,
+            durations=self.durations.copy(),
+            last_started_at=self.last_started_at,
+            next_run_at=self.next_run_at
+        )
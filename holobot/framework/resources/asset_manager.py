@@ -82,11 +82,7 @@ class AssetManager(IAssetManager):
 
         return asset
 
-    @staticmethod
-    def __get_cache_key(asset_type: str, asset_id: str) -> str:
-        return f"asset/{asset_type}/{asset_id}"
-
-    def __get_asset_path(self, asset_id: str) -> str:
+    def get_asset_path(self, asset_id: str) -> str:
         if not self.__options.value.ResourceDirectoryPaths:
             return os.path.join(self.__environment.root_path, asset_id)
 
@@ -97,8 +93,12 @@ class AssetManager(IAssetManager):
 
         raise FileNotFoundError(f"Asset with identifier '{asset_id}' cannot be found.")
 
+    @staticmethod
+    def __get_cache_key(asset_type: str, asset_id: str) -> str:
+        return f"asset/{asset_type}/{asset_id}"
+
     def __load_image(self, asset_id: str) -> Awaitable[_DisposableAsset[Image.Image]]:
-        asset_path = self.__get_asset_path(asset_id)
+        asset_path = self.get_asset_path(asset_id)
         asset = Image.open(asset_path)
 
         self.__logger.trace("Loaded image asset", path=asset_path)
@@ -110,7 +110,7 @@ class AssetManager(IAssetManager):
         ))
 
     def __load_font(self, asset_id: str, size: int) -> Awaitable[ImageFont.FreeTypeFont]:
-        asset_path = self.__get_asset_path(asset_id)
+        asset_path = self.get_asset_path(asset_id)
         asset = ImageFont.truetype(asset_path, size=size)
 
         self.__logger.trace("Loaded font asset", path=asset_path)
@@ -1,9 +1,12 @@
 from .absolute_expiration_cache_entry_policy import AbsoluteExpirationCacheEntryPolicy
+from .batch_loader import BatchLoader
 from .cache_entry_policy import CacheEntryPolicy
 from .cache_view import CacheView
 from .concurrent_dict import ConcurrentDict
 from .concurrent_memory_cache import ConcurrentMemoryCache
+from .expiring_dict import ExpiringDict
 from .icache import ICache
 from .iobject_cache import IObjectCache
 from .no_expiration_cache_entry_policy import NoExpirationCacheEntryPolicy
+from .size_bounded_lru_cache import SizeBoundedLruCache
 from .sliding_expiration_cache_entry_policy import SlidingExpirationCacheEntryPolicy
@@ -0,0 +1,109 @@
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Generic, TypeVar
+
+from holobot.sdk.exceptions import ArgumentError
+
+TKey = TypeVar("TKey", bound=Hashable)
+TValue = TypeVar("TValue")
+
+class BatchLoader(Generic[TKey, TValue]):
+    """Loads values by their keys in batches.
+
+    The keys requested within the same iteration of the event loop are collected
+    and are loaded by a single invocation of the batch loading callback,
+    in chunks of the maximum batch size. Each requested key is loaded only once
+    per batch, regardless of the number of requests.
+
+    Batches are loaded independently of the context of the requests (such as
+    the current unit of work), therefore they always use pooled connections.
+    """
+
+    DEFAULT_MAX_BATCH_SIZE = 100
+
+    @property
+    def batch_count(self) -> int:
+        """Gets the number of batches loaded so far."""
+
+        return self.__batch_count
+
+    def __init__(
+        self,
+        batch_load: Callable[[tuple[TKey, ...]], Awaitable[Mapping[TKey, TValue]]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+    ) -> None:
+        if max_batch_size < 1:
+            raise ArgumentError("max_batch_size", "Value must be positive.")
+
+        self.__batch_load = batch_load
+        self.__max_batch_size = max_batch_size
+        self.__pending_keys: dict[TKey, asyncio.Future[TValue | None]] = {}
+        self.__running_tasks = set[asyncio.Task[None]]()
+        self.__is_dispatch_scheduled = False
+        self.__batch_count = 0
+
+    def load(self, key: TKey) -> Awaitable[TValue | None]:
+        """Loads the value with the specified key as part of the next batch.
+
+        :param key: The key of the value.
+        :type key: TKey
+        :return: If exists, the value; otherwise, None.
+        :rtype: Awaitable[TValue | None]
+        """
+
+        if (future := self.__pending_keys.get(key)) is None:
+            loop = asyncio.get_running_loop()
+            self.__pending_keys[key] = future = loop.create_future()
+            if not self.__is_dispatch_scheduled:
+                self.__is_dispatch_scheduled = True
+                loop.call_soon(self.__dispatch, context=contextvars.Context())
+
+        # The future is shared by the requests of the key, which mustn't be
+        # cancelled along with any of them.
+        return asyncio.shield(future)
+
+    async def load_immediately(self, key: TKey) -> TValue | None:
+        """Loads the value with the specified key on its own, in the current context.
+
+        :param key: The key of the value.
+        :type key: TKey
+        :return: If exists, the value; otherwise, None.
+        :rtype: TValue | None
+        """
+
+        self.__batch_count += 1
+        return (await self.__batch_load((key,))).get(key)
+
+    def __dispatch(self) -> None:
+        pending_keys = self.__pending_keys
+        self.__pending_keys = {}
+        self.__is_dispatch_scheduled = False
+
+        keys = tuple(pending_keys.keys())
+        for index in range(0, len(keys), self.__max_batch_size):
+            batch = {
+                key: pending_keys[key]
+                for key in keys[index:index + self.__max_batch_size]
+            }
+            task = asyncio.ensure_future(self.__load_batch(batch))
+            self.__running_tasks.add(task)
+            task.add_done_callback(self.__running_tasks.discard)
+
+    async def __load_batch(self, batch: dict[TKey, asyncio.Future[TValue | None]]) -> None:
+        self.__batch_count += 1
+        try:
+            values = await self.__batch_load(tuple(batch.keys()))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as error:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,162 @@
+import heapq
+from datetime import datetime
+from typing import Generic, TypeVar
+
+from holobot.sdk.exceptions import ArgumentError
+
+TKey = TypeVar("TKey")
+TValue = TypeVar("TValue")
+
+class _Shard(Generic[TKey, TValue]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.entries: dict[TKey, tuple[datetime, TValue]] = {}
+        # Entries are never removed from the heap directly;
+        # stale nodes are skipped when they reach the top.
+        self.expirations: list[tuple[datetime, int, TKey]] = []
+
+class ExpiringDict(Generic[TKey, TValue]):
+    """A dictionary whose entries are dropped once they expire.
+
+    The entries are distributed across shards, each of which keeps a heap
+    of expiration times so that the expired entries are evicted in the order
+    they expire, whenever the shard is accessed. Shards that aren't accessed
+    keep their expired entries until evict_expired is called. None of the operations
+    yield to the event loop, hence they are atomic without any locking.
+    """
+
+    @property
+    def size(self) -> int:
+        """Gets the number of entries, including the ones expired but not yet evicted.
+
+        :return: The number of entries.
+        :rtype: int
+        """
+
+        return sum(len(shard.entries) for shard in self.__shards)
+
+    @property
+    def eviction_count(self) -> int:
+        """Gets the total number of entries evicted due to expiration.
+
+        :return: The number of evicted entries.
+        :rtype: int
+        """
+
+        return self.__eviction_count
+
+    def __init__(self, shard_count: int = 16) -> None:
+        if shard_count < 1:
+            raise ArgumentError("shard_count", "Value must be positive.")
+
+        super().__init__()
+        self.__shards = tuple(_Shard[TKey, TValue]() for _ in range(shard_count))
+        self.__eviction_count = 0
+        self.__sequence = 0
+
+    def get(self, key: TKey, now: datetime) -> TValue | None:
+        """Gets the value of the entry with the specified key, if it hasn't expired yet.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :param now: The current date and time.
+        :type now: datetime
+        :return: If exists, the value of the entry; otherwise, None.
+        :rtype: TValue | None
+        """
+
+        shard = self.__get_shard(key)
+        self.__evict_expired(shard, now)
+        entry = shard.entries.get(key)
+        return entry[1] if entry else None
+
+    def get_or_add(
+        self,
+        key: TKey,
+        value: TValue,
+        expires_at: datetime,
+        now: datetime
+    ) -> TValue | None:
+        """Adds an entry with the specified key if there is no live entry with the same key.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :param value: The value to add.
+        :type value: TValue
+        :param expires_at: The date and time at which the new entry expires.
+        :type expires_at: datetime
+        :param now: The current date and time.
+        :type now: datetime
+        :return: If exists, the value of the live entry; otherwise, None, and the value is added.
+        :rtype: TValue | None
+        """
+
+        shard = self.__get_shard(key)
+        self.__evict_expired(shard, now)
+        if entry := shard.entries.get(key):
+            return entry[1]
+
+        self.__set(shard, key, value, expires_at)
+        return None
+
+    def set(self, key: TKey, value: TValue, expires_at: datetime) -> None:
+        """Adds or replaces the entry with the specified key.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :param value: The value to set.
+        :type value: TValue
+        :param expires_at: The date and time at which the entry expires.
+        :type expires_at: datetime
+        """
+
+        self.__set(self.__get_shard(key), key, value, expires_at)
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the entry with the specified key.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :return: True, if the entry existed.
+        :rtype: bool
+        """
+
+        return self.__get_shard(key).entries.pop(key, None) is not None
+
+    def evict_expired(self, now: datetime) -> int:
+        """Evicts the expired entries of every shard.
+
+        :param now: The current date and time.
+        :type now: datetime
+        :return: The number of evicted entries.
+        :rtype: int
+        """
+
+        return sum(self.__evict_expired(shard, now) for shard in self.__shards)
+
+    def __get_shard(self, key: TKey) -> _Shard[TKey, TValue]:
+        return self.__shards[hash(key) % len(self.__shards)]
+
+    def __set(
+        self,
+        shard: _Shard[TKey, TValue],
+        key: TKey,
+        value: TValue,
+        expires_at: datetime
+    ) -> None:
+        shard.entries[key] = (expires_at, value)
+        self.__sequence += 1
+        heapq.heappush(shard.expirations, (expires_at, self.__sequence, key))
+
+    def __evict_expired(self, shard: _Shard[TKey, TValue], now: datetime) -> int:
+        evicted_count = 0
+        expirations = shard.expirations
+        while expirations and expirations[0][0] <= now:
+            expires_at, _, key = heapq.heappop(expirations)
+            # Skip the node if the entry has been replaced or removed since.
+            if (entry := shard.entries.get(key)) and entry[0] == expires_at:
+                del shard.entries[key]
+                evicted_count += 1
+
+        self.__eviction_count += evicted_count
+        return evicted_count
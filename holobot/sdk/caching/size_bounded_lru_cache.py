@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from holobot.sdk.exceptions import ArgumentError
+
+TKey = TypeVar("TKey")
+TValue = TypeVar("TValue")
+
+class SizeBoundedLruCache(Generic[TKey, TValue]):
+    """A least recently used cache bounded by the total size of its values.
+
+    None of the operations yield to the event loop, hence no locking is necessary.
+    """
+
+    @property
+    def max_size(self) -> int:
+        """Gets the maximum total size of the values."""
+
+        return self.__max_size
+
+    @property
+    def size(self) -> int:
+        """Gets the total size of the values."""
+
+        return self.__size
+
+    @property
+    def count(self) -> int:
+        """Gets the number of entries."""
+
+        return len(self.__entries)
+
+    @property
+    def hit_count(self) -> int:
+        """Gets the number of lookups that found an entry."""
+
+        return self.__hit_count
+
+    @property
+    def miss_count(self) -> int:
+        """Gets the number of lookups that didn't find an entry."""
+
+        return self.__miss_count
+
+    @property
+    def eviction_count(self) -> int:
+        """Gets the number of entries evicted to make space for new ones."""
+
+        return self.__eviction_count
+
+    def __init__(
+        self,
+        max_size: int,
+        size_of: Callable[[TValue], int]
+    ) -> None:
+        if max_size < 1:
+            raise ArgumentError("max_size", "Value must be positive.")
+
+        self.__max_size = max_size
+        self.__size_of = size_of
+        self.__entries = OrderedDict[TKey, tuple[TValue, int]]()
+        self.__size = 0
+        self.__hit_count = 0
+        self.__miss_count = 0
+        self.__eviction_count = 0
+
+    def get(self, key: TKey) -> TValue | None:
+        """Gets the value of the entry with the specified key.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :return: If exists, the value of the entry; otherwise, None.
+        :rtype: TValue | None
+        """
+
+        if (entry := self.__entries.get(key)) is None:
+            self.__miss_count += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hit_count += 1
+        return entry[0]
+
+    def set(self, key: TKey, value: TValue) -> bool:
+        """Adds or replaces the entry with the specified key.
+
+        Values larger than the maximum size are not cached.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :param value: The value to set.
+        :type value: TValue
+        :return: True, if the value has been cached.
+        :rtype: bool
+        """
+
+        value_size = self.__size_of(value)
+        if value_size > self.__max_size:
+            return False
+
+        self.remove(key)
+        self.__entries[key] = (value, value_size)
+        self.__size += value_size
+        while self.__size > self.__max_size:
+            _, (_, evicted_size) = self.__entries.popitem(last=False)
+            self.__size -= evicted_size
+            self.__eviction_count += 1
+
+        return True
+
+    def remove(self, key: TKey) -> bool:
+        """Removes the entry with the specified key.
+
+        :param key: The key of the entry.
+        :type key: TKey
+        :return: True, if the entry existed.
+        :rtype: bool
+        """
+
+        if (entry := self.__entries.pop(key, None)) is None:
+            return False
+
+        self.__size -= entry[1]
+        return True
+
+    def clear(self) -> None:
+        """Removes every entry."""
+
+        self.__entries.clear()
+        self.__size = 0
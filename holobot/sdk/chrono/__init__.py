@@ -1,3 +1,4 @@
+from .cron_expression import CronExpression
 from .iclock import IClock
 from .interval_parser import parse_interval
 from .invalid_input_error import InvalidInputError
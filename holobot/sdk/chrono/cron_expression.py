@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from .invalid_input_error import InvalidInputError
+
+# Enough to find the next occurrence of any satisfiable expression within a few years.
+_MAX_ITERATIONS = 100_000
+
+class CronExpression:
+    """A cron-like schedule consisting of five space separated fields:
+    minute, hour, day of month, month and day of week.
+
+    Each field is either "*", a value, a range ("1-5"), a step ("*/15", "0-30/5")
+    or a comma separated list of these. Days of week range from 0 (Sunday) to 6,
+    and 7 is accepted as Sunday, too. When both day fields are restricted,
+    a day matching either of them matches, as in cron.
+    """
+
+    def __init__(
+        self,
+        minutes: frozenset[int],
+        hours: frozenset[int],
+        days: frozenset[int] | None,
+        months: frozenset[int],
+        days_of_week: frozenset[int] | None
+    ) -> None:
+        self.__minutes = minutes
+        self.__hours = hours
+        self.__days = days
+        self.__months = months
+        self.__days_of_week = days_of_week
+
+    @staticmethod
+    def parse(value: str) -> CronExpression:
+        """Parses a cron-like expression.
+
+        :param value: The expression to parse.
+        :type value: str
+        :raises InvalidInputError: Raised when the expression is malformed.
+        :return: The parsed expression.
+        :rtype: CronExpression
+        """
+
+        fields = value.split()
+        if len(fields) != 5:
+            raise InvalidInputError("A cron expression must consist of exactly five fields.")
+
+        days_of_week = CronExpression.__parse_field(fields[4], 0, 7)
+        return CronExpression(
+            CronExpression.__parse_field(fields[0], 0, 59) or frozenset(range(60)),
+            CronExpression.__parse_field(fields[1], 0, 23) or frozenset(range(24)),
+            CronExpression.__parse_field(fields[2], 1, 31),
+            CronExpression.__parse_field(fields[3], 1, 12) or frozenset(range(1, 13)),
+            frozenset(day % 7 for day in days_of_week) if days_of_week else None
+        )
+
+    def get_next(self, after: datetime) -> datetime:
+        """Gets the first time matching the expression after the specified time.
+
+        :param after: The time after which to get the next match, exclusive.
+        :type after: datetime
+        :raises ValueError: Raised when the expression matches no date, such as February 30.
+        :return: The first matching time, in the same time zone as the specified time.
+        :rtype: datetime
+        """
+
+        current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        for _ in range(_MAX_ITERATIONS):
+            if current.month not in self.__months:
+                current = (current.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self.__is_matching_day(current):
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+            elif current.hour not in self.__hours:
+                current = current.replace(minute=0) + timedelta(hours=1)
+            elif current.minute not in self.__minutes:
+                current += timedelta(minutes=1)
+            else:
+                return current
+
+        raise ValueError("The cron expression doesn't match any date.")
+
+    def __is_matching_day(self, value: datetime) -> bool:
+        is_matching_day = self.__days is not None and value.day in self.__days
+        # Python's weeks start on Monday, while cron's on Sunday.
+        is_matching_day_of_week = (
+            self.__days_of_week is not None
+            and (value.weekday() + 1) % 7 in self.__days_of_week
+        )
+        if self.__days is None and self.__days_of_week is None:
+            return True
+        if self.__days is None:
+            return is_matching_day_of_week
+        if self.__days_of_week is None:
+            return is_matching_day
+
+        return is_matching_day or is_matching_day_of_week
+
+    @staticmethod
+    def __parse_field(value: str, min_value: int, max_value: int) -> frozenset[int] | None:
+        if value == "*":
+            return None
+
+        values = set[int]()
+        for part in value.split(","):
+            range_part, _, step_part = part.partition("/")
+            step = CronExpression.__parse_int(step_part, 1, max_value) if step_part else 1
+            if range_part == "*":
+                start, end = min_value, max_value
+            elif "-" in range_part:
+                start_part, _, end_part = range_part.partition("-")
+                start = CronExpression.__parse_int(start_part, min_value, max_value)
+                end = CronExpression.__parse_int(end_part, start, max_value)
+            else:
+                start = CronExpression.__parse_int(range_part, min_value, max_value)
+                end = max_value if step_part else start
+            values.update(range(start, end + 1, step))
+
+        return frozenset(values)
+
+    @staticmethod
+    def __parse_int(value: str, min_value: int, max_value: int) -> int:
+        if not value.isdigit() or not min_value <= (int_value := int(value)) <= max_value:
+            raise InvalidInputError(f"Expected a value between {min_value} and {max_value}, but got '{value}'.")
+
+        return int_value
@@ -1,2 +1,3 @@
 from .async_anonymous_disposable import AsyncAnonymousDisposable
+from .async_rate_limiter import AsyncRateLimiter
 from .iasync_disposable import IAsyncDisposable
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from collections import deque
+from datetime import timedelta
+
+from holobot.sdk.exceptions import ArgumentError
+
+class AsyncRateLimiter:
+    """Limits the rate at which operations are performed using a sliding window.
+
+    Unlike `AsyncRateLimitPolicy`, which rejects the excess operations,
+    this delays them until they fit in the window, in the order of arrival.
+    """
+
+    @property
+    def is_idle(self) -> bool:
+        """Determines whether no operations have been performed within the current window."""
+
+        return not self.__timestamps or self.__timestamps[-1] < time.monotonic() - self.__interval
+
+    def __init__(
+        self,
+        operations_per_interval: int,
+        interval: timedelta
+    ) -> None:
+        if operations_per_interval < 1:
+            raise ArgumentError("operations_per_interval", "Value must be positive.")
+        if interval <= timedelta():
+            raise ArgumentError("interval", "Value must be positive.")
+
+        self.__operations_per_interval = operations_per_interval
+        self.__interval = interval.total_seconds()
+        self.__lock = asyncio.Lock()
+        self.__timestamps = deque[float](maxlen=operations_per_interval)
+
+    def try_acquire(self) -> bool:
+        """Reserves another operation if it can be performed without waiting.
+
+        :return: True, if the operation has been reserved.
+        :rtype: bool
+        """
+
+        if self.__lock.locked():
+            return False
+
+        current_time = time.monotonic()
+        self.__remove_expired_timestamps(current_time)
+        if len(self.__timestamps) >= self.__operations_per_interval:
+            return False
+
+        self.__timestamps.append(current_time)
+        return True
+
+    async def acquire(self) -> None:
+        """Waits until another operation can be performed and reserves it."""
+
+        async with self.__lock:
+            while True:
+                current_time = time.monotonic()
+                self.__remove_expired_timestamps(current_time)
+                if len(self.__timestamps) < self.__operations_per_interval:
+                    self.__timestamps.append(current_time)
+                    return
+
+                await asyncio.sleep(self.__timestamps[0] + self.__interval - current_time)
+
+    def __remove_expired_timestamps(self, current_time: float) -> None:
+        while self.__timestamps and self.__timestamps[0] <= current_time - self.__interval:
+            self.__timestamps.popleft()
@@ -1,4 +1,8 @@
+from .iconnection_initializer import IConnectionInitializer
 from .idatabase_manager import IDatabaseManager
+from .iidentity_map import IIdentityMap
+from .iquery_fan_out import IQueryFanOut
 from .isession import ISession
 from .iunit_of_work import IUnitOfWork
 from .iunit_of_work_provider import IUnitOfWorkProvider
+from .pool_statistics import PoolStatistics
@@ -1 +1,2 @@
+from .count_mode import CountMode
 from .isolation_level import IsolationLevel
@@ -0,0 +1,17 @@
+from enum import IntEnum, unique
+
+@unique
+class CountMode(IntEnum):
+    """Defines how the total number of items is determined during pagination."""
+
+    NONE = 0
+    """The items aren't counted."""
+
+    EXACT = 1
+    """The items matching the filter are counted."""
+
+    ESTIMATED = 2
+    """The number of rows in the whole table is estimated from the planner statistics.
+
+    This is very cheap, but it ignores the filter and may be inaccurate.
+    """
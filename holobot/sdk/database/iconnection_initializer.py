@@ -0,0 +1,21 @@
+from collections.abc import Awaitable
+from typing import Protocol
+
+import asyncpg
+
+class IConnectionInitializer(Protocol):
+    """Interface for a service that prepares new database connections.
+
+    Initializers are invoked once for every connection the pool opens,
+    before it's used for the first time; for example, to register type codecs.
+    """
+
+    def initialize(self, connection: asyncpg.Connection) -> Awaitable[None]:
+        """Initializes the specified connection.
+
+        :param connection: The newly opened connection.
+        :type connection: asyncpg.Connection
+        :return: None.
+        :rtype: Awaitable[None]
+        """
+        ...
@@ -2,6 +2,7 @@ from collections.abc import Awaitable
 from typing import Protocol
 
 from .isession import ISession
+from .pool_statistics import PoolStatistics
 
 class IDatabaseManager(Protocol):
     def upgrade_all(self) -> Awaitable[None]:
@@ -9,3 +10,11 @@ class IDatabaseManager(Protocol):
 
     def acquire_connection(self) -> Awaitable[ISession]:
         ...
+
+    def get_pool_statistics(self) -> PoolStatistics:
+        """Gets the current statistics of the connection pool.
+
+        :return: A snapshot of the statistics.
+        :rtype: PoolStatistics
+        """
+        ...
@@ -0,0 +1,50 @@
+from collections.abc import Hashable
+from typing import Any, Protocol
+
+class IIdentityMap(Protocol):
+    """Interface for an identity map that keeps track of loaded entities.
+
+    Unlike a unit of work, an identity map is not bound to a transaction,
+    hence it's meant to be short-lived, such as the processing of a single request.
+    """
+
+    def get(self, entity_type: type, key: Hashable) -> Any | None:
+        """Gets the entity with the specified key.
+
+        :param entity_type: The type of the entity.
+        :type entity_type: type
+        :param key: The key of the entity, such as its identifier.
+        :type key: Hashable
+        :return: If found, the matching entity; otherwise, None.
+        :rtype: Any | None
+        """
+        ...
+
+    def set(self, entity_type: type, key: Hashable, value: Any) -> None:
+        """Sets the specified entity.
+
+        If there is already an entity with the same key,
+        this new entity will replace the old one.
+
+        :param entity_type: The type of the entity.
+        :type entity_type: type
+        :param key: The key of the entity, such as its identifier.
+        :type key: Hashable
+        :param value: The entity to be set.
+        :type value: Any
+        """
+        ...
+
+    def remove(self, entity_type: type, key: Hashable) -> None:
+        """Removes the entity with the specified key, if any.
+
+        :param entity_type: The type of the entity.
+        :type entity_type: type
+        :param key: The key of the entity, such as its identifier.
+        :type key: Hashable
+        """
+        ...
+
+    def clear(self) -> None:
+        """Removes all entities."""
+        ...
@@ -0,0 +1,67 @@
+from collections.abc import Awaitable, Iterable
+from typing import Any, Protocol, TypeVar, overload
+
+T = TypeVar("T")
+T1 = TypeVar("T1")
+T2 = TypeVar("T2")
+T3 = TypeVar("T3")
+T4 = TypeVar("T4")
+
+class IQueryFanOut(Protocol):
+    """Interface for a service used to execute independent queries concurrently.
+
+    Outside a unit of work, each query uses its own pooled connection, hence
+    their latencies overlap. Within a unit of work, all queries must share
+    the connection of the unit of work, therefore they are executed one by one.
+    If any of the queries fails, the rest of them are cancelled.
+    """
+
+    @overload
+    def fetch(
+        self,
+        query1: Awaitable[T1],
+        query2: Awaitable[T2],
+        /
+    ) -> Awaitable[tuple[T1, T2]]:
+        ...
+
+    @overload
+    def fetch(
+        self,
+        query1: Awaitable[T1],
+        query2: Awaitable[T2],
+        query3: Awaitable[T3],
+        /
+    ) -> Awaitable[tuple[T1, T2, T3]]:
+        ...
+
+    @overload
+    def fetch(
+        self,
+        query1: Awaitable[T1],
+        query2: Awaitable[T2],
+        query3: Awaitable[T3],
+        query4: Awaitable[T4],
+        /
+    ) -> Awaitable[tuple[T1, T2, T3, T4]]:
+        ...
+
+    def fetch(self, *queries: Awaitable[Any]) -> Awaitable[tuple[Any, ...]]:
+        """Executes the specified independent queries.
+
+        :param queries: The queries, such as repository method calls, to be executed.
+        :type queries: Awaitable[Any]
+        :return: The results of the queries, in the same order as the queries.
+        :rtype: Awaitable[tuple[Any, ...]]
+        """
+        ...
+
+    def fetch_all(self, queries: Iterable[Awaitable[T]]) -> Awaitable[tuple[T, ...]]:
+        """Executes the specified independent queries of the same result type.
+
+        :param queries: The queries, such as repository method calls, to be executed.
+        :type queries: Iterable[Awaitable[T]]
+        :return: The results of the queries, in the same order as the queries.
+        :rtype: Awaitable[tuple[T, ...]]
+        """
+        ...
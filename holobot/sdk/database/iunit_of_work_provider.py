@@ -1,7 +1,9 @@
 from collections.abc import Awaitable
+from contextlib import AbstractContextManager
 from typing import Protocol
 
 from holobot.sdk.database.enums import IsolationLevel
+from .iidentity_map import IIdentityMap
 from .iunit_of_work import IUnitOfWork
 
 class IUnitOfWorkProvider(Protocol):
@@ -16,6 +18,27 @@ class IUnitOfWorkProvider(Protocol):
         """
         ...
 
+    @property
+    def identity_map(self) -> IIdentityMap | None:
+        """Gets the identity map of the current scope.
+
+        :return: If there is an active scope, its identity map; otherwise, None.
+        :rtype: IIdentityMap | None
+        """
+        ...
+
+    def create_identity_map_scope(self) -> AbstractContextManager[IIdentityMap]:
+        """Creates a new scope with its own identity map.
+
+        Repositories use the identity map of the current scope to avoid
+        loading the same entity repeatedly, while outside a unit of work.
+        If there is an active scope already, its identity map is reused.
+
+        :return: A context manager that activates the identity map until exited.
+        :rtype: AbstractContextManager[IIdentityMap]
+        """
+        ...
+
     def create_new(
         self,
         isolation_level: IsolationLevel = IsolationLevel.READ_COMMITTED
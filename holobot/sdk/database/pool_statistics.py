@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+from holobot.sdk.diagnostics import Histogram
+
+@dataclass(kw_only=True, frozen=True)
+class PoolStatistics:
+    """A snapshot of the state of the database connection pool."""
+
+    min_size: int
+    """The minimum number of connections kept open."""
+
+    max_size: int
+    """The maximum number of connections."""
+
+    size: int
+    """The number of currently open connections."""
+
+    in_use_count: int
+    """The number of connections currently acquired."""
+
+    idle_count: int
+    """The number of open connections currently available."""
+
+    acquisition_count: int
+    """The number of successful acquisitions since the start."""
+
+    acquisition_timeout_count: int
+    """The number of acquisitions that timed out since the start."""
+
+    acquire_wait_times: Histogram
+    """The time spent waiting for a connection by successful acquisitions, in milliseconds."""
@@ -1,3 +1,4 @@
+from .compiled_keyset_pagination_query import CompiledKeysetPaginationQuery
 from .compiled_pagination_query import CompiledPaginationQuery
 from .compiled_query import CompiledQuery
 from .delete_builder import DeleteBuilder
@@ -8,16 +9,20 @@ from .icompileable_query_part_builder import ICompileableQueryPartBuilder
 from .icompiled_query import ICompiledQuery
 from .insert_builder import InsertBuilder
 from .iquery_part_builder import IQueryPartBuilder
+from .iquery_tracer import IQueryTracer
 from .isupports_exists import ISupportsExists
 from .isupports_pagination import ISupportsPagination
 from .iwhere_builder import IWhereBuilder
 from .join_builder import JoinBuilder
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .limit_builder import LimitBuilder
 from .on_conflict_builder import OnConflictBuilder
 from .on_conflict_update_builder import OnConflictUpdateBuilder
 from .order_by_builder import OrderByBuilder
 from .paginate_builder import PaginateBuilder
 from .query import Query
+from .query_template_cache import QueryTemplateCache
+from .query_tracer_context import QueryTracerContext, trace_query
 from .returning_builder import ReturningBuilder
 from .select_builder import SelectBuilder
 from .update_builder import UpdateBuilder
@@ -0,0 +1,50 @@
+import time
+from typing import Any
+
+from asyncpg.connection import Connection
+
+from .enums import SeekDirection
+from .models import KeysetPaginationResult
+from .query_tracer_context import trace_query
+
+class CompiledKeysetPaginationQuery:
+    def __init__(
+        self,
+        query: str,
+        arguments: tuple[Any, ...],
+        key_columns: tuple[str, ...],
+        page_size: int,
+        direction: SeekDirection,
+        has_cursor: bool
+    ) -> None:
+        self.__query: str = query
+        self.__arguments: tuple[Any, ...] = arguments
+        self.__key_columns: tuple[str, ...] = key_columns
+        self.__page_size: int = page_size
+        self.__direction: SeekDirection = direction
+        self.__has_cursor: bool = has_cursor
+
+    async def fetch(self, connection: Connection) -> KeysetPaginationResult:
+        started_at = time.perf_counter()
+        records: list[Any] = await connection.fetch(self.__query, *self.__arguments)
+        await trace_query(connection, self.__query, self.__arguments, len(records), started_at)
+        # One extra record is fetched to tell whether there are more in the seek direction.
+        has_more = len(records) > self.__page_size
+        records = records[:self.__page_size]
+        if self.__direction == SeekDirection.BACKWARD:
+            records.reverse()
+            has_previous_page, has_next_page = has_more, self.__has_cursor
+        else:
+            has_previous_page, has_next_page = self.__has_cursor, has_more
+
+        return KeysetPaginationResult(
+            self.__page_size,
+            has_previous_page,
+            has_next_page,
+            self.__get_key(records[0]) if records else None,
+            self.__get_key(records[-1]) if records else None,
+            records
+        )
+
+    def __get_key(self, record: Any) -> tuple[Any, ...]:
+        return tuple(record[column] for column in self.__key_columns)
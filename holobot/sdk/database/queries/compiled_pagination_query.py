@@ -1,10 +1,11 @@
+import time
 from typing import Any
 
 from asyncpg.connection import Connection
 
 from .models import PaginationResult
+from .query_tracer_context import trace_query
 
-# TODO Query string tracing.
 class CompiledPaginationQuery:
     def __init__(
         self,
@@ -17,10 +18,11 @@ class CompiledPaginationQuery:
         self.__arguments: tuple[Any, ...] = arguments
         self.__page_index: int = page_index
         self.__page_size: int = page_size
-        # print(f"Query: {query}\nArgs: {", ".join(map(lambda i: str(i), arguments))}")
 
     async def fetch(self, connection: Connection) -> PaginationResult:
+        started_at = time.perf_counter()
         records: list[Any] = await connection.fetch(self.__query, *self.__arguments)
+        await trace_query(connection, self.__query, self.__arguments, len(records), started_at)
         total_count = records[0]["_totalrows"] if records else 0
         return PaginationResult(
             self.__page_index,
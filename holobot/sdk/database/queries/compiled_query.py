@@ -1,29 +1,51 @@
+import time
 from typing import Any
 
 import asyncpg
 
 from holobot.sdk.database.exceptions import SerializationError
 from holobot.sdk.database.statuses import CommandComplete
+from holobot.sdk.database.statuses.command_tags import (
+    DeleteCommandTag, InsertCommandTag, UpdateCommandTag
+)
 from .icompiled_query import ICompiledQuery
+from .query_tracer_context import trace_query
 
-# TODO Query string tracing.
 class CompiledQuery(ICompiledQuery):
+    @property
+    def query(self) -> str:
+        return self.__query
+
+    @property
+    def arguments(self) -> tuple[Any, ...]:
+        return self.__arguments
+
     def __init__(self, query: str, arguments: tuple[Any, ...]) -> None:
         self.__query: str = query
         self.__arguments: tuple[Any, ...] = arguments
-        # print(f"Query: {query}\nArgs: {", ".join(map(lambda i: str(i), arguments))}")
 
     async def execute(self, connection: asyncpg.Connection) -> CommandComplete[Any]:
         try:
+            started_at = time.perf_counter()
             status = await connection.execute(self.__query, *self.__arguments)
+            command_complete = CommandComplete.parse(status)
+            await trace_query(
+                connection,
+                self.__query,
+                self.__arguments,
+                CompiledQuery.__get_affected_row_count(command_complete),
+                started_at
+            )
 
-            return CommandComplete.parse(status)
+            return command_complete
         except asyncpg.exceptions.SerializationError as error:
             raise SerializationError(str(error)) from error
 
     async def fetch(self, connection: asyncpg.Connection) -> tuple[dict[str, Any], ...]:
         try:
+            started_at = time.perf_counter()
             records: list[dict[str, Any]] = await connection.fetch(self.__query, *self.__arguments)
+            await trace_query(connection, self.__query, self.__arguments, len(records), started_at)
 
             return tuple(records)
         except asyncpg.exceptions.SerializationError as error:
@@ -31,10 +53,18 @@ class CompiledQuery(ICompiledQuery):
 
     async def fetchrow(self, connection: asyncpg.Connection) -> dict[str, Any] | None:
         try:
+            started_at = time.perf_counter()
             record: dict[str, Any] | None = await connection.fetchrow(
                 self.__query,
                 *self.__arguments
             )
+            await trace_query(
+                connection,
+                self.__query,
+                self.__arguments,
+                0 if record is None else 1,
+                started_at
+            )
 
             return record
         except asyncpg.exceptions.SerializationError as error:
@@ -42,6 +72,24 @@ class CompiledQuery(ICompiledQuery):
 
     async def fetchval(self, connection: asyncpg.Connection) -> Any | None:
         try:
-            return await connection.fetchval(self.__query, *self.__arguments)
+            started_at = time.perf_counter()
+            value = await connection.fetchval(self.__query, *self.__arguments)
+            await trace_query(
+                connection,
+                self.__query,
+                self.__arguments,
+                0 if value is None else 1,
+                started_at
+            )
+
+            return value
         except asyncpg.exceptions.SerializationError as error:
             raise SerializationError(str(error)) from error
+
+    @staticmethod
+    def __get_affected_row_count(command_complete: CommandComplete[Any]) -> int:
+        command_tag = command_complete.command_tag
+        if isinstance(command_tag, (DeleteCommandTag, InsertCommandTag, UpdateCommandTag)):
+            return command_tag.rows
+
+        return 0
@@ -1,3 +1,4 @@
 from .connector import Connector
 from .equality import Equality
 from .order import Order
+from .seek_direction import SeekDirection
@@ -0,0 +1,9 @@
+from enum import IntEnum, unique
+
+@unique
+class SeekDirection(IntEnum):
+    FORWARD = 0
+    """Fetch the rows following the cursor."""
+
+    BACKWARD = 1
+    """Fetch the rows preceding the cursor."""
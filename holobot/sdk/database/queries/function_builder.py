@@ -1,9 +1,10 @@
 from typing import Any
 
 from .compiled_query import CompiledQuery
-from .enums import Order
+from .enums import Order, SeekDirection
 from .iquery_part_builder import IQueryPartBuilder
 from .isupports_pagination import ISupportsPagination
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .limit_builder import LimitBuilder
 from .order_by_builder import OrderByBuilder
 from .paginate_builder import PaginateBuilder
@@ -41,6 +42,15 @@ class FunctionBuilder(IQueryPartBuilder, ISupportsPagination):
     ) -> PaginateBuilder:
         return PaginateBuilder(self, ordering_columns, page_index, page_size)
 
+    def paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginateBuilder:
+        return KeysetPaginateBuilder(self, ordering_columns, page_size, cursor, direction)
+
     def compile(self) -> CompiledQuery:
         return CompiledQuery(*self.build())
 
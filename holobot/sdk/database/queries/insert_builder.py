@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 from .compiled_query import CompiledQuery
@@ -12,6 +13,8 @@ class InsertBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
         self.__table_name: str = ""
         self.__schema_name: str | None = None
         self.__fields: dict[str, Any | None] = {}
+        self.__column_names: tuple[str, ...] = ()
+        self.__rows: list[tuple[Any | None, ...]] = []
 
     @property
     def table_name(self) -> str:
@@ -43,6 +46,33 @@ class InsertBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
         self.__fields |= fields
         return self
 
+    def rows(
+        self,
+        column_names: tuple[str, ...],
+        rows: Iterable[tuple[Any | None, ...]]
+    ) -> InsertBuilder:
+        """Inserts multiple rows with a single statement.
+
+        This cannot be combined with the single-row field() and fields() methods.
+
+        :param column_names: The names of the columns to be set.
+        :type column_names: tuple[str, ...]
+        :param rows: The values of the rows in the same order as the columns.
+        :type rows: Iterable[tuple[Any | None, ...]]
+        :return: The same builder.
+        :rtype: InsertBuilder
+        """
+
+        if self.__column_names and self.__column_names != column_names:
+            raise ValueError("Every row must set the same columns.")
+
+        self.__column_names = column_names
+        for row in rows:
+            if len(row) != len(column_names):
+                raise ValueError("Every row must have exactly one value for each column.")
+            self.__rows.append(row)
+        return self
+
     def on_conflict(self, column: str, *columns: str) -> OnConflictBuilder:
         return OnConflictBuilder(self, column, *columns)
 
@@ -53,6 +83,11 @@ class InsertBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
         return CompiledQuery(*self.build())
 
     def build(self) -> tuple[str, tuple[Any, ...]]:
+        if self.__rows:
+            if self.__fields:
+                raise ValueError("Single-row fields and multiple rows cannot be combined.")
+            return self.__build_rows()
+
         if not self.__fields:
             raise ValueError("The UPDATE clause must have at least one field.")
 
@@ -66,3 +101,19 @@ class InsertBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
         sql_parts.append(f"({', '.join(f'${index + 1}' for index in range(len(self.__fields)))})")
 
         return ("".join(sql_parts), tuple(self.__fields.values()))
+
+    def __build_rows(self) -> tuple[str, tuple[Any, ...]]:
+        sql_parts = ["INSERT INTO "]
+        if self.__schema_name:
+            sql_parts.append(self.__schema_name)
+            sql_parts.append(".")
+
+        sql_parts.append(self.__table_name)
+        sql_parts.append(f" ({', '.join(self.__column_names)}) VALUES ")
+        column_count = len(self.__column_names)
+        sql_parts.append(", ".join(
+            f"({', '.join(f'${row_index * column_count + index + 1}' for index in range(column_count))})"
+            for row_index in range(len(self.__rows))
+        ))
+
+        return ("".join(sql_parts), tuple(value for row in self.__rows for value in row))
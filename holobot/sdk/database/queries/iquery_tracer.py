@@ -0,0 +1,62 @@
+from collections.abc import Awaitable
+from typing import Any, Protocol
+
+import asyncpg
+
+from .models import QueryShapeStatistics
+
+class IQueryTracer(Protocol):
+    """Interface for a service that collects statistics about the executed queries."""
+
+    def record(
+        self,
+        query: str,
+        argument_count: int,
+        row_count: int,
+        elapsed_time: float
+    ) -> bool:
+        """Records an execution of a query.
+
+        :param query: The SQL text of the query.
+        :type query: str
+        :param argument_count: The number of arguments the query has been executed with.
+        :type argument_count: int
+        :param row_count: The number of rows returned or affected by the query.
+        :type row_count: int
+        :param elapsed_time: The time spent executing the query, in milliseconds.
+        :type elapsed_time: float
+        :return: True, if the execution plan of the query should be captured.
+        :rtype: bool
+        """
+        ...
+
+    def capture_query_plan(
+        self,
+        connection: asyncpg.Connection,
+        query: str,
+        arguments: tuple[Any, ...]
+    ) -> Awaitable[None]:
+        """Captures the execution plan of a query by executing it again.
+
+        :param connection: The connection the query has been executed on.
+        :type connection: asyncpg.Connection
+        :param query: The SQL text of the query.
+        :type query: str
+        :param arguments: The arguments the query has been executed with.
+        :type arguments: tuple[Any, ...]
+        """
+        ...
+
+    def get_top_query_shapes(self, count: int) -> tuple[QueryShapeStatistics, ...]:
+        """Gets the query shapes with the highest total execution time.
+
+        :param count: The maximum number of query shapes to get.
+        :type count: int
+        :return: A snapshot of the statistics of the query shapes, in descending order of total time.
+        :rtype: tuple[QueryShapeStatistics, ...]
+        """
+        ...
+
+    def reset(self) -> None:
+        """Discards the collected statistics."""
+        ...
@@ -1,6 +1,7 @@
-from typing import Protocol
+from typing import Any, Protocol
 
-from .enums import Order
+from .enums import Order, SeekDirection
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .paginate_builder import PaginateBuilder
 
 class ISupportsPagination(Protocol):
@@ -11,3 +12,12 @@ class ISupportsPagination(Protocol):
         page_size: int
     ) -> PaginateBuilder:
         ...
+
+    def paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginateBuilder:
+        ...
@@ -0,0 +1,101 @@
+from typing import Any
+
+from holobot.sdk.exceptions import ArgumentError
+from .compiled_keyset_pagination_query import CompiledKeysetPaginationQuery
+from .enums import Order, SeekDirection
+from .icompileable_query_part_builder import ICompileableQueryPartBuilder
+from .iquery_part_builder import IQueryPartBuilder
+
+class KeysetPaginateBuilder(ICompileableQueryPartBuilder[CompiledKeysetPaginationQuery]):
+    """Builds a query that seeks to a page by the values of the ordering columns.
+
+    Unlike offset based pagination, the cost of fetching a page doesn't depend
+    on its position, given that there is an index matching the ordering.
+    The ordering columns must identify the rows uniquely and mustn't be null.
+    """
+
+    def __init__(
+        self,
+        parent_builder: IQueryPartBuilder,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> None:
+        super().__init__()
+        if len(ordering_columns) < 1:
+            raise ArgumentError(
+                "ordering_columns",
+                "At least one ordering column must be specified."
+            )
+        if cursor is not None and len(cursor) != len(ordering_columns):
+            raise ArgumentError(
+                "cursor",
+                "The cursor must have exactly one value for each ordering column."
+            )
+        if page_size < 1:
+            raise ArgumentError("page_size", "Value must be positive.")
+
+        self.__parent_builder = parent_builder
+        self.__ordering_columns = ordering_columns
+        self.__page_size = page_size
+        self.__cursor = cursor
+        self.__direction = direction
+
+    def compile(self) -> CompiledKeysetPaginationQuery:
+        return CompiledKeysetPaginationQuery(
+            *self.build(),
+            tuple(column.rsplit(".", 1)[-1] for column, _ in self.__ordering_columns),
+            self.__page_size,
+            self.__direction,
+            self.__cursor is not None
+        )
+
+    def build(self) -> tuple[str, tuple[Any, ...]]:
+        parent_sql, parent_args = self.__parent_builder.build()
+        arguments = list[Any](parent_args)
+        is_backward = self.__direction == SeekDirection.BACKWARD
+        # When seeking backward, the ordering is reversed and so are the results later.
+        orders = [
+            (column, (order == Order.ASCENDING) != is_backward)
+            for column, order in self.__ordering_columns
+        ]
+        sql = [f"SELECT * FROM ({parent_sql}) AS Data_CTE"]
+        if self.__cursor is not None:
+            base_index = len(arguments) + 1
+            arguments.extend(self.__cursor)
+            sql.append(f" WHERE {KeysetPaginateBuilder.__build_seek_predicate(orders, base_index)}")
+
+        sql.append(" ORDER BY ")
+        sql.append(", ".join(
+            f"{column} {'ASC' if is_ascending else 'DESC'}"
+            for column, is_ascending in orders
+        ))
+        arguments.append(self.__page_size + 1)
+        sql.append(f" LIMIT ${len(arguments)}")
+
+        return ("".join(sql), tuple(arguments))
+
+    @staticmethod
+    def __build_seek_predicate(
+        orders: list[tuple[str, bool]],
+        base_index: int
+    ) -> str:
+        # A row value comparison is used when possible, because it can use a matching index.
+        if all(is_ascending == orders[0][1] for _, is_ascending in orders):
+            operator = ">" if orders[0][1] else "<"
+            columns = ", ".join(column for column, _ in orders)
+            parameters = ", ".join(f"${base_index + index}" for index in range(len(orders)))
+            return f"({columns}) {operator} ({parameters})"
+
+        # Mixed directions need the expanded form: (a > $1) OR (a = $1 AND b < $2) OR ...
+        alternatives = []
+        for index, (column, is_ascending) in enumerate(orders):
+            conditions = [
+                f"{orders[previous_index][0]} = ${base_index + previous_index}"
+                for previous_index in range(index)
+            ]
+            conditions.append(f"{column} {'>' if is_ascending else '<'} ${base_index + index}")
+            alternatives.append(f"({' AND '.join(conditions)})")
+
+        return f"({' OR '.join(alternatives)})"
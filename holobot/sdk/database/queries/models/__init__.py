@@ -1 +1,3 @@
+from .keyset_pagination_result import KeysetPaginationResult
 from .pagination_result import PaginationResult
+from .query_shape_statistics import QueryShapeStatistics
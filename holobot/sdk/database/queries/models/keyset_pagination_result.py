@@ -0,0 +1,25 @@
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+@dataclass(frozen=True)
+class KeysetPaginationResult:
+    """Represents the results of a keyset pagination query."""
+
+    page_size: int
+    """The maximum number of records on a single page."""
+
+    has_previous_page: bool
+    """Whether there are records preceding the current page."""
+
+    has_next_page: bool
+    """Whether there are records following the current page."""
+
+    first_key: tuple[Any, ...] | None = None
+    """The values of the ordering columns of the first record, if any."""
+
+    last_key: tuple[Any, ...] | None = None
+    """The values of the ordering columns of the last record, if any."""
+
+    records: Sequence[dict[str, Any]] = field(default_factory=list)
+    """The records of the current page, in order."""
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+
+from holobot.sdk.diagnostics import Histogram
+
+@dataclass(kw_only=True)
+class QueryShapeStatistics:
+    """The aggregated statistics of the executions of a query shape.
+
+    A query shape is the SQL text of a query without its argument values.
+    """
+
+    query: str
+    """The SQL text of the query."""
+
+    argument_count: int
+    """The number of arguments the query is executed with."""
+
+    elapsed_times: Histogram
+    """The time spent executing the query, in milliseconds."""
+
+    row_count: int = 0
+    """The total number of rows returned or affected by the executions."""
+
+    slow_execution_count: int = 0
+    """The number of executions above the slow query threshold."""
+
+    query_plan: str | None = None
+    """The most recently captured execution plan, if any."""
+
+    @property
+    def total_elapsed_time(self) -> float:
+        return self.elapsed_times.total
+
+    @property
+    def mean_row_count(self) -> float:
+        return self.row_count / self.elapsed_times.count if self.elapsed_times.count else 0.0
@@ -5,6 +5,7 @@ from typing import Any
 from .compiled_query import CompiledQuery
 from .icompileable_query_part_builder import ICompileableQueryPartBuilder
 from .iquery_part_builder import IQueryPartBuilder
+from .returning_builder import ReturningBuilder
 
 class OnConflictUpdateBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
     def __init__(self, parent_builder: IQueryPartBuilder) -> None:
@@ -30,6 +31,9 @@ class OnConflictUpdateBuilder(ICompileableQueryPartBuilder[CompiledQuery]):
             self.__fields[f[0]] = (f[1], False)
         return self
 
+    def returning(self) -> ReturningBuilder:
+        return ReturningBuilder(self)
+
     def compile(self) -> CompiledQuery:
         return CompiledQuery(*self.build())
 
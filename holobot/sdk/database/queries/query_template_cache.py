@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from holobot.sdk.exceptions import ArgumentError
+from .compiled_query import CompiledQuery
+from .icompileable_query_part_builder import ICompileableQueryPartBuilder
+
+class QueryTemplateCache:
+    """A bounded cache of the SQL text of query shapes.
+
+    A query shape is identified by a key chosen by the caller, which must
+    capture everything that affects the SQL text, such as the table,
+    the columns and the order of the arguments, but not the argument values.
+    Notice that a None value in a filter changes the SQL text ("IS NULL"),
+    therefore such filters must be reflected by the key, too.
+    On a hit, the query is compiled without running the builders.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    @property
+    def count(self) -> int:
+        return len(self.__templates)
+
+    @property
+    def hit_count(self) -> int:
+        return self.__hit_count
+
+    @property
+    def miss_count(self) -> int:
+        return self.__miss_count
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        if max_size < 1:
+            raise ArgumentError("max_size", "Value must be positive.")
+
+        self.__max_size = max_size
+        self.__templates = OrderedDict[Hashable, str]()
+        self.__hit_count = 0
+        self.__miss_count = 0
+
+    def compile(
+        self,
+        key: Hashable,
+        arguments: tuple[Any, ...],
+        builder_factory: Callable[[], ICompileableQueryPartBuilder[CompiledQuery]]
+    ) -> CompiledQuery:
+        """Compiles a query using the cached SQL text of its shape, if available.
+
+        :param key: The key identifying the shape of the query.
+        :type key: Hashable
+        :param arguments: The arguments of the query, in the order the builders would emit them.
+        :type arguments: tuple[Any, ...]
+        :param builder_factory: A callback that creates the query builder on a miss.
+        :type builder_factory: Callable[[], ICompileableQueryPartBuilder[CompiledQuery]]
+        :return: The compiled query.
+        :rtype: CompiledQuery
+        """
+
+        if (query := self.__templates.get(key)) is not None:
+            self.__templates.move_to_end(key)
+            self.__hit_count += 1
+            return CompiledQuery(query, arguments)
+
+        self.__miss_count += 1
+        query, built_arguments = builder_factory().build()
+        # A mismatch means the key doesn't describe the shape correctly,
+        # in which case it's safer to always use the builders.
+        if built_arguments == arguments:
+            self.__templates[key] = query
+            if len(self.__templates) > self.__max_size:
+                self.__templates.popitem(last=False)
+
+        return CompiledQuery(query, built_arguments)
+
+    def clear(self) -> None:
+        self.__templates.clear()
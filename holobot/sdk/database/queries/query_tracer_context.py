@@ -0,0 +1,54 @@
+import time
+from typing import Any, ClassVar
+
+import asyncpg
+
+from holobot.sdk.ioc.decorators import injectable
+from .iquery_tracer import IQueryTracer
+
+@injectable(None)
+class QueryTracerContext:
+    """
+    Keeps a reference to the `IQueryTracer` provided to an instance of this class.
+    Compiled queries are created by the query builders without dependency injection,
+    therefore they report their executions through this context instead.
+
+    NOTE: This works because IQueryTracer is not a scoped service.
+    """
+
+    # Dependency injection will initialize this.
+    query_tracer: ClassVar[IQueryTracer | None] = None
+
+    def __init__(
+        self,
+        query_tracer: IQueryTracer
+    ) -> None:
+        QueryTracerContext.query_tracer = query_tracer
+
+async def trace_query(
+    connection: asyncpg.Connection,
+    query: str,
+    arguments: tuple[Any, ...],
+    row_count: int,
+    started_at: float
+) -> None:
+    """Records an execution of a query with the current query tracer, if any.
+
+    :param connection: The connection the query has been executed on.
+    :type connection: asyncpg.Connection
+    :param query: The SQL text of the query.
+    :type query: str
+    :param arguments: The arguments the query has been executed with.
+    :type arguments: tuple[Any, ...]
+    :param row_count: The number of rows returned or affected by the query.
+    :type row_count: int
+    :param started_at: The value of `time.perf_counter()` when the execution started.
+    :type started_at: float
+    """
+
+    if not (query_tracer := QueryTracerContext.query_tracer):
+        return
+
+    elapsed_time = (time.perf_counter() - started_at) * 1000
+    if query_tracer.record(query, len(arguments), row_count, elapsed_time):
+        await query_tracer.capture_query_plan(connection, query, arguments)
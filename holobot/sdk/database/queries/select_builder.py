@@ -3,12 +3,13 @@ from __future__ import annotations
 from typing import Any
 
 from .compiled_query import CompiledQuery
-from .enums import Order
+from .enums import Order, SeekDirection
 from .exists_builder import ExistsBuilder
 from .function_builder import FunctionBuilder
 from .icompileable_query_part_builder import ICompileableQueryPartBuilder
 from .isupports_pagination import ISupportsPagination
 from .join_builder import JOIN_TYPE, JoinBuilder
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .paginate_builder import PaginateBuilder
 from .where_builder import WhereBuilder
 
@@ -83,6 +84,15 @@ class SelectBuilder(ICompileableQueryPartBuilder[CompiledQuery], ISupportsPagina
     ) -> PaginateBuilder:
         return PaginateBuilder(self, ordering_columns, page_index, page_size)
 
+    def paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginateBuilder:
+        return KeysetPaginateBuilder(self, ordering_columns, page_size, cursor, direction)
+
     def compile(self) -> CompiledQuery:
         return CompiledQuery(*self.build())
 
@@ -6,11 +6,12 @@ from .constraints import (
     ColumnConstraintBuilder, ColumnInConstraintBuilder, EmptyConstraintBuilder, IConstraintBuilder,
     LogicalConstraintBuilder
 )
-from .enums import Connector, Equality, Order
+from .enums import Connector, Equality, Order, SeekDirection
 from .exists_builder import ExistsBuilder
 from .iquery_part_builder import IQueryPartBuilder
 from .isupports_pagination import ISupportsPagination
 from .iwhere_builder import IWhereBuilder
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .limit_builder import LimitBuilder
 from .order_by_builder import OrderByBuilder
 from .paginate_builder import PaginateBuilder
@@ -89,6 +90,15 @@ class WhereBuilder(IWhereBuilder, ISupportsPagination):
     ) -> PaginateBuilder:
         return PaginateBuilder(self, ordering_columns, page_index, page_size)
 
+    def paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginateBuilder:
+        return KeysetPaginateBuilder(self, ordering_columns, page_size, cursor, direction)
+
     def compile(self) -> CompiledQuery:
         return CompiledQuery(*self.build())
 
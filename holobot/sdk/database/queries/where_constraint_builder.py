@@ -4,11 +4,12 @@ from typing import Any
 
 from .compiled_query import CompiledQuery
 from .constraints import ColumnConstraintBuilder, IConstraintBuilder, LogicalConstraintBuilder
-from .enums import Connector, Equality, Order
+from .enums import Connector, Equality, Order, SeekDirection
 from .exists_builder import ExistsBuilder
 from .icompileable_query_part_builder import ICompileableQueryPartBuilder
 from .isupports_exists import ISupportsExists
 from .isupports_pagination import ISupportsPagination
+from .keyset_paginate_builder import KeysetPaginateBuilder
 from .limit_builder import LimitBuilder
 from .order_by_builder import OrderByBuilder
 from .paginate_builder import PaginateBuilder
@@ -67,6 +68,15 @@ class WhereConstraintBuilder(
     ) -> PaginateBuilder:
         return PaginateBuilder(self, ordering_columns, page_index, page_size)
 
+    def paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: tuple[Any, ...] | None = None,
+        direction: SeekDirection = SeekDirection.FORWARD
+    ) -> KeysetPaginateBuilder:
+        return KeysetPaginateBuilder(self, ordering_columns, page_size, cursor, direction)
+
     def compile(self) -> CompiledQuery:
         return CompiledQuery(*self.build())
 
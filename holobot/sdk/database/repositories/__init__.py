@@ -1,3 +1,4 @@
+from .entity_snapshot import EntitySnapshot
 from .ientity_cache import IEntityCache
 from .irepository import IRepository
 from .manually_generated_key import manually_generated_key
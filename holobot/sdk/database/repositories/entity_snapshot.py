@@ -0,0 +1,98 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Generic, TypeVar
+
+from holobot.sdk.database.entities import AggregateRoot
+from holobot.sdk.utils import utcnow
+
+TIdentifier = TypeVar("TIdentifier", int, str)
+TModel = TypeVar("TModel", bound=AggregateRoot)
+
+class EntitySnapshot(Generic[TIdentifier, TModel]):
+    """An in-process snapshot of all entities of a specific type.
+
+    The entities are loaded at once upon first access and are served from
+    memory afterwards, until the snapshot expires or is invalidated.
+    """
+
+    @property
+    def is_loaded(self) -> bool:
+        """Determines whether the snapshot holds a non-expired copy of the entities.
+
+        :return: True, if the snapshot is loaded and hasn't expired.
+        :rtype: bool
+        """
+
+        return not self.__is_expired()
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[Iterable[TModel]]],
+        time_to_live: timedelta
+    ) -> None:
+        super().__init__()
+        self.__loader = loader
+        self.__time_to_live = time_to_live
+        self.__entities: dict[TIdentifier, TModel] = {}
+        self.__expires_at: datetime | None = None
+        self.__generation = 0
+        self.__lock = asyncio.Lock()
+
+    async def get(self, identifier: TIdentifier) -> TModel | None:
+        """Gets the entity with the specified identifier.
+
+        :param identifier: The identifier of the entity.
+        :type identifier: TIdentifier
+        :return: If exists, the matching entity; otherwise, None.
+        :rtype: TModel | None
+        """
+
+        if self.__is_expired():
+            await self.__load()
+
+        return self.__entities.get(identifier)
+
+    async def get_all(self) -> tuple[TModel, ...]:
+        """Gets all entities of the snapshot.
+
+        :return: A sequence of entities.
+        :rtype: tuple[TModel, ...]
+        """
+
+        if self.__is_expired():
+            await self.__load()
+
+        return tuple(self.__entities.values())
+
+    def invalidate(self) -> None:
+        """Invalidates the snapshot, causing the entities to be reloaded upon next access."""
+
+        self.__generation += 1
+        self.__expires_at = None
+
+    async def refresh(self) -> None:
+        """Reloads the entities immediately."""
+
+        self.invalidate()
+        await self.__load()
+
+    def __is_expired(self) -> bool:
+        return self.__expires_at is None or utcnow() >= self.__expires_at
+
+    async def __load(self) -> None:
+        async with self.__lock:
+            # Another caller may have loaded the entities while waiting for the lock.
+            if not self.__is_expired():
+                return
+
+            generation = self.__generation
+            entities = {
+                entity.identifier: entity
+                for entity in await self.__loader()
+            }
+
+            self.__entities = entities
+            # An invalidation during the load means the loaded entities may be stale already.
+            if generation == self.__generation:
+                self.__expires_at = utcnow() + self.__time_to_live
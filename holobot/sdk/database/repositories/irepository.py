@@ -1,4 +1,4 @@
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Sequence
 from typing import Protocol, TypeVar
 
 from holobot.sdk.database.entities import Identifier
@@ -17,6 +17,30 @@ class IRepository(Protocol[TIdentifier, TModel]):
         """
         ...
 
+    def add_many(self, models: Sequence[TModel]) -> Awaitable[tuple[TIdentifier, ...]]:
+        """Adds multiple new entities to the repository in as few round-trips as possible.
+
+        The identifiers are assigned to the models, too.
+
+        :param models: The models to be added.
+        :type models: Sequence[TModel]
+        :return: The identifiers assigned to the entities, in the order of the models.
+        :rtype: Awaitable[tuple[TIdentifier, ...]]
+        """
+        ...
+
+    def upsert_many(self, models: Sequence[TModel]) -> Awaitable[tuple[TIdentifier, ...]]:
+        """Adds multiple entities to the repository or updates them, if they already exist.
+
+        Entities are matched by their identifiers, which must be unique among the models.
+
+        :param models: The models to be added or updated.
+        :type models: Sequence[TModel]
+        :return: The identifiers of the entities, in the order of the models.
+        :rtype: Awaitable[tuple[TIdentifier, ...]]
+        """
+        ...
+
     def get(self, identifier: TIdentifier) -> Awaitable[TModel | None]:
         """Gets an entity from the repository.
 
@@ -1,6 +1,6 @@
 import typing
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Sequence
+from collections.abc import Awaitable, Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
@@ -8,20 +8,24 @@ from typing import Any, Callable, Generic, TypeVar, cast
 
 import asyncpg
 
+from holobot.sdk.caching import BatchLoader
 from holobot.sdk.database.entities import AggregateRoot, Identifier, PrimaryKey, Record
+from holobot.sdk.database.enums import CountMode
 from holobot.sdk.database.exceptions import DatabaseError
 from holobot.sdk.database.idatabase_manager import IDatabaseManager
 from holobot.sdk.database.isession import ISession
 from holobot.sdk.database.iunit_of_work_provider import IUnitOfWorkProvider
 from holobot.sdk.database.queries import (
     CompiledQuery, ICompileableQueryPartBuilder, ISupportsExists, ISupportsPagination, Query,
-    WhereBuilder, WhereConstraintBuilder
+    QueryTemplateCache, ReturningBuilder, WhereBuilder, WhereConstraintBuilder
 )
-from holobot.sdk.database.queries.enums import Equality, Order
+from holobot.sdk.database.queries.enums import Equality, Order, SeekDirection
 from holobot.sdk.database.statuses import CommandComplete
 from holobot.sdk.database.statuses.command_tags import DeleteCommandTag, UpdateCommandTag
-from holobot.sdk.queries import PaginationResult
-from holobot.sdk.threading.utils import COMPLETED_TASK
+from holobot.sdk.queries import (
+    KeysetPaginationResult, PaginationResult, decode_cursor, encode_cursor
+)
+from holobot.sdk.threading.utils import COMPLETED_TASK, as_task
 from holobot.sdk.utils import set_time_zone
 from holobot.sdk.utils.dataclass_utils import (
     ObjectTypeDescriptor, ParameterInfo, TypeDescriptor, get_parameter_infos
@@ -32,6 +36,8 @@ from .irepository import IRepository
 TIdentifier = TypeVar("TIdentifier", bound=int | str | Identifier)
 TRecord = TypeVar("TRecord", bound=Record)
 TModel = TypeVar("TModel", bound=AggregateRoot)
+TKey = TypeVar("TKey")
+TValue = TypeVar("TValue")
 
 @dataclass(kw_only=True, frozen=True)
 class PrimaryKeyTypeDescriptor(TypeDescriptor):
@@ -45,6 +51,9 @@ _CUSTOM_RESOLVERS: dict[type, Callable[[type], TypeDescriptor]] = {
     PrimaryKey: __resolve_primary_key_type_descriptor
 }
 
+# The maximum number of bind parameters in a single PostgreSQL statement.
+_MAX_PARAMETER_COUNT = 32767
+
 class _UnitOfWorkSession(ISession):
     def __init__(self, connection: asyncpg.Connection) -> None:
         super().__init__()
@@ -159,6 +168,18 @@ class RepositoryBase(
             for name, parameter_info in self.__columns.items()
             if isinstance(parameter_info.object_type, PrimaryKeyTypeDescriptor)
         }
+        # Rows are mapped by converters specialized per column, so that no reflection is needed per row.
+        self.__column_mappers = tuple(
+            (name, RepositoryBase.__create_column_mapper(parameter_info))
+            for name, parameter_info in self.__columns.items()
+        )
+        self.__id_column_mappers = tuple(
+            (name, mapper)
+            for name, mapper in self.__column_mappers
+            if name in self.__id_columns
+        )
+        # The SQL of the fixed-shape queries (get by ID, update, etc.) is built only once.
+        self.__query_cache = QueryTemplateCache()
 
     async def add(self, model: TModel) -> TIdentifier:
         record = self._map_model_to_record(model)
@@ -184,41 +205,50 @@ class RepositoryBase(
 
             return identifier
 
+    def add_many(self, models: Sequence[TModel]) -> Awaitable[tuple[TIdentifier, ...]]:
+        return self.__insert_many(models, False)
+
+    def upsert_many(self, models: Sequence[TModel]) -> Awaitable[tuple[TIdentifier, ...]]:
+        return self.__insert_many(models, True)
+
     async def get(self, identifier: TIdentifier) -> TModel | None:
         if existing_model := await self.__try_get_model(identifier):
             return existing_model
 
         async with (session := await self._get_session()):
-            builder = (Query
-                .select()
-                .columns(*self.column_names)
-                .from_table(self.table_name, None, self.schema_name)
-                .where()
-            )
-            result = await (self
-                ._add_id_filter(builder, identifier)
-                .compile()
-                .fetchrow(session.connection)
-            )
+            result = await self.__query_cache.compile(
+                "get",
+                self.__get_id_arguments(identifier),
+                lambda: self._add_id_filter(
+                    Query
+                        .select()
+                        .columns(*self.column_names)
+                        .from_table(self.table_name, None, self.schema_name)
+                        .where(),
+                    identifier
+                )
+            ).fetchrow(session.connection)
+            if result is None:
+                return None
 
-            return (
-                self._map_record_to_model(self._map_query_result_to_record(result))
-                if result is not None else None
-            )
+            model = self._map_record_to_model(self._map_query_result_to_record(result))
+            await self.__try_set_model(model)
+
+            return model
 
     async def get_all(self) -> tuple[TModel, ...]:
         async with (session := await self._get_session()):
-            query = (Query
-                .select()
-                .columns(*self.column_names)
-                .from_table(self.table_name, None, self.schema_name)
-            )
-            results = await query.compile().fetch(session.connection)
-
-            models = tuple(
-                self._map_record_to_model(self._map_query_result_to_record(result))
-                for result in results
-            )
+            results = await self.__query_cache.compile(
+                "get_all",
+                (),
+                lambda: (Query
+                    .select()
+                    .columns(*self.column_names)
+                    .from_table(self.table_name, None, self.schema_name)
+                )
+            ).fetch(session.connection)
+
+            models = self._map_query_results_to_models(results)
 
             for model in models:
                 await self.__try_set_model(model)
@@ -227,13 +257,15 @@ class RepositoryBase(
 
     async def count(self) -> int | None:
         async with (session := await self._get_session()):
-            result = await (Query
-                .select()
-                .column("COUNT(*)")
-                .from_table(self.table_name, None, self.schema_name)
-                .compile()
-                .fetchval(session.connection)
-            )
+            result = await self.__query_cache.compile(
+                "count",
+                (),
+                lambda: (Query
+                    .select()
+                    .column("COUNT(*)")
+                    .from_table(self.table_name, None, self.schema_name)
+                )
+            ).fetchval(session.connection)
 
             return result
 
@@ -241,17 +273,18 @@ class RepositoryBase(
         record = self._map_model_to_record(model)
         fields = self._get_fields(record, False)
         async with (session := await self._get_session()):
-            builder = (Query
-                .update()
-                .table(self.table_name, self.schema_name)
-                .fields(*fields)
-                .where()
-            )
-            result = await (self
-                ._add_id_filter(builder, model.identifier)
-                .compile()
-                .execute(session.connection)
-            )
+            result = await self.__query_cache.compile(
+                ("update", *(name for name, _ in fields)),
+                (*(value for _, value in fields), *self.__get_id_arguments(model.identifier)),
+                lambda: self._add_id_filter(
+                    Query
+                        .update()
+                        .table(self.table_name, self.schema_name)
+                        .fields(*fields)
+                        .where(),
+                    model.identifier
+                )
+            ).execute(session.connection)
             if not isinstance(result, CommandComplete):
                 raise DatabaseError("Failed to update an existing record.")
 
@@ -261,12 +294,14 @@ class RepositoryBase(
 
     async def delete(self, identifier: TIdentifier) -> int:
         async with (session := await self._get_session()):
-            builder = Query.delete().from_table(self.table_name, self.schema_name).where()
-            result = await (self
-                ._add_id_filter(builder, identifier)
-                .compile()
-                .execute(session.connection)
-            )
+            result = await self.__query_cache.compile(
+                "delete",
+                self.__get_id_arguments(identifier),
+                lambda: self._add_id_filter(
+                    Query.delete().from_table(self.table_name, self.schema_name).where(),
+                    identifier
+                )
+            ).execute(session.connection)
             if not isinstance(result, CommandComplete):
                 raise DatabaseError("Failed to delete a record.")
 
@@ -338,10 +373,7 @@ class RepositoryBase(
             )
             results = await query.compile().fetch(session.connection)
 
-            models = tuple(
-                self._map_record_to_model(self._map_query_result_to_record(result))
-                for result in results
-            )
+            models = self._map_query_results_to_models(results)
 
             for model in models:
                 await self.__try_set_model(model)
@@ -411,10 +443,7 @@ class RepositoryBase(
                 .from_function(function_name, arguments)
             )
             results = await query.compile().fetch(session.connection)
-            models = tuple(
-                self._map_record_to_model(self._map_query_result_to_record(result))
-                for result in results
-            )
+            models = self._map_query_results_to_models(results)
 
             for model in models:
                 await self.__try_set_model(model)
@@ -518,11 +547,113 @@ class RepositoryBase(
                 result.page_index,
                 result.page_size,
                 result.total_count,
-                [
-                    self._map_record_to_model(self._map_query_result_to_record(record))
-                    for record in result.records
-                ]
+                list(self._map_query_results_to_models(result.records))
+            )
+
+    async def _paginate_keyset(
+        self,
+        ordering_columns: tuple[tuple[str, Order], ...],
+        page_size: int,
+        cursor: str | None,
+        direction: SeekDirection,
+        filter_builder: Callable[[WhereBuilder], ISupportsPagination] | None,
+        count_mode: CountMode = CountMode.NONE,
+        total_count: int | None = None
+    ) -> KeysetPaginationResult[TModel]:
+        """Gets a sequence of models matching the specified filter in a paging manner,
+        seeking to the page by the values of the ordering columns.
+
+        The identifier columns are appended to the ordering columns as necessary
+        so that the ordering is unique. The ordering columns mustn't be nullable.
+
+        :param ordering_columns: The columns used for ordering the intermediary results.
+        :type ordering_columns: tuple[tuple[str, Order], ...]
+        :param page_size: The size of the pages.
+        :type page_size: int
+        :param cursor: The cursor of a previous result to seek from. If None or invalid, the first page is returned.
+        :type cursor: str | None
+        :param direction: The direction to seek in from the cursor.
+        :type direction: SeekDirection
+        :param filter_builder: A callback that attaches the filter to the query.
+        :type filter_builder: Callable[[WhereBuilder], ISupportsPagination] | None
+        :param count_mode: Determines how the items are counted, if total_count isn't specified, defaults to CountMode.NONE
+        :type count_mode: CountMode, optional
+        :param total_count: A total count known from a previous result, to be returned as is, defaults to None
+        :type total_count: int | None, optional
+        :return: A pagination result containing the matching models.
+        :rtype: KeysetPaginationResult[TModel]
+        """
+
+        ordering_columns = (
+            *ordering_columns,
+            *(
+                (column_name, Order.ASCENDING)
+                for column_name in self.__id_columns.keys()
+                if all(column[0] != column_name for column in ordering_columns)
+            )
+        )
+        if (cursor_values := decode_cursor(cursor)) is not None and len(cursor_values) != len(ordering_columns):
+            cursor_values = None
+
+        async with (session := await self._get_session()):
+            query = Query.select().columns(*self.column_names).from_table(self.table_name, None, self.schema_name)
+            if filter_builder is not None:
+                query = filter_builder(query.where())
+
+            result = await (query
+                .paginate_keyset(
+                    ordering_columns,
+                    page_size,
+                    cursor_values,
+                    direction if cursor_values is not None else SeekDirection.FORWARD
+                )
+                .compile()
+                .fetch(session.connection)
+            )
+            if total_count is None and count_mode != CountMode.NONE:
+                total_count = await self._count_for_pagination(session.connection, count_mode, filter_builder)
+
+            return KeysetPaginationResult[TModel](
+                result.page_size,
+                list(self._map_query_results_to_models(result.records)),
+                encode_cursor(result.first_key) if result.has_previous_page and result.first_key else None,
+                encode_cursor(result.last_key) if result.has_next_page and result.last_key else None,
+                total_count
+            )
+
+    async def _count_for_pagination(
+        self,
+        connection: asyncpg.Connection,
+        count_mode: CountMode,
+        filter_builder: Callable[[WhereBuilder], ISupportsPagination] | None = None
+    ) -> int:
+        """Counts the entities for a pagination result.
+
+        :param connection: The connection to use.
+        :type connection: asyncpg.Connection
+        :param count_mode: Determines how the entities are counted.
+        :type count_mode: CountMode
+        :param filter_builder: A callback that attaches the filter to the query, defaults to None
+        :type filter_builder: Callable[[WhereBuilder], ISupportsPagination] | None, optional
+        :return: The number of entities.
+        :rtype: int
+        """
+
+        if count_mode == CountMode.ESTIMATED:
+            estimate = await connection.fetchval(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass($1)",
+                f"{self.schema_name}.{self.table_name}"
             )
+            # A negative value means that the table hasn't been analyzed yet.
+            if estimate is not None and estimate >= 0:
+                return estimate
+
+        query = Query.select().column("COUNT(*)").from_table(self.table_name, None, self.schema_name)
+        if filter_builder is None:
+            return await query.compile().fetchval(connection) or 0
+
+        count_query = cast(ICompileableQueryPartBuilder[CompiledQuery], filter_builder(query.where()))
+        return await count_query.compile().fetchval(connection) or 0
 
     def _add_id_filter(self, where_builder: WhereBuilder, identifier: TIdentifier) -> WhereConstraintBuilder:
         """Adds the identifier filter to the query builder.
@@ -556,6 +687,56 @@ class RepositoryBase(
         # TODO Make this dynamic instead of the magical _ID_FIELD_NAME.
         return where_builder.field(RepositoryBase._ID_FIELD_NAME, Equality.EQUAL, identifier)
 
+    async def _load_batched(
+        self,
+        loader: BatchLoader[TKey, TValue],
+        value_type: type[TValue],
+        key: TKey
+    ) -> TValue | None:
+        """Loads a value using the specified batch loader.
+
+        The loaded values are remembered by the identity map of the current scope,
+        if any, so that each value is loaded only once per scope. Within a unit
+        of work, the value is loaded on its own, using the unit of work.
+
+        :param loader: The batch loader to be used.
+        :type loader: BatchLoader[TKey, TValue]
+        :param value_type: The type of the value, used for telling values apart in the identity map.
+        :type value_type: type[TValue]
+        :param key: The key of the value.
+        :type key: TKey
+        :return: If exists, the value; otherwise, None.
+        :rtype: TValue | None
+        """
+
+        if self.__unit_of_work_provider.current:
+            return await loader.load_immediately(key)
+
+        if not (identity_map := self.__unit_of_work_provider.identity_map):
+            return await loader.load(key)
+
+        if (value := identity_map.get(value_type, key)) is not None:
+            return value
+
+        if (value := await loader.load(key)) is not None:
+            identity_map.set(value_type, key, value)
+
+        return value
+
+    def _invalidate_model(self, identifier: TIdentifier) -> Awaitable[None]:
+        """Forgets the tracked model with the specified identifier, if any.
+
+        This must be used when an entity is modified by a custom statement,
+        so that subsequent reads don't return a stale model.
+
+        :param identifier: The identifier of the model.
+        :type identifier: TIdentifier
+        :return: None.
+        :rtype: Awaitable[None]
+        """
+
+        return self.__try_remove_model(identifier)
+
     def _map_query_result_to_record(self, columns: dict[str, Any]) -> TRecord:
         """Maps the specified result of a query to a record.
 
@@ -566,17 +747,37 @@ class RepositoryBase(
         :rtype: TRecord
         """
 
-        arguments = {
-            column.name: self._map_query_result_column(column.name, columns, self.__columns)
-            for column in self.__columns.values()
-        }
+        return self.record_type(**{
+            name: mapper(columns.get(name))
+            for name, mapper in self.__column_mappers
+        })
+
+    def _map_query_results_to_models(self, results: Iterable[dict[str, Any]]) -> tuple[TModel, ...]:
+        """Maps the specified results of a query to models.
+
+        :param results: The results of the query.
+        :type results: Iterable[dict[str, Any]]
+        :raises TypeError: Raised when the type of one of the values is incorrect.
+        :return: The new instances of the models, in the order of the results.
+        :rtype: tuple[TModel, ...]
+        """
 
-        return self.record_type(**arguments)
+        record_type = self.record_type
+        column_mappers = self.__column_mappers
+        map_record_to_model = self._map_record_to_model
+
+        return tuple(
+            map_record_to_model(record_type(**{
+                name: mapper(result.get(name))
+                for name, mapper in column_mappers
+            }))
+            for result in results
+        )
 
     def _map_query_result_to_identifier(self, columns: dict[str, Any]) -> TIdentifier:
         arguments = {
-            column_name: self._map_query_result_column(column_name, columns, self.__id_columns).value
-            for column_name in self.__id_columns.keys()
+            name: mapper(columns.get(name)).value
+            for name, mapper in self.__id_column_mappers
         }
 
         return (
@@ -585,44 +786,6 @@ class RepositoryBase(
             else self.identifier_type(**arguments)
         )
 
-    def _map_query_result_column(
-        self,
-        column_name: str,
-        record_columns: dict[str, Any],
-        model_columns: dict[str, ParameterInfo]
-    ) -> Any:
-        if not (column := model_columns.get(column_name, None)):
-            raise TypeError(f"Cannot find the type descriptor of column '{column_name}'.")
-
-        if isinstance(column.object_type, ObjectTypeDescriptor):
-            object_type = column.object_type.value
-        elif isinstance(column.object_type, PrimaryKeyTypeDescriptor):
-            object_type = PrimaryKey
-        else:
-            raise TypeError(
-                f"Expected the type descriptor of column {column.name} to be an"
-                f" ObjectTypeDescriptor, but got {type(column.object_type).__name__}."
-            )
-
-        value = record_columns.get(column_name)
-        record_value = RepositoryBase.__convert_field_to_model(value, object_type)
-        if record_value is None and not column.allows_none:
-            if column.default_value:
-                record_value = column.default_value
-            elif column.default_factory:
-                record_value = column.default_factory()
-
-        if (
-            record_value is None and not column.allows_none
-            or record_value is not None and not isinstance(record_value, object_type)
-        ):
-            raise TypeError((
-                f"Expected '{object_type.__name__}',"
-                f" but got '{type(record_value).__name__}'."
-            ))
-
-        return record_value
-
     def _get_fields(
         self,
         record: TRecord,
@@ -654,19 +817,59 @@ class RepositoryBase(
         return await self._database_manager.acquire_connection()
 
     @staticmethod
-    def __convert_field_to_model(
-        value: Any,
-        expected_type: type
-    ) -> Any:
-        if issubclass(expected_type, Enum):
-            return expected_type(value)
-        if isinstance(value, datetime):
-            datetime_value = cast(datetime, value)
-            if not datetime_value.tzinfo:
-                return set_time_zone(value, timezone.utc)
-        if expected_type is PrimaryKey:
-            return PrimaryKey(value)
-        return value
+    def __create_column_mapper(column: ParameterInfo) -> Callable[[Any], Any]:
+        if isinstance(column.object_type, PrimaryKeyTypeDescriptor):
+            return PrimaryKey
+
+        if not isinstance(column.object_type, ObjectTypeDescriptor):
+            def raise_unsupported_type(value: Any) -> Any:
+                raise TypeError(
+                    f"Expected the type descriptor of column {column.name} to be an"
+                    f" ObjectTypeDescriptor, but got {type(column.object_type).__name__}."
+                )
+
+            return raise_unsupported_type
+
+        object_type = column.object_type.value
+        converter: Callable[[Any], Any] | None = None
+        if isinstance(object_type, type) and issubclass(object_type, Enum):
+            converter = object_type
+        elif object_type is datetime:
+            converter = RepositoryBase.__convert_datetime_to_model
+
+        allows_none = column.allows_none
+        default_value = column.default_value
+        default_factory = column.default_factory
+
+        def map_column(value: Any) -> Any:
+            if value is None:
+                if allows_none:
+                    return None
+                if default_value:
+                    value = default_value
+                elif default_factory:
+                    value = default_factory()
+                else:
+                    raise TypeError(f"Expected '{object_type.__name__}', but got 'NoneType'.")
+            elif converter is not None:
+                value = converter(value)
+            elif value.__class__ is object_type:
+                # Most values already have the exact type expected.
+                return value
+
+            if not isinstance(value, object_type):
+                raise TypeError((
+                    f"Expected '{object_type.__name__}',"
+                    f" but got '{type(value).__name__}'."
+                ))
+
+            return value
+
+        return map_column
+
+    @staticmethod
+    def __convert_datetime_to_model(value: datetime) -> datetime:
+        return set_time_zone(value, timezone.utc) if not value.tzinfo else value
 
     @staticmethod
     def __convert_field_to_record(value: Any) -> Any:
@@ -680,19 +883,141 @@ class RepositoryBase(
             return value.value
         return value
 
+    async def __insert_many(
+        self,
+        models: Sequence[TModel],
+        is_upsert: bool
+    ) -> tuple[TIdentifier, ...]:
+        if not models:
+            return ()
+
+        ignore_identifier = not is_upsert and not getattr(self.record_type, MANUALLY_GENERATED_KEY_NAME, False)
+        records = [self._map_model_to_record(model) for model in models]
+        async with (session := await self._get_session()):
+            # Batches must succeed or fail together, even outside of a unit of work.
+            async with session.connection.transaction():
+                # PostgreSQL doesn't guarantee the order of the rows returned by a multi-row
+                # INSERT, hence generated identifiers are allocated upfront and every row
+                # is inserted with its identifier known in advance.
+                generated_identifiers = (
+                    await self.__allocate_identifiers(session.connection, len(records))
+                    if ignore_identifier
+                    else ()
+                )
+                rows = list[tuple[Any, ...]]()
+                identifiers = list[TIdentifier]()
+                column_names: tuple[str, ...] = ()
+                for index, record in enumerate(records):
+                    fields = self._get_fields(record, ignore_identifier)
+                    if ignore_identifier:
+                        fields = [*generated_identifiers[index].items(), *fields]
+                    column_names = tuple(name for name, _ in fields)
+                    rows.append(tuple(value for _, value in fields))
+                    identifiers.append(self._map_query_result_to_identifier({
+                        name: value
+                        for name, value in fields
+                        if name in self.__id_columns
+                    }))
+
+                batch_size = max(1, _MAX_PARAMETER_COUNT // len(column_names))
+                for batch_start in range(0, len(rows), batch_size):
+                    batch = rows[batch_start:batch_start + batch_size]
+                    inserted_rows = await (self
+                        .__create_insert_many_query(column_names, batch, is_upsert)
+                        .columns(*self.__id_columns.keys())
+                        .compile()
+                        .fetch(session.connection)
+                    )
+                    if len(inserted_rows) != len(batch):
+                        raise DatabaseError("Failed to insert new records.")
+
+        for model, identifier in zip(models, identifiers):
+            model.identifier = identifier
+            await self.__try_set_model(model)
+
+        return tuple(identifiers)
+
+    async def __allocate_identifiers(
+        self,
+        connection: asyncpg.Connection,
+        count: int
+    ) -> tuple[dict[str, Any], ...]:
+        if len(self.__id_columns) != 1:
+            raise DatabaseError("Only single-column identifiers can be generated for multiple records.")
+
+        id_column_name = next(iter(self.__id_columns.keys()))
+        result = await CompiledQuery(
+            (
+                f"SELECT nextval(pg_get_serial_sequence($1, $2)) AS {id_column_name}"
+                " FROM generate_series(1, $3)"
+            ),
+            (f"{self.schema_name}.{self.table_name}", id_column_name, count)
+        ).fetch(connection)
+        if any(row[id_column_name] is None for row in result):
+            raise DatabaseError(f"Cannot find the sequence of the identifiers of table '{self.table_name}'.")
+
+        return tuple(dict(row) for row in result)
+
+    def __create_insert_many_query(
+        self,
+        column_names: tuple[str, ...],
+        rows: list[tuple[Any, ...]],
+        is_upsert: bool
+    ) -> ReturningBuilder:
+        query = Query.insert().in_table(self.table_name, self.schema_name).rows(column_names, rows)
+        if not is_upsert:
+            return query.returning()
+
+        # Updating the identifier columns makes sure that the rows are returned
+        # even if there is nothing else to update.
+        update_columns = (
+            tuple(name for name in column_names if name not in self.__id_columns)
+            or tuple(self.__id_columns.keys())
+        )
+        update_query = query.on_conflict(*self.__id_columns.keys()).update()
+        for column_name in update_columns:
+            update_query = update_query.field(column_name, f"EXCLUDED.{column_name}", True)
+
+        return update_query.returning()
+
+    def __get_id_arguments(self, identifier: TIdentifier) -> tuple[Any, ...]:
+        # The same order as the one of the arguments emitted by _add_id_filter().
+        if isinstance(identifier, Identifier):
+            return tuple(getattr(identifier, column_name) for column_name in self.__id_columns.keys())
+
+        return (identifier,)
+
+    def __get_identity_key(self, identifier: TIdentifier) -> Any:
+        # Composite identifiers are mutable dataclasses, hence they aren't hashable.
+        return self.__get_id_arguments(identifier) if isinstance(identifier, Identifier) else identifier
+
     def __try_get_model(self, identifier: TIdentifier) -> Awaitable[TModel | None]:
-        if not (unit_of_work := self.__unit_of_work_provider.current):
-            return COMPLETED_TASK
+        if unit_of_work := self.__unit_of_work_provider.current:
+            return unit_of_work.get(self.model_type, identifier)
 
-        return unit_of_work.get(self.model_type, identifier)
+        if identity_map := self.__unit_of_work_provider.identity_map:
+            return as_task(identity_map.get(self.model_type, self.__get_identity_key(identifier)))
+
+        return COMPLETED_TASK
 
     def __try_set_model(self, model: TModel) -> Awaitable[None]:
-        if not (unit_of_work := self.__unit_of_work_provider.current):
-            return COMPLETED_TASK
+        if not (identity_map := self.__unit_of_work_provider.identity_map):
+            unit_of_work = self.__unit_of_work_provider.current
+            return unit_of_work.set(model) if unit_of_work else COMPLETED_TASK
 
-        return unit_of_work.set(model)
+        key = self.__get_identity_key(model.identifier)
+        if unit_of_work := self.__unit_of_work_provider.current:
+            # The scope would outlive the transaction, which may be rolled back.
+            identity_map.remove(self.model_type, key)
+            return unit_of_work.set(model)
+
+        identity_map.set(self.model_type, key, model)
+        return COMPLETED_TASK
 
     def __try_remove_model(self, identifier: TIdentifier) -> Awaitable[None]:
+        if identity_map := self.__unit_of_work_provider.identity_map:
+            identity_map.remove(self.model_type, self.__get_identity_key(identifier))
+
         if unit_of_work := self.__unit_of_work_provider.current:
             return unit_of_work.remove(self.model_type, identifier)
 
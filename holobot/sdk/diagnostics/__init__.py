@@ -1,5 +1,6 @@
 from .execution_context import ExecutionContext
 from .execution_context_data import ExecutionContextData
+from .histogram import Histogram
 from .idebugger import IDebugger
 from .iexecution_context import IExecutionContext
 from .iexecution_context_factory import IExecutionContextFactory
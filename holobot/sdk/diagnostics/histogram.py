@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from holobot.sdk.exceptions import ArgumentError
+
+class Histogram:
+    """A histogram of measurements, such as durations in milliseconds, with fixed buckets.
+
+    Each bucket counts the measurements that are greater than the upper bound
+    of the previous bucket and less than or equal to its own upper bound.
+    Measurements beyond the last upper bound are counted by an overflow bucket.
+    """
+
+    DEFAULT_BUCKET_UPPER_BOUNDS: tuple[float, ...] = (
+        1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+    )
+
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    @property
+    def total(self) -> float:
+        return self.__total
+
+    @property
+    def maximum(self) -> float:
+        return self.__maximum
+
+    @property
+    def mean(self) -> float:
+        return self.__total / self.__count if self.__count else 0.0
+
+    def __init__(
+        self,
+        bucket_upper_bounds: Sequence[float] = DEFAULT_BUCKET_UPPER_BOUNDS
+    ) -> None:
+        if not bucket_upper_bounds:
+            raise ArgumentError("bucket_upper_bounds", "At least one bucket must be specified.")
+        if any(bucket_upper_bounds[i] >= bucket_upper_bounds[i + 1] for i in range(len(bucket_upper_bounds) - 1)):
+            raise ArgumentError("bucket_upper_bounds", "The upper bounds must be strictly increasing.")
+
+        self.__upper_bounds = tuple(bucket_upper_bounds)
+        self.__bucket_counts = [0] * (len(self.__upper_bounds) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__maximum = 0.0
+
+    def record(self, value: float) -> None:
+        """Records a new measurement.
+
+        :param value: The measured value.
+        :type value: float
+        """
+
+        self.__bucket_counts[bisect_left(self.__upper_bounds, value)] += 1
+        self.__count += 1
+        self.__total += value
+        if value > self.__maximum:
+            self.__maximum = value
+
+    def get_buckets(self) -> tuple[tuple[float, int], ...]:
+        """Gets the upper bounds of the buckets with their counts.
+
+        The upper bound of the overflow bucket is infinity.
+
+        :return: The pairs of the upper bounds and counts.
+        :rtype: tuple[tuple[float, int], ...]
+        """
+
+        return tuple(zip((*self.__upper_bounds, float("inf")), self.__bucket_counts))
+
+    def get_percentile(self, percentile: float) -> float:
+        """Gets an estimate of the specified percentile.
+
+        The estimate is the upper bound of the bucket the percentile falls into,
+        or the largest measurement, if it falls into the overflow bucket.
+
+        :param percentile: The percentile, between 0 and 100.
+        :type percentile: float
+        :return: The estimated value, or zero if there are no measurements.
+        :rtype: float
+        """
+
+        if not 0 <= percentile <= 100:
+            raise ArgumentError("percentile", "The percentile must be between 0 and 100.")
+
+        if not self.__count:
+            return 0.0
+
+        threshold = self.__count * percentile / 100
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(self.__upper_bounds, self.__bucket_counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= threshold:
+                return min(upper_bound, self.__maximum)
+
+        return self.__maximum
+
+    def copy(self) -> Histogram:
+        """Creates an independent copy of the histogram.
+
+        :return: The copy of the histogram.
+        :rtype: Histogram
+        """
+
+        histogram = Histogram(self.__upper_bounds)
+        histogram.__bucket_counts = list(self.__bucket_counts)
+        histogram.__count = self.__count
+        histogram.__total = self.__total
+        histogram.__maximum = self.__maximum
+        return histogram
+
+    def reset(self) -> None:
+        """Removes all measurements."""
+
+        self.__bucket_counts = [0] * (len(self.__upper_bounds) + 1)
+        self.__count = 0
+        self.__total = 0.0
+        self.__maximum = 0.0
@@ -1 +1,3 @@
+from .ijob import IJob
+from .ijob_scheduler import IJobScheduler
 from .istartable import IStartable
@@ -0,0 +1,26 @@
+from collections.abc import Awaitable
+from typing import Protocol
+
+from holobot.sdk.threading import CancellationToken
+from .models import JobSchedule
+
+class IJob(Protocol):
+    """Interface for a background job run periodically by the job scheduler."""
+
+    @property
+    def name(self) -> str:
+        """Gets the unique name of the job, used for triggering it manually."""
+        ...
+
+    @property
+    def schedule(self) -> JobSchedule:
+        """Gets the schedule of the job. It's read once, when the scheduler starts."""
+        ...
+
+    def run(self, token: CancellationToken) -> Awaitable[None]:
+        """Runs the job once.
+
+        :param token: The token signaling that the application is shutting down.
+        :type token: CancellationToken
+        """
+        ...
@@ -0,0 +1,25 @@
+from typing import Protocol
+
+from .models import JobStatistics
+
+class IJobScheduler(Protocol):
+    """Interface for the service running the registered jobs in the background."""
+
+    def get_statistics(self) -> tuple[JobStatistics, ...]:
+        """Gets a snapshot of the state of every registered job.
+
+        :return: The statistics of the jobs, in the order of their names.
+        :rtype: tuple[JobStatistics, ...]
+        """
+        ...
+
+    def trigger(self, job_name: str) -> bool:
+        """Runs a job immediately, independently of its schedule.
+
+        :param job_name: The name of the job.
+        :type job_name: str
+        :raises ArgumentError: Raised when there is no job with the specified name.
+        :return: True, if the job has been triggered; False, if it's disabled or still running.
+        :rtype: bool
+        """
+        ...
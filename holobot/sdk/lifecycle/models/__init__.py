@@ -0,0 +1,2 @@
+from .job_schedule import JobSchedule
+from .job_statistics import JobStatistics
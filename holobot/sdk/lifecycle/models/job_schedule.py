@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from holobot.sdk.chrono import CronExpression
+from holobot.sdk.exceptions import ArgumentError
+
+@dataclass(kw_only=True, frozen=True)
+class JobSchedule:
+    """Describes when a job is run.
+
+    Exactly one of the interval and the cron expression must be specified.
+    """
+
+    interval: timedelta | None = None
+    """The time between the scheduled starts of consecutive runs."""
+
+    cron_expression: CronExpression | None = None
+    """The cron-like expression matching the scheduled starts of the runs, in UTC."""
+
+    initial_delay: timedelta = timedelta()
+    """The time to wait after start-up before the first run is scheduled."""
+
+    jitter: timedelta = timedelta()
+    """The maximum random delay added to each scheduled start."""
+
+    max_runtime: timedelta | None = None
+    """The time after which a run is cancelled, if any."""
+
+    is_enabled: bool = True
+    """Determines whether the job is scheduled at all."""
+
+    def __post_init__(self) -> None:
+        if (self.interval is None) == (self.cron_expression is None):
+            raise ArgumentError("interval", "Either an interval or a cron expression must be specified.")
+        if self.interval is not None and self.interval <= timedelta():
+            raise ArgumentError("interval", "Value must be positive.")
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from holobot.sdk.diagnostics import Histogram
+
+@dataclass(kw_only=True, frozen=True)
+class JobStatistics:
+    """A snapshot of the state of a scheduled job."""
+
+    name: str
+    """The name of the job."""
+
+    is_enabled: bool
+    """Whether the job is scheduled."""
+
+    is_running: bool
+    """Whether the job is currently running."""
+
+    run_count: int
+    """The number of runs since the start."""
+
+    failure_count: int
+    """The number of runs that raised an error."""
+
+    timeout_count: int
+    """The number of runs cancelled for exceeding the maximum runtime."""
+
+    skipped_count: int
+    """The number of runs skipped because the previous one was still running."""
+
+    durations: Histogram
+    """The durations of the runs, in milliseconds."""
+
+    last_started_at: datetime | None
+    """The time the last run started at, if any."""
+
+    next_run_at: datetime | None
+    """The time the next run is scheduled at, if any."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import asyncio
+from collections import deque
 from collections.abc import Awaitable, Callable
 from time import time
 from typing import Generic, TypeVar
@@ -14,6 +14,9 @@ TResult = TypeVar("TResult")
 
 DEFAULT_FAILURE_THRESHOLD: int = 5
 DEFAULT_RECOVERY_TIMEOUT: int = 30
+DEFAULT_HALF_OPEN_PROBE_COUNT: int = 1
+DEFAULT_SAMPLING_WINDOW: int = 60
+DEFAULT_MINIMUM_THROUGHPUT: int = 10
 
 async def constant_break(
     circuit_breaker: AsyncCircuitBreakerPolicy,
@@ -38,7 +41,10 @@ class AsyncCircuitBreakerPolicy(Generic[TState, TResult], IResiliencePolicy[TSta
 
     @property
     def failure_threshold(self) -> int:
-        """The number of consecutive failures after which the circuit breaks."""
+        """The number of consecutive failures after which the circuit breaks.
+
+        Ignored if a failure rate threshold is configured.
+        """
 
         return self.__failure_threshold
 
@@ -76,6 +82,39 @@ class AsyncCircuitBreakerPolicy(Generic[TState, TResult], IResiliencePolicy[TSta
     ) -> None:
         self.__error_evaluator = value
 
+    @property
+    def half_open_probe_count(self) -> int:
+        """The number of calls allowed concurrently while the circuit is half-open."""
+
+        return self.__half_open_probe_count
+
+    @half_open_probe_count.setter
+    def half_open_probe_count(self, value: int):
+        if value <= 0:
+            raise ValueError("The half-open probe count must be greater than zero.")
+        self.__half_open_probe_count = value
+
+    @property
+    def failure_rate_threshold(self) -> float | None:
+        """The ratio of failures in the sampling window at which the circuit breaks.
+
+        If None, the circuit breaks after the configured number of consecutive failures.
+        """
+
+        return self.__failure_rate_threshold
+
+    @property
+    def sampling_window(self) -> int:
+        """The length, in seconds, of the rolling window the failure rate is calculated over."""
+
+        return self.__sampling_window
+
+    @property
+    def minimum_throughput(self) -> int:
+        """The number of calls required in the sampling window before the failure rate is considered."""
+
+        return self.__minimum_throughput
+
     @property
     def state(self) -> CircuitState:
         """The current state of the circuit."""
@@ -98,15 +137,36 @@ class AsyncCircuitBreakerPolicy(Generic[TState, TResult], IResiliencePolicy[TSta
         self,
         failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
         recovery_timeout: int = DEFAULT_RECOVERY_TIMEOUT,
-        error_evaluator: Callable[[AsyncCircuitBreakerPolicy, Exception], Awaitable[int]] = constant_break
+        error_evaluator: Callable[[AsyncCircuitBreakerPolicy, Exception], Awaitable[int]] = constant_break,
+        half_open_probe_count: int = DEFAULT_HALF_OPEN_PROBE_COUNT,
+        failure_rate_threshold: float | None = None,
+        sampling_window: int = DEFAULT_SAMPLING_WINDOW,
+        minimum_throughput: int = DEFAULT_MINIMUM_THROUGHPUT
     ):
+        if failure_rate_threshold is not None and not 0 < failure_rate_threshold <= 1:
+            raise ValueError("The failure rate threshold must be greater than zero and at most one.")
+        if sampling_window <= 0:
+            raise ValueError("The sampling window must be greater than zero.")
+        if minimum_throughput <= 0:
+            raise ValueError("The minimum throughput must be greater than zero.")
+
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.error_evaluator = error_evaluator
+        self.half_open_probe_count = half_open_probe_count
+        self.__failure_rate_threshold = failure_rate_threshold
+        self.__sampling_window = sampling_window
+        self.__minimum_throughput = minimum_throughput
         self.__state: CircuitState = CircuitState.CLOSED
         self.__failure_count: int = 0
         self.__close_time: int = 0
-        self.__lock = asyncio.Lock()
+        self.__probe_count: int = 0
+        # Incremented on each state transition, so that the outcome of
+        # a call started in a previous state doesn't affect the current one.
+        self.__generation: int = 0
+        # The timestamps and outcomes (True, if failed) of the calls in the sampling window.
+        self.__outcomes = deque[tuple[float, bool]]()
+        self.__outcome_failure_count: int = 0
 
     async def __call__(
         self,
@@ -120,31 +180,81 @@ class AsyncCircuitBreakerPolicy(Generic[TState, TResult], IResiliencePolicy[TSta
         callback: Callable[[TState], Awaitable[TResult]],
         state: TState
     ) -> TResult:
-        # Double checking outside the lock as a fast fail optimization.
-        if self.state is CircuitState.OPEN:
+        # There is no locking here, because everything up to awaiting
+        # the callback and the state transitions are executed synchronously.
+        circuit_state = self.state
+        if circuit_state is CircuitState.OPEN:
             raise CircuitBrokenError("The circuit is broken.")
 
-        async with self.__lock:
-            if self.state is CircuitState.OPEN:
+        is_probe = circuit_state is CircuitState.HALF_OPEN
+        if is_probe:
+            if self.__probe_count >= self.__half_open_probe_count:
                 raise CircuitBrokenError("The circuit is broken.")
+            self.__probe_count += 1
 
-            try:
-                result = await callback(state)
-            except Exception as error:
-                await self.__on_failure(error)
-                raise
-
-            self.__on_success()
-            return result
-
-    async def __on_failure(self, error: Exception):
-        self.__failure_count += 1
-        if self.__failure_count >= self.__failure_threshold:
-            # TODO Support datetime and int as well (from the Retry-After HTTP header).
-            recovery_timeout = await self.error_evaluator(self, error)
-            self.__state = CircuitState.OPEN
+        generation = self.__generation
+        try:
+            result = await callback(state)
+        except Exception as error:
+            if generation == self.__generation:
+                await self.__on_failure(error, is_probe)
+            raise
+        finally:
+            if is_probe and generation == self.__generation:
+                self.__probe_count -= 1
+
+        if generation == self.__generation:
+            self.__on_success(is_probe)
+        return result
+
+    async def __on_failure(self, error: Exception, is_probe: bool) -> None:
+        if not is_probe and not self.__should_break():
+            return
+
+        # The circuit is broken immediately so that no other calls are let through
+        # while the error evaluator is awaited, then the recovery time is adjusted.
+        self.__transition(CircuitState.OPEN)
+        self.__close_time = int(time() + self.__recovery_timeout)
+        generation = self.__generation
+        # TODO Support datetime and int as well (from the Retry-After HTTP header).
+        recovery_timeout = await self.error_evaluator(self, error)
+        if generation == self.__generation:
             self.__close_time = int(time() + recovery_timeout)
 
-    def __on_success(self):
+    def __on_success(self, is_probe: bool) -> None:
+        if is_probe:
+            self.__transition(CircuitState.CLOSED)
+            return
+
+        self.__failure_count = 0
+        if self.__failure_rate_threshold is not None:
+            self.__record_outcome(False)
+
+    def __should_break(self) -> bool:
+        if self.__failure_rate_threshold is None:
+            self.__failure_count += 1
+            return self.__failure_count >= self.__failure_threshold
+
+        self.__record_outcome(True)
+        call_count = len(self.__outcomes)
+        return (
+            call_count >= self.__minimum_throughput
+            and self.__outcome_failure_count / call_count >= self.__failure_rate_threshold
+        )
+
+    def __record_outcome(self, is_failure: bool) -> None:
+        now = time()
+        self.__outcomes.append((now, is_failure))
+        self.__outcome_failure_count += is_failure
+        erase_before = now - self.__sampling_window
+        while self.__outcomes and self.__outcomes[0][0] < erase_before:
+            _, was_failure = self.__outcomes.popleft()
+            self.__outcome_failure_count -= was_failure
+
+    def __transition(self, state: CircuitState) -> None:
+        self.__state = state
+        self.__generation += 1
         self.__failure_count = 0
-        self.__state = CircuitState.CLOSED
+        self.__probe_count = 0
+        self.__outcomes.clear()
+        self.__outcome_failure_count = 0
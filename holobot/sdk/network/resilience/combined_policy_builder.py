@@ -6,7 +6,10 @@ from typing import Generic, TypeVar
 
 from .async_circuit_breaker_policy import (
     DEFAULT_FAILURE_THRESHOLD as DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
-    DEFAULT_RECOVERY_TIMEOUT as DEFAULT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT, AsyncCircuitBreakerPolicy,
+    DEFAULT_HALF_OPEN_PROBE_COUNT as DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_PROBE_COUNT,
+    DEFAULT_MINIMUM_THROUGHPUT as DEFAULT_CIRCUIT_BREAKER_MINIMUM_THROUGHPUT,
+    DEFAULT_RECOVERY_TIMEOUT as DEFAULT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    DEFAULT_SAMPLING_WINDOW as DEFAULT_CIRCUIT_BREAKER_SAMPLING_WINDOW, AsyncCircuitBreakerPolicy,
     constant_break
 )
 from .async_rate_limit_policy import AsyncRateLimitPolicy
@@ -31,7 +34,11 @@ class CombinedPolicyBuilder(Generic[TState, TResult]):
         self,
         failure_threshold: int = DEFAULT_CIRCUIT_BREAKER_FAILURE_THRESHOLD,
         recovery_timeout: int = DEFAULT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
-        error_evaluator: Callable[[AsyncCircuitBreakerPolicy[TState, TResult], Exception], Awaitable[int]] = constant_break
+        error_evaluator: Callable[[AsyncCircuitBreakerPolicy[TState, TResult], Exception], Awaitable[int]] = constant_break,
+        half_open_probe_count: int = DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_PROBE_COUNT,
+        failure_rate_threshold: float | None = None,
+        sampling_window: int = DEFAULT_CIRCUIT_BREAKER_SAMPLING_WINDOW,
+        minimum_throughput: int = DEFAULT_CIRCUIT_BREAKER_MINIMUM_THROUGHPUT
     ) -> CombinedPolicyBuilder[TState, TResult]:
         """Configures a circuit breaker policy.
 
@@ -41,6 +48,14 @@ class CombinedPolicyBuilder(Generic[TState, TResult]):
         :type recovery_timeout: int, optional
         :param error_evaluator: A function invoked when the circuit breaks, defaults to constant_break
         :type error_evaluator: Callable[[AsyncCircuitBreakerPolicy[TState, TResult], Exception], Awaitable[int]], optional
+        :param half_open_probe_count: The number of calls allowed concurrently while the circuit is half-open, defaults to DEFAULT_CIRCUIT_BREAKER_HALF_OPEN_PROBE_COUNT
+        :type half_open_probe_count: int, optional
+        :param failure_rate_threshold: The ratio of failures in the sampling window at which the circuit breaks. If not specified, consecutive failures are counted instead, defaults to None
+        :type failure_rate_threshold: float | None, optional
+        :param sampling_window: The length, in seconds, of the rolling window the failure rate is calculated over, defaults to DEFAULT_CIRCUIT_BREAKER_SAMPLING_WINDOW
+        :type sampling_window: int, optional
+        :param minimum_throughput: The number of calls required in the sampling window before the failure rate is considered, defaults to DEFAULT_CIRCUIT_BREAKER_MINIMUM_THROUGHPUT
+        :type minimum_throughput: int, optional
         :return: The same instance of policy builder.
         :rtype: CombinedPolicyBuilder[TState, TResult]
         """
@@ -48,7 +63,11 @@ class CombinedPolicyBuilder(Generic[TState, TResult]):
         self.__policies.append(AsyncCircuitBreakerPolicy[TState, TResult](
             failure_threshold,
             recovery_timeout,
-            error_evaluator
+            error_evaluator,
+            half_open_probe_count,
+            failure_rate_threshold,
+            sampling_window,
+            minimum_throughput
         ))
         return self
 
@@ -1 +1,3 @@
+from .cursor_utils import decode_cursor, encode_cursor
+from .keyset_pagination_result import KeysetPaginationResult
 from .pagination_result import PaginationResult
@@ -0,0 +1,70 @@
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+_SEPARATOR = ","
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+def encode_cursor(values: tuple[Any, ...]) -> str:
+    """Encodes the values of the ordering columns as a compact, URL and custom ID safe token.
+
+    Supported value types are bool, int, str, datetime and None.
+
+    :param values: The values to encode.
+    :type values: tuple[Any, ...]
+    :raises TypeError: Raised when a value of an unsupported type is specified.
+    :return: The encoded token.
+    :rtype: str
+    """
+
+    return _SEPARATOR.join(map(_encode_value, values))
+
+def decode_cursor(token: str | None) -> tuple[Any, ...] | None:
+    """Decodes the values of the ordering columns from a token.
+
+    :param token: The token created by encode_cursor().
+    :type token: str | None
+    :return: If the token is valid, the decoded values; otherwise, None.
+    :rtype: tuple[Any, ...] | None
+    """
+
+    if not token:
+        return None
+
+    try:
+        return tuple(map(_decode_value, token.split(_SEPARATOR)))
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
+
+def _encode_value(value: Any) -> str:
+    # NOTE: bool must precede int, because it's a subclass of it.
+    if value is None:
+        return "n"
+    if isinstance(value, bool):
+        return "b1" if value else "b0"
+    if isinstance(value, int):
+        return f"i{value}"
+    if isinstance(value, datetime):
+        timestamp = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        return f"d{(timestamp - _EPOCH) // _MICROSECOND}"
+    if isinstance(value, str):
+        return "s" + base64.urlsafe_b64encode(value.encode()).decode().rstrip("=")
+
+    raise TypeError(f"Values of type '{type(value).__name__}' cannot be used in a cursor.")
+
+def _decode_value(part: str) -> Any:
+    kind, value = part[:1], part[1:]
+    if kind == "n" and not value:
+        return None
+    if kind == "b" and value in ("0", "1"):
+        return value == "1"
+    if kind == "i":
+        return int(value)
+    if kind == "d":
+        return _EPOCH + int(value) * _MICROSECOND
+    if kind == "s":
+        return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4)).decode()
+
+    raise ValueError(f"Unknown cursor value '{part}'.")
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+TItem = TypeVar("TItem")
+
+@dataclass(frozen=True)
+class KeysetPaginationResult(Generic[TItem]):
+    """Represents the results of a keyset pagination query."""
+
+    page_size: int
+    """The maximum number of items on a single page."""
+
+    items: list[TItem] = field(default_factory=list)
+    """The items of the current page."""
+
+    previous_cursor: str | None = None
+    """If there is a previous page, the cursor for seeking backward from the current page."""
+
+    next_cursor: str | None = None
+    """If there is a next page, the cursor for seeking forward from the current page."""
+
+    total_count: int | None = None
+    """If requested, the total number of items matching the query. It may be an estimate."""
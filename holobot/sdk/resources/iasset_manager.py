@@ -9,3 +9,6 @@ class IAssetManager(Protocol):
 
     def get_font(self, asset_id: str, size: int) -> Awaitable[ImageFont.FreeTypeFont]:
         ...
+
+    def get_asset_path(self, asset_id: str) -> str:
+        ...
@@ -0,0 +1,134 @@
+"""Compares the cold and the warm paths of resolving the effective permissions of a member.
+
+Run it from the project root directory using
+``python -m tests.benchmarks.member_permissions_benchmark``.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Any, cast
+
+import hikari
+
+from holobot.discord import DiscordOptions
+from holobot.discord.bot import bot_accessor
+from holobot.discord.sdk.enums import Permission
+from holobot.discord.servers import MemberDataProvider, PermissionCache
+from holobot.discord.utils.permission_utils import PERMISSION_TO_MODELS, map_permissions_to_model
+from tests.machinery.fakes import FakeOptionsProvider
+
+_ITERATIONS = 20_000
+_SERVER_ID = hikari.Snowflake(1)
+_CHANNEL_ID = hikari.Snowflake(2)
+_USER_ID = hikari.Snowflake(3)
+_ROLE_COUNT = 25
+
+class _FakeBot:
+    def __init__(self) -> None:
+        self.guild = cast(Any, type("Guild", (), { "id": _SERVER_ID, "owner_id": hikari.Snowflake(4) })())
+        self.roles = {
+            hikari.Snowflake(role_id): cast(Any, type("Role", (), {
+                "id": hikari.Snowflake(role_id),
+                "permissions": hikari.Permissions.VIEW_CHANNEL | hikari.Permissions.SEND_MESSAGES
+                               if role_id == _SERVER_ID else hikari.Permissions(1 << (role_id % 40))
+            })())
+            for role_id in range(1, _ROLE_COUNT + 1)
+        }
+        self.member = cast(Any, type("Member", (), {
+            "id": _USER_ID,
+            "guild_id": _SERVER_ID,
+            "role_ids": list(self.roles.keys())[1:],
+            "user": type("User", (), { "id": _USER_ID })()
+        })())
+        self.channel = hikari.GuildTextChannel(
+            app=cast(Any, None),
+            id=_CHANNEL_ID,
+            name="general",
+            type=hikari.ChannelType.GUILD_TEXT,
+            guild_id=_SERVER_ID,
+            parent_id=None,
+            position=0,
+            is_nsfw=False,
+            permission_overwrites={
+                role_id: hikari.PermissionOverwrite(
+                    id=role_id,
+                    type=hikari.PermissionOverwriteType.ROLE,
+                    allow=hikari.Permissions.EMBED_LINKS,
+                    deny=hikari.Permissions.MENTION_ROLES
+                )
+                for role_id in self.roles.keys()
+            },
+            topic=None,
+            last_message_id=None,
+            rate_limit_per_user=timedelta(),
+            last_pin_timestamp=None,
+            default_auto_archive_duration=timedelta(days=1)
+        )
+
+    async def get_guild_by_id(self, guild_id: int) -> Any:
+        return self.guild
+
+    async def get_guild_member(self, guild: Any, user_id: int) -> Any:
+        return self.member
+
+    async def get_guild_roles(self, guild: Any) -> Any:
+        return self.roles
+
+    async def get_guild_channel(self, guild: Any, channel_id: int) -> Any:
+        return self.channel
+
+def _transform_permissions_by_bits(dto: hikari.Permissions) -> Permission:
+    # The bit loop that map_permissions_to_model() replaced.
+    permissions = Permission.NONE
+    flags = dto.value
+    current_flag = 1
+    while flags > 0:
+        if (flags & current_flag) != current_flag:
+            current_flag <<= 1
+            continue
+
+        flags ^= current_flag
+        if (current_permission := PERMISSION_TO_MODELS.get(hikari.Permissions(current_flag))) is not None:
+            permissions |= int(current_permission)
+        current_flag <<= 1
+
+    return permissions
+
+def _report(name: str, elapsed: float) -> None:
+    print(f"{name:<32}{elapsed / _ITERATIONS * 1_000_000:>10.2f} us/op")
+
+def _benchmark_conversion() -> None:
+    dto = hikari.Permissions(0)
+    for current_dto in PERMISSION_TO_MODELS.keys():
+        dto |= current_dto
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        _transform_permissions_by_bits(dto)
+    _report("Conversion (bit loop)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        map_permissions_to_model(dto)
+    _report("Conversion (table lookup)", time.perf_counter() - start)
+
+async def _benchmark_member_permissions() -> None:
+    bot_accessor._bot = cast(Any, _FakeBot())
+    cache = PermissionCache(FakeOptionsProvider(DiscordOptions()))
+    provider = MemberDataProvider(cache)
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        cache.invalidate_server(_SERVER_ID)
+        await provider.get_member_permissions(_SERVER_ID, _CHANNEL_ID, _USER_ID)
+    _report("get_member_permissions (cold)", time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        await provider.get_member_permissions(_SERVER_ID, _CHANNEL_ID, _USER_ID)
+    _report("get_member_permissions (warm)", time.perf_counter() - start)
+
+if __name__ == "__main__":
+    _benchmark_conversion()
+    asyncio.run(_benchmark_member_permissions())
@@ -0,0 +1,128 @@
+"""Compares drawing user profiles layer by layer to drawing them from precomposited templates.
+
+Run it from the project root directory using
+``python -m tests.benchmarks.user_profile_compositing_benchmark``.
+"""
+
+import io
+import os
+import time
+from collections.abc import Callable
+from typing import Any
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+from holobot.extensions.general.models.user_profiles import (
+    UserProfileAssetPaths, UserProfileRenderRequest
+)
+from holobot.extensions.general.rendering import user_profile_drawing
+from .user_profile_rendering_benchmark import _create_request
+
+_ITERATIONS = 100
+_RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+
+def _get_path(asset_id: str) -> str:
+    return os.path.join(_RESOURCES_PATH, asset_id)
+
+def _draw_layer_by_layer(request: UserProfileRenderRequest, assets: dict[str, Any]) -> Image.Image:
+    # The pipeline the precomposited templates replaced, with the assets already loaded.
+    avatar = Image.open(io.BytesIO(request.avatar)).resize((128, 128), Image.Resampling.LANCZOS)
+    avatar_cropped = Image.new("RGBA", avatar.size, (255, 255, 255, 0))
+    avatar_cropped.paste(avatar, mask=assets["avatar_mask"])
+    background_image = assets["background"]
+
+    profile_image = Image.new("RGBA", (548, 174), None)
+    profile_image.paste(assets["card_background"])
+    profile_image.paste(background_image, background_image)
+    profile_image.paste(avatar_cropped, (23, 23), avatar_cropped)
+    profile_image.paste(assets["avatar_border"], (22, 22), assets["avatar_border"])
+    profile_image.paste(assets["text_background"], mask=assets["text_background"])
+    profile_image.paste(assets["reputation_icon"], (192, 81), assets["reputation_icon"])
+    profile_image.paste(assets["badges_background"], mask=assets["badges_background"])
+    for badge_index, badge_id in enumerate(request.badge_ids):
+        if badge_id is None:
+            continue
+
+        badge_x = (badge_id % 25) * 40
+        badge_y = (badge_id // 25) * 40
+        badge_icon = assets["badges"].crop((badge_x, badge_y, badge_x + 40, badge_y + 40))
+        profile_image.paste(badge_icon, (badge_index * 44 + 183, 120), badge_icon)
+    profile_image.paste(assets["card_border"], mask=assets["card_border"])
+
+    drawing_context = ImageDraw.Draw(profile_image)
+    drawing_context.text(xy=(195, 20), text=request.user_name[:20], font=assets["font_large"], fill=(102, 102, 102), stroke_width=1, stroke_fill="black")
+    drawing_context.text(xy=(194, 56), text=request.title, font=assets["font_medium"], fill="black")
+    drawing_context.text(xy=(193, 55), text=request.title, font=assets["font_medium"], fill=request.rank_color)
+    reputation_bar_scale = min(1, (request.reputation_points - request.last_required_reputation) / (request.next_required_reputation - request.last_required_reputation))
+    reputation_bar_width = int(307 * reputation_bar_scale)
+    profile_image.paste(assets["progress_bar_background"], (220, 85))
+    if reputation_bar_width > 0:
+        drawing_context.rectangle(((220, 85), (220 + reputation_bar_width, 99)), fill=request.rank_color)
+    drawing_context.text(xy=(366, 92), text=f"{request.reputation_points}/{request.next_required_reputation}", anchor="mm", align="center", font=assets["font_small"], fill="white", stroke_width=1, stroke_fill="black")
+
+    return profile_image
+
+def _load_legacy_assets(paths: UserProfileAssetPaths, background_path: str) -> dict[str, Any]:
+    avatar_mask = Image.new("L", (128, 128), 0)
+    ImageDraw.Draw(avatar_mask).ellipse((0, 0, 128, 128), fill=255)
+    assets = {
+        name: Image.open(getattr(paths, name))
+        for name in (
+            "card_background", "text_background", "badges_background", "progress_bar_background",
+            "avatar_border", "card_border", "reputation_icon", "badges"
+        )
+    }
+    assets.update(
+        avatar_mask=avatar_mask,
+        background=Image.open(background_path),
+        font_small=ImageFont.truetype(paths.font, size=15),
+        font_medium=ImageFont.truetype(paths.font, size=20),
+        font_large=ImageFont.truetype(paths.font, size=30)
+    )
+    for asset in assets.values():
+        if isinstance(asset, Image.Image):
+            asset.load()
+
+    return assets
+
+def _measure(name: str, draw: Callable[[], Image.Image]) -> Image.Image:
+    image = draw()
+    start = time.perf_counter()
+    for _ in range(_ITERATIONS):
+        draw()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20}{elapsed / _ITERATIONS * 1000:>10.2f} ms/render (without PNG encoding)")
+    return image
+
+if __name__ == "__main__":
+    asset_paths = UserProfileAssetPaths(
+        card_background=_get_path("images/user_profiles/card_background.png"),
+        text_background=_get_path("images/user_profiles/text_background.png"),
+        badges_background=_get_path("images/user_profiles/badges.png"),
+        progress_bar_background=_get_path("images/user_profiles/progress_bar_background.png"),
+        default_background=_get_path("images/user_profiles/default_background.png"),
+        avatar_border=_get_path("images/user_profiles/avatar_border_default.png"),
+        card_border=_get_path("images/user_profiles/card_border.png"),
+        reputation_icon=_get_path("images/user_profiles/reputation_icon.png"),
+        default_avatar=_get_path("images/user_profiles/default_avatar.png"),
+        font=_get_path("fonts/AGPmod.ttf"),
+        badges=_get_path("images/user_profiles/badge_icons.png")
+    )
+    render_request = _create_request()
+    legacy_assets = _load_legacy_assets(asset_paths, render_request.background_path)
+    user_profile_drawing.initialize(asset_paths)
+
+    legacy_image = _measure("Layer by layer", lambda: _draw_layer_by_layer(render_request, legacy_assets))
+    template_image = _measure("Precomposited", lambda: user_profile_drawing._draw_user_profile_image(
+        render_request,
+        user_profile_drawing._assets,
+        Image.open(io.BytesIO(render_request.avatar)),
+        user_profile_drawing._get_template(
+            user_profile_drawing._assets,
+            render_request.background_path,
+            render_request.show_badges
+        )
+    ))
+
+    difference = ImageChops.difference(legacy_image, template_image).getbbox()
+    print("The images are identical." if difference is None else f"The images differ in {difference}.")
@@ -0,0 +1,88 @@
+"""Measures the throughput of user profile rendering and the event loop stalls it causes.
+
+Run it from the project root directory using
+``python -m tests.benchmarks.user_profile_rendering_benchmark``.
+"""
+
+import asyncio
+import io
+import os
+import time
+from typing import cast
+
+from PIL import Image
+
+from holobot.extensions.general.models.user_profiles import UserProfileRenderRequest
+from holobot.extensions.general.options import UserProfileOptions
+from holobot.extensions.general.rendering import UserProfileRenderer
+from holobot.sdk.resources import IAssetManager
+from tests.machinery.fakes import FakeLoggerFactory, FakeOptionsProvider
+
+_RENDER_COUNT = 200
+_TICK_INTERVAL = 0.001
+_RESOURCES_PATH = os.path.join(os.path.dirname(__file__), "..", "..", "resources")
+
+class _FakeAssetManager:
+    def get_asset_path(self, asset_id: str) -> str:
+        return os.path.join(_RESOURCES_PATH, asset_id)
+
+def _create_request() -> UserProfileRenderRequest:
+    avatar = io.BytesIO()
+    Image.new("RGBA", (256, 256), (200, 100, 50, 255)).save(avatar, format="PNG")
+    return UserProfileRenderRequest(
+        user_name="Benchmark",
+        title="Regular",
+        rank_color=(157, 157, 157, 255),
+        reputation_points=150,
+        last_required_reputation=100,
+        next_required_reputation=500,
+        show_badges=True,
+        badge_ids=(1, 2, None, 4, 5, None, 7, 8),
+        avatar=avatar.getvalue(),
+        background_path=os.path.join(_RESOURCES_PATH, "images/user_profiles/custom_backgrounds/1.png")
+    )
+
+async def _measure_stalls(stop_event: asyncio.Event, stalls: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop_event.is_set():
+        scheduled_at = loop.time()
+        await asyncio.sleep(_TICK_INTERVAL)
+        stalls.append(loop.time() - scheduled_at - _TICK_INTERVAL)
+
+async def _benchmark(worker_count: int) -> None:
+    renderer = UserProfileRenderer(
+        cast(IAssetManager, _FakeAssetManager()),
+        FakeLoggerFactory(),
+        FakeOptionsProvider(UserProfileOptions(
+            RendererWorkerCount=worker_count,
+            RendererMaxPendingCount=_RENDER_COUNT
+        ))
+    )
+    await renderer.start()
+    request = _create_request()
+    # Warm up the processes so that their start-up isn't measured.
+    await asyncio.gather(*(renderer.render(request) for _ in range(max(worker_count, 1) * 2)))
+
+    stalls = list[float]()
+    stop_event = asyncio.Event()
+    stall_task = asyncio.create_task(_measure_stalls(stop_event, stalls))
+    await asyncio.sleep(_TICK_INTERVAL)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(renderer.render(request) for _ in range(_RENDER_COUNT)))
+    elapsed = time.perf_counter() - start
+
+    stop_event.set()
+    await stall_task
+    await renderer.stop()
+
+    mode = f"{worker_count} workers" if worker_count else "event loop"
+    print(
+        f"{mode:<12}{_RENDER_COUNT / elapsed:>10.1f} renders/s"
+        f"{max(stalls) * 1000:>10.2f} ms max stall"
+        f"{sum(stalls) * 1000:>12.2f} ms total stall"
+    )
+
+if __name__ == "__main__":
+    for worker_count in (0, 1, 2, 4):
+        asyncio.run(_benchmark(worker_count))
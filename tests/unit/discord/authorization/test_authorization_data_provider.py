@@ -0,0 +1,93 @@
+import asyncio
+import unittest
+from typing import Any
+
+from holobot.discord import DiscordOptions
+from holobot.discord.authorization import AuthorizationDataProvider
+from holobot.discord.authorization.models import (
+    InteractableAuthorization, InteractableAuthorizationId
+)
+from holobot.discord.sdk.workflows.interactables import Interactable
+from holobot.discord.sdk.workflows.interactables.restrictions import FeatureRestriction
+from tests.machinery.fakes import FakeLoggerFactory, FakeOptionsProvider
+
+async def _callback(*args: Any) -> Any:
+    raise NotImplementedError
+
+def _get_key(identifier: InteractableAuthorizationId) -> tuple[str, int]:
+    return (identifier.interactable_id, identifier.server_id)
+
+class _FakeUnitOfWork:
+    async def __aenter__(self) -> "_FakeUnitOfWork":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def complete(self) -> None:
+        pass
+
+class _FakeUnitOfWorkProvider:
+    async def create_new(self) -> _FakeUnitOfWork:
+        return _FakeUnitOfWork()
+
+class _FakeAuthorizationRepository:
+    def __init__(self) -> None:
+        self.authorizations = dict[tuple[str, int], InteractableAuthorization]()
+        self.load_started = asyncio.Event()
+        self.load_released = asyncio.Event()
+        self.load_released.set()
+
+    async def add(self, model: InteractableAuthorization) -> None:
+        self.authorizations[_get_key(model.identifier)] = model
+
+    async def update(self, model: InteractableAuthorization) -> bool:
+        if _get_key(model.identifier) not in self.authorizations:
+            return False
+
+        self.authorizations[_get_key(model.identifier)] = model
+        return True
+
+    async def delete(self, identifier: InteractableAuthorizationId) -> None:
+        self.authorizations.pop(_get_key(identifier), None)
+
+    async def get_all(self) -> tuple[InteractableAuthorization, ...]:
+        authorizations = tuple(self.authorizations.values())
+        self.load_started.set()
+        await self.load_released.wait()
+        return authorizations
+
+class TestAuthorizationDataProvider(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__repository = _FakeAuthorizationRepository()
+        repository: Any = self.__repository
+        unit_of_work_provider: Any = _FakeUnitOfWorkProvider()
+        self.__provider = AuthorizationDataProvider(
+            repository,
+            (),
+            FakeLoggerFactory(),
+            FakeOptionsProvider(DiscordOptions()),
+            unit_of_work_provider
+        )
+        self.__interactable = Interactable(
+            callback=_callback,
+            restrictions=(FeatureRestriction(feature_name="feature"),)
+        )
+
+    async def test_change_is_visible_after_set(self):
+        self.assertFalse(await self.__provider.is_server_authorized(self.__interactable, 1))
+
+        await self.__provider.set_authorization("feature", 1, True)
+
+        self.assertTrue(await self.__provider.is_server_authorized(self.__interactable, 1))
+
+    async def test_reload_started_before_change_does_not_hide_it(self):
+        self.__repository.load_released.clear()
+        reload = asyncio.create_task(self.__provider.is_server_authorized(self.__interactable, 1))
+        await self.__repository.load_started.wait()
+
+        await self.__provider.set_authorization("feature", 1, True)
+        self.__repository.load_released.set()
+        await reload
+
+        self.assertTrue(await self.__provider.is_server_authorized(self.__interactable, 1))
@@ -0,0 +1,47 @@
+import unittest
+
+from holobot.discord.authorization.models import (
+    AuthorizationSnapshot, InteractableAuthorization, InteractableAuthorizationId
+)
+
+def _create_authorization(feature_name: str, server_id: int, status: bool) -> InteractableAuthorization:
+    return InteractableAuthorization(
+        identifier=InteractableAuthorizationId.create(feature_name, server_id),
+        status=status
+    )
+
+class TestAuthorizationSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__snapshot = AuthorizationSnapshot((
+            _create_authorization("feature1", 1, True),
+            _create_authorization("feature1", 2, False),
+            _create_authorization("feature2", 1, True)
+        ))
+
+    def test_statuses_are_grouped_by_feature(self):
+        self.assertTrue(self.__snapshot.get_status("feature1", 1))
+        self.assertFalse(self.__snapshot.get_status("feature1", 2))
+        self.assertTrue(self.__snapshot.get_status("feature2", 1))
+        self.assertIsNone(self.__snapshot.get_status("feature2", 2))
+        self.assertIsNone(self.__snapshot.get_status("feature3", 1))
+
+    def test_server_ids_include_every_authorization_of_the_feature(self):
+        self.assertEqual({1, 2}, set(self.__snapshot.get_server_ids("feature1")))
+        self.assertEqual(set(), set(self.__snapshot.get_server_ids("feature3")))
+
+    def test_statuses_can_be_changed(self):
+        self.__snapshot.set_status("feature1", 2, True)
+        self.__snapshot.set_status("feature3", 3, False)
+
+        self.assertTrue(self.__snapshot.get_status("feature1", 2))
+        self.assertFalse(self.__snapshot.get_status("feature3", 3))
+        self.assertEqual({3}, set(self.__snapshot.get_server_ids("feature3")))
+
+    def test_statuses_can_be_removed(self):
+        self.__snapshot.set_status("feature1", 1, None)
+        self.__snapshot.set_status("feature2", 1, None)
+        self.__snapshot.set_status("feature3", 1, None)
+
+        self.assertIsNone(self.__snapshot.get_status("feature1", 1))
+        self.assertEqual({2}, set(self.__snapshot.get_server_ids("feature1")))
+        self.assertEqual(set(), set(self.__snapshot.get_server_ids("feature2")))
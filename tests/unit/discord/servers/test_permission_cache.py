@@ -0,0 +1,62 @@
+import unittest
+
+import hikari
+
+from holobot.discord import DiscordOptions
+from holobot.discord.sdk.enums import Permission
+from holobot.discord.servers import PermissionCache
+from holobot.discord.utils.permission_utils import PERMISSION_TO_MODELS, map_permissions_to_model
+from tests.machinery.fakes import FakeOptionsProvider
+
+class TestPermissionCache(unittest.TestCase):
+    def test_map_permissions_to_model_matches_flags(self):
+        dto = hikari.Permissions.NONE
+        expected = Permission.NONE
+        for current_dto, model in PERMISSION_TO_MODELS.items():
+            dto |= current_dto
+            expected |= model
+
+            self.assertEqual(expected, map_permissions_to_model(dto))
+
+        # Permissions without a model counterpart are ignored.
+        self.assertEqual(
+            Permission.NONE,
+            map_permissions_to_model(hikari.Permissions.MANAGE_THREADS)
+        )
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = TestPermissionCache.__create_cache(2)
+        cache.set(1, 10, 100, Permission.VIEW_CHANNEL)
+        cache.set(1, 10, 101, Permission.SEND_MESSAGES)
+        cache.get(1, 10, 100)
+        cache.set(1, 10, 102, Permission.ADD_REACTIONS)
+
+        self.assertEqual(Permission.VIEW_CHANNEL, cache.get(1, 10, 100))
+        self.assertIsNone(cache.get(1, 10, 101))
+        self.assertEqual(Permission.ADD_REACTIONS, cache.get(1, 10, 102))
+        self.assertEqual(2, cache.size)
+
+    def test_invalidations_are_scoped(self):
+        cache = TestPermissionCache.__create_cache(10)
+        cache.set(1, 10, 100, Permission.VIEW_CHANNEL)
+        cache.set(1, 11, 100, Permission.VIEW_CHANNEL)
+        cache.set(1, 11, 101, Permission.VIEW_CHANNEL)
+        cache.set(2, 20, 100, Permission.VIEW_CHANNEL)
+
+        version = cache.version
+        cache.invalidate_channel(1, 11)
+        self.assertGreater(cache.version, version)
+        self.assertIsNotNone(cache.get(1, 10, 100))
+        self.assertIsNone(cache.get(1, 11, 100))
+        self.assertIsNone(cache.get(1, 11, 101))
+
+        cache.invalidate_member(1, 100)
+        self.assertIsNone(cache.get(1, 10, 100))
+        self.assertIsNotNone(cache.get(2, 20, 100))
+
+        cache.invalidate_server(2)
+        self.assertEqual(0, cache.size)
+
+    @staticmethod
+    def __create_cache(max_size: int) -> PermissionCache:
+        return PermissionCache(FakeOptionsProvider(DiscordOptions(PermissionCacheMaxSize=max_size)))
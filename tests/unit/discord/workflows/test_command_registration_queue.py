@@ -0,0 +1,26 @@
+import asyncio
+import unittest
+
+from holobot.discord.sdk.events import AuthorizationChangedEvent
+from holobot.discord.workflows import CommandRegistrationQueue
+
+class TestCommandRegistrationQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_changed_servers_are_dequeued_once(self):
+        queue = CommandRegistrationQueue()
+        await queue.on_event(AuthorizationChangedEvent(feature_name="feature", server_id=1, status=True))
+        await queue.on_event(AuthorizationChangedEvent(feature_name="feature", server_id=2, status=None))
+        queue.enqueue(1)
+
+        self.assertEqual({1, 2}, set(await queue.dequeue_all()))
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(queue.dequeue_all(), 0.01)
+
+    async def test_dequeue_waits_for_a_server(self):
+        queue = CommandRegistrationQueue()
+        dequeue = asyncio.create_task(queue.dequeue_all())
+        await asyncio.sleep(0)
+        self.assertFalse(dequeue.done())
+
+        queue.enqueue(3)
+
+        self.assertEqual((3,), await dequeue)
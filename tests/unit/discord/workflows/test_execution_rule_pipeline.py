@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+from typing import Any, cast
+
+from holobot.discord.sdk.models import InteractionContext
+from holobot.discord.sdk.workflows import IWorkflow
+from holobot.discord.sdk.workflows.interactables import Interactable
+from holobot.discord.sdk.workflows.rules import IWorkflowExecutionRule
+from holobot.discord.workflows import ExecutionRulePipeline
+from holobot.sdk.diagnostics import ExecutionContext
+
+class _Rule(IWorkflowExecutionRule):
+    def __init__(
+        self,
+        should_halt: bool,
+        priority: int = 0,
+        is_io_bound: bool = True,
+        delay: float = 0.0,
+        has_side_effects: bool = False
+    ) -> None:
+        super().__init__()
+        self.__should_halt = should_halt
+        self.__priority = priority
+        self.__is_io_bound = is_io_bound
+        self.__delay = delay
+        self.__has_side_effects = has_side_effects
+        self.is_evaluated = False
+        self.is_cancelled = False
+
+    @property
+    def priority(self) -> int:
+        return self.__priority
+
+    @property
+    def is_io_bound(self) -> bool:
+        return self.__is_io_bound
+
+    @property
+    def has_side_effects(self) -> bool:
+        return self.__has_side_effects
+
+    async def should_halt(
+        self,
+        workflow: IWorkflow,
+        interactable: Interactable,
+        context: InteractionContext
+    ) -> tuple[bool, str | None]:
+        try:
+            await asyncio.sleep(self.__delay)
+        except asyncio.CancelledError:
+            self.is_cancelled = True
+            raise
+
+        self.is_evaluated = True
+        return (self.__should_halt, str(self.__priority))
+
+class _Rule1(_Rule): ...
+class _Rule2(_Rule): ...
+class _Rule3(_Rule): ...
+
+class TestExecutionRulePipeline(unittest.IsolatedAsyncioTestCase):
+    async def __evaluate(self, *rules: _Rule):
+        subject = ExecutionRulePipeline(rules)
+        context = ExecutionContext()
+        result = await subject.evaluate(
+            cast(IWorkflow, None),
+            cast(Interactable, None),
+            cast(Any, None),
+            context
+        )
+        return result, context.collect()
+
+    async def test_no_rule_halts(self):
+        result, measurements = await self.__evaluate(
+            _Rule1(False, 0, False),
+            _Rule2(False, 1),
+            _Rule3(False, 2)
+        )
+
+        self.assertIsNone(result)
+        self.assertEqual(len(measurements), 3)
+
+    async def test_higher_priority_io_bound_rule_overrides_cheap_rule(self):
+        cheap_rule = _Rule1(True, 1, False)
+        io_bound_rule = _Rule2(True, 0, True, 0.01)
+        lower_io_bound_rule = _Rule3(True, 2)
+        result, _ = await self.__evaluate(cheap_rule, io_bound_rule, lower_io_bound_rule)
+
+        self.assertIsNotNone(result)
+        self.assertIs(result.rule, io_bound_rule)  # type: ignore
+        self.assertFalse(lower_io_bound_rule.is_evaluated)
+
+    async def test_lower_priority_rules_are_cancelled(self):
+        halting_rule = _Rule1(True, 0)
+        slow_rule = _Rule2(False, 1, True, 5.0)
+        result, measurements = await self.__evaluate(halting_rule, slow_rule)
+
+        self.assertIsNotNone(result)
+        self.assertIs(result.rule, halting_rule)  # type: ignore
+        self.assertTrue(slow_rule.is_cancelled)
+        self.assertTrue(all(i.elapsed_milliseconds >= 0 for i in measurements))
+
+    async def test_higher_priority_rules_are_awaited(self):
+        slow_rule = _Rule1(True, 0, True, 0.05)
+        fast_rule = _Rule2(True, 1)
+        result, _ = await self.__evaluate(fast_rule, slow_rule)
+
+        self.assertIsNotNone(result)
+        self.assertIs(result.rule, slow_rule)  # type: ignore
+        self.assertEqual(result.message, "0")  # type: ignore
+
+    async def test_rules_with_side_effects_are_skipped_when_halted(self):
+        side_effecting_rule = _Rule1(False, 0, False, has_side_effects=True)
+        halting_rule = _Rule2(True, 1)
+        result, _ = await self.__evaluate(side_effecting_rule, halting_rule)
+
+        self.assertIsNotNone(result)
+        self.assertIs(result.rule, halting_rule)  # type: ignore
+        self.assertFalse(side_effecting_rule.is_evaluated)
+
+    async def test_rules_with_side_effects_are_evaluated_last(self):
+        side_effecting_rule = _Rule1(True, 0, False, has_side_effects=True)
+        other_rule = _Rule2(False, 1)
+        result, measurements = await self.__evaluate(side_effecting_rule, other_rule)
+
+        self.assertIsNotNone(result)
+        self.assertIs(result.rule, side_effecting_rule)  # type: ignore
+        self.assertTrue(other_rule.is_evaluated)
+        self.assertEqual(len(measurements), 2)
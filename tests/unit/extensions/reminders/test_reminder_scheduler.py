@@ -0,0 +1,85 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from holobot.extensions.reminders import ReminderScheduler
+from holobot.extensions.reminders.models import Reminder
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+def _create_reminder(identifier: int, minutes: int) -> Reminder:
+    return Reminder(
+        identifier=identifier,
+        user_id=1,
+        next_trigger=_NOW + timedelta(minutes=minutes)
+    )
+
+class TestReminderScheduler(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__scheduler = ReminderScheduler()
+
+    def test_due_reminders_are_popped_in_order(self):
+        self.__scheduler.load(
+            (_create_reminder(1, 5), _create_reminder(2, 1), _create_reminder(3, 10)),
+            _NOW + timedelta(minutes=30)
+        )
+
+        reminders = self.__scheduler.pop_due(_NOW + timedelta(minutes=5))
+
+        self.assertEqual((2, 1), tuple(i.identifier for i in reminders))
+        self.assertEqual(_NOW + timedelta(minutes=10), self.__scheduler.get_next_trigger())
+
+    def test_reminders_outside_the_window_are_ignored(self):
+        self.__scheduler.load((), _NOW + timedelta(minutes=30))
+
+        self.__scheduler.schedule(_create_reminder(1, 60))
+
+        self.assertIsNone(self.__scheduler.get_next_trigger())
+
+    def test_rescheduled_and_removed_reminders_are_not_popped(self):
+        self.__scheduler.load(
+            (_create_reminder(1, 1), _create_reminder(2, 2)),
+            _NOW + timedelta(minutes=30)
+        )
+
+        self.__scheduler.schedule(_create_reminder(1, 20))
+        self.__scheduler.unschedule(2)
+
+        self.assertEqual((), self.__scheduler.pop_due(_NOW + timedelta(minutes=10)))
+        self.assertEqual(_NOW + timedelta(minutes=20), self.__scheduler.get_next_trigger())
+
+    def test_changes_during_a_load_are_replayed(self):
+        self.__scheduler.load((), _NOW)
+        self.__scheduler.begin_load()
+        self.__scheduler.unschedule(1)
+        self.__scheduler.schedule(_create_reminder(2, 3))
+
+        self.__scheduler.load(
+            (_create_reminder(1, 1), _create_reminder(2, 2)),
+            _NOW + timedelta(minutes=30)
+        )
+
+        reminders = self.__scheduler.pop_due(_NOW + timedelta(minutes=10))
+        self.assertEqual(1, len(reminders))
+        self.assertEqual(_NOW + timedelta(minutes=3), reminders[0].next_trigger)
+
+    def test_removed_reminders_are_not_restored_by_a_load(self):
+        self.__scheduler.load((_create_reminder(1, 1),), _NOW + timedelta(minutes=30))
+        self.__scheduler.begin_load()
+        self.__scheduler.pop_due(_NOW + timedelta(minutes=5))
+        self.__scheduler.unschedule(1)
+
+        # The load may have read the reminder before its removal was persisted.
+        self.__scheduler.load((_create_reminder(1, 1),), _NOW + timedelta(minutes=30))
+
+        self.assertEqual((), self.__scheduler.pop_due(_NOW + timedelta(minutes=5)))
+
+    async def test_scheduling_an_earlier_reminder_wakes_the_waiter(self):
+        self.__scheduler.load((_create_reminder(1, 10),), _NOW + timedelta(minutes=30))
+        await self.__scheduler.wait_for_change(0)
+        waiter = asyncio.ensure_future(self.__scheduler.wait_for_change(10))
+        await asyncio.sleep(0)
+
+        self.__scheduler.schedule(_create_reminder(2, 1))
+
+        await asyncio.wait_for(waiter, 1)
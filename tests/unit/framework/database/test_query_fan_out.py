@@ -0,0 +1,56 @@
+import asyncio
+import unittest
+from typing import Any
+
+from holobot.framework.database import DatabaseOptions, QueryFanOut
+
+class _FakeOptions:
+    value = DatabaseOptions()
+
+class _FakeUnitOfWorkProvider:
+    current: Any = None
+
+class TestQueryFanOut(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__unit_of_work_provider = _FakeUnitOfWorkProvider()
+        options: Any = _FakeOptions()
+        unit_of_work_provider: Any = self.__unit_of_work_provider
+        self.__fan_out = QueryFanOut(options, unit_of_work_provider)
+        self.__running_count = 0
+        self.__max_running_count = 0
+
+    async def test_queries_are_executed_concurrently(self):
+        results = await self.__fan_out.fetch(self.__query(1), self.__query("a"), self.__query(None))
+
+        self.assertEqual((1, "a", None), results)
+        self.assertEqual(3, self.__max_running_count)
+
+    async def test_queries_are_executed_sequentially_within_a_unit_of_work(self):
+        self.__unit_of_work_provider.current = object()
+
+        results = await self.__fan_out.fetch_all(self.__query(index) for index in range(3))
+
+        self.assertEqual((0, 1, 2), results)
+        self.assertEqual(1, self.__max_running_count)
+
+    async def test_remaining_queries_are_cancelled_on_failure(self):
+        slow_query = asyncio.ensure_future(self.__query(1, 10))
+
+        with self.assertRaises(ValueError):
+            await self.__fan_out.fetch(slow_query, self.__fail())
+        await asyncio.sleep(0)
+
+        self.assertTrue(slow_query.cancelled())
+
+    async def __query(self, result: Any, delay: float = 0.01) -> Any:
+        self.__running_count += 1
+        self.__max_running_count = max(self.__max_running_count, self.__running_count)
+        try:
+            await asyncio.sleep(delay)
+            return result
+        finally:
+            self.__running_count -= 1
+
+    @staticmethod
+    async def __fail() -> None:
+        raise ValueError
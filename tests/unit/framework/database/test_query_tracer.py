@@ -0,0 +1,79 @@
+import unittest
+from typing import Any
+
+from holobot.framework.database import DatabaseOptions, QueryTracer
+
+class _FakeOptions:
+    def __init__(self, value: DatabaseOptions) -> None:
+        self.value = value
+
+class _FakeDebugger:
+    def is_debug_mode_enabled(self) -> bool:
+        return True
+
+class _FakeLogger:
+    def __init__(self) -> None:
+        self.warnings: list[tuple[str, dict[str, Any]]] = []
+
+    def debug(self, message: str, **kwargs: Any) -> None:
+        pass
+
+    def warning(self, message: str, **kwargs: Any) -> None:
+        self.warnings.append((message, kwargs))
+
+class _FakeLoggerFactory:
+    def __init__(self, logger: _FakeLogger) -> None:
+        self.__logger = logger
+
+    def create(self, _: type) -> _FakeLogger:
+        return self.__logger
+
+class TestQueryTracer(unittest.TestCase):
+    def setUp(self) -> None:
+        self.__logger = _FakeLogger()
+        self.__options = DatabaseOptions(SlowQueryThreshold=100, MaxTrackedQueryShapes=2)
+        options: Any = _FakeOptions(self.__options)
+        debugger: Any = _FakeDebugger()
+        logger_factory: Any = _FakeLoggerFactory(self.__logger)
+        self.__tracer = QueryTracer(options, debugger, logger_factory)
+
+    def test_query_shapes_are_ordered_by_total_time(self):
+        self.__tracer.record("SELECT 1", 0, 1, 10.0)
+        self.__tracer.record("SELECT 2", 1, 5, 30.0)
+        self.__tracer.record("SELECT 1", 0, 1, 15.0)
+
+        query_shapes = self.__tracer.get_top_query_shapes(10)
+
+        self.assertEqual(("SELECT 2", "SELECT 1"), tuple(i.query for i in query_shapes))
+        self.assertEqual(2, query_shapes[1].elapsed_times.count)
+        self.assertEqual(25.0, query_shapes[1].total_elapsed_time)
+        self.assertEqual(5, query_shapes[0].row_count)
+        self.assertEqual(1, query_shapes[0].argument_count)
+
+    def test_query_shapes_above_the_limit_are_not_tracked(self):
+        for query in ("SELECT 1", "SELECT 2", "SELECT 3"):
+            self.__tracer.record(query, 0, 0, 1.0)
+
+        self.assertEqual(2, len(self.__tracer.get_top_query_shapes(10)))
+
+    def test_slow_queries_are_logged_without_arguments(self):
+        self.__tracer.record("SELECT * FROM t WHERE id = $1", 1, 1, 150.0)
+
+        self.assertEqual(1, len(self.__logger.warnings))
+        self.assertEqual("SELECT * FROM t WHERE id = $1", self.__logger.warnings[0][1]["query"])
+        self.assertEqual(1, self.__tracer.get_top_query_shapes(1)[0].slow_execution_count)
+
+    def test_query_plan_is_requested_for_slow_reads_only(self):
+        self.__options.IsQueryPlanCaptureEnabled = True
+
+        self.assertTrue(self.__tracer.record("SELECT 1", 0, 1, 150.0))
+        self.assertFalse(self.__tracer.record("SELECT 1", 0, 1, 50.0))
+        self.assertFalse(self.__tracer.record("DELETE FROM t", 0, 1, 150.0))
+
+    def test_reports_are_snapshots(self):
+        self.__tracer.record("SELECT 1", 0, 1, 10.0)
+        query_shape = self.__tracer.get_top_query_shapes(1)[0]
+
+        self.__tracer.record("SELECT 1", 0, 1, 10.0)
+
+        self.assertEqual(1, query_shape.elapsed_times.count)
@@ -0,0 +1,30 @@
+import unittest
+from typing import Any
+
+from holobot.framework.database import UnitOfWorkProvider
+
+class TestUnitOfWorkProvider(unittest.TestCase):
+    def setUp(self) -> None:
+        database_manager: Any = None
+        self.__provider = UnitOfWorkProvider(database_manager)
+
+    def test_identity_map_is_available_within_its_scope_only(self):
+        self.assertIsNone(self.__provider.identity_map)
+
+        with self.__provider.create_identity_map_scope() as identity_map:
+            self.assertIs(identity_map, self.__provider.identity_map)
+            identity_map.set(str, 1, "a")
+            self.assertEqual("a", identity_map.get(str, 1))
+            identity_map.remove(str, 1)
+            self.assertIsNone(identity_map.get(str, 1))
+
+        self.assertIsNone(self.__provider.identity_map)
+
+    def test_nested_scopes_share_the_identity_map(self):
+        with self.__provider.create_identity_map_scope() as outer_identity_map:
+            outer_identity_map.set(str, (1, 2), "a")
+            with self.__provider.create_identity_map_scope() as inner_identity_map:
+                self.assertIs(outer_identity_map, inner_identity_map)
+
+            self.assertIs(outer_identity_map, self.__provider.identity_map)
+            self.assertEqual("a", outer_identity_map.get(str, (1, 2)))
@@ -0,0 +1,88 @@
+import asyncio
+import unittest
+from datetime import timedelta
+from typing import Any
+
+from holobot.framework.lifecycle import JobScheduler
+from holobot.sdk.exceptions import ArgumentError
+from holobot.sdk.lifecycle.models import JobSchedule
+from holobot.sdk.threading import CancellationToken
+
+class _FakeLogger:
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: None
+
+class _FakeLoggerFactory:
+    def create(self, _: type) -> _FakeLogger:
+        return _FakeLogger()
+
+class _FakeJob:
+    def __init__(self, name: str, schedule: JobSchedule, duration: float = 0, error: Exception | None = None) -> None:
+        self.name = name
+        self.schedule = schedule
+        self.run_count = 0
+        self.__duration = duration
+        self.__error = error
+
+    async def run(self, token: CancellationToken) -> None:
+        self.run_count += 1
+        await asyncio.sleep(self.__duration)
+        if self.__error:
+            raise self.__error
+
+class TestJobScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_jobs_are_run_periodically(self):
+        job = _FakeJob("job", JobSchedule(interval=timedelta(milliseconds=20)))
+        statistics = await self.__run_jobs((job,), 0.11)
+
+        self.assertGreaterEqual(job.run_count, 4)
+        self.assertEqual(job.run_count, statistics[0].run_count)
+        self.assertEqual(job.run_count, statistics[0].durations.count)
+
+    async def test_failures_and_timeouts_are_counted(self):
+        failing_job = _FakeJob("failing", JobSchedule(interval=timedelta(seconds=10)), error=ValueError())
+        slow_job = _FakeJob("slow", JobSchedule(
+            interval=timedelta(seconds=10),
+            max_runtime=timedelta(milliseconds=10)
+        ), duration=1)
+        statistics = await self.__run_jobs((slow_job, failing_job), 0.05)
+
+        self.assertEqual(("failing", "slow"), tuple(i.name for i in statistics))
+        self.assertEqual(1, statistics[0].failure_count)
+        self.assertEqual(1, statistics[1].timeout_count)
+
+    async def test_runs_are_skipped_while_the_previous_one_is_running(self):
+        job = _FakeJob("job", JobSchedule(interval=timedelta(milliseconds=10)), duration=0.05)
+        statistics = await self.__run_jobs((job,), 0.08)
+
+        self.assertEqual(2, job.run_count)
+        self.assertGreater(statistics[0].skipped_count, 0)
+
+    async def test_jobs_can_be_triggered_manually(self):
+        job = _FakeJob("job", JobSchedule(interval=timedelta(seconds=10), initial_delay=timedelta(seconds=10)))
+        scheduler = JobScheduler((job,), _FakeLoggerFactory()) # type: ignore
+        await scheduler.start()
+        try:
+            self.assertTrue(scheduler.trigger("job"))
+            await asyncio.sleep(0.01)
+            self.assertEqual(1, job.run_count)
+            with self.assertRaises(ArgumentError):
+                scheduler.trigger("unknown")
+        finally:
+            await scheduler.stop()
+
+    async def test_disabled_jobs_are_not_run(self):
+        job = _FakeJob("job", JobSchedule(interval=timedelta(milliseconds=10), is_enabled=False))
+        statistics = await self.__run_jobs((job,), 0.03)
+
+        self.assertEqual(0, job.run_count)
+        self.assertFalse(statistics[0].is_enabled)
+
+    async def __run_jobs(self, jobs: tuple[_FakeJob, ...], duration: float):
+        scheduler = JobScheduler(jobs, _FakeLoggerFactory()) # type: ignore
+        await scheduler.start()
+        try:
+            await asyncio.sleep(duration)
+            return scheduler.get_statistics()
+        finally:
+            await scheduler.stop()
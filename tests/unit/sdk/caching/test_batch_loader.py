@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+
+from holobot.sdk.caching import BatchLoader
+
+class TestBatchLoader(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__batches = list[tuple[int, ...]]()
+        self.__loader = BatchLoader[int, str](self.__load, 3)
+
+    async def test_keys_requested_together_are_loaded_in_one_batch(self):
+        values = await asyncio.gather(
+            self.__loader.load(1),
+            self.__loader.load(2),
+            self.__loader.load(1),
+            self.__loader.load(-1)
+        )
+
+        self.assertEqual(["1", "2", "1", None], values)
+        self.assertEqual([(1, 2, -1)], self.__batches)
+
+    async def test_batches_are_limited_by_size(self):
+        values = await asyncio.gather(*(self.__loader.load(key) for key in range(5)))
+
+        self.assertEqual(["0", "1", "2", "3", "4"], values)
+        self.assertEqual([(0, 1, 2), (3, 4)], self.__batches)
+        self.assertEqual(2, self.__loader.batch_count)
+
+    async def test_subsequent_requests_are_loaded_in_new_batches(self):
+        self.assertEqual("1", await self.__loader.load(1))
+        self.assertEqual("1", await self.__loader.load(1))
+        self.assertEqual([(1,), (1,)], self.__batches)
+
+    async def test_failures_are_propagated_to_every_request(self):
+        loader = BatchLoader[int, str](self.__fail)
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), return_exceptions=True)
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_cancelling_a_request_does_not_cancel_the_others(self):
+        cancelled_request = asyncio.ensure_future(self.__loader.load(1))
+        request = asyncio.ensure_future(self.__loader.load(1))
+        await asyncio.sleep(0)
+
+        cancelled_request.cancel()
+
+        self.assertEqual("1", await request)
+        self.assertTrue(cancelled_request.cancelled())
+        self.assertEqual([(1,)], self.__batches)
+
+    async def __load(self, keys: tuple[int, ...]) -> dict[int, str]:
+        self.__batches.append(keys)
+        await asyncio.sleep(0)
+        return { key: str(key) for key in keys if key >= 0 }
+
+    @staticmethod
+    async def __fail(keys: tuple[int, ...]) -> dict[int, str]:
+        raise ValueError
@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from holobot.sdk.caching import ExpiringDict
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+class TestExpiringDict(unittest.TestCase):
+    def test_get_or_add_returns_live_value(self):
+        cache = ExpiringDict[str, int](shard_count=4)
+
+        self.assertIsNone(cache.get_or_add("a", 1, _NOW + timedelta(seconds=10), _NOW))
+        self.assertEqual(1, cache.get_or_add("a", 2, _NOW + timedelta(seconds=20), _NOW + timedelta(seconds=5)))
+        self.assertEqual(1, cache.get("a", _NOW + timedelta(seconds=9)))
+
+    def test_expired_entries_are_evicted(self):
+        cache = ExpiringDict[str, int](shard_count=1)
+        cache.get_or_add("a", 1, _NOW + timedelta(seconds=10), _NOW)
+        cache.get_or_add("b", 2, _NOW + timedelta(seconds=20), _NOW)
+
+        self.assertIsNone(cache.get_or_add("a", 3, _NOW + timedelta(seconds=30), _NOW + timedelta(seconds=10)))
+        self.assertEqual(1, cache.eviction_count)
+        self.assertEqual(2, cache.size)
+
+        self.assertEqual(1, cache.evict_expired(_NOW + timedelta(seconds=25)))
+        self.assertIsNone(cache.get("b", _NOW + timedelta(seconds=25)))
+        self.assertEqual(3, cache.get("a", _NOW + timedelta(seconds=25)))
+        self.assertEqual(1, cache.size)
+
+    def test_replaced_entry_is_not_evicted_early(self):
+        cache = ExpiringDict[str, int](shard_count=1)
+        cache.set("a", 1, _NOW + timedelta(seconds=10))
+        cache.set("a", 2, _NOW + timedelta(seconds=30))
+
+        self.assertEqual(0, cache.evict_expired(_NOW + timedelta(seconds=15)))
+        self.assertEqual(2, cache.get("a", _NOW + timedelta(seconds=15)))
+        self.assertEqual(0, cache.eviction_count)
@@ -0,0 +1,33 @@
+import unittest
+
+from holobot.sdk.caching import SizeBoundedLruCache
+
+class TestSizeBoundedLruCache(unittest.TestCase):
+    def test_least_recently_used_entries_are_evicted_by_size(self):
+        cache = SizeBoundedLruCache[str, bytes](10, len)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        self.assertEqual(b"1234", cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(b"1234", cache.get("c"))
+        self.assertEqual(8, cache.size)
+        self.assertEqual(1, cache.eviction_count)
+        self.assertEqual(3, cache.hit_count)
+        self.assertEqual(1, cache.miss_count)
+
+    def test_replacing_an_entry_updates_the_size(self):
+        cache = SizeBoundedLruCache[str, bytes](10, len)
+        cache.set("a", b"1234")
+        cache.set("a", b"12")
+
+        self.assertEqual(2, cache.size)
+        self.assertEqual(1, cache.count)
+
+    def test_oversized_values_are_not_cached(self):
+        cache = SizeBoundedLruCache[str, bytes](4, len)
+
+        self.assertFalse(cache.set("a", b"12345"))
+        self.assertEqual(0, cache.count)
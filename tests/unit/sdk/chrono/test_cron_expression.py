@@ -0,0 +1,32 @@
+import unittest
+from datetime import datetime, timezone
+
+from holobot.sdk.chrono import CronExpression, InvalidInputError
+
+# A Sunday.
+_NOW = datetime(2026, 10, 18, 12, 34, 56, tzinfo=timezone.utc)
+
+class TestCronExpression(unittest.TestCase):
+    def test_next_occurrences(self):
+        for expression, expected in (
+            ("* * * * *", datetime(2026, 10, 18, 12, 35, tzinfo=timezone.utc)),
+            ("*/15 * * * *", datetime(2026, 10, 18, 12, 45, tzinfo=timezone.utc)),
+            ("0 3 * * *", datetime(2026, 10, 19, 3, 0, tzinfo=timezone.utc)),
+            ("0 0 1 * *", datetime(2026, 11, 1, 0, 0, tzinfo=timezone.utc)),
+            ("30 9 * * 1-5", datetime(2026, 10, 19, 9, 30, tzinfo=timezone.utc)),
+            ("0 12 * * 0", datetime(2026, 10, 25, 12, 0, tzinfo=timezone.utc)),
+            ("0 0 29 2 *", datetime(2028, 2, 29, 0, 0, tzinfo=timezone.utc)),
+            ("0 0 13 * 5", datetime(2026, 10, 23, 0, 0, tzinfo=timezone.utc))
+        ):
+            with self.subTest(expression=expression):
+                self.assertEqual(expected, CronExpression.parse(expression).get_next(_NOW))
+
+    def test_invalid_expressions_are_rejected(self):
+        for expression in ("* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *", "a * * * *"):
+            with self.subTest(expression=expression):
+                with self.assertRaises(InvalidInputError):
+                    CronExpression.parse(expression)
+
+    def test_unsatisfiable_expression_raises(self):
+        with self.assertRaises(ValueError):
+            CronExpression.parse("0 0 30 2 *").get_next(_NOW)
@@ -0,0 +1,40 @@
+import asyncio
+import time
+import unittest
+from datetime import timedelta
+
+from holobot.sdk.concurrency import AsyncRateLimiter
+
+class TestAsyncRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def test_operations_within_the_limit_are_not_delayed(self):
+        rate_limiter = AsyncRateLimiter(3, timedelta(seconds=10))
+        started_at = time.monotonic()
+
+        for _ in range(3):
+            await rate_limiter.acquire()
+
+        self.assertLess(time.monotonic() - started_at, 0.05)
+        self.assertFalse(rate_limiter.is_idle)
+
+    async def test_excess_operations_are_delayed_until_the_window_slides(self):
+        rate_limiter = AsyncRateLimiter(2, timedelta(milliseconds=100))
+        started_at = time.monotonic()
+
+        await asyncio.gather(*(rate_limiter.acquire() for _ in range(5)))
+
+        self.assertGreaterEqual(time.monotonic() - started_at, 0.2)
+
+    async def test_rate_limiter_becomes_idle_after_the_window(self):
+        rate_limiter = AsyncRateLimiter(1, timedelta(milliseconds=20))
+
+        await rate_limiter.acquire()
+        await asyncio.sleep(0.03)
+
+        self.assertTrue(rate_limiter.is_idle)
+
+    async def test_try_acquire_doesnt_wait_for_the_window(self):
+        rate_limiter = AsyncRateLimiter(2, timedelta(seconds=10))
+
+        self.assertTrue(rate_limiter.try_acquire())
+        self.assertTrue(rate_limiter.try_acquire())
+        self.assertFalse(rate_limiter.try_acquire())
@@ -0,0 +1,45 @@
+import unittest
+
+from holobot.sdk.database.queries import Query
+
+class TestInsertBuilder(unittest.TestCase):
+    def test_multiple_rows_are_inserted_with_a_single_statement(self):
+        sql, arguments = (Query
+            .insert()
+            .in_table("items", "public")
+            .rows(("id", "name"), ((1, "a"), (2, "b"), (3, None)))
+            .returning()
+            .columns("id")
+            .build()
+        )
+
+        self.assertEqual(
+            "INSERT INTO public.items (id, name) VALUES ($1, $2), ($3, $4), ($5, $6) RETURNING id",
+            sql
+        )
+        self.assertEqual((1, "a", 2, "b", 3, None), arguments)
+
+    def test_multiple_rows_can_be_upserted(self):
+        sql, arguments = (Query
+            .insert()
+            .in_table("items")
+            .rows(("id", "name"), ((1, "a"), (2, "b")))
+            .on_conflict("id")
+            .update()
+            .field("name", "EXCLUDED.name", True)
+            .returning()
+            .columns("id")
+            .build()
+        )
+
+        self.assertEqual(
+            "INSERT INTO items (id, name) VALUES ($1, $2), ($3, $4)"
+            " ON CONFLICT (id) DO UPDATE  SET name = EXCLUDED.name RETURNING id",
+            sql
+        )
+        self.assertEqual((1, "a", 2, "b"), arguments)
+
+    def test_rows_must_match_the_columns(self):
+        builder = Query.insert().in_table("items")
+
+        self.assertRaises(ValueError, builder.rows, ("id", "name"), ((1,),))
@@ -0,0 +1,53 @@
+import unittest
+
+from holobot.sdk.database.queries import Query
+from holobot.sdk.database.queries.enums import Equality, Order, SeekDirection
+
+class TestKeysetPaginateBuilder(unittest.TestCase):
+    def test_first_page_has_no_seek_predicate(self):
+        sql, arguments = (Query
+            .select()
+            .columns("id", "points")
+            .from_table("users")
+            .paginate_keyset((("points", Order.DESCENDING), ("id", Order.DESCENDING)), 10)
+            .build()
+        )
+
+        self.assertNotIn("WHERE", sql)
+        self.assertTrue(sql.endswith("ORDER BY points DESC, id DESC LIMIT $1"))
+        self.assertEqual((11,), arguments)
+
+    def test_uniform_ordering_uses_a_row_value_comparison(self):
+        sql, arguments = (Query
+            .select()
+            .columns("id", "points")
+            .from_table("users")
+            .where()
+            .field("server_id", Equality.EQUAL, "1")
+            .paginate_keyset(
+                (("points", Order.ASCENDING), ("id", Order.ASCENDING)),
+                10,
+                (5, 7),
+                SeekDirection.BACKWARD
+            )
+            .build()
+        )
+
+        self.assertIn("WHERE (points, id) < ($2, $3) ORDER BY points DESC, id DESC LIMIT $4", sql)
+        self.assertEqual(("1", 5, 7, 11), arguments)
+
+    def test_mixed_ordering_uses_the_expanded_predicate(self):
+        sql, arguments = (Query
+            .select()
+            .columns("id", "points")
+            .from_table("users")
+            .paginate_keyset(
+                (("points", Order.DESCENDING), ("id", Order.ASCENDING)),
+                10,
+                (5, 7)
+            )
+            .build()
+        )
+
+        self.assertIn("WHERE ((points < $1) OR (points = $1 AND id > $2))", sql)
+        self.assertEqual((5, 7, 11), arguments)
@@ -0,0 +1,54 @@
+import unittest
+
+from holobot.sdk.database.queries import Query, QueryTemplateCache
+from holobot.sdk.database.queries.enums import Equality
+
+class TestQueryTemplateCache(unittest.TestCase):
+    def test_cached_query_matches_the_built_query(self):
+        cache = QueryTemplateCache()
+        build_count = 0
+
+        def create_builder(user_id: str, server_id: str):
+            nonlocal build_count
+            build_count += 1
+            return (Query
+                .select()
+                .columns("id", "name")
+                .from_table("users")
+                .where()
+                .field("user_id", Equality.EQUAL, user_id)
+                .and_field("server_id", Equality.EQUAL, server_id)
+            )
+
+        first = cache.compile("get", ("1", "2"), lambda: create_builder("1", "2"))
+        second = cache.compile("get", ("3", "4"), lambda: create_builder("3", "4"))
+
+        self.assertEqual(1, build_count)
+        self.assertEqual(1, cache.hit_count)
+        self.assertEqual(1, cache.miss_count)
+        self.assertEqual(create_builder("3", "4").build(), (second.query, second.arguments))
+        self.assertEqual(create_builder("1", "2").build(), (first.query, first.arguments))
+
+    def test_mismatching_arguments_are_not_cached(self):
+        cache = QueryTemplateCache()
+        create_builder = lambda: (Query
+            .select()
+            .columns("id")
+            .from_table("users")
+            .where()
+            .field("user_id", Equality.EQUAL, None)
+        )
+
+        cache.compile("get", (None,), create_builder)
+
+        self.assertEqual(0, cache.count)
+
+    def test_least_recently_used_shapes_are_evicted(self):
+        cache = QueryTemplateCache(2)
+        for table_name in ("a", "b", "a", "c"):
+            cache.compile(table_name, (), lambda: Query.select().columns("id").from_table(table_name))
+
+        self.assertEqual(2, cache.count)
+        self.assertEqual(1, cache.hit_count)
+        cache.compile("a", (), lambda: Query.select().columns("id").from_table("a"))
+        self.assertEqual(2, cache.hit_count)
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from holobot.sdk.database.entities import AggregateRoot
+from holobot.sdk.database.repositories import EntitySnapshot
+
+_TIME_FUNCTION = "holobot.sdk.database.repositories.entity_snapshot.utcnow"
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+@dataclass(kw_only=True)
+class _Entity(AggregateRoot[str]):
+    identifier: str
+    value: int
+
+class TestEntitySnapshot(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__load_count = 0
+        self.__value = 1
+        self.__load_started: asyncio.Event | None = None
+        self.__load_released: asyncio.Event | None = None
+        self.__snapshot = EntitySnapshot[str, _Entity](self.__load, timedelta(minutes=1))
+
+    async def test_entities_are_loaded_once_within_the_time_to_live(self):
+        with patch(_TIME_FUNCTION, return_value=_NOW) as time_mock:
+            self.assertEqual(1, await self.__get_value())
+            self.assertIsNone(await self.__snapshot.get("c"))
+            time_mock.return_value = _NOW + timedelta(seconds=59)
+            self.assertEqual(2, len(await self.__snapshot.get_all()))
+
+        self.assertEqual(1, self.__load_count)
+
+    async def test_entities_are_reloaded_after_the_time_to_live(self):
+        with patch(_TIME_FUNCTION, return_value=_NOW) as time_mock:
+            await self.__snapshot.get("a")
+            self.__value = 2
+            time_mock.return_value = _NOW + timedelta(minutes=1)
+
+            self.assertFalse(self.__snapshot.is_loaded)
+            self.assertEqual(2, await self.__get_value())
+            self.assertEqual(2, self.__load_count)
+
+    async def test_entities_are_reloaded_after_an_invalidation(self):
+        with patch(_TIME_FUNCTION, return_value=_NOW):
+            await self.__snapshot.get("a")
+            self.__value = 2
+            self.__snapshot.invalidate()
+
+            self.assertFalse(self.__snapshot.is_loaded)
+            self.assertEqual(2, await self.__get_value())
+            self.assertEqual(2, self.__load_count)
+
+    async def test_concurrent_accesses_load_the_entities_once(self):
+        await asyncio.gather(*(self.__snapshot.get("a") for _ in range(5)))
+
+        self.assertEqual(1, self.__load_count)
+
+    async def test_an_invalidation_during_a_load_keeps_the_snapshot_expired(self):
+        self.__load_started = asyncio.Event()
+        self.__load_released = asyncio.Event()
+        load_task = asyncio.ensure_future(self.__snapshot.get("a"))
+        await self.__load_started.wait()
+
+        # The running load may have read the state preceding the change.
+        self.__snapshot.invalidate()
+        self.__load_released.set()
+        await load_task
+
+        self.assertFalse(self.__snapshot.is_loaded)
+        self.__load_started = self.__load_released = None
+        await self.__snapshot.get("a")
+        self.assertTrue(self.__snapshot.is_loaded)
+        self.assertEqual(2, self.__load_count)
+
+    async def __get_value(self) -> int | None:
+        entity = await self.__snapshot.get("a")
+        return entity.value if entity else None
+
+    async def __load(self) -> tuple[_Entity, ...]:
+        self.__load_count += 1
+        if self.__load_started and self.__load_released:
+            self.__load_started.set()
+            await self.__load_released.wait()
+
+        return (
+            _Entity(identifier="a", value=self.__value),
+            _Entity(identifier="b", value=self.__value)
+        )
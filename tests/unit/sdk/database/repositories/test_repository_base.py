@@ -0,0 +1,200 @@
+import unittest
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import IntEnum
+from typing import Any
+
+from holobot.framework.database import IdentityMap
+from holobot.sdk.caching import BatchLoader
+from holobot.sdk.database.entities import AggregateRoot, PrimaryKey, Record
+from holobot.sdk.database.repositories import RepositoryBase
+
+class _Color(IntEnum):
+    RED = 1
+    GREEN = 2
+
+@dataclass(kw_only=True)
+class _TestRecord(Record):
+    id: PrimaryKey[int]
+    color: _Color
+    created_at: datetime
+    name: str | None
+    count: int = 5
+
+@dataclass(kw_only=True)
+class _TestModel(AggregateRoot[int]):
+    color: _Color
+    created_at: datetime
+    name: str | None
+    count: int
+
+class _FakeUnitOfWorkProvider:
+    current = None
+    identity_map: IdentityMap | None = None
+
+class _FakeConnection:
+    def __init__(self) -> None:
+        self.queries = list[tuple[str, tuple[Any, ...]]]()
+
+    def transaction(self) -> Any:
+        return nullcontext()
+
+    async def fetch(self, query: str, *arguments: Any) -> list[dict[str, Any]]:
+        self.queries.append((query, arguments))
+        if "nextval" in query:
+            return [{ "id": 10 + index } for index in range(arguments[2])]
+
+        # The rows are returned in the reverse order on purpose.
+        return [{ "id": arguments[index] } for index in range(len(arguments) - 5, -1, -5)]
+
+class _FakeUnitOfWork:
+    def __init__(self, connection: _FakeConnection) -> None:
+        self.connection = connection
+
+    async def set(self, model: Any) -> None:
+        pass
+
+class _TestRepository(RepositoryBase[int, _TestRecord, _TestModel]):
+    @property
+    def record_type(self) -> type[_TestRecord]:
+        return _TestRecord
+
+    @property
+    def model_type(self) -> type[_TestModel]:
+        return _TestModel
+
+    @property
+    def identifier_type(self) -> type[int]:
+        return int
+
+    @property
+    def table_name(self) -> str:
+        return "tests"
+
+    def _map_record_to_model(self, record: _TestRecord) -> _TestModel:
+        return _TestModel(
+            identifier=record.id.value,
+            color=record.color,
+            created_at=record.created_at,
+            name=record.name,
+            count=record.count
+        )
+
+    def _map_model_to_record(self, model: _TestModel) -> _TestRecord:
+        return _TestRecord(
+            id=PrimaryKey(model.identifier),
+            color=model.color,
+            created_at=model.created_at,
+            name=model.name,
+            count=model.count
+        )
+
+class TestRepositoryBase(unittest.TestCase):
+    def setUp(self) -> None:
+        unit_of_work_provider: Any = _FakeUnitOfWorkProvider()
+        self.__repository = _TestRepository(unit_of_work_provider, unit_of_work_provider)
+
+    def test_rows_are_mapped_to_models(self):
+        models = self.__repository._map_query_results_to_models([
+            { "id": 1, "color": 2, "created_at": datetime(2024, 1, 2), "name": None, "count": None },
+            { "id": 2, "color": 1, "created_at": datetime(2024, 1, 3, tzinfo=timezone.utc), "name": "a", "count": 3 }
+        ])
+
+        self.assertEqual((
+            _TestModel(
+                identifier=1,
+                color=_Color.GREEN,
+                created_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                name=None,
+                count=5
+            ),
+            _TestModel(
+                identifier=2,
+                color=_Color.RED,
+                created_at=datetime(2024, 1, 3, tzinfo=timezone.utc),
+                name="a",
+                count=3
+            )
+        ), models)
+
+    def test_values_of_the_wrong_type_are_rejected(self):
+        self.assertRaises(
+            TypeError,
+            self.__repository._map_query_result_to_record,
+            { "id": 1, "color": 1, "created_at": datetime(2024, 1, 2), "name": 5 }
+        )
+        self.assertRaises(
+            TypeError,
+            self.__repository._map_query_result_to_record,
+            { "id": 1, "color": 1, "created_at": None, "name": None }
+        )
+
+    def test_identifiers_are_mapped(self):
+        self.assertEqual(7, self.__repository._map_query_result_to_identifier({ "id": 7 }))
+
+class TestRepositoryBaseIdentityMap(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__unit_of_work_provider = _FakeUnitOfWorkProvider()
+        self.__unit_of_work_provider.identity_map = IdentityMap()
+        # There is no database manager, hence any query would fail.
+        self.__repository = _TestRepository(None, self.__unit_of_work_provider) # type: ignore
+        self.__model = _TestModel(
+            identifier=1,
+            color=_Color.RED,
+            created_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+            name=None,
+            count=5
+        )
+
+    async def test_tracked_models_are_returned_without_querying(self):
+        self.__unit_of_work_provider.identity_map.set(_TestModel, 1, self.__model) # type: ignore
+
+        self.assertIs(self.__model, await self.__repository.get(1))
+
+    async def test_invalidated_models_are_forgotten(self):
+        identity_map: Any = self.__unit_of_work_provider.identity_map
+        identity_map.set(_TestModel, 1, self.__model)
+
+        await self.__repository._invalidate_model(1)
+
+        self.assertIsNone(identity_map.get(_TestModel, 1))
+
+    async def test_batch_loaded_values_are_loaded_once_per_scope(self):
+        async def load(keys: tuple[int, ...]) -> dict[int, str]:
+            return { key: str(key) for key in keys }
+
+        loader = BatchLoader[int, str](load)
+
+        self.assertEqual("1", await self.__repository._load_batched(loader, str, 1))
+        self.assertEqual("1", await self.__repository._load_batched(loader, str, 1))
+        self.assertEqual(1, loader.batch_count)
+
+class TestRepositoryBaseInsertMany(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.__connection = _FakeConnection()
+        unit_of_work_provider: Any = _FakeUnitOfWorkProvider()
+        unit_of_work_provider.current = _FakeUnitOfWork(self.__connection)
+        self.__repository = _TestRepository(unit_of_work_provider, unit_of_work_provider)
+
+    async def test_generated_identifiers_are_assigned_regardless_of_the_returned_order(self):
+        models = [
+            _TestModel(
+                identifier=0,
+                color=_Color.RED,
+                created_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+                name=name,
+                count=1
+            )
+            for name in ("a", "b")
+        ]
+
+        identifiers = await self.__repository.add_many(models)
+
+        self.assertEqual((10, 11), identifiers)
+        self.assertEqual([10, 11], [model.identifier for model in models])
+        _, insert_arguments = self.__connection.queries[-1]
+        self.assertEqual(
+            (10, 1, datetime(2024, 1, 2), "a", 1, 11, 1, datetime(2024, 1, 2), "b", 1),
+            insert_arguments
+        )
@@ -0,0 +1,40 @@
+import unittest
+
+from holobot.sdk.diagnostics import Histogram
+from holobot.sdk.exceptions import ArgumentError
+
+class TestHistogram(unittest.TestCase):
+    def test_measurements_are_counted_by_buckets(self):
+        histogram = Histogram((1, 10, 100))
+        for value in (0.5, 1, 2, 10, 50, 1000):
+            histogram.record(value)
+
+        self.assertEqual(((1, 2), (10, 2), (100, 1), (float("inf"), 1)), histogram.get_buckets())
+        self.assertEqual(6, histogram.count)
+        self.assertEqual(1000, histogram.maximum)
+        self.assertAlmostEqual(1063.5 / 6, histogram.mean)
+
+    def test_percentiles_are_estimated_by_bucket_upper_bounds(self):
+        histogram = Histogram((1, 10, 100))
+        for value in (0.5, 2, 3, 50):
+            histogram.record(value)
+
+        self.assertEqual(1, histogram.get_percentile(25))
+        self.assertEqual(10, histogram.get_percentile(50))
+        self.assertEqual(50, histogram.get_percentile(100))
+        self.assertEqual(0, Histogram().get_percentile(50))
+
+    def test_copies_are_independent(self):
+        histogram = Histogram((1, 10))
+        histogram.record(5)
+        copy = histogram.copy()
+        histogram.record(5)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(1, copy.count)
+        self.assertEqual(((1, 0), (10, 1), (float("inf"), 0)), copy.get_buckets())
+
+    def test_invalid_buckets_are_rejected(self):
+        self.assertRaises(ArgumentError, Histogram, ())
+        self.assertRaises(ArgumentError, Histogram, (10, 1))
@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+
+from holobot.sdk.network.resilience import AsyncCircuitBreakerPolicy
+from holobot.sdk.network.resilience.exceptions import CircuitBrokenError
+from holobot.sdk.network.resilience.models import CircuitState
+
+_TIME_FUNCTION = "holobot.sdk.network.resilience.async_circuit_breaker_policy.time"
+
+async def _succeed(delay: float) -> float:
+    await asyncio.sleep(delay)
+    return delay
+
+async def _fail(delay: float) -> float:
+    await asyncio.sleep(delay)
+    raise ValueError("Failed.")
+
+class TestAsyncCircuitBreakerPolicy(unittest.IsolatedAsyncioTestCase):
+    async def test_closed_calls_run_concurrently(self):
+        policy = AsyncCircuitBreakerPolicy[float, float]()
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        results = await asyncio.gather(*(policy.execute(_succeed, 0.1) for _ in range(10)))
+
+        self.assertEqual([0.1] * 10, results)
+        self.assertLess(loop.time() - started_at, 0.5)
+
+    async def test_circuit_breaks_after_consecutive_failures(self):
+        policy = AsyncCircuitBreakerPolicy[float, float](failure_threshold=2)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                await policy.execute(_fail, 0)
+
+        self.assertIs(CircuitState.OPEN, policy.state)
+        with self.assertRaises(CircuitBrokenError):
+            await policy.execute(_succeed, 0)
+
+    async def test_half_open_allows_limited_probes(self):
+        with patch(_TIME_FUNCTION, return_value=1000.0) as time_mock:
+            policy = AsyncCircuitBreakerPolicy[float, float](
+                failure_threshold=1,
+                recovery_timeout=10,
+                half_open_probe_count=2
+            )
+            with self.assertRaises(ValueError):
+                await policy.execute(_fail, 0)
+
+            time_mock.return_value = 1011.0
+            self.assertIs(CircuitState.HALF_OPEN, policy.state)
+
+            probes = [asyncio.create_task(policy.execute(_succeed, 0.05)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with self.assertRaises(CircuitBrokenError):
+                await policy.execute(_succeed, 0)
+
+            await asyncio.gather(*probes)
+            self.assertIs(CircuitState.CLOSED, policy.state)
+
+    async def test_circuit_breaks_on_failure_rate(self):
+        policy = AsyncCircuitBreakerPolicy[float, float](
+            failure_rate_threshold=0.5,
+            minimum_throughput=4
+        )
+        await policy.execute(_succeed, 0)
+        await policy.execute(_succeed, 0)
+        with self.assertRaises(ValueError):
+            await policy.execute(_fail, 0)
+
+        self.assertIs(CircuitState.CLOSED, policy.state)
+        with self.assertRaises(ValueError):
+            await policy.execute(_fail, 0)
+
+        self.assertIs(CircuitState.OPEN, policy.state)
@@ -0,0 +1,30 @@
+import unittest
+from datetime import datetime, timezone
+
+from holobot.sdk.queries import decode_cursor, encode_cursor
+
+class TestCursorUtils(unittest.TestCase):
+    def test_values_survive_a_round_trip(self):
+        values = (
+            None,
+            True,
+            False,
+            -42,
+            2 ** 63 - 1,
+            "Hello, world!=;~",
+            datetime(2023, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+        )
+
+        token = encode_cursor(values)
+
+        self.assertEqual(values, decode_cursor(token))
+        for character in ";~= ":
+            self.assertNotIn(character, token)
+
+    def test_invalid_tokens_are_decoded_as_none(self):
+        for token in (None, "", "x1", "i1,iabc", "b2"):
+            with self.subTest(token=token):
+                self.assertIsNone(decode_cursor(token))
+
+    def test_unsupported_values_cannot_be_encoded(self):
+        self.assertRaises(TypeError, encode_cursor, (1.5,))